@@ -0,0 +1,566 @@
+"""
+One headless browser for every page that has to be rendered.
+
+The club-profile scraper, the competition monitor, competition discovery
+and the ClubZap automation all need JavaScript-rendered pages.  Rather
+than each starting its own browser, they share a ``PageEngine``: one
+Playwright Chromium per process, running on a private asyncio event loop
+in a background thread, with a pool of BROWSER_POOL_SIZE browser
+contexts (one reusable tab each).
+
+Synchronous callers use ``render()`` / ``render_many()``, which block
+until the page(s) are done; ``render_many()`` loads its pages in
+parallel tabs.  Async callers (ClubZap) run their coroutine on the
+engine's loop with ``engine.run(coro)`` and take their own contexts from
+``new_context()``, so a browser warmed up by the scrapers serves the
+ClubZap sync too.
+
+The browser is started on first use, so creating an engine is free when
+every page comes from the HTTP client or the saved fixture endpoint.
+
+Every render runs under a watchdog:
+
+  - navigation is limited to BROWSER_NAV_TIMEOUT and each script call
+    (reading the page back) to BROWSER_SCRIPT_TIMEOUT;
+  - a render still unfinished BROWSER_HANG_GRACE after its navigation,
+    selector wait and script budgets (render_deadline), counted from when
+    it got its pooled page, counts as a hung browser: the browser is
+    killed and relaunched, and the page is tried once more (as are pages that
+    failed because of the restart);
+  - the browser is also recycled, before the next page, after
+    BROWSER_RECYCLE_PAGES pages or once it uses more than
+    BROWSER_RECYCLE_MEMORY_MB.
+
+Pages and restarts are counted in ``engine.metrics`` for the run log and
+heartbeat.
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import signal
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright
+
+from config import (BROWSER_CLOSE_TIMEOUT, BROWSER_HEADLESS, BROWSER_NAV_TIMEOUT,
+                    BROWSER_HANG_GRACE, BROWSER_POOL_SIZE,
+                    BROWSER_RECYCLE_MEMORY_MB, BROWSER_RECYCLE_PAGES,
+                    BROWSER_SCRIPT_TIMEOUT, BROWSER_VIEWPORT, USER_AGENT)
+
+# Responses recorded with capture=True (background requests only)
+_CAPTURED_TYPES = ("xhr", "fetch")
+
+
+class PageHung(Exception):
+    """A page stopped responding, before and after a browser restart."""
+
+
+class RenderedPage:
+    """A page's markup after its scripts ran.
+
+    ``found`` is False when the ``wait_for`` selector never appeared (the
+    markup is still whatever had rendered by then); ``exchanges`` holds
+    the XHR / fetch requests made while loading, if captured.
+    """
+
+    def __init__(self, url, html, exchanges=None, found=True):
+        self.url = url
+        self.html = html
+        self.exchanges = exchanges or []
+        self.found = found
+
+
+class BrowserMetrics:
+    """Pages rendered and browser restarts, for the end-of-run log."""
+
+    def __init__(self):
+        self.pages = 0
+        self.retries = 0
+        self.recycles = []
+
+    def record_recycle(self, reason, pages, memory_mb=None, url=None):
+        self.recycles.append({
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "reason": reason,
+            "pages": pages,
+            "memory_mb": memory_mb,
+            "url": url,
+        })
+
+    def recycle_counts(self):
+        """{reason: restarts} - hang, pages or memory."""
+        counts = {}
+        for event in self.recycles:
+            counts[event["reason"]] = counts.get(event["reason"], 0) + 1
+        return counts
+
+    def summary(self):
+        """A few lines for the end-of-run log ("" if nothing was rendered)."""
+        if not self.pages and not self.recycles:
+            return ""
+        lines = [f"{self.pages} pages rendered, {len(self.recycles)} browser "
+                 f"restarts, {self.retries} pages retried"]
+        for event in self.recycles:
+            detail = f"{event['reason']} after {event['pages']} pages"
+            if event["memory_mb"] is not None:
+                detail += f", {event['memory_mb']:.0f} MB"
+            if event["url"]:
+                detail += f" ({event['url']})"
+            lines.append(f"  {event['at']} restart: {detail}")
+        return "\n".join(lines)
+
+
+def _child_processes():
+    """{pid: (name, rss bytes)} for every process descended from this one.
+
+    Read from /proc; empty where that isn't available (not Linux).
+    """
+    try:
+        pids = [int(p) for p in os.listdir("/proc") if p.isdigit()]
+    except OSError:
+        return {}
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    parents = {}
+    info = {}
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        name = stat[stat.find("(") + 1:stat.rfind(")")]
+        fields = stat[stat.rfind(")") + 2:].split()
+        parents.setdefault(int(fields[1]), []).append(pid)
+        info[pid] = (name, int(fields[21]) * page_size)
+    found = {}
+    todo = list(parents.get(os.getpid(), []))
+    while todo:
+        pid = todo.pop()
+        if pid in info and pid not in found:
+            found[pid] = info[pid]
+            todo.extend(parents.get(pid, []))
+    return found
+
+
+def browser_memory_mb():
+    """Resident memory of this process's children (the Playwright driver
+    and the browser), in MB; None where it can't be measured."""
+    children = _child_processes()
+    if not children:
+        return None
+    return sum(rss for _, rss in children.values()) / (1024 * 1024)
+
+
+def _kill_browser_processes():
+    """SIGKILL browser processes descended from this one (a wedged browser)."""
+    for pid, (name, _) in _child_processes().items():
+        if "chrom" in name.lower() or "headless" in name.lower():
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+
+async def _exchange(response):
+    """A captured XHR / fetch as a plain dict (see fixture_endpoint)."""
+    request = response.request
+    try:
+        body = await response.text()
+    except Exception:
+        body = None
+    return {
+        'request': {'url': request.url, 'method': request.method,
+                    'postData': request.post_data, 'headers': request.headers},
+        'status': response.status,
+        'content_type': response.headers.get('content-type', ''),
+        'body': body,
+    }
+
+
+class PageEngine:
+    """A pooled Playwright browser shared by the scrapers and ClubZap.
+
+    *launcher*, if given, is an async callable returning a browser-like
+    object (``new_context()`` / ``close()``), used instead of Chromium;
+    *memory_probe* returns the browser's memory in MB (or None).
+    """
+
+    close_timeout = BROWSER_CLOSE_TIMEOUT  # seconds before a browser is killed
+
+    def __init__(self, pool_size=BROWSER_POOL_SIZE, headless=BROWSER_HEADLESS,
+                 nav_timeout=BROWSER_NAV_TIMEOUT, script_timeout=BROWSER_SCRIPT_TIMEOUT,
+                 hang_grace=BROWSER_HANG_GRACE, recycle_pages=BROWSER_RECYCLE_PAGES,
+                 recycle_memory_mb=BROWSER_RECYCLE_MEMORY_MB, launcher=None,
+                 memory_probe=browser_memory_mb):
+        self.pool_size = pool_size
+        self.headless = headless
+        self.nav_timeout = nav_timeout
+        self.script_timeout = script_timeout
+        self.hang_grace = hang_grace
+        self.recycle_pages = recycle_pages
+        self.recycle_memory_mb = recycle_memory_mb
+        self.launcher = launcher
+        self.memory_probe = memory_probe
+        self.metrics = BrowserMetrics()
+        self.loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._playwright = None
+        self._browser = None
+        self._launching = None
+        self._slots = None
+        self._recycling = None
+        self._idle = []  # pages ready for the next lease
+        self._contexts = set()  # contexts handed out by new_context()
+        self._generation = 0  # bumped by every restart
+        self._pages_since_launch = 0
+
+    @property
+    def pages_rendered(self):
+        return self.metrics.pages
+
+    # ------------------------------------------------------------------
+    # Event loop
+    # ------------------------------------------------------------------
+    def _ensure_loop(self):
+        with self._lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self.loop.run_forever,
+                                                name="page-engine", daemon=True)
+                self._thread.start()
+        return self.loop
+
+    def run(self, coro, timeout=None):
+        """Run *coro* on the engine's loop and return its result.
+
+        If *timeout* seconds pass first, *coro* is cancelled and
+        TimeoutError raised.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("PageEngine.run() called from the engine's own "
+                               "loop; await the coroutine instead")
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    # ------------------------------------------------------------------
+    # Browser and page pool
+    # ------------------------------------------------------------------
+    @property
+    def started(self):
+        """Whether the browser has been launched."""
+        return self._browser is not None
+
+    async def browser(self):
+        """The browser, launched on first use."""
+        if self._browser is None:
+            if self._launching is None:
+                self._launching = asyncio.ensure_future(self._launch())
+            try:
+                self._browser = await asyncio.shield(self._launching)
+            except Exception:
+                self._launching = None
+                raise
+        return self._browser
+
+    async def _launch(self):
+        self._pages_since_launch = 0
+        if self.launcher is not None:
+            return await self.launcher()
+        self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu'])
+        print(f"Browser started (Chromium, {self.pool_size} pages at once)")
+        return browser
+
+    async def new_context(self, **options):
+        """A fresh browser context (cookies, storage) on the shared browser.
+
+        The browser isn't recycled for page count or memory while a
+        context from here is open; close it when done.
+        """
+        context = await self._new_context(**options)
+        self._contexts.add(context)
+        context.once('close', lambda _: self._contexts.discard(context))
+        return context
+
+    async def _new_context(self, **options):
+        browser = await self.browser()
+        options.setdefault('user_agent', USER_AGENT)
+        options.setdefault('viewport', BROWSER_VIEWPORT)
+        return await browser.new_context(**options)
+
+    async def _new_page(self):
+        context = await self._new_context()
+        page = await context.new_page()
+        page.set_default_navigation_timeout(self.nav_timeout * 1000)
+        page.set_default_timeout(self.script_timeout * 1000)
+        return page
+
+    def _pool(self):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+            self._recycling = asyncio.Lock()
+        return self._slots
+
+    @asynccontextmanager
+    async def lease(self):
+        """A pooled page for the duration of the block.
+
+        At most pool_size pages are leased at once.  A page whose block
+        raised (or was cancelled) is closed with its context rather than
+        reused.
+        """
+        self._pool()
+        await self._acquire_slot()
+        try:
+            generation = self._generation
+            page = self._idle.pop() if self._idle else await self._new_page()
+            try:
+                yield page
+            except BaseException:
+                await self._discard(page)
+                raise
+            if generation == self._generation:
+                self._idle.append(page)
+        finally:
+            self._slots.release()
+
+    async def _discard(self, page):
+        try:
+            await asyncio.wait_for(page.context.close(), self.close_timeout)
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # Watchdog
+    # ------------------------------------------------------------------
+    async def recycle(self, reason, url=None):
+        """Kill the browser now; the next page relaunches it.
+
+        Pages in flight on the old browser fail and are retried by
+        arender().  Recorded in metrics with *reason*.
+        """
+        memory = self.memory_probe() if self.memory_probe else None
+        browser, playwright = self._browser, self._playwright
+        self.metrics.record_recycle(reason, self._pages_since_launch, memory, url)
+        print(f"Restarting browser ({reason}) after {self._pages_since_launch} pages"
+              + (f", {memory:.0f} MB" if memory is not None else ""))
+        self._browser = self._playwright = self._launching = None
+        self._idle = []
+        self._contexts.clear()
+        self._generation += 1
+        self._pages_since_launch = 0
+        if browser is not None:
+            try:
+                await asyncio.wait_for(browser.close(), self.close_timeout)
+            except Exception as e:
+                print(f"Browser didn't close ({type(e).__name__}); killing it")
+                _kill_browser_processes()
+        if playwright is not None:
+            try:
+                await asyncio.wait_for(playwright.stop(), self.close_timeout)
+            except Exception:
+                pass
+
+    def _recycle_reason(self):
+        """Why the browser should be recycled now, or None."""
+        if self._browser is None or self._contexts:
+            return None
+        if self.recycle_pages and self._pages_since_launch >= self.recycle_pages:
+            return "pages"
+        if self.recycle_memory_mb and self.memory_probe:
+            memory = self.memory_probe()
+            if memory is not None and memory >= self.recycle_memory_mb:
+                return "memory"
+        return None
+
+    async def _acquire_slot(self):
+        """Take a pool slot, recycling the browser first if one is due.
+
+        The task that finds a recycle due drains the pool (waits for
+        every other slot) before restarting the browser; tasks arriving
+        meanwhile give their slot back and wait for the restart.
+        """
+        while True:
+            await self._slots.acquire()
+            reason = self._recycle_reason()
+            if reason is None:
+                return
+            if self._recycling.locked():
+                self._slots.release()
+                async with self._recycling:
+                    continue
+            async with self._recycling:
+                for _ in range(self.pool_size - 1):
+                    await self._slots.acquire()
+                try:
+                    if self._browser is not None:
+                        await self.recycle(reason)
+                finally:
+                    for _ in range(self.pool_size - 1):
+                        self._slots.release()
+            return
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+    def render_deadline(self, wait_for=None, wait_timeout=None):
+        """Seconds after which a render's browser is taken to be hung.
+
+        Every step of a render has its own limit (navigation, the selector
+        wait, reading the page back); a render outlasting all of them plus
+        hang_grace isn't slow but stuck.
+        """
+        deadline = self.nav_timeout + self.script_timeout + self.hang_grace
+        if wait_for:
+            deadline += wait_timeout if wait_timeout is not None else self.nav_timeout
+        return deadline
+
+    async def arender(self, url, wait_for=None, wait_timeout=None, capture=False):
+        """Load *url* in a pooled page and return a RenderedPage.
+
+        *wait_for* is a CSS selector to wait for (attached, not
+        necessarily visible: SportLomo hides inactive tabs) for up to
+        *wait_timeout* seconds.  With *capture*, the page's XHR / fetch
+        exchanges are recorded.  A hung attempt restarts the browser and
+        is retried once; PageHung is raised if the retry hangs too.
+        """
+        deadline = self.render_deadline(wait_for, wait_timeout)
+        for attempt in (1, 2):
+            self._pool()
+            generation = self._generation
+            try:
+                page = await self._render_once(url, wait_for, wait_timeout, capture,
+                                               deadline)
+            except asyncio.TimeoutError:
+                print(f"Page hung for over {deadline:.0f}s: {url}")
+                if generation == self._generation:
+                    await self.recycle("hang", url=url)
+                if attempt == 2:
+                    raise PageHung(f"{url} hung before and after a browser restart")
+            except Exception:
+                # Failed because a restart closed its page: try again
+                if attempt == 2 or generation == self._generation:
+                    raise
+            else:
+                return page
+            self.metrics.retries += 1
+            print(f"Retrying {url}")
+
+    async def _render_once(self, url, wait_for, wait_timeout, capture, deadline):
+        """One attempt at arender() on a leased page.
+
+        The watchdog's *deadline* starts once the page is leased: time
+        spent queued for a pool slot isn't the browser hanging.
+        """
+        async with self.lease() as page:
+            html, exchanges, found = await asyncio.wait_for(
+                self._load(page, url, wait_for, wait_timeout, capture), deadline)
+            # Counted before the slot is freed, for the next lease's recycle check
+            self.metrics.pages += 1
+            self._pages_since_launch += 1
+        return RenderedPage(url, html, exchanges, found)
+
+    async def _load(self, page, url, wait_for, wait_timeout, capture):
+        """(html, exchanges, found) for *url*, loaded in *page*."""
+        pending = []
+
+        def on_response(response):
+            if response.request.resource_type in _CAPTURED_TYPES:
+                pending.append(asyncio.ensure_future(_exchange(response)))
+
+        if capture:
+            page.on('response', on_response)
+        try:
+            await page.goto(url, wait_until='domcontentloaded')
+            found = True
+            if wait_for:
+                timeout = wait_timeout if wait_timeout is not None else self.nav_timeout
+                try:
+                    await page.wait_for_selector(wait_for, state='attached',
+                                                 timeout=timeout * 1000)
+                except PlaywrightTimeout:
+                    found = False
+            html = await asyncio.wait_for(page.content(), self.script_timeout)
+        except asyncio.TimeoutError:
+            raise PlaywrightTimeout(f"reading {url} took over "
+                                    f"{self.script_timeout}s")
+        finally:
+            if capture:
+                page.remove_listener('response', on_response)
+        exchanges = [e for e in await asyncio.gather(*pending) if e['body'] is not None]
+        return html, exchanges, found
+
+    def render(self, url, timeout=None, **kwargs):
+        """Blocking arender(); errors (navigation timeouts, ...) are raised.
+
+        With *timeout*, the render is cancelled after that many seconds
+        (retry included) and TimeoutError raised.
+        """
+        return self.run(self.arender(url, **kwargs), timeout)
+
+    async def arender_many(self, urls, **kwargs):
+        results = await asyncio.gather(*(self.arender(url, **kwargs) for url in urls),
+                                       return_exceptions=True)
+        pages = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                print(f"Could not render {url}: {result}")
+                result = None
+            pages.append(result)
+        return pages
+
+    def render_many(self, urls, **kwargs):
+        """Render *urls* in parallel tabs; a list of RenderedPage (None on error)."""
+        return self.run(self.arender_many(list(urls), **kwargs))
+
+    # ------------------------------------------------------------------
+    # Shutdown
+    # ------------------------------------------------------------------
+    async def aclose(self):
+        for page in self._idle:
+            await self._discard(page)
+        self._idle = []
+        if self._browser is not None:
+            try:
+                await asyncio.wait_for(self._browser.close(), self.close_timeout)
+            except Exception as e:
+                print(f"Error closing browser ({type(e).__name__}); killing it")
+                _kill_browser_processes()
+            self._browser = None
+            self._launching = None
+        if self._playwright is not None:
+            try:
+                await asyncio.wait_for(self._playwright.stop(), self.close_timeout)
+            except Exception:
+                pass
+            self._playwright = None
+
+    def close(self):
+        """Close the browser and stop the engine's loop."""
+        if self.loop is None:
+            return
+        try:
+            self.run(self.aclose(), timeout=4 * self.close_timeout)
+        except Exception as e:
+            print(f"Browser shutdown timed out: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=self.close_timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+        self.loop = None
+        self._thread = None
+        self._slots = None
+        self._recycling = None
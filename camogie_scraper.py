@@ -6,50 +6,118 @@ inside WordPress pages.  Each fixture is an <article class="foireann-card">
 containing round, date/time, team names, scores, division, and venue.
 
 No Selenium is needed — plain HTTP requests + regex extraction.
+
+League pages are fetched concurrently through the shared HTTP client
+(corkcamogie.com's incomplete certificate chain is handled there).  Each
+page's ETag / Last-Modified validators and last parse are kept in a small
+JSON cache (CAMOGIE_CACHE_FILE): a 304, or a 200 whose body hashes the
+same as last time, reuses the cached parse instead of re-parsing.  One
+parse holds every card (with scores) and the standings tables, so the
+competition monitor's camogie adapter uses the same fetch.
 """
 
+import copy
+import functools
+import hashlib
+import json
+import os
 import re
-import warnings
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from html import unescape
 
 import requests
 
-from config import CAMOGIE_LEAGUES, CLUB_NAME
+from config import CAMOGIE_CACHE_FILE, CAMOGIE_LEAGUES, CLUB_NAME
+from gaa_utils import gaa_total
+from http_client import get_client
 
-# Suppress only the InsecureRequestWarning from urllib3 (corkcamogie.com cert)
-warnings.filterwarnings("ignore", message="Unverified HTTPS request")
+_TIMEOUT = 20  # seconds
+_MAX_WORKERS = 4  # concurrent league page fetches
 
-_HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    ),
-}
+_cache_lock = threading.Lock()
+_default_cache = None
 
-# ── HTML parsing helpers ────────────────────────────────────────────────
 
+class LeagueCache:
+    """Per-league validators and last parse, persisted as JSON.
+
+    Entries are keyed by page URL:
+        {"etag", "last_modified", "body_hash", "page"}
+    where "page" is the parse_league_page() output for that body.
+    Thread-safe; every update is written straight to disk.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (json.JSONDecodeError, ValueError):
+                self.entries = {}
+
+    def get(self, url):
+        with self._lock:
+            return self.entries.get(url)
+
+    def put(self, url, entry):
+        with self._lock:
+            self.entries[url] = entry
+            if self.path:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self.entries, f)
+
+
+def _get_default_cache():
+    global _default_cache
+    with _cache_lock:
+        if _default_cache is None:
+            _default_cache = LeagueCache(CAMOGIE_CACHE_FILE)
+        return _default_cache
 
-def _extract_text(pattern, html, default=""):
-    """Return first regex capture group, stripped & unescaped, or *default*."""
-    m = re.search(pattern, html, re.DOTALL)
-    return unescape(m.group(1).strip()) if m else default
 
+# ── HTML parsing helpers ────────────────────────────────────────────────
 
+# Every token the parser needs sits in a "foireann-*" class, so one
+# alternation with that literal prefix scans a page once (the regex engine
+# can skip straight to each "foireann-") instead of re.split plus several
+# searches per card.  Division/Venue are the <strong> labels inside a
+# foireann-card-detail element; the card start is confirmed against the
+# full <article class="foireann-card"> tag in _is_card_start.
+_CARD_TOKEN_RE = re.compile(
+    r'foireann-(?:'
+    r'(?P<card>card">)'
+    r'|card-date[^>]*>(?P<date>[^<]*)<'
+    r'|team-name[^>]*>(?P<team>[^<]*)<'
+    r'|score-badge[^>]*>(?P<score>[^<]*)<'
+    r'|card-detail[^>]*>(?:\s*<(?!strong>)[^>]*>)*\s*<strong>'
+    r'(?P<label>Division|Venue):</strong>\s*(?P<detail>[^<]*)<'
+    r')'
+)
+_ARTICLE_OPEN_RE = re.compile(r'<article\s+class="')
+_TRAILING_TEAM_NUMBER_RE = re.compile(r"\s+\d+$")
+
+_DATETIME_FORMATS = (
+    "%a %d %b %Y %I:%M %p",   # Mon 30 Mar 2026 6:00 pm
+    "%a %d %b %Y %I:%M%p",    # Mon 30 Mar 2026 6:00pm
+    "%d %b %Y %I:%M %p",      # 30 Mar 2026 6:00 pm
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_datetime(raw):
     """Parse a Foireann date string like 'Mon 30 Mar 2026 6:00 pm'.
 
     Returns (date_str, time_str) in the formats used by the GAA Cork
-    scraper: date = '30 Mar 2026', time = '18:00'.
+    scraper: date = '30 Mar 2026', time = '18:00'.  Memoised: a league
+    page repeats the same few match dates many times.
     """
     raw = raw.strip()
-    # Try the standard Foireann format: "Day DD Mon YYYY H:MM am/pm"
-    for fmt in (
-        "%a %d %b %Y %I:%M %p",   # Mon 30 Mar 2026 6:00 pm
-        "%a %d %b %Y %I:%M%p",    # Mon 30 Mar 2026 6:00pm
-        "%d %b %Y %I:%M %p",      # 30 Mar 2026 6:00 pm
-    ):
+    for fmt in _DATETIME_FORMATS:
         try:
             dt = datetime.strptime(raw, fmt)
             return dt.strftime("%d %b %Y"), dt.strftime("%H:%M")
@@ -59,57 +127,310 @@ def _parse_datetime(raw):
     return raw, ""
 
 
-def parse_fixture_cards(html, club_name):
-    """Parse all Foireann fixture cards from *html*.
+def _clean(value):
+    return unescape(value.strip()) if value is not None else ""
+
+
+def _is_card_start(html, pos):
+    """True if the 'foireann-card">' at *pos* closes an <article class=" tag."""
+    start = html.rfind("<article", 0, pos)
+    return start != -1 and _ARTICLE_OPEN_RE.fullmatch(html, start, pos) is not None
+
+
+def _finish_card(club, date, teams, scores, division, venue, fixtures,
+                 with_scores=False):
+    """Append the fixture dict for one tokenised card, if it qualifies."""
+    date_raw = _clean(date)
+    if not date_raw:
+        return
+    date_str, time_str = _parse_datetime(date_raw)
+
+    home = _clean(teams[0]) if len(teams) > 0 else ""
+    away = _clean(teams[1]) if len(teams) > 1 else ""
+
+    # Only keep fixtures involving our club
+    if club and club not in home.lower() and club not in away.lower():
+        return
+
+    venue = _clean(venue)
+    if not venue:
+        # Default to home team name (strip trailing team number)
+        venue = _TRAILING_TEAM_NUMBER_RE.sub("", home)
+
+    fixture = {
+        "home": home,
+        "away": away,
+        "date": date_str,
+        "time": time_str,
+        "venue": venue,
+        "competition": _clean(division),
+        "referee": "",
+        # Results cards carry score badges (the same fixture also appears
+        # once as upcoming); callers use this to tell them apart.
+        "_has_score": any(s.strip() for s in scores),
+    }
+    if with_scores and fixture["_has_score"]:
+        fixture["home_score"] = _clean(scores[0]) if len(scores) > 0 else ""
+        fixture["away_score"] = _clean(scores[1]) if len(scores) > 1 else ""
+    fixtures.append(fixture)
 
-    Returns a list of fixture dicts for matches involving *club_name*.
+
+def parse_fixture_cards(html, club_name=None, with_scores=False):
+    """Parse all Foireann fixture cards from *html* in a single pass.
+
+    Returns a list of fixture dicts for matches involving *club_name*, or
+    for every card when *club_name* is empty (all divisions).
     Each dict has the same keys as the GAA Cork selenium scraper output:
         home, away, date, time, venue, competition, referee
+    With *with_scores*, scored cards also get home_score / away_score.
     """
+    club = club_name.lower() if club_name else None
     fixtures = []
-    cards = re.split(r"<article\s+class=\"foireann-card\">", html)
-    for card in cards[1:]:  # first chunk is before the first card
-        date_raw = _extract_text(r'foireann-card-date[^>]*>([^<]*)<', card)
-        if not date_raw:
-            continue
-        date_str, time_str = _parse_datetime(date_raw)
+    in_card = False
+    date = division = venue = None
+    teams, scores = [], []
+    for m in _CARD_TOKEN_RE.finditer(html):
+        kind = m.lastgroup
+        if kind == "card":
+            if not _is_card_start(html, m.start()):
+                continue
+            if in_card:
+                _finish_card(club, date, teams, scores, division, venue,
+                             fixtures, with_scores)
+            in_card = True
+            date = division = venue = None
+            teams, scores = [], []
+        elif not in_card:
+            continue  # before the first card
+        elif kind == "team":
+            teams.append(m.group("team"))
+        elif kind == "score":
+            scores.append(m.group("score"))
+        elif kind == "date":
+            if date is None:  # first date wins
+                date = m.group("date")
+        elif m.group("label") == "Division":
+            if division is None:
+                division = m.group("detail")
+        elif venue is None:
+            venue = m.group("detail")
+    if in_card:
+        _finish_card(club, date, teams, scores, division, venue, fixtures,
+                     with_scores)
+    return fixtures
+
+
+# Standings widget: a <table> with a foireann class, one <tr> per team.
+_STANDINGS_TABLE_RE = re.compile(
+    r'<table[^>]*class="[^"]*foireann[^"]*"[^>]*>(.*?)</table>', re.DOTALL)
+_ROW_RE = re.compile(r'<tr[^>]*>(.*?)</tr>', re.DOTALL)
+_CELL_RE = re.compile(r'<t([hd])[^>]*>(.*?)</t[hd]>', re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_GAA_SCORE_RE = re.compile(r'^\d+-\d+$')
+
+# Header text -> table row key (as in CompetitionScraper's table rows)
+_STANDINGS_COLUMNS = {
+    "pos": "position", "position": "position", "#": "position",
+    "team": "team", "club": "team",
+    "p": "played", "pld": "played", "played": "played", "gp": "played",
+    "w": "won", "won": "won",
+    "d": "drawn", "drawn": "drawn", "draw": "drawn",
+    "l": "lost", "lost": "lost",
+    "f": "pf", "pf": "pf", "for": "pf", "sf": "pf",
+    "a": "pa", "pa": "pa", "against": "pa", "sa": "pa",
+    "pd": "pd", "diff": "pd", "+/-": "pd", "sd": "pd", "score diff": "pd",
+    "pts": "pts", "points": "pts",
+}
+_NUMERIC_ORDER = ["played", "won", "drawn", "lost", "pf", "pa", "pd", "pts"]
+
+
+def _to_int(text):
+    """Cell text to int; GAA scores ('5-40') become total points."""
+    text = text.strip().lstrip("+")
+    if _GAA_SCORE_RE.match(text):
+        return gaa_total(text)
+    return int(text) if text.lstrip("-").isdigit() else None
+
+
+def _standings_row(texts, columns, idx):
+    """Build a table row dict from cell texts, by header or by position."""
+    row = {"position": idx, "team": "", "played": 0, "won": 0, "drawn": 0,
+           "lost": 0, "pf": 0, "pa": 0, "pd": 0, "pts": 0}
+    if columns:
+        for key, text in zip(columns, texts):
+            if key == "team":
+                row["team"] = text
+            elif key:
+                value = _to_int(text)
+                if value is not None:
+                    row[key] = value
+    else:
+        # No header: [pos] team played won drawn lost ... pts
+        offset = 1 if texts and texts[0].isdigit() else 0
+        if offset:
+            row["position"] = int(texts[0])
+        row["team"] = texts[offset] if offset < len(texts) else ""
+        nums = [n for n in map(_to_int, texts[offset + 1:]) if n is not None]
+        if len(nums) < 5:
+            return None
+        row.update(zip(_NUMERIC_ORDER, nums))
+        row["pts"] = nums[7] if len(nums) > 7 else nums[-1]
+    if not row["team"] or row["team"].lower() == "team":
+        return None
+    return row
+
+
+def parse_standings(html):
+    """Parse every Foireann standings table on the page.
+
+    Returns a list of tables, each a list of row dicts with the keys used
+    by CompetitionScraper: position, team, played, won, drawn, lost, pf,
+    pa, pd, pts.
+    """
+    tables = []
+    for table_match in _STANDINGS_TABLE_RE.finditer(html):
+        columns = None
+        rows = []
+        for row_match in _ROW_RE.finditer(table_match.group(1)):
+            cells = _CELL_RE.findall(row_match.group(1))
+            texts = [unescape(_TAG_RE.sub("", text)).strip() for _, text in cells]
+            if cells and all(kind == "h" for kind, _ in cells):
+                columns = [_STANDINGS_COLUMNS.get(t.lower()) for t in texts]
+                continue
+            if len(texts) < 4:
+                continue
+            row = _standings_row(texts, columns, len(rows) + 1)
+            if row:
+                rows.append(row)
+        if rows:
+            tables.append(rows)
+    return tables
+
+
+def parse_league_page(html):
+    """Everything the monitors use from one league page.
+
+    Returns {"cards": [...], "standings": [...]}: every fixture card (all
+    divisions, with scores) and every standings table.
+    """
+    return {
+        "cards": parse_fixture_cards(html, None, with_scores=True),
+        "standings": parse_standings(html),
+    }
 
-        teams = re.findall(r'foireann-team-name[^>]*>([^<]*)<', card)
-        home = unescape(teams[0].strip()) if len(teams) > 0 else ""
-        away = unescape(teams[1].strip()) if len(teams) > 1 else ""
 
-        # Only keep fixtures involving our club
-        if club_name.lower() not in home.lower() and club_name.lower() not in away.lower():
+def fetch_league_page(url, session=None, cache=None):
+    """Fetch one league page and return parse_league_page() output.
+
+    Sends If-None-Match / If-Modified-Since from the cached validators.  A
+    304, or a body identical to the cached one, returns a copy of the
+    cached parse without re-parsing.  Raises requests.RequestException if
+    the page can't be fetched.
+    """
+    session = session or get_client()
+    cache = cache if cache is not None else _get_default_cache()
+    entry = cache.get(url)
+    if entry and "page" not in entry:
+        entry = None  # written by an older version; refetch in full
+
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = session.get(url, headers=headers, timeout=_TIMEOUT)
+    if resp.status_code == 304 and entry:
+        print(f"Camogie: {url} not modified (304)")
+        return copy.deepcopy(entry["page"])
+    resp.raise_for_status()
+
+    body_hash = hashlib.sha256(resp.content).hexdigest()
+    if entry and entry.get("body_hash") == body_hash:
+        page = entry["page"]
+    else:
+        page = parse_league_page(resp.text)
+
+    cache.put(url, {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "body_hash": body_hash,
+        "page": page,
+    })
+    return copy.deepcopy(page)
+
+
+def involves_club(card, club_name):
+    """True if *club_name* is the home or away team (case-insensitive substring)."""
+    club = club_name.lower()
+    return club in card["home"].lower() or club in card["away"].lower()
+
+
+def fetch_league_cards(league, session=None, cache=None):
+    """Fetch one league page and return the cards involving its club.
+
+    Same output as parse_fixture_cards(html, league["club_name"]).
+    """
+    page = fetch_league_page(league["url"], session=session, cache=cache)
+    cards = []
+    for card in page["cards"]:
+        if involves_club(card, league["club_name"]):
+            card.pop("home_score", None)
+            card.pop("away_score", None)
+            cards.append(card)
+    return cards
+
+
+def fixture_key(fx):
+    """De-duplication key for a camogie fixture: (date, home, away).
+
+    The competition is left out: the same match can be listed on more
+    than one league page under different names.
+    """
+    return (fx["date"], fx["home"].lower(), fx["away"].lower())
+
+
+def _league_fixtures(league, cards, seen):
+    """Turn one league's parsed cards into monitor fixture dicts."""
+    competition = league.get("competition", "")
+    fixtures = []
+    for fx in cards:
+        # De-duplicate: fixture cards sometimes appear twice (once as
+        # upcoming, once with scores).  Keep the most informative one.
+        key = fixture_key(fx)
+        if key in seen:
             continue
+        seen.add(key)
 
-        division = _extract_text(r"Division:</strong>\s*([^<]*)<", card)
-        venue = _extract_text(r"Venue:</strong>\s*([^<]*)<", card)
-        if not venue:
-            # Default to home team name (strip trailing team number)
-            venue = re.sub(r"\s+\d+$", "", home)
-
-        # Skip duplicate results cards (same fixture appears once as upcoming,
-        # once with scores when played).  We detect results by score badges.
-        scores = re.findall(r'foireann-score-badge[^>]*>([^<]*)<', card)
-        has_score = any(s.strip() for s in scores)
-
-        fixtures.append({
-            "home": home,
-            "away": away,
-            "date": date_str,
-            "time": time_str,
-            "venue": venue,
-            "competition": division,
-            "referee": "",
-            "_has_score": has_score,
-        })
+        # Use the friendly competition name from config if available
+        if competition:
+            fx["competition"] = competition
 
+        fx["team"] = league["team"]
+        fx.pop("_has_score", None)  # internal helper key
+        fixtures.append(fx)
     return fixtures
 
 
-def scrape_camogie_fixtures(leagues=None):
+def scrape_camogie_league(league, seen=None, session=None, cache=None):
+    """Fetch and parse one league page from CAMOGIE_LEAGUES.
+
+    Returns the fixture dicts for that league (with 'team' set and helper
+    keys stripped).  *seen* is an optional set of de-duplication keys shared
+    across leagues.  Raises requests.RequestException if the page can't be
+    fetched.
+    """
+    cards = fetch_league_cards(league, session=session, cache=cache)
+    print(f"Camogie: {len(cards)} fixtures for {league['club_name']} "
+          f"from {league['url']}")
+    return _league_fixtures(league, cards, set() if seen is None else seen)
+
+
+def scrape_camogie_fixtures(leagues=None, session=None, cache=None):
     """Scrape all configured camogie league pages and return fixture dicts.
 
+    Pages are fetched concurrently; results are merged in league order.
     Each returned dict has the standard keys (home, away, date, time, venue,
     competition, referee) plus 'team' (the pre-mapped ClubZap team name).
 
@@ -117,47 +438,34 @@ def scrape_camogie_fixtures(leagues=None):
     ----------
     leagues : list[dict] | None
         Override the league list from config (useful for testing).
+    session : http_client.HttpClient | requests.Session | None
+        Override the shared HTTP client.
+    cache : LeagueCache | None
+        Override the on-disk validator/parse cache (CAMOGIE_CACHE_FILE).
     """
     if leagues is None:
         leagues = CAMOGIE_LEAGUES
+    if not leagues:
+        return []
 
-    all_fixtures = []
-    seen = set()  # de-duplicate across fixture/result cards
-
-    for league in leagues:
-        url = league["url"]
-        team_name = league["team"]
-        club_name = league["club_name"]
-        competition = league.get("competition", "")
-
+    def fetch(league):
         try:
-            resp = requests.get(url, headers=_HEADERS, timeout=20, verify=False)
-            resp.raise_for_status()
+            return fetch_league_cards(league, session=session, cache=cache)
         except requests.RequestException as e:
-            print(f"WARNING: Could not fetch {url}: {e}")
-            continue
-
-        cards = parse_fixture_cards(resp.text, club_name)
-        print(f"Camogie: {len(cards)} fixtures for {club_name} from {url}")
-
-        for fx in cards:
-            # De-duplicate: fixture cards sometimes appear twice (once as
-            # upcoming, once with scores).  Keep the most informative one.
-            key = (fx["date"], fx["home"].lower(), fx["away"].lower())
-            if key in seen:
-                continue
-            seen.add(key)
+            print(f"WARNING: Could not fetch {league['url']}: {e}")
+            return None
 
-            # Use the friendly competition name from config if available
-            if competition:
-                fx["competition"] = competition
+    with ThreadPoolExecutor(max_workers=min(len(leagues), _MAX_WORKERS)) as pool:
+        all_cards = list(pool.map(fetch, leagues))
 
-            fx["team"] = team_name
-            all_fixtures.append(fx)
-
-    # Strip internal helper keys
-    for fx in all_fixtures:
-        fx.pop("_has_score", None)
+    all_fixtures = []
+    seen = set()  # de-duplicate across fixture/result cards
+    for league, cards in zip(leagues, all_cards):
+        if cards is None:
+            continue
+        print(f"Camogie: {len(cards)} fixtures for {league['club_name']} "
+              f"from {league['url']}")
+        all_fixtures.extend(_league_fixtures(league, cards, seen))
 
     print(f"Camogie: {len(all_fixtures)} total fixtures across {len(leagues)} leagues")
     return all_fixtures
@@ -166,6 +474,16 @@ def scrape_camogie_fixtures(leagues=None):
 # ── Standalone test ─────────────────────────────────────────────────────
 
 if __name__ == "__main__":
+    import argparse
+
+    from config import HTTP_CACHE_MODE
+    from response_cache import CACHE_MODES
+
+    parser = argparse.ArgumentParser(description="Scrape Cork Camogie league fixtures")
+    parser.add_argument("--cache-mode", choices=CACHE_MODES, default=HTTP_CACHE_MODE,
+                        help="On-disk HTTP response cache (offline-only: no network)")
+    get_client().set_cache_mode(parser.parse_args().cache_mode)
+
     fixtures = scrape_camogie_fixtures()
     for fx in fixtures:
         print(
@@ -0,0 +1,239 @@
+"""
+Concurrent, resumable crawler for gaacork.ie club profiles.
+
+Builds the county-wide club directory (output/gaa_clubs.csv) on top of
+GAAClubScraper.extract_club_info:
+
+  - a bounded worker pool fetches several profiles at once, while the
+    shared HTTP client's per-host token bucket keeps gaacork.ie at its
+    configured rate however many workers there are;
+  - progress is saved to CLUB_CRAWL_STATE_FILE as clubs complete, so an
+    interrupted crawl resumes where it stopped;
+  - re-crawls are incremental: each profile is requested with the stored
+    ETag / Last-Modified, and a page whose fingerprint (its HTML minus
+    scripts, comments and whitespace) hasn't changed keeps its previous
+    record instead of being re-parsed.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import requests
+
+from config import CLUB_CRAWL_STATE_FILE, CLUB_CRAWL_WORKERS, TIMEOUT
+from scraper import GAAClubScraper
+
+SAVE_EVERY = 10  # clubs between state saves
+
+_VOLATILE_RE = re.compile(r"<script\b.*?</script>|<!--.*?-->", re.DOTALL | re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+_BETWEEN_TAGS_RE = re.compile(r">\s+<")
+
+
+def page_fingerprint(html):
+    """Hash of a page's markup, ignoring scripts, comments and whitespace.
+
+    WordPress pages embed per-request nonces in inline scripts; leaving
+    them out means an unchanged profile fingerprints the same each time.
+    """
+    stable = _VOLATILE_RE.sub("", html)
+    stable = _WHITESPACE_RE.sub(" ", _BETWEEN_TAGS_RE.sub("><", stable)).strip()
+    return hashlib.sha256(stable.encode("utf-8")).hexdigest()[:16]
+
+
+class CrawlState:
+    """Crawl progress and per-club results, persisted as JSON.
+
+    Layout:
+        {"run": {"started_at", "finished_at", "done": [club_id, ...],
+                 "failed": [club_id, ...]},
+         "clubs": {club_id: {"url", "etag", "last_modified",
+                             "fingerprint", "crawled_at", "checked_at",
+                             "data"}}}
+    Club IDs are stored as strings (JSON keys).  A run that finished
+    with failures keeps them in "failed" so the next resumed crawl retries
+    just those.  Thread-safe.
+    """
+
+    def __init__(self, path=CLUB_CRAWL_STATE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.run = {}
+        self.clubs = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+            self.run = saved.get("run", {})
+            self.clubs = saved.get("clubs", {})
+
+    @property
+    def interrupted(self):
+        """True if the last crawl started but never finished."""
+        return bool(self.run) and not self.run.get("finished_at")
+
+    @property
+    def failed(self):
+        """Club IDs the last crawl couldn't fetch or parse."""
+        return list(self.run.get("failed", []))
+
+    def start_run(self, resume=True):
+        """Begin a crawl; returns the club IDs already done if resuming.
+
+        Resuming picks up an interrupted crawl, or one that finished with
+        failures, so only the clubs it didn't complete are crawled.
+        """
+        with self._lock:
+            if resume and (self.interrupted or self.run.get("failed")):
+                self.run.update(finished_at=None, failed=[])
+                return set(self.run.get("done", []))
+            self.run = {"started_at": datetime.now().isoformat(),
+                        "finished_at": None, "done": [], "failed": []}
+            return set()
+
+    def get(self, club_id):
+        with self._lock:
+            return self.clubs.get(str(club_id))
+
+    def update(self, club_id, entry):
+        """Record a finished club; returns how many are done this run."""
+        with self._lock:
+            self.clubs[str(club_id)] = entry
+            self.run["done"].append(str(club_id))
+            return len(self.run["done"])
+
+    def fail(self, club_id):
+        with self._lock:
+            self.run.setdefault("failed", []).append(str(club_id))
+
+    def finish_run(self):
+        with self._lock:
+            self.run["finished_at"] = datetime.now().isoformat()
+
+    def save(self):
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"run": self.run, "clubs": self.clubs}, f)
+            os.replace(tmp, self.path)
+
+
+class ClubCrawler:
+    """Crawl many club profiles concurrently, resumably and incrementally."""
+
+    def __init__(self, scraper=None, state=None, workers=CLUB_CRAWL_WORKERS,
+                 log=print):
+        self.scraper = scraper or GAAClubScraper()
+        self.state = state if state is not None else CrawlState()
+        self.workers = max(1, workers)
+        self.log = log
+
+    def crawl(self, club_ids, competition_id=None, team_id=None, resume=True,
+              full=False):
+        """Crawl *club_ids* and return a report dict.
+
+        Args:
+            resume: skip clubs already done by an interrupted crawl, or by
+                one that finished with failures (retrying just those).
+            full: ignore stored validators and fingerprints; re-parse all.
+
+        Report keys: clubs, skipped (resumed), parsed, unchanged (same
+        fingerprint), not_modified (304), failed (list of IDs), bytes,
+        elapsed, clubs_per_sec.
+        """
+        done = self.state.start_run(resume=resume)
+        todo = [c for c in club_ids if str(c) not in done]
+        report = {"clubs": len(club_ids), "skipped": len(club_ids) - len(todo),
+                  "parsed": 0, "unchanged": 0, "not_modified": 0,
+                  "failed": [], "bytes": 0}
+        if report["skipped"]:
+            self.log(f"Resuming: {report['skipped']} clubs already done")
+
+        start = time.monotonic()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers,
+                                    thread_name_prefix="crawl") as pool:
+                futures = {
+                    pool.submit(self._crawl_one, club_id, competition_id,
+                                team_id, full): club_id
+                    for club_id in todo
+                }
+                for future in as_completed(futures):
+                    club_id = futures[future]
+                    try:
+                        outcome, nbytes, entry = future.result()
+                    except Exception as e:
+                        # A network error or a profile the parser chokes
+                        # on; either way the rest of the crawl carries on
+                        stage = "crawl" if isinstance(e, requests.RequestException) \
+                            else "parse"
+                        self.log(f"Failed to {stage} club {club_id}: {e}")
+                        report["failed"].append(club_id)
+                        self.state.fail(club_id)
+                        continue
+                    report[outcome] += 1
+                    report["bytes"] += nbytes
+                    if self.state.update(club_id, entry) % SAVE_EVERY == 0:
+                        self.state.save()
+            # Failures are kept in the run for the next crawl to retry
+            self.state.finish_run()
+        finally:
+            self.state.save()
+        report["elapsed"] = time.monotonic() - start
+        crawled = len(todo) - len(report["failed"])
+        report["clubs_per_sec"] = (crawled / report["elapsed"]
+                                   if report["elapsed"] > 0 else 0.0)
+        return report
+
+    def _crawl_one(self, club_id, competition_id, team_id, full):
+        """Fetch one profile; returns (outcome, bytes, state entry)."""
+        url = self.scraper.club_profile_url(club_id, competition_id, team_id)
+        previous = None if full else self.state.get(club_id)
+        if previous and previous.get("url") != url:
+            previous = None
+
+        headers = {}
+        if previous:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        resp = self.scraper.session.get(url, headers=headers, timeout=TIMEOUT)
+        now = datetime.now().isoformat()
+        if resp.status_code == 304 and previous:
+            return "not_modified", 0, dict(previous, checked_at=now)
+        resp.raise_for_status()
+
+        entry = {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "fingerprint": page_fingerprint(resp.text),
+            "checked_at": now,
+        }
+        if previous and previous.get("fingerprint") == entry["fingerprint"]:
+            entry.update(crawled_at=previous["crawled_at"], data=previous["data"])
+            return "unchanged", len(resp.content), entry
+
+        soup = self.scraper.parse_html(resp.content)
+        data = self.scraper.extract_club_info(soup, url, competition_id, team_id)
+        entry.update(crawled_at=now, data=data)
+        return "parsed", len(resp.content), entry
+
+    def records(self, club_ids):
+        """Club data dicts for *club_ids* (in order) that have been crawled."""
+        records = []
+        for club_id in club_ids:
+            entry = self.state.get(club_id)
+            if entry and entry.get("data"):
+                records.append(entry["data"])
+        return records
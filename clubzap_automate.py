@@ -9,6 +9,13 @@ Usage:
   py clubzap_automate.py upload           -> upload new fixtures CSV only
   py clubzap_automate.py edit             -> edit changed fixtures only
   py clubzap_automate.py delete           -> delete removed fixtures only
+  py clubzap_automate.py reconcile        -> re-read the whole ClubZap fixture list
+                                             into the saved fixture-ID map
+
+Fixture IDs are kept between runs (see clubzap_fixture_map.py), so edits
+and deletes normally only need the top of the fixture list re-read.  A
+fixture page that 404s means a saved ID is out of date: the whole list is
+re-read and the fixture tried again under its current ID.
 
 Requires environment variables:
   CLUBZAP_EMAIL    - ClubZap login email
@@ -19,15 +26,50 @@ import asyncio
 import csv
 import os
 import sys
-import re
+import time
 from datetime import datetime
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 
+from browser_engine import PageEngine
+from clubzap_fixture_map import FixtureIdMap, parse_date
 from config import (
     CLUBZAP_BASE_URL as BASE_URL, CLUBZAP_FIXTURES_URL as FIXTURES_URL,
-    BASELINE_CSV, NEW_CSV, CHANGED_CSV, REMOVED_CSV,
+    BASELINE_CSV, NEW_CSV, CHANGED_CSV, REMOVED_CSV, CLUBZAP_PAGE_TABS,
+    CLUBZAP_WAIT_TIMEOUTS, CLUBZAP_WORKERS, CLUBZAP_RETRIES,
 )
 
+# Requests that submit a form (Rails sends PATCH / DELETE as POST + _method)
+_FORM_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+_FLASH_SELECTOR = '.alert, .error, .flash, .notice'
+_FIXTURE_ROWS_SELECTOR = 'table tbody tr'
+
+# Reads a fixtures-list page in one round trip: each row with a fixture
+# link as [id, DATE, TIME, TYPE, COMPETITION, TEAM 1, TEAM 2, VENUE], and
+# the highest page number the pager links to
+_READ_FIXTURES_JS = r"""
+() => {
+    const rows = [];
+    for (const tr of document.querySelectorAll('table tbody tr')) {
+        const link = tr.querySelector('a[href*="/fixtures/"]');
+        const match = link && /\/fixtures\/(\d+)$/.exec(link.getAttribute('href') || '');
+        const cells = tr.querySelectorAll('td');
+        if (!match || cells.length < 7) continue;
+        rows.push([match[1]].concat(
+            Array.from(cells).slice(0, 7).map(td => td.innerText.trim())));
+    }
+    let lastPage = 1;
+    for (const a of document.querySelectorAll('a[href*="page="]')) {
+        const page = /[?&]page=(\d+)/.exec(a.getAttribute('href'));
+        if (page) lastPage = Math.max(lastPage, Number(page[1]));
+    }
+    return {rows: rows, last_page: lastPage};
+}
+"""
+
+
+class FixtureNotFound(Exception):
+    """A fixture's ClubZap page is gone (404): its saved ID is out of date."""
+
 
 def log(msg):
     timestamp = datetime.now().strftime('%H:%M:%S')
@@ -42,145 +84,308 @@ def read_diff_csv(filepath):
         return list(csv.DictReader(f))
 
 
+def _is_form_post(response):
+    """The response to a submitted form: a navigation that sends data.
+
+    Analytics beacons and other background POSTs fired on the click
+    aren't navigations, so they don't count.
+    """
+    request = response.request
+    return request.method in _FORM_METHODS and request.is_navigation_request()
+
+
+def fixture_from_cells(cells):
+    """Fixture map entry from a fixtures-list row's cell texts.
+
+    ClubZap table columns: DATE, TIME, TYPE, COMPETITION, TEAM 1, TEAM 2, VENUE
+    """
+    date_text, time_text, _type, competition, team, opponent, venue = cells[:7]
+    return {
+        'date': date_text,
+        'time': time_text,
+        'competition': competition,
+        'team': team,
+        'opponent': opponent,
+        'venue': venue,
+    }
+
+
 class ClubZapAutomation:
-    def __init__(self, email, password, headless=True):
+    def __init__(self, email, password, engine, id_map=None):
+        """*engine* is the shared PageEngine; sync() runs on its loop.
+
+        *id_map* is the saved FixtureIdMap (loaded from
+        CLUBZAP_FIXTURE_MAP_FILE by default).
+        """
         self.email = email
         self.password = password
-        self.headless = headless
-        self.browser = None
+        self.engine = engine
+        self.id_map = id_map if id_map is not None else FixtureIdMap()
+        self.context = None
         self.page = None
-        self.fixture_map = {}  # fixture_id -> {date, team, opponent, text}
+        self.ambiguous = []  # (date, team, opponent, candidate IDs) lookups skipped
+        self.report = []  # edit / delete jobs: {action, fixture, id, status, attempts, row}
+        self.waits = {}  # step -> [seconds waited, ...]
         self._edit_failures = False
+        self._map_rebuilt = False  # the whole list was re-read this sync
+
+    @property
+    def fixture_map(self):
+        """fixture_id -> {date, time, competition, team, opponent, venue, ...}"""
+        return self.id_map.fixtures
 
     async def start(self):
-        """Launch browser and create page."""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        self.page = await self.browser.new_page()
-        self.page.set_default_timeout(30000)
-        log("Browser started")
+        """Open a private browser context (own cookies) and page."""
+        self.context = await self.engine.new_context()
+        self.page = await self._new_tab()
+        log("Browser context opened")
+
+    async def _new_tab(self):
+        """Another page in the logged-in context."""
+        page = await self.context.new_page()
+        page.set_default_timeout(30000)
+        return page
 
     async def stop(self):
-        """Close browser."""
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
-        log("Browser closed")
+        """Close the context; the engine's browser stays up for its owner."""
+        if self.context:
+            await self.context.close()
+            self.context = None
+            self.page = None
+        log("Browser context closed")
 
     async def login(self):
         """Log in to ClubZap dashboard."""
         log("Logging in to ClubZap...")
         await self.page.goto(f"{BASE_URL}/signin", wait_until='domcontentloaded')
-        await self.page.wait_for_timeout(3000)
+        await self._wait('login form', self.page.wait_for_selector(
+            'input[type="password"]', timeout=self._timeout('login form')))
 
         await self.page.fill('input[type="email"], input[name*="email"]', self.email)
         await self.page.fill('input[type="password"]', self.password)
-        await self.page.click('input[type="submit"], button[type="submit"]')
-        await self.page.wait_for_timeout(5000)
+        signed_in = await self._submit(
+            self.page, 'sign in', lambda url: '/signin' not in url,
+            lambda: self.page.click('input[type="submit"], button[type="submit"]'))
 
-        if '/signin' in self.page.url:
+        if not signed_in:
             raise Exception("Login failed - check credentials")
 
         log(f"Logged in successfully as {self.email}")
 
-    async def build_fixture_map(self):
-        """Scrape all pages of fixtures list to map fixture details -> ID.
-        
-        ClubZap table columns: DATE, TIME, TYPE, COMPETITION, TEAM 1, TEAM 2, VENUE, ACTIONS
-        """
-        log("Building fixture map from ClubZap...")
-        self.fixture_map = {}
+    # ------------------------------------------------------------------
+    # Waiting for outcomes
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _timeout(step):
+        """Playwright timeout (ms) for *step* (see CLUBZAP_WAIT_TIMEOUTS)."""
+        return CLUBZAP_WAIT_TIMEOUTS[step] * 1000
 
-        page_num = 1
-        while True:
-            url = f"{FIXTURES_URL}?page={page_num}" if page_num > 1 else FIXTURES_URL
-            await self.page.goto(url, wait_until='domcontentloaded')
-            await self.page.wait_for_timeout(3000)
+    def _record_wait(self, step, started):
+        elapsed = time.monotonic() - started
+        self.waits.setdefault(step, []).append(elapsed)
+        log(f"    waited {elapsed:.1f}s for {step}")
 
-            log(f"  Scanning fixtures page {page_num}...")
+    async def _wait(self, step, waiting):
+        """Await *waiting* (a Playwright wait for *step*), logging how long it took.
 
-            rows = await self.page.query_selector_all('table tbody tr')
-            if not rows:
-                log(f"  No table rows found on page {page_num}")
-                break
+        PlaywrightTimeout propagates.
+        """
+        started = time.monotonic()
+        try:
+            return await waiting
+        finally:
+            self._record_wait(step, started)
 
-            rows_on_page = 0
-            for row in rows:
-                try:
-                    # Find the first link with a fixture ID (the date link)
-                    link = await row.query_selector('a[href*="/fixtures/"]')
-                    if not link:
-                        continue
-                    href = await link.get_attribute('href') or ''
-                    match = re.search(r'/fixtures/(\d+)$', href)
-                    if not match:
-                        continue
-                    fixture_id = match.group(1)
-
-                    # Extract cell text from the row
-                    cells = await row.query_selector_all('td')
-                    if len(cells) < 7:
-                        continue
-
-                    date_text = (await cells[0].inner_text()).strip()
-                    time_text = (await cells[1].inner_text()).strip()
-                    competition = (await cells[3].inner_text()).strip()
-                    team = (await cells[4].inner_text()).strip()
-                    opponent = (await cells[5].inner_text()).strip()
-                    venue = (await cells[6].inner_text()).strip()
-
-                    self.fixture_map[fixture_id] = {
-                        'date': date_text,
-                        'time': time_text,
-                        'competition': competition,
-                        'team': team,
-                        'opponent': opponent,
-                        'venue': venue,
-                    }
-                    rows_on_page += 1
-                except Exception as e:
-                    log(f"    WARNING: Error parsing fixture row: {e}")
-                    continue
+    async def _submit(self, tab, step, done, trigger):
+        """Submit a form with *trigger()* and wait for the outcome.
 
-            log(f"    Found {rows_on_page} fixtures on page {page_num}")
+        Waits for the form POST's response and, if it redirects, for the
+        page it leads to.  Returns True if *done(url)* accepts the URL the
+        tab ends up on; False if it doesn't, or nothing came back within
+        the step's timeout.
+        """
+        timeout = self._timeout(step)
+        started = time.monotonic()
+        try:
+            async with tab.expect_response(_is_form_post, timeout=timeout) as posted:
+                await trigger()
+            response = await posted.value
+            if 300 <= response.status < 400:
+                await tab.wait_for_url(done, wait_until='domcontentloaded', timeout=timeout)
+            else:
+                await tab.wait_for_load_state('domcontentloaded')
+        except PlaywrightTimeout:
+            log(f"    No response for {step} within {timeout / 1000:.0f}s")
+        finally:
+            self._record_wait(step, started)
+        return done(tab.url)
 
-            if rows_on_page == 0:
-                break
+    def wait_summary(self):
+        """One line per step: how often it was waited for and how long."""
+        lines = []
+        for step, waits in self.waits.items():
+            lines.append(f"{step}: {len(waits)}x, avg {sum(waits) / len(waits):.1f}s, "
+                         f"max {max(waits):.1f}s")
+        return lines
 
-            # Check for next page link
-            next_link = await self.page.query_selector(f'a[href*="page={page_num + 1}"]')
-            if next_link:
-                page_num += 1
-            else:
-                break
+    async def build_fixture_map(self):
+        """Read all pages of the fixtures list and reconcile the map with it.
 
-        log(f"  Total: {len(self.fixture_map)} fixtures mapped in ClubZap")
+        Page 1 gives the page count; the rest are read concurrently in up
+        to CLUBZAP_PAGE_TABS tabs.  Pages beyond the count page 1 showed
+        (a windowed pager) are read as later pages reveal them.  Saved
+        fixtures no longer listed are dropped.
+        """
+        log("Building fixture map from ClubZap...")
+        started = time.monotonic()
+
+        pages = await self._read_fixture_pages([1])
+        entries, last_page = pages[1]
+        if not entries:
+            log("  No fixtures found on page 1")
+        while entries:
+            wanted = [n for n in range(2, last_page + 1) if n not in pages]
+            if not wanted:
+                break
+            pages.update(await self._read_fixture_pages(wanted))
+            last_page = max(last for _, last in pages.values())
+
+        dropped = self.id_map.reconcile(
+            {page_num: fixtures for page_num, (fixtures, _) in pages.items()})
+        self._map_rebuilt = True
+        log(f"  Total: {len(self.fixture_map)} fixtures mapped in ClubZap "
+            f"({len(pages)} pages, {dropped} no longer listed, "
+            f"{time.monotonic() - started:.1f}s)")
+
+    async def refresh_fixture_map(self, since):
+        """Bring the saved map up to date from the top of the fixtures list.
+
+        Pages are read in order until one matches its saved fingerprint,
+        or its fixtures are all dated before *since* after earlier pages
+        had later ones, or the list ends.  Saved fixtures from the pages
+        read that weren't seen on them again are dropped.
+        """
+        log("Refreshing fixture map from ClubZap...")
+        started = time.monotonic()
+        page_num = 1
+        reached_window = False
+        seen = set()
+        while True:
+            fixtures, last_page = await self._read_fixture_page(self.page, page_num)
+            seen.update(fixtures)
+            if not fixtures:
+                reason = "end of list"
+                break
+            if self.id_map.record_page(page_num, fixtures):
+                reason = "unchanged since last sync"
+                break
+            dates = [parse_date(entry['date']) for entry in fixtures.values()]
+            before = all(d is not None and d < since for d in dates)
+            if before and reached_window:
+                reason = f"fixtures before {since:%d/%m/%Y}"
+                break
+            reached_window = reached_window or not before
+            if page_num >= last_page:
+                reason = "end of list"
+                break
+            page_num += 1
+        dropped = self.id_map.drop_unseen(range(1, page_num + 1), seen)
+        self.id_map.finish_refresh()
+        log(f"  Read {page_num} of {last_page} pages ({reason}); "
+            f"{len(self.fixture_map)} fixtures mapped, {dropped} no longer listed "
+            f"({time.monotonic() - started:.1f}s)")
+
+    async def update_fixture_map(self, wanted, uploaded=(), reconcile=False):
+        """Make sure the map holds the fixtures the sync is about to touch.
+
+        *wanted* are the changed / removed diff rows and *uploaded* the
+        rows just uploaded; their dates bound the refresh.  The whole
+        list is re-read instead when *reconcile* is set, when the saved
+        map is missing or due a reconcile, or when a wanted or uploaded
+        fixture is still unmapped after the refresh (an upload can land
+        below the first unchanged page, where the refresh stops).
+        """
+        if reconcile or self.id_map.needs_reconcile():
+            await self.build_fixture_map()
+            return
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        dates = [parse_date(row.get('Date', '')) for row in list(wanted) + list(uploaded)]
+        await self.refresh_fixture_map(min([d for d in dates if d] + [today]))
+        missing = [row for row in list(wanted) + list(uploaded)
+                   if not self.id_map.match(row.get('Date', ''), row.get('Team', ''),
+                                            row.get('Opponent', ''))[0]]
+        if missing:
+            log(f"  {len(missing)} fixtures not in the saved map - re-reading the whole list")
+            await self.build_fixture_map()
+
+    def _lookup(self, row):
+        return self.find_fixture_id(row.get('Date', ''), row.get('Team', ''),
+                                    row.get('Opponent', ''))
+
+    def record_uploads(self, rows):
+        """Mark the uploaded diff *rows* in the map, once they're listed."""
+        recorded = 0
+        for row in rows:
+            fixture_id = self._lookup(row)
+            if fixture_id:
+                self.id_map.mark_uploaded(fixture_id)
+                recorded += 1
+        log(f"  Recorded ClubZap IDs for {recorded} of {len(rows)} uploaded fixtures")
+
+    async def _read_fixture_pages(self, page_nums):
+        """{page number: (fixtures, last page)} for fixture-list pages,
+        read in up to CLUBZAP_PAGE_TABS tabs at once."""
+        results = await self._in_tabs(page_nums, self._read_fixture_page, CLUBZAP_PAGE_TABS)
+        return dict(zip(page_nums, results))
+
+    async def _read_fixture_page(self, tab, page_num):
+        """(fixtures, last page) from one fixture-list page.
+
+        Once the table has rows it is read in a single evaluate.  No rows
+        within the step's timeout is taken as an empty list.  *fixtures*
+        maps fixture ID -> {date, time, competition, team, opponent, venue}.
+        """
+        url = f"{FIXTURES_URL}?page={page_num}" if page_num > 1 else FIXTURES_URL
+        await tab.goto(url, wait_until='domcontentloaded')
+        try:
+            await self._wait('fixture list', tab.wait_for_selector(
+                _FIXTURE_ROWS_SELECTOR, state='attached',
+                timeout=self._timeout('fixture list')))
+        except PlaywrightTimeout:
+            log(f"  No fixture rows on page {page_num}")
+        table = await tab.evaluate(_READ_FIXTURES_JS)
+        fixtures = {}
+        for fixture_id, *cells in table['rows']:
+            fixtures[fixture_id] = fixture_from_cells(cells)
+        log(f"  Found {len(fixtures)} fixtures on page {page_num}")
+        return fixtures, max(table['last_page'], page_num)
 
     def find_fixture_id(self, date_str, team, opponent):
-        """Find a ClubZap fixture ID by matching date, team, and opponent."""
-        date_str = date_str.strip()
-        team_lower = team.lower().strip()
-        opponent_lower = opponent.lower().strip()
-
-        for fixture_id, info in self.fixture_map.items():
-            # Match date (ClubZap shows DD/MM/YYYY)
-            if info['date'] != date_str:
-                continue
-            # Match opponent
-            if info['opponent'].lower().strip() != opponent_lower:
-                continue
-            # Match team
-            if info['team'].lower().strip() == team_lower:
-                return fixture_id
+        """Find a ClubZap fixture ID by matching date, team, and opponent.
 
-        # Fuzzy fallback: match date + opponent only (may be ambiguous if multiple teams play same opponent on same date)
-        for fixture_id, info in self.fixture_map.items():
-            if info['date'] == date_str and info['opponent'].lower().strip() == opponent_lower:
-                log(f"    NOTE: Fuzzy match used for {date_str} vs {opponent_lower} (matched team: {info['team']})")
-                return fixture_id
-
-        return None
+        Names are compared normalised (see clubzap_fixture_map).  Failing
+        an exact match, a fixture against the same opponent that day is
+        used if there is only one; with several (two of our teams playing
+        that opponent) the lookup is reported as ambiguous and None is
+        returned rather than guessing.
+        """
+        ids, exact = self.id_map.match(date_str, team, opponent)
+        if not ids:
+            return None
+        if exact:
+            if len(ids) > 1:
+                log(f"    NOTE: {date_str} {team} vs {opponent} is listed {len(ids)} times "
+                    f"(IDs {', '.join(ids)}) - using {ids[0]}")
+            return ids[0]
+        teams = [self.fixture_map[fixture_id]['team'] for fixture_id in ids]
+        if len(ids) > 1:
+            log(f"    AMBIGUOUS: {date_str} {team} vs {opponent} - no exact match, and "
+                f"{len(ids)} fixtures against {opponent} that day "
+                f"({', '.join(f'{i}: {t}' for i, t in zip(ids, teams))})")
+            self.ambiguous.append((date_str, team, opponent, ids))
+            return None
+        log(f"    NOTE: Fuzzy match used for {date_str} vs {opponent} (matched team: {teams[0]})")
+        return ids[0]
 
     async def upload_new_fixtures(self):
         """Upload new fixtures CSV via ClubZap's file input on the fixtures page."""
@@ -193,40 +398,54 @@ class ClubZapAutomation:
         log(f"Uploading {len(fixtures)} new fixtures from {NEW_CSV}...")
 
         await self.page.goto(FIXTURES_URL, wait_until='domcontentloaded')
-        await self.page.wait_for_timeout(3000)
-
-        # Count existing fixtures before upload
-        rows_before = await self.page.query_selector_all('table tbody tr')
-        log(f"  Fixtures before upload: {len(rows_before)}")
 
         # The upload file input is directly on the fixtures page
-        file_input = await self.page.query_selector('input[type="file"]')
-        if not file_input:
+        try:
+            file_input = await self._wait('fixtures page', self.page.wait_for_selector(
+                'input[type="file"]', state='attached', timeout=self._timeout('fixtures page')))
+        except PlaywrightTimeout:
             log("ERROR: Could not find file input on fixtures page")
             return 0
 
-        await file_input.set_input_files(csv_path)
-        log("  CSV file selected")
+        # Count existing fixtures before upload
+        rows_before = await self.page.query_selector_all('table tbody tr')
+        log(f"  Fixtures before upload: {len(rows_before)}")
 
         # Look for a submit/upload button to click after file selection
         submit_btn = await self.page.query_selector(
             'input[type="submit"][value*="Upload"], input[type="submit"][value*="Import"], '
             'input[type="submit"], button[type="submit"]'
         )
-        if submit_btn:
-            btn_text = await submit_btn.get_attribute('value') or await submit_btn.inner_text()
-            log(f"  Clicking submit button: {btn_text}")
-            await submit_btn.click()
-            await self.page.wait_for_timeout(8000)
-        else:
-            log("  No submit button found, waiting for auto-upload...")
-            await self.page.wait_for_timeout(8000)
+
+        async def send():
+            await file_input.set_input_files(csv_path)
+            log("  CSV file selected")
+            if submit_btn:
+                btn_text = await submit_btn.get_attribute('value') or await submit_btn.inner_text()
+                log(f"  Clicking submit button: {btn_text}")
+                await submit_btn.click()
+            else:
+                log("  No submit button found, waiting for auto-upload...")
+
+        # The import redirects back to the fixtures list, so the URL can't
+        # tell the old page from the new: wait for the navigation itself
+        try:
+            async with self.page.expect_navigation(wait_until='domcontentloaded',
+                                                   timeout=self._timeout('upload')):
+                await self._submit(self.page, 'upload', lambda url: True, send)
+        except PlaywrightTimeout:
+            log("  No page load after the upload; reading the page as it is")
+        try:
+            await self._wait('flash', self.page.wait_for_selector(
+                _FLASH_SELECTOR, timeout=self._timeout('flash')))
+        except PlaywrightTimeout:
+            pass
 
         # Check page for success indicators
         log(f"  Current URL: {self.page.url}")
 
         # Look for flash/alert messages (specific elements, not page-wide text)
-        alerts = await self.page.query_selector_all('.alert, .error, .flash, .notice')
+        alerts = await self.page.query_selector_all(_FLASH_SELECTOR)
         success_found = False
         for alert in alerts:
             text = (await alert.inner_text()).strip()
@@ -254,11 +473,17 @@ class ClubZapAutomation:
         log(f"  WARNING: Upload may have failed - fixture count unchanged ({len(rows_before)} -> {len(rows_after)})")
         return 0
 
-    async def edit_fixture(self, fixture_id, changes):
-        """Edit a single fixture by navigating to its edit page."""
-        edit_url = f"{BASE_URL}/fixtures/{fixture_id}/edit"
-        await self.page.goto(edit_url, wait_until='domcontentloaded')
-        await self.page.wait_for_timeout(3000)
+    async def edit_fixture(self, fixture_id, changes, tab=None):
+        """Edit a single fixture by navigating to its edit page (in *tab*)."""
+        tab = tab or self.page
+        await self._open_fixture(tab, f"{BASE_URL}/fixtures/{fixture_id}/edit", fixture_id)
+        try:
+            await self._wait('edit form', tab.wait_for_selector(
+                'input[type="submit"], button[type="submit"], input[name="commit"]',
+                state='attached', timeout=self._timeout('edit form')))
+        except PlaywrightTimeout:
+            log(f"    WARNING: No edit form for fixture {fixture_id}")
+            return False, False
 
         edited = False
         failed_fields = []
@@ -267,7 +492,7 @@ class ClubZapAutomation:
             try:
                 if field == 'Time':
                     # datetime-local input: value format is 2026-09-30T19:00:00
-                    time_input = await self.page.query_selector(
+                    time_input = await tab.query_selector(
                         '#fixture_event_attributes_start, input[name*="[start]"]'
                     )
                     if time_input:
@@ -284,7 +509,7 @@ class ClubZapAutomation:
                             edited = True
 
                 elif field == 'Venue':
-                    venue_input = await self.page.query_selector(
+                    venue_input = await tab.query_selector(
                         '#fixture_event_attributes_venue, input[name*="[venue]"]'
                     )
                     if venue_input:
@@ -294,7 +519,7 @@ class ClubZapAutomation:
 
                 elif field == 'Ground':
                     # Select values are lowercase: home, away, neutral
-                    ground_select = await self.page.query_selector(
+                    ground_select = await tab.query_selector(
                         '#fixture_event_attributes_ground_type, select[name*="[ground_type]"]'
                     )
                     if ground_select:
@@ -303,7 +528,7 @@ class ClubZapAutomation:
                         edited = True
 
                 elif field == 'Referee':
-                    ref_input = await self.page.query_selector(
+                    ref_input = await tab.query_selector(
                         '#fixture_event_attributes_referee, input[name*="[referee]"]'
                     )
                     if ref_input:
@@ -316,42 +541,34 @@ class ClubZapAutomation:
                 failed_fields.append(field)
 
         if edited:
-            submit_btn = await self.page.query_selector(
+            submit_btn = await tab.query_selector(
                 'input[type="submit"], button[type="submit"], input[name="commit"]'
             )
             if submit_btn:
-                await submit_btn.click()
-                await self.page.wait_for_timeout(3000)
-
-                # Check for success
-                if '/edit' not in self.page.url:
+                # Saved if the form redirects away from the edit page
+                if await self._submit(tab, 'save', lambda url: '/edit' not in url,
+                                      submit_btn.click):
                     return True, len(failed_fields) > 0
-                content = await self.page.content()
+                content = await tab.content()
                 if 'success' in content.lower() or 'updated' in content.lower():
                     return True, len(failed_fields) > 0
 
         return False, len(failed_fields) > 0
 
     async def edit_changed_fixtures(self):
-        """Edit all changed fixtures."""
+        """Edit all changed fixtures, CLUBZAP_WORKERS at a time."""
         changed = read_diff_csv(CHANGED_CSV)
         if not changed:
             log("No changed fixtures to edit")
             return 0
 
         log(f"Editing {len(changed)} changed fixtures...")
-        edited_count = 0
-
+        jobs = []
         for row in changed:
-            date = row.get('Date', '')
-            team = row.get('Team', '')
-            opponent = row.get('Opponent', '')
-            changes_desc = row.get('Changes', '')
-
-            fixture_id = self.find_fixture_id(date, team, opponent)
-            if not fixture_id:
-                log(f"  SKIP: Could not find {date} {team} vs {opponent} in ClubZap")
+            job = self._job('edit', row)
+            if not job:
                 continue
+            changes_desc = row.get('Changes', '')
 
             # Parse changes: "Time: '14:30' -> '13:00'; Venue: 'X' -> 'Y'"
             changes = {}
@@ -366,80 +583,193 @@ class ClubZapAutomation:
                 for col in ['Time', 'Venue', 'Ground', 'Referee']:
                     if row.get(col, '').strip():
                         changes[col] = row[col].strip()
+            job['changes'] = changes
+            jobs.append(job)
 
-            log(f"  Editing: {date} {team} vs {opponent} (ID: {fixture_id})")
-            for f, v in changes.items():
+        async def edit(tab, job):
+            log(f"  Editing: {job['fixture']} (ID: {job['id']})")
+            for f, v in job['changes'].items():
                 log(f"    {f} -> {v}")
-
-            success, had_failures = await self.edit_fixture(fixture_id, changes)
+            success, had_failures = await self.edit_fixture(job['id'], job['changes'], tab)
             if success:
-                if had_failures:
-                    log(f"    Partially saved (some fields failed)")
-                else:
-                    log(f"    Saved")
-                edited_count += 1
-            else:
-                log(f"    WARNING: Edit may not have saved")
-            if had_failures:
-                self._edit_failures = True
-
-        return edited_count
-
-    async def delete_fixture_by_id(self, fixture_id):
-        """Delete a fixture using the Delete link on the fixtures list page."""
+                log(f"    Saved {job['fixture']}" + (" (some fields failed)" if had_failures else ""))
+                return 'partial' if had_failures else 'done'
+            log(f"    WARNING: Edit of {job['fixture']} may not have saved")
+            return 'failed'
+
+        await self._run_jobs(jobs, edit)
+        # An edit that didn't fully save must stay out of the baseline so
+        # the next run retries it
+        if any(job['status'] in ('failed', 'partial') for job in jobs):
+            self._edit_failures = True
+        return sum(job['status'] in ('done', 'partial') for job in jobs)
+
+    @staticmethod
+    async def _open_fixture(tab, url, fixture_id):
+        """Load one of a fixture's pages; FixtureNotFound if it 404s."""
+        response = await tab.goto(url, wait_until='domcontentloaded')
+        if response is not None and response.status == 404:
+            raise FixtureNotFound(fixture_id)
+
+    async def delete_fixture_by_id(self, fixture_id, tab=None):
+        """Delete a fixture using the Delete link on its page (in *tab*)."""
+        tab = tab or self.page
         # Navigate to the fixture view page
-        view_url = f"{BASE_URL}/fixtures/{fixture_id}"
-        await self.page.goto(view_url, wait_until='domcontentloaded')
-        await self.page.wait_for_timeout(2000)
-
-        # Handle the confirmation dialog that appears on delete
-        self.page.once('dialog', lambda dialog: asyncio.ensure_future(dialog.accept()))
+        await self._open_fixture(tab, f"{BASE_URL}/fixtures/{fixture_id}", fixture_id)
 
         # Click the Delete button/link
-        delete_btn = await self.page.query_selector(
-            'a:has-text("Delete"), input[value="Delete"]'
-        )
-
-        if not delete_btn:
+        try:
+            delete_btn = await self._wait('delete button', tab.wait_for_selector(
+                'a:has-text("Delete"), input[value="Delete"]',
+                timeout=self._timeout('delete button')))
+        except PlaywrightTimeout:
             return False
 
-        await delete_btn.click()
-        await self.page.wait_for_timeout(3000)
+        # Handle the confirmation dialog that appears on delete
+        tab.once('dialog', lambda dialog: asyncio.ensure_future(dialog.accept()))
 
         # Success if redirected away from the fixture page
-        if f'/fixtures/{fixture_id}' not in self.page.url:
-            return True
-        return False
+        return await self._submit(tab, 'delete',
+                                  lambda url: f'/fixtures/{fixture_id}' not in url,
+                                  delete_btn.click)
 
     async def delete_removed_fixtures(self):
-        """Delete all removed and postponed fixtures."""
+        """Delete all removed and postponed fixtures, CLUBZAP_WORKERS at a time."""
         removed = read_diff_csv(REMOVED_CSV)
         if not removed:
             log("No removed fixtures to delete")
             return 0
 
         log(f"Deleting {len(removed)} removed/postponed fixtures...")
-        deleted_count = 0
-
-        for row in removed:
-            date = row.get('Date', '')
-            team = row.get('Team', '')
-            opponent = row.get('Opponent', '')
-
-            fixture_id = self.find_fixture_id(date, team, opponent)
-            if not fixture_id:
-                log(f"  SKIP: Could not find {date} {team} vs {opponent} in ClubZap")
-                continue
+        jobs = [job for job in (self._job('delete', row) for row in removed) if job]
+
+        async def delete(tab, job):
+            log(f"  Deleting: {job['fixture']} (ID: {job['id']})")
+            if await self.delete_fixture_by_id(job['id'], tab):
+                log(f"    Deleted {job['fixture']}")
+                self.id_map.remove(job['id'])
+                return 'done'
+            log(f"    WARNING: Delete of {job['fixture']} may have failed")
+            return 'failed'
+
+        await self._run_jobs(jobs, delete)
+        return sum(job['status'] == 'done' for job in jobs)
+
+    # ------------------------------------------------------------------
+    # Edit / delete workers
+    # ------------------------------------------------------------------
+    def _job(self, action, row):
+        """A job for a diff *row*, added to the report; None if it can't be run.
+
+        Rows whose fixture isn't mapped (or matches ambiguously) are
+        reported and skipped.
+        """
+        date = row.get('Date', '')
+        team = row.get('Team', '')
+        opponent = row.get('Opponent', '')
+        ambiguous = len(self.ambiguous)
+        fixture_id = self.find_fixture_id(date, team, opponent)
+        job = {'action': action, 'fixture': f"{date} {team} vs {opponent}",
+               'id': fixture_id, 'status': None, 'attempts': 0, 'row': row}
+        self.report.append(job)
+        if not fixture_id:
+            job['status'] = 'ambiguous' if len(self.ambiguous) > ambiguous else 'not found'
+            log(f"  SKIP: Could not find {job['fixture']} in ClubZap")
+            return None
+        return job
+
+    async def _run_jobs(self, jobs, attempt):
+        """Run *attempt(tab, job)* for each job, CLUBZAP_WORKERS at a time.
+
+        *attempt* returns the job's status; a 'failed' attempt or one
+        that raises is retried up to CLUBZAP_RETRIES times on the same
+        tab (each attempt loads the fixture's page afresh).  Jobs whose
+        fixture page 404s are looked up again once the whole list has
+        been re-read (at most once a sync), and run again if the fixture
+        is still listed.
+        """
+        async def run(tab, job):
+            while True:
+                job['attempts'] += 1
+                try:
+                    job['status'] = await attempt(tab, job)
+                except FixtureNotFound:
+                    log(f"    Fixture page for {job['fixture']} (ID {job['id']}) not found")
+                    job['status'] = 'gone'
+                    return
+                except Exception as e:
+                    log(f"    WARNING: {job['action']} {job['fixture']} raised "
+                        f"{type(e).__name__}: {e}")
+                    job['status'] = 'failed'
+                if job['status'] != 'failed' or job['attempts'] > CLUBZAP_RETRIES:
+                    return
+                log(f"    Retrying {job['action']} of {job['fixture']} "
+                    f"(attempt {job['attempts'] + 1})")
+
+        await self._in_tabs(jobs, run, CLUBZAP_WORKERS)
+        gone = [job for job in jobs if job['status'] == 'gone']
+        if not gone:
+            return
+        for job in gone:
+            self.id_map.remove(job['id'])
+        if not self._map_rebuilt:
+            log(f"  {len(gone)} fixture pages not found - re-reading the whole list")
+            await self.build_fixture_map()
+        for job in gone:
+            job['id'] = self._lookup(job['row'])
+            job['status'] = None if job['id'] else 'not found'
+        retry = [job for job in gone if job['id']]
+        await self._in_tabs(retry, run, CLUBZAP_WORKERS)
+        for job in retry:
+            if job['status'] == 'gone':
+                job['status'] = 'not found'
+
+    async def _in_tabs(self, items, handle, limit):
+        """[await handle(tab, item) for item in items], *limit* tabs at once.
+
+        The items are shared out between self.page and extra tabs opened
+        in the logged-in context (closed afterwards), so they share its
+        session.  Results are in item order; the first error is raised
+        once every tab has stopped.
+        """
+        queue = list(enumerate(items))
+        results = [None] * len(queue)
+        tabs = [self.page]
+        try:
+            for _ in range(min(limit, len(queue)) - 1):
+                tabs.append(await self._new_tab())
 
-            log(f"  Deleting: {date} {team} vs {opponent} (ID: {fixture_id})")
-            success = await self.delete_fixture_by_id(fixture_id)
-            if success:
-                log(f"    Deleted")
-                deleted_count += 1
-            else:
-                log(f"    WARNING: Delete may have failed")
+            async def worker(tab):
+                while queue:
+                    index, item = queue.pop(0)
+                    results[index] = await handle(tab, item)
 
-        return deleted_count
+            outcomes = await asyncio.gather(*(worker(tab) for tab in tabs),
+                                            return_exceptions=True)
+        finally:
+            for tab in tabs[1:]:
+                await tab.close()
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return results
+
+    def result_report(self):
+        """Lines summarising every edit / delete this sync: counts by
+        action and outcome, then one line per fixture that wasn't done."""
+        counts = {}
+        for job in self.report:
+            key = (job['action'], job['status'])
+            counts[key] = counts.get(key, 0) + 1
+        lines = [f"{action} {status}: {count}" for (action, status), count in counts.items()]
+        for job in self.report:
+            if job['status'] != 'done':
+                detail = f", ID {job['id']}" if job['id'] else ""
+                if job['attempts'] > 1:
+                    detail += f", {job['attempts']} attempts"
+                lines.append(f"{job['status'].upper()}: {job['action']} "
+                             f"{job['fixture']}{detail}")
+        return lines
 
     async def sync(self, actions=None):
         """Run full sync: upload new, edit changed, delete removed."""
@@ -447,6 +777,11 @@ class ClubZapAutomation:
             actions = ['upload', 'edit', 'delete']
 
         self._edit_failures = False  # reset for this run
+        self._map_rebuilt = False
+        self.ambiguous = []
+        self.report = []
+        self.waits = {}
+        map_used = False
 
         try:
             await self.start()
@@ -457,9 +792,16 @@ class ClubZapAutomation:
             if 'upload' in actions and os.path.exists(NEW_CSV):
                 results['uploaded'] = await self.upload_new_fixtures()
 
-            if ('edit' in actions or 'delete' in actions):
-                if os.path.exists(CHANGED_CSV) or os.path.exists(REMOVED_CSV):
-                    await self.build_fixture_map()
+            changed = read_diff_csv(CHANGED_CSV) if 'edit' in actions else []
+            removed = read_diff_csv(REMOVED_CSV) if 'delete' in actions else []
+            uploaded = read_diff_csv(NEW_CSV) if results.get('uploaded') else []
+            if changed or removed or uploaded or 'reconcile' in actions:
+                map_used = True
+                await self.update_fixture_map(changed + removed, uploaded,
+                                              reconcile='reconcile' in actions)
+                if uploaded:
+                    self.record_uploads(uploaded)
+                self.id_map.save()
 
             if 'edit' in actions and os.path.exists(CHANGED_CSV):
                 results['edited'] = await self.edit_changed_fixtures()
@@ -476,6 +818,14 @@ class ClubZapAutomation:
                 log(f"  Edited:   {results['edited']} fixtures")
             if 'deleted' in results:
                 log(f"  Deleted:  {results['deleted']} fixtures")
+            if self.report:
+                log("  Results:")
+                for line in self.result_report():
+                    log(f"    {line}")
+            if self.waits:
+                log("  Waits:")
+                for line in self.wait_summary():
+                    log(f"    {line}")
             log("=" * 50)
 
             if any(v > 0 for v in results.values()):
@@ -496,10 +846,12 @@ class ClubZapAutomation:
             log(f"ERROR: {e}")
             raise
         finally:
+            if map_used:
+                self.id_map.save()
             await self.stop()
 
 
-async def main():
+def main():
     email = os.environ.get('CLUBZAP_EMAIL', '')
     password = os.environ.get('CLUBZAP_PASSWORD', '')
 
@@ -508,9 +860,21 @@ async def main():
         log("  Set CLUBZAP_EMAIL and CLUBZAP_PASSWORD to enable")
         sys.exit(0)
 
+    actions = None
+    if len(sys.argv) > 1:
+        action = sys.argv[1].lower()
+        if action in ('upload', 'edit', 'delete', 'reconcile'):
+            actions = [action]
+        elif action == 'all':
+            actions = None
+        else:
+            print(f"Unknown action: {action}")
+            print("Usage: py clubzap_automate.py [upload|edit|delete|reconcile|all]")
+            sys.exit(1)
+
     # Check if there are any diff files to process
     has_work = any(os.path.exists(f) for f in [NEW_CSV, CHANGED_CSV, REMOVED_CSV])
-    if not has_work:
+    if not has_work and actions != ['reconcile']:
         log("No diff files found - nothing to sync to ClubZap")
         sys.exit(0)
 
@@ -525,23 +889,15 @@ async def main():
             log("  Run 'py clubzap_sync.py uploaded' to establish baseline first.")
             sys.exit(0)
 
-    actions = None
-    if len(sys.argv) > 1:
-        action = sys.argv[1].lower()
-        if action in ('upload', 'edit', 'delete'):
-            actions = [action]
-        elif action == 'all':
-            actions = None
-        else:
-            print(f"Unknown action: {action}")
-            print("Usage: py clubzap_automate.py [upload|edit|delete|all]")
-            sys.exit(1)
-
     headless = os.environ.get('CLUBZAP_HEADLESS', 'true').lower() != 'false'
 
-    automation = ClubZapAutomation(email, password, headless=headless)
-    await automation.sync(actions)
+    engine = PageEngine(headless=headless)
+    try:
+        automation = ClubZapAutomation(email, password, engine)
+        engine.run(automation.sync(actions))
+    finally:
+        engine.close()
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    main()
@@ -0,0 +1,261 @@
+"""
+Persistent map of ClubZap fixture IDs for clubzap_automate.py.
+
+ClubZap's dashboard only edits and deletes fixtures by ID, and the only
+place the IDs show up is the paged fixtures list.  Rather than reading
+the whole list before every sync, the IDs are kept in
+CLUBZAP_FIXTURE_MAP_FILE between runs:
+
+  - every fixture seen on the list is stored with the time it was last
+    seen, and fixtures we uploaded are marked with their upload time;
+  - each list page's fingerprint is kept, so a refresh can read pages
+    from the top and stop at the first one that hasn't changed (or once
+    its fixtures fall before the dates the sync is interested in).
+    Fixtures last seen on the pages a refresh read but not found there
+    again are dropped;
+  - a full reconcile re-reads every page and drops fixtures that are no
+    longer listed.  It runs on demand (``py clubzap_automate.py
+    reconcile``), when nothing is saved yet, when the last one is older
+    than CLUBZAP_MAP_RECONCILE_DAYS, and when a refresh can't find a
+    fixture the sync needs.
+
+Lookups by (date, team, opponent) go through two indexes kept in step
+with the map, keyed on normalised names (see normalise_name).
+"""
+
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from datetime import datetime, timedelta
+
+from config import CLUBZAP_FIXTURE_MAP_FILE, CLUBZAP_MAP_RECONCILE_DAYS
+
+
+def page_fingerprint(fixtures):
+    """Hash of a list page's fixtures ({fixture_id: entry}), in page order."""
+    rows = [[fixture_id, entry['date'], entry['time'], entry['competition'],
+             entry['team'], entry['opponent'], entry['venue']]
+            for fixture_id, entry in fixtures.items()]
+    return hashlib.sha256(json.dumps(rows).encode('utf-8')).hexdigest()[:16]
+
+
+# Spelling variants of the same team name, after lower-casing
+_QUOTES_RE = re.compile(r"['\"‘’“”`.]")
+_SEPARATORS_RE = re.compile(r"[^a-z0-9&]+")
+_UNDER_AGE_RE = re.compile(r"\b(?:under|u)\s*(\d{2})\b")
+_CLUB_AFFIX_RE = re.compile(r"^gaa\s+|\s+gaa(?:\s+club)?$")
+_WORD_VARIANTS = {
+    '&': 'and',
+    'saint': 'st',
+    'snr': 'senior', 'sen': 'senior',
+    'jnr': 'junior', 'jun': 'junior',
+    'int': 'intermediate', 'inter': 'intermediate',
+    'prem': 'premier',
+    'hurl': 'hurling',
+    'fball': 'football', 'ftball': 'football',
+}
+
+
+def normalise_name(name):
+    """A team or opponent name reduced for matching.
+
+    Accents, case, punctuation and spacing are dropped, common
+    abbreviations expanded ("Snr" -> "senior", "&" -> "and", "Under 14"
+    -> "u14") and a leading "GAA" or trailing "GAA" / "GAA Club" removed,
+    so "St. Finbarr's GAA" and "st finbarrs" match.
+    """
+    text = unicodedata.normalize('NFKD', name or '')
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    text = _QUOTES_RE.sub('', text)
+    text = _SEPARATORS_RE.sub(' ', text.replace('&', ' & '))
+    text = _UNDER_AGE_RE.sub(r'u\1', text)
+    text = ' '.join(_WORD_VARIANTS.get(word, word) for word in text.split())
+    return _CLUB_AFFIX_RE.sub('', text)
+
+
+def normalise_date(text):
+    """A date as YYYY-MM-DD if it parses (so 1/4/2026 == 01/04/2026)."""
+    parsed = parse_date(text)
+    return parsed.strftime('%Y-%m-%d') if parsed else (text or '').strip()
+
+
+def parse_date(text):
+    """A DD/MM/YYYY date (as ClubZap and the diff CSVs show it), or None."""
+    try:
+        return datetime.strptime(text.strip(), '%d/%m/%Y')
+    except (AttributeError, ValueError):
+        return None
+
+
+class FixtureIdMap:
+    """ClubZap fixture IDs and list-page fingerprints, persisted as JSON.
+
+    Layout:
+        {"reconciled_at", "refreshed_at",
+         "pages": {page_num: fingerprint},
+         "fixtures": {fixture_id: {"date", "time", "competition", "team",
+                                   "opponent", "venue", "page", "last_seen",
+                                   "uploaded_at"}}}
+    "page" is the list page the fixture was last seen on; "uploaded_at"
+    is only present for fixtures we uploaded.  Page numbers are stored as
+    strings when they are JSON keys.
+
+    match() answers from two indexes, (date, team, opponent) -> IDs and
+    (date, opponent) -> IDs, built on first use and then updated as
+    pages are recorded and fixtures removed.
+    """
+
+    def __init__(self, path=CLUBZAP_FIXTURE_MAP_FILE):
+        self.path = path
+        self.fixtures = {}
+        self.pages = {}
+        self.reconciled_at = None
+        self.refreshed_at = None
+        self._by_teams = None  # (date, team, opponent) -> {fixture_id: None}
+        self._by_opponent = None  # (date, opponent) -> {fixture_id: None}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    saved = json.load(f)
+                self.fixtures = saved.get('fixtures', {})
+                self.pages = saved.get('pages', {})
+                self.reconciled_at = saved.get('reconciled_at')
+                self.refreshed_at = saved.get('refreshed_at')
+            except (ValueError, AttributeError) as e:
+                print(f"Ignoring unreadable ClubZap fixture map {path}: {e}")
+
+    def needs_reconcile(self, now=None):
+        """True if the map should be rebuilt from every list page."""
+        if not self.reconciled_at:
+            return True
+        now = now or datetime.now()
+        age = now - datetime.fromisoformat(self.reconciled_at)
+        return age > timedelta(days=CLUBZAP_MAP_RECONCILE_DAYS)
+
+    def record_page(self, page_num, fixtures, now=None):
+        """Store one list page's fixtures; returns True if it was unchanged."""
+        now = (now or datetime.now()).isoformat()
+        fingerprint = page_fingerprint(fixtures)
+        unchanged = self.pages.get(str(page_num)) == fingerprint
+        self.pages[str(page_num)] = fingerprint
+        for fixture_id, entry in fixtures.items():
+            stored = dict(entry, page=int(page_num), last_seen=now)
+            if 'uploaded_at' in self.fixtures.get(fixture_id, {}):
+                stored['uploaded_at'] = self.fixtures[fixture_id]['uploaded_at']
+            self._unindex(fixture_id)
+            self.fixtures[fixture_id] = stored
+            self._index(fixture_id)
+        return unchanged
+
+    def drop_unseen(self, page_nums, seen):
+        """Forget fixtures last seen on *page_nums* that aren't in *seen*.
+
+        Called after a refresh has read *page_nums*: a fixture no longer
+        there was deleted on ClubZap, or pushed further down the list, in
+        which case a lookup miss re-reads the whole list.  Returns how
+        many were dropped.
+        """
+        page_nums = {int(n) for n in page_nums}
+        stale = [fixture_id for fixture_id, entry in self.fixtures.items()
+                 if entry.get('page') in page_nums and fixture_id not in seen]
+        for fixture_id in stale:
+            self._unindex(fixture_id)
+            del self.fixtures[fixture_id]
+        return len(stale)
+
+    def finish_refresh(self, now=None):
+        self.refreshed_at = (now or datetime.now()).isoformat()
+
+    def reconcile(self, pages, now=None):
+        """Replace the map with a full read of the list.
+
+        *pages* is {page_num: {fixture_id: entry}} for every page; stored
+        fixtures that no longer appear are dropped.
+        """
+        now = now or datetime.now()
+        previous = self.fixtures
+        self.fixtures = {}
+        self.pages = {}
+        self._by_teams = self._by_opponent = None
+        for page_num in sorted(pages):
+            self.record_page(page_num, pages[page_num], now)
+        for fixture_id, entry in self.fixtures.items():
+            if 'uploaded_at' in previous.get(fixture_id, {}):
+                entry['uploaded_at'] = previous[fixture_id]['uploaded_at']
+        dropped = len(set(previous) - set(self.fixtures))
+        self.reconciled_at = self.refreshed_at = now.isoformat()
+        return dropped
+
+    def mark_uploaded(self, fixture_id, now=None):
+        self.fixtures[fixture_id]['uploaded_at'] = (now or datetime.now()).isoformat()
+
+    def remove(self, fixture_id):
+        """Forget a fixture we deleted.
+
+        The page fingerprints are cleared too: the list has shifted, so
+        the next refresh mustn't stop at a page that merely looks cached.
+        """
+        self._unindex(fixture_id)
+        self.fixtures.pop(fixture_id, None)
+        self.pages = {}
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def match(self, date, team, opponent):
+        """(fixture IDs, exact) for a fixture, most recently seen first.
+
+        IDs whose date, team and opponent all match are returned with
+        exact=True; failing any, those matching date and opponent only
+        (another of our teams may be listed against the same opponent
+        that day) with exact=False.  IDs seen at the same time stay in
+        list order.
+        """
+        if self._by_teams is None:
+            self._by_teams, self._by_opponent = {}, {}
+            for fixture_id in self.fixtures:
+                self._index(fixture_id)
+        date, opponent = normalise_date(date), normalise_name(opponent)
+        exact = self._by_teams.get((date, normalise_name(team), opponent))
+        if exact:
+            return self._latest_first(exact), True
+        return self._latest_first(self._by_opponent.get((date, opponent), ())), False
+
+    def _latest_first(self, ids):
+        return sorted(ids, key=lambda fixture_id: self.fixtures[fixture_id]['last_seen'],
+                      reverse=True)
+
+    def _keys(self, fixture_id):
+        entry = self.fixtures[fixture_id]
+        date, opponent = normalise_date(entry['date']), normalise_name(entry['opponent'])
+        return (date, normalise_name(entry['team']), opponent), (date, opponent)
+
+    def _index(self, fixture_id):
+        if self._by_teams is None:
+            return
+        teams_key, opponent_key = self._keys(fixture_id)
+        self._by_teams.setdefault(teams_key, {})[fixture_id] = None
+        self._by_opponent.setdefault(opponent_key, {})[fixture_id] = None
+
+    def _unindex(self, fixture_id):
+        if self._by_teams is None or fixture_id not in self.fixtures:
+            return
+        for index, key in zip((self._by_teams, self._by_opponent), self._keys(fixture_id)):
+            ids = index.get(key, {})
+            ids.pop(fixture_id, None)
+            if not ids:
+                index.pop(key, None)
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'reconciled_at': self.reconciled_at,
+                       'refreshed_at': self.refreshed_at,
+                       'pages': self.pages,
+                       'fixtures': self.fixtures}, f, indent=1)
+        os.replace(tmp, self.path)
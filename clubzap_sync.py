@@ -14,6 +14,7 @@ Usage:
 """
 
 import csv
+import hashlib
 import os
 import sys
 import shutil
@@ -29,6 +30,12 @@ def fixture_key(row):
     return tuple(row.get(c, '').strip() for c in KEY_COLS)
 
 
+def fixture_hash(row):
+    """Content hash of one fixture row (all FIXTURE_HEADER columns)."""
+    values = "\x1f".join(row.get(c, '').strip() for c in HEADER)
+    return hashlib.sha256(values.encode('utf-8')).hexdigest()[:16]
+
+
 def read_csv_fixtures(filepath):
     """Read fixtures from CSV into a dict keyed by fixture_key."""
     fixtures = {}
@@ -51,95 +58,113 @@ def write_csv(filepath, rows):
             writer.writerow(row)
 
 
-def diff_fixtures():
-    """Compare current fixtures against uploaded baseline and generate diff files."""
-    
-    current = read_csv_fixtures(FULL_CSV)
-    baseline = read_csv_fixtures(BASELINE_CSV)
-    
-    if not current:
-        print(f"ERROR: No fixtures found in {FULL_CSV}")
-        return
-    
+def compute_diff(current, baseline):
+    """Keyed diff of current fixtures against the uploaded baseline.
+
+    Both arguments are dicts keyed by fixture_key (as returned by
+    read_csv_fixtures).  Returns a dict with:
+      new:       rows not in the baseline
+      changed:   (row, [(col, old, new), ...]) for CHANGE_COLS differences
+      postponed: rows now marked Postponed (delete from ClubZap)
+      removed:   baseline rows no longer on the website
+      unchanged: count of rows needing no action
+    plus current_count / baseline_count.
+    """
     new_fixtures = []
     changed_fixtures = []
+    postponed_fixtures = []
     removed_fixtures = []
     unchanged = 0
-    
-    postponed_fixtures = []
-    
-    # Find new, changed, and postponed fixtures
+
     for key, row in current.items():
-        if key not in baseline:
-            # Skip postponed fixtures from new imports (delete from ClubZap instead)
-            if row.get('Time', '') == 'Postponed':
-                postponed_fixtures.append(row)
-            else:
-                new_fixtures.append(row)
+        # Postponed fixtures are never imported; existing ones get deleted
+        if row.get('Time', '') == 'Postponed':
+            postponed_fixtures.append(row)
+            continue
+        old_row = baseline.get(key)
+        if old_row is None:
+            new_fixtures.append(row)
+            continue
+        if fixture_hash(old_row) == fixture_hash(row):
+            unchanged += 1
+            continue
+
+        # Check if any important fields changed
+        changes = []
+        for col in CHANGE_COLS:
+            old_val = old_row.get(col, '').strip()
+            new_val = row.get(col, '').strip()
+            if old_val != new_val:
+                changes.append((col, old_val, new_val))
+        if changes:
+            changed_fixtures.append((row, changes))
         else:
-            # If fixture is now postponed, flag for deletion from ClubZap
-            if row.get('Time', '') == 'Postponed':
-                postponed_fixtures.append(row)
-                continue
-            
-            # Check if any important fields changed
-            old_row = baseline[key]
-            changes = []
-            for col in CHANGE_COLS:
-                old_val = old_row.get(col, '').strip()
-                new_val = row.get(col, '').strip()
-                if old_val != new_val:
-                    changes.append(f"{col}: '{old_val}' -> '{new_val}'")
-            
-            if changes:
-                changed_fixtures.append((row, changes))
-            else:
-                unchanged += 1
-    
-    # Find removed fixtures
+            unchanged += 1
+
     for key, row in baseline.items():
         if key not in current:
             removed_fixtures.append(row)
-    
-    # Write diff files
-    if new_fixtures:
-        write_csv(NEW_CSV, new_fixtures)
+
+    return {
+        'new': new_fixtures,
+        'changed': changed_fixtures,
+        'postponed': postponed_fixtures,
+        'removed': removed_fixtures,
+        'unchanged': unchanged,
+        'current_count': len(current),
+        'baseline_count': len(baseline),
+    }
+
+
+def format_change(col, old_val, new_val):
+    """Describe one column change, e.g. "Time: '19:30' -> '14:00'"."""
+    return f"{col}: '{old_val}' -> '{new_val}'"
+
+
+def write_diff_files(diff):
+    """Write (or clean up) the new/changed/removed CSVs for a computed diff."""
+    if diff['new']:
+        write_csv(NEW_CSV, diff['new'])
     elif os.path.exists(NEW_CSV):
         os.remove(NEW_CSV)
-    
-    if changed_fixtures:
+
+    if diff['changed']:
         # Include a Changes column describing what changed
-        changed_rows = []
-        for row, changes in changed_fixtures:
-            row_copy = dict(row)
-            row_copy['Changes'] = '; '.join(changes)
-            changed_rows.append(row_copy)
         changed_header = HEADER + ['Changes']
         with open(CHANGED_CSV, 'w', encoding='utf-8', newline='') as f:
             writer = csv.DictWriter(f, fieldnames=changed_header)
             writer.writeheader()
-            for row in changed_rows:
-                writer.writerow(row)
+            for row, changes in diff['changed']:
+                row_copy = dict(row)
+                row_copy['Changes'] = '; '.join(format_change(*c) for c in changes)
+                writer.writerow(row_copy)
     elif os.path.exists(CHANGED_CSV):
         os.remove(CHANGED_CSV)
-    
-    if removed_fixtures:
-        write_csv(REMOVED_CSV, removed_fixtures)
+
+    if diff['removed']:
+        write_csv(REMOVED_CSV, diff['removed'])
     elif os.path.exists(REMOVED_CSV):
         os.remove(REMOVED_CSV)
-    
-    # Print summary
+
+
+def print_diff_report(diff):
+    """Print the human-readable sync report for a computed diff."""
+    new_fixtures = diff['new']
+    changed_fixtures = diff['changed']
+    postponed_fixtures = diff['postponed']
+    removed_fixtures = diff['removed']
+
     print("=" * 60)
     print("  ClubZap Sync - Fixture Diff Report")
     print(f"  {datetime.now().strftime('%d/%m/%Y %H:%M')}")
     print("=" * 60)
-    print(f"  Current fixtures (website):  {len(current)}")
-    print(f"  Baseline (uploaded):         {len(baseline)}")
+    print(f"  Current fixtures (website):  {diff['current_count']}")
+    print(f"  Baseline (uploaded):         {diff['baseline_count']}")
     print("-" * 60)
     
-    if not baseline:
+    if not diff['baseline_count']:
         print(f"\n  FIRST RUN - No baseline found.")
-        print(f"  All {len(current)} fixtures are new.")
+        print(f"  All {diff['current_count']} fixtures are new.")
         print(f"\n  -> {NEW_CSV}")
         print(f"     Upload this file to ClubZap, then run:")
         print(f"     py clubzap_sync.py uploaded")
@@ -148,7 +173,7 @@ def diff_fixtures():
         print(f"  CHANGED fixtures (edit):      {len(changed_fixtures)}")
         print(f"  POSTPONED (delete):           {len(postponed_fixtures)}")
         print(f"  REMOVED fixtures (delete):    {len(removed_fixtures)}")
-        print(f"  Unchanged:                    {unchanged}")
+        print(f"  Unchanged:                    {diff['unchanged']}")
         
         if new_fixtures:
             print(f"\n  -> {NEW_CSV}")
@@ -165,7 +190,7 @@ def diff_fixtures():
             for row, changes in changed_fixtures:
                 print(f"       {row['Date']} {row['Team']} vs {row['Opponent']}")
                 for c in changes:
-                    print(f"         {c}")
+                    print(f"         {format_change(*c)}")
         
         if postponed_fixtures:
             print(f"\n  POSTPONED - Delete these from ClubZap:")
@@ -187,6 +212,29 @@ def diff_fixtures():
     print("=" * 60)
 
 
+def diff_fixtures(current=None, baseline=None):
+    """Compare current fixtures against uploaded baseline and generate diff files.
+
+    *current* / *baseline* may be passed in as already-parsed fixture dicts
+    (the monitor does this); otherwise they are read from FULL_CSV and
+    BASELINE_CSV.  Returns the diff (see compute_diff), or None if there
+    are no current fixtures.
+    """
+    if current is None:
+        current = read_csv_fixtures(FULL_CSV)
+    if baseline is None:
+        baseline = read_csv_fixtures(BASELINE_CSV)
+    
+    if not current:
+        print(f"ERROR: No fixtures found in {FULL_CSV}")
+        return None
+    
+    diff = compute_diff(current, baseline)
+    write_diff_files(diff)
+    print_diff_report(diff)
+    return diff
+
+
 def mark_uploaded():
     """Copy current full CSV as the new baseline (marks all as uploaded)."""
     if not os.path.exists(FULL_CSV):
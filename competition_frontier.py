@@ -0,0 +1,112 @@
+"""
+Competition-link frontier for club profiles without fixtures.
+
+When a club profile lists no fixtures, GAAClubScraper falls back to the
+league / competition pages it links to.  This module turns those links
+into a frontier:
+
+  - hrefs are normalised (absolute https URL, lower-case host, trailing
+    slash, no fragment or tracking parameters, sorted query) so the same
+    competition linked several ways is fetched once;
+  - each competition page's parsed fixtures are kept in a
+    CompetitionPageCache for the run, so clubs in the same competition
+    reuse one fetch and parse - concurrent requests for a page still in
+    flight wait for it rather than fetching it again.
+"""
+
+import threading
+from concurrent.futures import Future
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from config import BASE_URL
+
+_SITE_HOST = urlsplit(BASE_URL).hostname
+_TRACKING_PREFIXES = ("utm_", "fbclid", "gclid")
+
+
+def is_competition_link(href):
+    """True for the hrefs the fallback follows (league / competition pages)."""
+    return bool(href) and ("league" in href or "competition" in href)
+
+
+def normalise_competition_url(href, base=BASE_URL):
+    """Canonical absolute URL for a competition href, or None if off-site.
+
+    >>> normalise_competition_url("/league/210001?utm_source=x#table")
+    'https://gaacork.ie/league/210001/'
+    """
+    parts = urlsplit(urljoin(base, href.strip()))
+    if parts.scheme not in ("http", "https") or parts.hostname != _SITE_HOST:
+        return None
+    path = parts.path or "/"
+    if not path.endswith("/"):
+        path += "/"
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not k.lower().startswith(_TRACKING_PREFIXES))
+    return urlunsplit(("https", parts.hostname, path, urlencode(query), ""))
+
+
+def competition_frontier(soup):
+    """Distinct normalised competition URLs linked from *soup*, in page order."""
+    seen = set()
+    frontier = []
+    for link in soup.find_all("a", href=is_competition_link):
+        url = normalise_competition_url(link["href"])
+        if url and url not in seen:
+            seen.add(url)
+            frontier.append(url)
+    return frontier
+
+
+class CompetitionPageCache:
+    """Parsed fixtures per competition URL, shared by every club in a run.
+
+    get(url, fetch) calls fetch(url) once per URL; other callers get the
+    same result, waiting if the fetch is still running.  A fetch that
+    returns None (page unavailable) isn't cached, so a later club retries
+    it.  Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pages = {}  # url -> Future of a fixtures list
+        self.hits = 0
+        self.fetches = 0
+
+    def __contains__(self, url):
+        with self._lock:
+            return url in self._pages
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pages)
+
+    def get(self, url, fetch):
+        with self._lock:
+            future = self._pages.get(url)
+            owner = future is None
+            if owner:
+                future = self._pages[url] = Future()
+                self.fetches += 1
+            else:
+                self.hits += 1
+        if not owner:
+            return future.result()
+
+        try:
+            fixtures = fetch(url)
+        except BaseException as e:
+            with self._lock:
+                del self._pages[url]
+            future.set_exception(e)
+            raise
+        if fixtures is None:
+            with self._lock:
+                del self._pages[url]
+        future.set_result(fixtures)
+        return fixtures
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+            self.hits = self.fetches = 0
@@ -0,0 +1,85 @@
+"""
+Camogie source adapter for the Competition Results Monitor.
+
+Cork Camogie league pages (corkcamogie.com) list every fixture and result
+as Foireann cards, with the group standings alongside.  This adapter turns
+one fetch of such a page into the same dict shape as
+``CompetitionScraper.scrape`` so the results tracker, notifier and
+dashboard need no camogie-specific code.  It shares camogie_scraper's
+pooled session and conditional-request cache with the fixture monitor, so
+a page already fetched this run costs a 304 at most.
+"""
+
+import requests
+
+from camogie_scraper import fetch_league_page, involves_club
+from competition_monitor.config import CLUB_NAME
+
+
+class CamogieCompetitionScraper:
+    """Scrape a camogie league page for fixtures, results and table."""
+
+    def __init__(self, club_name=CLUB_NAME, session=None, cache=None):
+        self.club_name = club_name
+        self.session = session
+        self.cache = cache
+
+    def scrape(self, competition_url):
+        """Fetch a league page and return structured data.
+
+        Only the division(s) *club_name* plays in are kept: the page lists
+        every division of the league.  Returns dict with keys:
+        competition_name, competition_url, fixtures (list), results (list),
+        table (list) — or None if the page can't be fetched.
+        """
+        print(f"Loading: {competition_url}")
+        try:
+            page = fetch_league_page(competition_url, session=self.session,
+                                     cache=self.cache)
+        except requests.RequestException as e:
+            print(f"Error scraping {competition_url}: {e}")
+            return None
+
+        cards = page["cards"]
+        divisions = {c["competition"] for c in cards
+                     if involves_club(c, self.club_name)}
+        cards = [c for c in cards if c["competition"] in divisions]
+
+        data = {
+            "competition_name": " / ".join(sorted(divisions)),
+            "competition_url": competition_url,
+            "fixtures": [],
+            "results": [],
+            "table": _our_table(page["standings"], self.club_name),
+        }
+
+        played = set()
+        for card in cards:
+            if card.pop("_has_score"):
+                data["results"].append(card)
+                played.add(_key(card))
+        # A played match also stays listed as an upcoming card
+        for card in cards:
+            if "home_score" not in card and _key(card) not in played:
+                data["fixtures"].append(card)
+
+        print(f"Scraped {len(data['fixtures'])} fixtures, "
+              f"{len(data['results'])} results, "
+              f"{len(data['table'])} table rows")
+        return data
+
+    def close(self):
+        pass
+
+
+def _key(card):
+    return (card["date"], card["home"].lower(), card["away"].lower())
+
+
+def _our_table(tables, club_name):
+    """The first standings table that includes *club_name*, else []."""
+    club = club_name.lower()
+    for table in tables:
+        if any(club in row["team"].lower() for row in table):
+            return table
+    return []
@@ -15,6 +15,8 @@ CLUB_NAME = "Ballincollig"
 # Underage (Rebel Og) competitions live on rebelog.ie
 REBELOG_BASE_URL = "https://rebelog.ie"
 GAACORK_BASE_URL = "https://gaacork.ie"
+# Camogie leagues live on corkcamogie.com (Foireann widgets, no SportLomo ID)
+CORK_CAMOGIE_BASE_URL = "https://corkcamogie.com"
 
 # ---- Age groups ----
 # Each age group has a combined ntfy topic and a pattern used by discovery.
@@ -39,6 +41,10 @@ AGE_GROUPS = {
         "ntfy_combined_topic": "ballincollig-minor-results",
         "discovery_pattern": "fe18",
     },
+    # Adult camogie: no rebelog.ie listing, so no discovery
+    "camogie": {
+        "ntfy_combined_topic": "ballincollig-camogie-results",
+    },
 }
 
 # ---- Competitions to monitor ----
@@ -47,6 +53,8 @@ AGE_GROUPS = {
 # base_url: which site hosts this competition
 # ntfy_topic: per-competition ntfy topic name
 # age_group: key into AGE_GROUPS (determines combined topic + discovery)
+# Camogie entries instead set source "camogie", the league page url and the
+# club_name our team is listed under (see competition_monitor/camogie.py).
 COMPETITIONS = {
     # ===== U13 (Fe13) =====
     # --- 1st team ---
@@ -167,6 +175,22 @@ COMPETITIONS = {
         "ntfy_topic": "ballincollig-minor-hurling-2",
         "age_group": "minor",
     },
+
+    # ===== Camogie =====
+    "Premier Intermediate Camogie League": {
+        "source": "camogie",
+        "url": f"{CORK_CAMOGIE_BASE_URL}/premier-intermediate-league-2026/",
+        "club_name": "Ballincollig",
+        "ntfy_topic": "ballincollig-camogie-senior",
+        "age_group": "camogie",
+    },
+    "Barry O'Sullivan Camogie League": {
+        "source": "camogie",
+        "url": f"{CORK_CAMOGIE_BASE_URL}/barry-osullivan-league-2026/",
+        "club_name": "Ballincollig 2",
+        "ntfy_topic": "ballincollig-camogie-junior",
+        "age_group": "camogie",
+    },
 }
 
 # Override via env: comma-separated list of competition names to run
@@ -178,15 +202,21 @@ COMP_NAMES_OVERRIDE = os.environ.get("COMP_NAMES")
 COMP_AGE_GROUPS_OVERRIDE = os.environ.get("COMP_AGE_GROUPS")
 
 # ---- Notifications ----
+# Point at a local stand-in (see ntfy_stub.py) for testing and benchmarks
+NTFY_BASE_URL = os.environ.get("NTFY_BASE_URL", "https://ntfy.sh")
 NTFY_ICON = "https://sportlomo-userupload.s3.amazonaws.com/clubLogos/1986/ballincollig.gif"
 # Legacy combined topic (kept for backwards compat, U14 only)
 NTFY_COMBINED_TOPIC = "ballincollig-u14-results"
+# Run digest instead of per-run "All Clear" (see heartbeat.py)
+HEARTBEAT_INTERVAL_HOURS = float(os.environ.get("HEARTBEAT_INTERVAL_HOURS", "24"))
+HEARTBEAT_FAILURE_THRESHOLD = int(os.environ.get("HEARTBEAT_FAILURE_THRESHOLD", "2"))
 
 # ---- Dashboard ----
 DASHBOARD_BASE_URL = "https://wfleury.github.io/ballincollig-gaa"
 
 # ---- File paths ----
 BASELINE_DIR = "competition_baselines"
+HEARTBEAT_FILE = os.path.join(BASELINE_DIR, "_heartbeat.json")
 
 # ---- Filters ----
 RUGBY_INDICATORS = ["rfc", "rugby", "rugbai", "munster bowl", "boys clubs"]
@@ -194,6 +224,8 @@ RUGBY_INDICATORS = ["rfc", "rugby", "rugbai", "munster bowl", "boys clubs"]
 
 def competition_url(comp):
     """Return the full URL for a competition page."""
+    if comp.get("url"):
+        return comp["url"]
     return f"{comp['base_url']}/league/{comp['competition_id']}/"
 
 
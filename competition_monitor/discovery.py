@@ -8,18 +8,19 @@ championship), sends a notification so the user knows to add it.
 """
 
 import re
-import time
 
-from selenium.webdriver.common.by import By
+from bs4 import BeautifulSoup
 
+from config import HTML_PARSER
 from competition_monitor.config import (
     AGE_GROUPS, CLUB_NAME, COMPETITIONS, NTFY_COMBINED_TOPIC,
     REBELOG_BASE_URL, get_active_age_groups,
 )
+from competition_monitor.scraper import MATCH_LIST_WAIT
 
 
 # All competition IDs we already monitor
-_KNOWN_IDS = {c["competition_id"] for c in COMPETITIONS.values()}
+_KNOWN_IDS = {c.get("competition_id") for c in COMPETITIONS.values()}
 
 
 def _active_discovery_patterns():
@@ -47,29 +48,33 @@ def _age_group_for_name(name):
     return None
 
 
-def _club_in_competition(driver, league_url):
-    """Load a league page and check whether CLUB_NAME appears in it."""
-    try:
-        driver.get(league_url)
-        time.sleep(2)
-        return CLUB_NAME.lower() in driver.page_source.lower()
-    except Exception as e:
-        print(f"Discovery: could not verify {league_url} – {e}")
-        return False
+def _league_links(html):
+    """{competition_id: link text} for league links matching an active age group."""
+    candidate_comps = {}
+    soup = BeautifulSoup(html, HTML_PARSER)
+    for link in soup.select('a[href*="/league/"]'):
+        m = re.search(r'/league/(\d+)', link.get("href", ""))
+        if not m:
+            continue
+        comp_name = " ".join(link.get_text(" ").split())
+        if comp_name and _matches_any_age_group(comp_name):
+            candidate_comps[int(m.group(1))] = comp_name
+    return candidate_comps
 
 
-def discover_new_competitions(driver):
-    """Use an existing Selenium driver to scan rebelog.ie for new
+def discover_new_competitions(engine):
+    """Use the shared page engine to scan rebelog.ie for new
     competitions involving Ballincollig across active age groups.
 
     Finds league links on the fixtures page whose link text matches
     an active age group pattern, then verifies Ballincollig is listed
-    on the actual league page before reporting.
+    on the actual league page before reporting.  The candidate league
+    pages are loaded in parallel tabs.
 
     Returns a list of dicts:
         [{"name": ..., "competition_id": ..., "url": ..., "age_group": ...}]
     """
-    if not driver:
+    if not engine:
         return []
 
     found = []
@@ -77,37 +82,30 @@ def discover_new_competitions(driver):
 
     try:
         print(f"Discovery: loading {url}")
-        driver.get(url)
-        time.sleep(3)
-
-        # Find league links whose link text matches an active age group
-        links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/league/"]')
-        candidate_comps = {}  # id -> name
-        for link in links:
-            href = link.get_attribute("href") or ""
-            m = re.search(r'/league/(\d+)', href)
-            if not m:
-                continue
-            comp_id = int(m.group(1))
-            comp_name = link.text.strip()
-            if comp_name and _matches_any_age_group(comp_name):
-                candidate_comps[comp_id] = comp_name
+        page = engine.render(url, wait_for='a[href*="/league/"]')
 
         # Filter to ones we don't already know, then verify Ballincollig
         # is actually listed in the competition before reporting it.
-        for comp_id, comp_name in candidate_comps.items():
-            if comp_id not in _KNOWN_IDS:
-                comp_url = f"{REBELOG_BASE_URL}/league/{comp_id}/"
-                if _club_in_competition(driver, comp_url):
-                    found.append({
-                        "name": comp_name,
-                        "competition_id": comp_id,
-                        "url": comp_url,
-                        "age_group": _age_group_for_name(comp_name),
-                    })
-                else:
-                    print(f"Discovery: skipping {comp_name} ({comp_id}) – "
-                          f"{CLUB_NAME} not found on league page")
+        candidates = {comp_id: comp_name
+                      for comp_id, comp_name in _league_links(page.html).items()
+                      if comp_id not in _KNOWN_IDS}
+        urls = [f"{REBELOG_BASE_URL}/league/{comp_id}/" for comp_id in candidates]
+        pages = engine.render_many(urls, wait_for='ul[data-date]',
+                                   wait_timeout=MATCH_LIST_WAIT)
+        for (comp_id, comp_name), comp_url, league_page in zip(
+                candidates.items(), urls, pages):
+            if league_page is None:
+                print(f"Discovery: could not verify {comp_url}")
+            elif CLUB_NAME.lower() in league_page.html.lower():
+                found.append({
+                    "name": comp_name,
+                    "competition_id": comp_id,
+                    "url": comp_url,
+                    "age_group": _age_group_for_name(comp_name),
+                })
+            else:
+                print(f"Discovery: skipping {comp_name} ({comp_id}) – "
+                      f"{CLUB_NAME} not found on league page")
 
     except Exception as e:
         print(f"Discovery: error – {e}")
@@ -2,15 +2,28 @@
 Main orchestrator for the Competition Results Monitor.
 
 For each configured competition:
-  1. Scrape the competition page (fixtures, results, table)
+  1. Scrape the competition page (fixtures, results, table); SportLomo
+     pages are all rendered up front, in parallel tabs of one browser
   2. Load baseline and compute diff
-  3. Send appropriate ntfy notifications
+  3. Queue appropriate ntfy notifications
   4. Save updated baseline
+
+Each run is recorded in a heartbeat file; instead of an "All Clear" per
+run, a digest goes out once per interval, plus an immediate alert when
+runs keep failing.  Queued notifications are flushed once at the end.
 """
 
+import time
+
+from browser_engine import PageEngine
+from heartbeat import Heartbeat
+from http_client import get_client
+
 from competition_monitor.config import (
     get_active_competitions, competition_url, CLUB_NAME,
+    HEARTBEAT_FILE, HEARTBEAT_INTERVAL_HOURS, HEARTBEAT_FAILURE_THRESHOLD,
 )
+from competition_monitor.camogie import CamogieCompetitionScraper
 from competition_monitor.scraper import CompetitionScraper
 from competition_monitor.results_tracker import (
     compute_diff, save_baseline, has_changes,
@@ -36,32 +49,96 @@ def run(competition_filter=None):
             print("Available:", ", ".join(get_active_competitions()))
             return
 
-    scraper = CompetitionScraper()
+    # The browser is only needed for SportLomo competitions
+    sportlomo_urls = [competition_url(c) for c in competitions.values()
+                      if c.get("source") != "camogie"]
+    engine = PageEngine() if sportlomo_urls else None
+    start = time.monotonic()
+    failed = []
+    fixture_count = 0
+    changed = False
+    error = None
     try:
+        scraped = {}
+        if engine:
+            scraped = CompetitionScraper(engine).scrape_many(sportlomo_urls)
+
         for comp_name, comp_config in competitions.items():
-            _process_competition(scraper, comp_name, comp_config)
+            if comp_config.get("source") == "camogie":
+                comp_scraper = CamogieCompetitionScraper(
+                    club_name=comp_config.get("club_name", CLUB_NAME))
+                data = comp_scraper.scrape(competition_url(comp_config))
+            else:
+                data = scraped.get(competition_url(comp_config))
+            data, comp_changed = _process_competition(comp_name, comp_config, data)
+            changed = changed or comp_changed
+            if data:
+                fixture_count += len(data.get("fixtures", []))
+            else:
+                failed.append(comp_name)
 
         # Check for new competitions across all age groups
-        if scraper.driver:
-            new_comps = discover_new_competitions(scraper.driver)
+        if engine:
+            new_comps = discover_new_competitions(engine)
             if new_comps:
                 notify_new_competitions(new_comps)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
     finally:
-        scraper.close()
-
-
-def _process_competition(scraper, comp_name, comp_config):
-    """Scrape, diff, notify, and save for one competition."""
+        if engine:
+            engine.close()
+            browser_summary = engine.metrics.summary()
+            if browser_summary:
+                print(f"Browser:\n{browser_summary}")
+        if failed and not error:
+            error = (f"Failed to scrape {len(failed)} of {len(competitions)}: "
+                     + ", ".join(failed))
+        _record_heartbeat(
+            ok=error is None,
+            fixtures=fixture_count,
+            duration=time.monotonic() - start,
+            error=error,
+            changed=changed,
+            browser_restarts=engine.metrics.recycle_counts() if engine else None,
+        )
+        # Send everything queued during the run as per-topic digests
+        notifier.flush()
+        http_summary = get_client().metrics.summary()
+        if http_summary:
+            print(f"HTTP requests:\n{http_summary}")
+
+
+def _record_heartbeat(ok, fixtures, duration, error, changed,
+                      browser_restarts=None):
+    """Record this run and queue any due heartbeat digest or failure alert."""
+    heartbeat = Heartbeat(
+        HEARTBEAT_FILE, f"{CLUB_NAME} Competitions",
+        interval_hours=HEARTBEAT_INTERVAL_HOURS,
+        failure_threshold=HEARTBEAT_FAILURE_THRESHOLD,
+    )
+    heartbeat.record_run(ok, fixtures=fixtures, duration=duration, error=error,
+                         changed=changed, browser_restarts=browser_restarts)
+    for note in heartbeat.due_notifications():
+        print(f"Heartbeat: {note['title']}")
+        notifier.notify_heartbeat(note)
+    heartbeat.save()
+
+
+def _process_competition(comp_name, comp_config, data):
+    """Diff, notify, and save one competition's scraped *data*.
+
+    Returns (data, changed); data is None if the scrape failed.
+    """
     url = competition_url(comp_config)
     print(f"\n{'='*60}")
     print(f"  {comp_name}")
     print(f"  {url}")
     print(f"{'='*60}")
 
-    data = scraper.scrape(url)
     if not data:
         print(f"ERROR: Failed to scrape {comp_name}")
-        return
+        return None, False
 
     # Use the scraped competition name if we got one
     if not data.get("competition_name"):
@@ -73,9 +150,10 @@ def _process_competition(scraper, comp_name, comp_config):
         print(f"First run for {comp_name} — saving baseline")
         notifier.notify_first_run(comp_config, diff, comp_name)
         save_baseline(comp_name, data)
-        return
+        return data, True
 
-    if has_changes(diff):
+    changed = has_changes(diff)
+    if changed:
         _report_changes(diff, comp_name)
 
         # Our results — high priority
@@ -93,6 +171,7 @@ def _process_competition(scraper, comp_name, comp_config):
         print(f"No changes for {comp_name}")
 
     save_baseline(comp_name, data)
+    return data, changed
 
 
 def _report_changes(diff, comp_name):
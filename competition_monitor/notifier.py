@@ -2,15 +2,21 @@
 ntfy notification sender for Competition Results Monitor.
 
 Sends push notifications for new results, fixture changes,
-and all-clear messages.  Each competition has its own ntfy topic,
+and the periodic run heartbeat.  Each competition has its own ntfy topic,
 plus a combined topic per age group.
+
+Messages are queued for the whole run and sent by ``flush()`` so that
+several updates bound for one topic arrive as a single digest.
 """
 
 import os
-import requests
 
-from competition_monitor.config import CLUB_NAME, NTFY_ICON, combined_topic_for, competition_url, dashboard_url
+from competition_monitor.config import (
+    CLUB_NAME, DASHBOARD_BASE_URL, NTFY_BASE_URL, NTFY_ICON, combined_topic_for,
+    competition_url, dashboard_url, get_active_age_groups,
+)
 from gaa_utils import gaa_total
+from ntfy_dispatcher import MAX_BODY_BYTES, NtfyDispatcher
 
 
 def _priority():
@@ -18,48 +24,44 @@ def _priority():
     return "low" if os.environ.get("COMP_NTFY_QUIET") else "high"
 
 
-_MAX_BODY_BYTES = 3900  # ntfy.sh converts bodies >4096 bytes to attachment.txt
+_MAX_BODY_BYTES = MAX_BODY_BYTES  # ntfy.sh converts bodies >4096 bytes to attachment.txt
+
+# Messages are queued here during a run and sent as per-topic digests by
+# flush(), which the monitor calls once at the end of the run.
+_dispatcher = NtfyDispatcher(base_url=NTFY_BASE_URL, max_body_bytes=_MAX_BODY_BYTES)
+
 
+def _send(topic, title, message, priority=None, action_url=None, rank=None):
+    """Queue a message for ntfy.sh (sent on ``flush()``).
 
-def _send(topic, title, message, priority=None, action_url=None):
-    """Post a message to ntfy.sh."""
-    headers = {
-        "Title": title,
-        "Priority": priority or _priority(),
-        "Icon": NTFY_ICON,
-        "Content-Type": "text/plain; charset=utf-8",
-    }
+    *rank* orders sends when ntfy.sh is throttling us (see NtfyDispatcher).
+    """
+    headers = {"Icon": NTFY_ICON}
     if action_url:
         headers["Actions"] = f"view, View Dashboard, {action_url}"
-
-    body = message.encode("utf-8")
-    if len(body) > _MAX_BODY_BYTES:
-        truncated = body[: _MAX_BODY_BYTES - 40]
-        # avoid cutting mid-character
-        truncated = truncated.decode("utf-8", errors="ignore").encode("utf-8")
-        body = truncated + b"\n\n... (truncated)"
-
-    try:
-        resp = requests.post(
-            f"https://ntfy.sh/{topic}",
-            data=body,
-            headers=headers,
-            timeout=10,
-        )
-        status = "ok" if resp.status_code == 200 else f"status {resp.status_code}"
-        print(f"ntfy -> {topic}: {status}")
-    except Exception as e:
-        print(f"ntfy -> {topic}: FAILED – {e}")
+    _dispatcher.post(topic, title, message,
+                     priority=priority or _priority(), headers=headers,
+                     rank=rank)
 
 
-def _send_both(comp_config, title, message, priority=None, action_url=None):
+def _send_both(comp_config, title, message, priority=None, action_url=None,
+               rank=None):
     """Send to the per-competition topic AND the age-group combined topic."""
     comp_topic = comp_config["ntfy_topic"]
     combined = combined_topic_for(comp_config)
-    _send(comp_topic, title, message, priority=priority, action_url=action_url)
+    _send(comp_topic, title, message, priority=priority, action_url=action_url,
+          rank=rank)
     if combined and combined != comp_topic:
         _send(combined, title, message, priority=priority,
-              action_url=action_url)
+              action_url=action_url, rank=rank)
+
+
+def flush():
+    """Send every queued notification, merging those that share a topic.
+
+    Returns the dispatcher's per-POST result list.
+    """
+    return _dispatcher.flush()
 
 
 def _format_score(result):
@@ -125,6 +127,7 @@ def notify_our_result(comp_config, diff, comp_name):
             message=f"{line}{standing}",
             priority="high" if not os.environ.get("COMP_NTFY_QUIET") else "low",
             action_url=url,
+            rank="max",
         )
 
 
@@ -205,32 +208,18 @@ def notify_first_run(comp_config, diff, comp_name):
     )
 
 
-def notify_all_clear(comp_config, diff, comp_name):
-    """Low-priority 'no changes' heartbeat sent to the combined topic only.
+def notify_heartbeat(note):
+    """Send a run-heartbeat digest or failure alert (see heartbeat.py).
 
-    Per-competition topics only receive notifications when there are
-    actual changes, keeping noise down for subscribers.
+    Replaces the per-competition "All Clear": quiet runs are summarised in
+    one digest per interval, sent to each active age group's combined topic.
     """
-    combined = combined_topic_for(comp_config)
-    if not combined:
-        return
-
-    url = _action_url(comp_config)
-
-    standing = ""
-    if diff.get("our_standing"):
-        s = diff["our_standing"]
-        standing = f"\nLeague position: {s['position']} ({s['pts']} pts)"
-
-    _send(
-        combined,
-        title=f"{comp_name} - All Clear",
-        message=(
-            f"No new results or fixture changes.\n"
-            f"{diff['result_count']} results, "
-            f"{diff['fixture_count']} upcoming."
-            f"{standing}"
-        ),
-        priority="low",
-        action_url=url,
-    )
+    for group in get_active_age_groups().values():
+        _send(
+            group["ntfy_combined_topic"],
+            title=note["title"],
+            message=note["message"],
+            priority=note["priority"],
+            action_url=DASHBOARD_BASE_URL,
+            rank="max" if note["kind"] == "alert" else "min",
+        )
@@ -1,44 +1,48 @@
 """
-Selenium-based scraper for competition pages on rebelog.ie / gaacork.ie.
+Scraper for competition pages on rebelog.ie / gaacork.ie.
 
 Extracts all fixtures, results (with scores), and the league table
-for every team in a competition — not just Ballincollig.
+for every team in a competition — not just Ballincollig.  Pages are
+rendered in the shared headless browser (browser_engine) and parsed
+from their markup, so several competitions load at once in one browser.
 """
 
 import re
-import time
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+from bs4 import BeautifulSoup
+
+from browser_engine import PageEngine
+from config import HTML_PARSER
 
 
 SCORE_RE = re.compile(r'(\d+-\d+)\s*v\s*(\d+-\d+)', re.IGNORECASE)
 
+# Seconds to wait for a competition's match list to render
+MATCH_LIST_WAIT = 10
+
 
 class CompetitionScraper:
-    """Scrape a single competition page for fixtures, results and table."""
+    """Scrape competition pages for fixtures, results and table."""
 
-    def __init__(self):
-        self.driver = None
-        self._setup_driver()
+    def __init__(self, engine=None):
+        # An engine passed in is shared, and left open by close()
+        self.engine = engine
+        self._owns_engine = engine is None
 
     # ------------------------------------------------------------------
-    # Driver setup
+    # Browser
     # ------------------------------------------------------------------
-    def _setup_driver(self):
-        opts = Options()
-        opts.add_argument('--headless')
-        opts.add_argument('--no-sandbox')
-        opts.add_argument('--disable-dev-shm-usage')
-        opts.add_argument('--disable-gpu')
-        opts.add_argument('--window-size=1920,1080')
-        opts.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        try:
-            self.driver = webdriver.Chrome(options=opts)
-            print("Competition scraper: Chrome driver ready")
-        except Exception as e:
-            print(f"Competition scraper: failed to init Chrome – {e}")
+    def ensure_engine(self):
+        """The page engine, created on first use."""
+        if self.engine is None:
+            self.engine = PageEngine()
+        return self.engine
+
+    def _render(self, urls):
+        for url in urls:
+            print(f"Loading: {url}")
+        return self.ensure_engine().render_many(
+            urls, wait_for='ul[data-date]', wait_timeout=MATCH_LIST_WAIT)
 
     # ------------------------------------------------------------------
     # Public API
@@ -52,18 +56,29 @@ class CompetitionScraper:
     def scrape(self, competition_url):
         """Scrape a competition page and return structured data.
 
-        SportLomo pages embed all fixtures, results, and the league
-        table in the DOM with distinguishing CSS classes, so we select
-        elements directly rather than relying on tab clicks and
-        ``is_displayed()``, which are unreliable in headless Chrome.
-
         Returns dict with keys: competition_name, competition_url,
-        fixtures (list), results (list), table (list).
+        fixtures (list), results (list), table (list) — or None if the
+        page couldn't be loaded.
         """
-        if not self.driver:
-            print("No driver available")
-            return None
+        return self.scrape_many([competition_url])[competition_url]
 
+    def scrape_many(self, competition_urls):
+        """Scrape several competition pages in parallel browser tabs.
+
+        Returns {url: data} with data as for scrape().
+        """
+        urls = list(dict.fromkeys(competition_urls))
+        return {url: self.parse(page.html, url) if page else None
+                for url, page in zip(urls, self._render(urls))}
+
+    def parse(self, html, competition_url):
+        """Structured data from a rendered competition page.
+
+        SportLomo pages embed all fixtures, results, and the league
+        table in the DOM with distinguishing CSS classes (inactive tabs
+        are only hidden), so elements are selected directly from the
+        markup rather than through tab clicks.
+        """
         comp_id = self._comp_id_from_url(competition_url)
 
         data = {
@@ -75,12 +90,10 @@ class CompetitionScraper:
         }
 
         try:
-            print(f"Loading: {competition_url}")
-            self.driver.get(competition_url)
-            time.sleep(3)
+            soup = BeautifulSoup(html, HTML_PARSER)
 
             # Extract competition name from the page heading
-            data["competition_name"] = self._get_competition_name()
+            data["competition_name"] = self._get_competition_name(soup)
 
             # Use CSS class selectors to pick the right elements.
             # Fixture <ul>s carry class "fixtures-{comp_id}",
@@ -92,16 +105,16 @@ class CompetitionScraper:
                 fix_sel = 'ul.fixtures[data-date]'
 
             self._extract_matches_by_selector(
-                data, fix_sel, kind="fixtures")
+                soup, data, fix_sel, kind="fixtures")
 
             # Results live inside a div whose class or id references
             # "results".  They have class "results" but NOT "fixtures-*".
             res_sel = 'ul.results[data-date]'
             self._extract_matches_by_selector(
-                data, res_sel, kind="results")
+                soup, data, res_sel, kind="results")
 
             # League table
-            data["table"] = self._extract_table()
+            data["table"] = self._extract_table(soup)
 
             print(f"Scraped {len(data['fixtures'])} fixtures, "
                   f"{len(data['results'])} results, "
@@ -113,41 +126,39 @@ class CompetitionScraper:
         return data
 
     def close(self):
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        if self.engine is not None and self._owns_engine:
+            self.engine.close()
+            self.engine = None
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
-    def _get_competition_name(self):
+    @staticmethod
+    def _text(el):
+        """An element's text with whitespace collapsed."""
+        return " ".join(el.get_text(" ").split())
+
+    def _get_competition_name(self, soup):
         """Try to read the main heading of the competition page."""
         for sel in ['h2', 'h1.entry-title', 'h1']:
-            try:
-                el = self.driver.find_element(By.CSS_SELECTOR, sel)
-                text = el.text.strip()
-                if text and 'menu' not in text.lower():
-                    return text
-            except Exception:
+            el = soup.select_one(sel)
+            if el is None:
                 continue
+            text = self._text(el)
+            if text and 'menu' not in text.lower():
+                return text
         return ""
 
-    def _extract_matches_by_selector(self, data, selector, kind):
+    def _extract_matches_by_selector(self, soup, data, selector, kind):
         """Extract fixture or result data from elements matching *selector*.
 
-        Uses JavaScript ``getAttribute`` / ``textContent`` so that
-        elements hidden by tab CSS are still readable.
-
         Args:
+            soup: the parsed competition page.
             data: dict to append to ("fixtures" or "results" key).
             selector: CSS selector for the <ul> match elements.
             kind: "fixtures" or "results".
         """
-        try:
-            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-        except Exception:
-            elements = []
-
+        elements = soup.select(selector)
         if not elements:
             print(f"No elements for '{kind}' ({selector})")
             return
@@ -157,14 +168,6 @@ class CompetitionScraper:
             if not match:
                 continue
             if kind == "results":
-                # Ensure we have scores — try JS textContent as fallback
-                if not match.get("home_score"):
-                    text = self.driver.execute_script(
-                        "return arguments[0].textContent || '';", el)
-                    score_match = SCORE_RE.search(text)
-                    if score_match:
-                        match["home_score"] = score_match.group(1)
-                        match["away_score"] = score_match.group(2)
                 if match.get("home_score"):
                     data["results"].append(match)
             else:
@@ -172,13 +175,8 @@ class CompetitionScraper:
                     data["fixtures"].append(match)
 
     def _parse_match_element(self, el):
-        """Parse a single fixture/result <ul> element.
-
-        Uses JavaScript getAttribute to reliably read data attributes
-        even when the element is hidden by tab CSS.
-        """
-        get = lambda attr: self.driver.execute_script(
-            "return arguments[0].getAttribute(arguments[1]) || '';", el, attr)
+        """Parse a single fixture/result <ul> element."""
+        get = lambda attr: el.get(attr) or ''
 
         home = get('data-hometeam')
         away = get('data-awayteam')
@@ -191,10 +189,8 @@ class CompetitionScraper:
         comp = get('data-compname')
         referee = get('data-referee').strip()
 
-        # Check for score in the element text (JS textContent for hidden els)
-        text = self.driver.execute_script(
-            "return arguments[0].textContent || '';", el)
-        score_match = SCORE_RE.search(text)
+        # Check for score in the element text
+        score_match = SCORE_RE.search(el.get_text())
 
         match = {
             "home": home,
@@ -214,107 +210,80 @@ class CompetitionScraper:
 
         return match
 
-    def _extract_table(self):
+    def _extract_table(self, soup):
         """Extract the league table from the page.
 
         Returns a list of dicts with keys:
         position, team, played, won, drawn, lost, pf, pa, pd, pts
         """
         # The SportLomo league table is a <table class="league_table ...">
-        # element.  It may be hidden by tab CSS, so we use JS to read it.
-        table_el = None
+        # element (possibly in a hidden tab).
         for sel in ['table.league_table', 'table.standings',
-                     'table.league-table', 'table.table', 'table']:
-            try:
-                candidates = self.driver.find_elements(By.CSS_SELECTOR, sel)
-                for cand in candidates:
-                    # Use JS textContent to check hidden tables
-                    header_text = self.driver.execute_script(
-                        "return arguments[0].textContent || '';",
-                        cand).lower()
-                    if 'pts' in header_text and ('pld' in header_text or
-                                                  'team' in header_text):
-                        table_el = cand
-                        break
-                if table_el:
-                    break
-            except Exception:
-                continue
-
-        if table_el:
-            return self._parse_html_table(table_el)
+                    'table.league-table', 'table.table', 'table']:
+            for cand in soup.select(sel):
+                header_text = cand.get_text().lower()
+                if 'pts' in header_text and ('pld' in header_text or
+                                             'team' in header_text):
+                    return self._parse_html_table(cand)
 
         # Fallback: try parsing text blocks that look like a table
-        return self._parse_table_from_text()
+        return self._parse_table_from_text(soup)
 
     def _parse_html_table(self, table_el):
-        """Parse a standard HTML <table> for league standings.
-
-        Uses JavaScript to read cell text so hidden tables are handled.
-        """
+        """Parse a standard HTML <table> for league standings."""
         rows = []
-        try:
-            trs = table_el.find_elements(By.CSS_SELECTOR, 'tbody tr')
-            if not trs:
-                trs = table_el.find_elements(By.CSS_SELECTOR, 'tr')
-            for tr in trs:
-                cells = tr.find_elements(By.CSS_SELECTOR, 'td, th')
-                # Use JS textContent for each cell
-                texts = [self.driver.execute_script(
-                    "return (arguments[0].textContent || '').trim();", c)
-                    for c in cells]
-                if not texts or len(texts) < 4:
-                    continue
-                # Skip header rows
-                if any(h in texts[0].lower() for h in ['pos', 'position',
-                                                        'league', '#']):
-                    continue
-                row = self._cells_to_row(texts, len(rows) + 1)
-                if row:
-                    rows.append(row)
-        except Exception as e:
-            print(f"Error parsing HTML table: {e}")
+        trs = table_el.select('tbody tr') or table_el.select('tr')
+        for tr in trs:
+            texts = [c.get_text().strip() for c in tr.select('td, th')]
+            if not texts or len(texts) < 4:
+                continue
+            # Skip header rows
+            if any(h in texts[0].lower() for h in ['pos', 'position',
+                                                    'league', '#']):
+                continue
+            row = self._cells_to_row(texts, len(rows) + 1)
+            if row:
+                rows.append(row)
         return rows
 
-    def _parse_table_from_text(self):
-        """Fallback: scrape the full page text and look for table-like data.
+    # Pattern: team name followed by numbers for Pld W D L PF PA PD Pts
+    _TABLE_TEXT_RE = re.compile(
+        r'^\s*(\d+)?\s*'             # optional position
+        r'([A-ZÁÉÍÓÚa-záéíóú\s\'-]+?)\s+'  # team name
+        r'(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+'  # Pld W D L
+        r'(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+'    # PF PA PD
+        r'(\d+)',                              # Pts
+        re.MULTILINE
+    )
+
+    def _parse_table_from_text(self, soup):
+        """Fallback: scan the page text for table-like data.
 
         The SportLomo pages sometimes render tables as styled <div> grids
         rather than <table> elements.
         """
         rows = []
-        try:
-            # Find all elements that might be table rows
-            # Look for divs/uls containing team names followed by numbers
-            body_text = self.driver.find_element(By.TAG_NAME, 'body').text
-            # Pattern: team name followed by numbers for Pld W D L PF PA PD Pts
-            table_re = re.compile(
-                r'^\s*(\d+)?\s*'             # optional position
-                r'([A-ZÁÉÍÓÚa-záéíóú\s\'-]+?)\s+'  # team name
-                r'(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+'  # Pld W D L
-                r'(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+'    # PF PA PD
-                r'(\d+)',                              # Pts
-                re.MULTILINE
-            )
-            for m in table_re.finditer(body_text):
-                pos = m.group(1) or ''
-                team = m.group(2).strip()
-                if team.lower() in ('team', ''):
-                    continue
-                rows.append({
-                    "position": int(pos) if pos else len(rows) + 1,
-                    "team": team,
-                    "played": int(m.group(3)),
-                    "won": int(m.group(4)),
-                    "drawn": int(m.group(5)),
-                    "lost": int(m.group(6)),
-                    "pf": int(m.group(7)),
-                    "pa": int(m.group(8)),
-                    "pd": int(m.group(9)),
-                    "pts": int(m.group(10)),
-                })
-        except Exception as e:
-            print(f"Error parsing table from text: {e}")
+        body = soup.body or soup
+        body_text = "\n".join(
+            s.strip() for s in body.find_all(string=True)
+            if s.strip() and s.parent.name not in ('script', 'style'))
+        for m in self._TABLE_TEXT_RE.finditer(body_text):
+            pos = m.group(1) or ''
+            team = m.group(2).strip()
+            if team.lower() in ('team', ''):
+                continue
+            rows.append({
+                "position": int(pos) if pos else len(rows) + 1,
+                "team": team,
+                "played": int(m.group(3)),
+                "won": int(m.group(4)),
+                "drawn": int(m.group(5)),
+                "lost": int(m.group(6)),
+                "pf": int(m.group(7)),
+                "pa": int(m.group(8)),
+                "pd": int(m.group(9)),
+                "pts": int(m.group(10)),
+            })
         return rows
 
     def _cells_to_row(self, texts, idx):
@@ -362,10 +331,12 @@ if __name__ == "__main__":
     from competition_monitor.config import COMPETITIONS, competition_url
     scraper = CompetitionScraper()
     try:
-        for name, comp in COMPETITIONS.items():
-            url = competition_url(comp)
+        urls = {name: competition_url(comp) for name, comp in COMPETITIONS.items()
+                if comp.get("source") != "camogie"}
+        scraped = scraper.scrape_many(urls.values())
+        for name, url in urls.items():
             print(f"\n=== {name} ===")
-            data = scraper.scrape(url)
+            data = scraped[url]
             if data:
                 print(f"Competition: {data['competition_name']}")
                 print(f"Fixtures: {len(data['fixtures'])}")
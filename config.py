@@ -23,15 +23,30 @@ CSV_FILENAME = "gaa_clubs.csv"
 FIXTURES_CSV = "Ballincollig_Fixtures_Final.csv"
 HASH_FILE = "fixture_hashes.json"
 LOG_FILE = "monitoring_log.txt"
+HEARTBEAT_FILE = "monitor_heartbeat.json"
+CAMOGIE_CACHE_FILE = "camogie_cache.json"  # league page validators + last parse
+CLUB_CRAWL_STATE_FILE = os.path.join(OUTPUT_DIR, "club_crawl_state.json")
+FIXTURE_ENDPOINT_FILE = "fixture_endpoint.json"  # captured club-profile fixture XHR
+CLUBZAP_FIXTURE_MAP_FILE = "clubzap_fixture_map.json"  # ClubZap fixture IDs between syncs
 BASELINE_CSV = "clubzap_uploaded_baseline.csv"
 NEW_CSV = "clubzap_new_fixtures.csv"
 CHANGED_CSV = "clubzap_changed_fixtures.csv"
 REMOVED_CSV = "clubzap_removed_fixtures.csv"
 
 # ---- Notifications ----
+# Point at a local stand-in (see ntfy_stub.py) for testing and benchmarks
+NTFY_BASE_URL = os.environ.get("NTFY_BASE_URL", "https://ntfy.sh")
 NTFY_TOPIC = os.environ.get("NTFY_TOPIC", "ballincollig-gaa-fixtures")
 NTFY_ICON = "https://sportlomo-userupload.s3.amazonaws.com/clubLogos/1986/ballincollig.gif"
 NTFY_FIXTURES_URL = "https://ballincolliggaa.ie/fixtures"
+# Local notification backends: "auto" (Windows toast or console, plus ntfy)
+# or a comma list of windows, ntfy, console, file (see notification_backends.py)
+NOTIFY_BACKENDS = os.environ.get("NOTIFY_BACKENDS", "auto")
+NOTIFY_FILE = os.environ.get("NOTIFY_FILE")  # enables the file backend under "auto"
+# Unchanged runs are summarised in one digest per interval instead of an
+# "All Clear" every run; an alert goes out after this many failed runs in a row
+HEARTBEAT_INTERVAL_HOURS = float(os.environ.get("HEARTBEAT_INTERVAL_HOURS", "24"))
+HEARTBEAT_FAILURE_THRESHOLD = int(os.environ.get("HEARTBEAT_FAILURE_THRESHOLD", "2"))
 
 # ClubZap website team IDs (for filtered fixture links in notifications)
 CLUBZAP_TEAM_IDS = {
@@ -93,8 +108,102 @@ KEY_COLS = ["Date", "Team", "Opponent", "Competition Name"]
 CHANGE_COLS = ["Time", "Venue", "Ground", "Referee"]
 
 # ---- Request settings ----
-REQUEST_DELAY = 1  # seconds between requests
+# Shared HTTP client (see http_client.py)
+REQUEST_DELAY = 1  # default seconds between requests to the same host
 TIMEOUT = 10  # seconds
+HTML_PARSER = "lxml"  # BeautifulSoup tree builder for scraped pages
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+# Per-host spacing overrides (a host also covers its subdomains).  ntfy.sh
+# is paced by NtfyDispatcher's own token bucket.
+HTTP_HOST_DELAYS = {
+    "ntfy.sh": 0,
+    "localhost": 0,
+    "127.0.0.1": 0,
+    "corkcamogie.com": 0.25,
+}
+# Requests a host may take back to back before its delay applies
+HTTP_HOST_BURSTS = {}
+# Hosts whose TLS certificate isn't verified (incomplete chain)
+HTTP_INSECURE_HOSTS = ["corkcamogie.com"]
+HTTP_MAX_RETRIES = 3
+HTTP_POOL_SIZE = 8  # connections kept per host
+
+# Optional on-disk response cache (see response_cache.py):
+# off, read-write, or offline-only (serve from disk, no network)
+HTTP_CACHE_MODE = os.environ.get("HTTP_CACHE_MODE", "off")
+HTTP_CACHE_DIR = os.path.join(OUTPUT_DIR, "http_cache")
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024  # compressed bodies; LRU beyond this
+# (URL pattern, seconds fresh) - first match wins
+HTTP_CACHE_TTLS = [
+    (r"/clubprofile/", 15 * 60),  # club profiles: fixtures change often
+    (r"/league/\d+|corkcamogie\.com/[\w-]+-league", 60 * 60),  # league pages
+    (r"/competition-listing/|/fixtures-results/", 24 * 60 * 60),  # listings
+]
+HTTP_CACHE_DEFAULT_TTL = 0  # other pages: always revalidated
+
+# Multi-club profile crawler (see club_crawler.py)
+CLUB_CRAWL_WORKERS = 4
+
+# Competition-link fallback for profiles without fixtures
+# (see competition_frontier.py)
+COMPETITION_FALLBACK_WORKERS = 4  # competition pages fetched at once
+COMPETITION_FALLBACK_BUDGET = 10  # uncached competition pages fetched per club
+
+# Club-profile fixtures straight from the page's XHR (see fixture_endpoint.py):
+# auto - call the saved endpoint, using (and capturing from) the browser
+#        only when none is saved or its response shape has changed
+# discover - always load the page in the browser and re-capture
+# off - browser only
+FIXTURE_ENDPOINT_MODE = os.environ.get("FIXTURE_ENDPOINT_MODE", "auto")
+
+# Shared headless browser (see browser_engine.py): one Playwright Chromium
+# per process, rendering up to BROWSER_POOL_SIZE pages at once
+BROWSER_POOL_SIZE = 3  # browser contexts (one reusable tab each)
+BROWSER_HEADLESS = os.environ.get("BROWSER_HEADLESS", "true").lower() != "false"
+BROWSER_NAV_TIMEOUT = 60  # seconds per page navigation
+BROWSER_VIEWPORT = {"width": 1920, "height": 1080}
+# Watchdog: script calls (reading a page back) are limited to
+# BROWSER_SCRIPT_TIMEOUT; a render still running BROWSER_HANG_GRACE after
+# its navigation, selector wait and script budgets are all spent means the
+# browser is hung, so it is killed, relaunched and the page retried once.
+# The browser is also recycled between pages.
+BROWSER_SCRIPT_TIMEOUT = 30  # seconds
+BROWSER_HANG_GRACE = 15  # seconds
+BROWSER_CLOSE_TIMEOUT = 10  # seconds for a clean shutdown before killing it
+BROWSER_RECYCLE_PAGES = 40  # pages per browser process
+BROWSER_RECYCLE_MEMORY_MB = 1500  # driver + browser resident memory
+
+# ClubZap dashboard automation (see clubzap_automate.py)
+CLUBZAP_PAGE_TABS = 4  # fixture-list pages read at once in the logged-in context
+# Edits / deletes in flight at once (tabs sharing the login); keep it low to
+# stay polite to ClubZap.  A failed edit or delete is retried CLUBZAP_RETRIES times.
+CLUBZAP_WORKERS = int(os.environ.get("CLUBZAP_WORKERS", "3"))
+CLUBZAP_RETRIES = 2
+CLUBZAP_MAP_RECONCILE_DAYS = 7  # full re-read of the fixture list at least this often
+# Seconds each step may wait for its outcome (the element it needs, or the
+# form POST's response and the page it redirects to) before it counts as failed
+CLUBZAP_WAIT_TIMEOUTS = {
+    "login form": 20,
+    "sign in": 30,
+    "fixtures page": 30,
+    "fixture list": 10,  # rows to appear; an empty list just waits this out
+    "upload": 120,  # the import is processed before ClubZap answers the POST
+    "flash": 5,
+    "edit form": 20,
+    "save": 30,
+    "delete button": 15,
+    "delete": 30,
+}
+
+# Per-source time limits for the fixture monitor's concurrent fetch
+# (see fixture_sources.py)
+# GAA Cork's covers two club-profile renders (a hang and its retry) plus the
+# browser restart between them
+GAA_CORK_SOURCE_TIMEOUT = 420  # seconds
+CAMOGIE_SOURCE_TIMEOUT = 60  # seconds per league page
 
 # ---- Data fields to extract (general club profile scraping) ----
 FIELDS_TO_EXTRACT = [
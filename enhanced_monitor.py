@@ -9,26 +9,52 @@ import json
 from datetime import datetime, timedelta
 from selenium_scraper import SeleniumScraper
 import hashlib
-import subprocess
 import sys
-import requests
+import time
+from heartbeat import Heartbeat
+from http_client import get_client
+from notification_backends import NotificationHub, select_backends
+from ntfy_dispatcher import NtfyDispatcher
 from team_mapping import map_team_name, determine_event_type
 from config import (
-    CLUB_NAME, CLUB_ID, TEAM_ID,
-    HASH_FILE, LOG_FILE, FIXTURES_CSV, NTFY_TOPIC, NTFY_ICON,
-    NTFY_FIXTURES_URL, team_ntfy_topic, team_fixtures_url,
-    CHANGE_COLS, CAMOGIE_LEAGUES,
+    CLUB_NAME, HASH_FILE, LOG_FILE, FIXTURES_CSV,
+    NTFY_BASE_URL, NTFY_TOPIC, NTFY_ICON, NTFY_FIXTURES_URL,
+    NOTIFY_BACKENDS, NOTIFY_FILE, team_ntfy_topic, team_fixtures_url,
+    HEARTBEAT_FILE, HEARTBEAT_INTERVAL_HOURS, HEARTBEAT_FAILURE_THRESHOLD,
+    FIXTURE_HEADER,
+)
+from fixture_sources import default_sources, fetch_sources
+from clubzap_sync import (
+    BASELINE_CSV, compute_diff, fixture_hash, fixture_key, print_diff_report,
+    read_csv_fixtures, write_diff_files,
 )
-from camogie_scraper import scrape_camogie_fixtures
 
 class EnhancedFixtureMonitor:
-    def __init__(self):
-        self.selenium_scraper = SeleniumScraper()
+    def __init__(self, selenium_scraper=None, ntfy_base_url=NTFY_BASE_URL):
+        self.selenium_scraper = selenium_scraper or SeleniumScraper()
         self.hash_file = HASH_FILE
         self.log_file = LOG_FILE
         self.output_file = FIXTURES_CSV
         self.ntfy_topic = NTFY_TOPIC
-        
+        self.sources = default_sources(self.selenium_scraper)
+        self.source_results = []
+        self.dispatcher = NtfyDispatcher(base_url=ntfy_base_url, log=self.log_message)
+        # Backends are detected once here; sends never block the monitor
+        self.notifiers = NotificationHub(
+            select_backends(NOTIFY_BACKENDS, send_ntfy=self.send_ntfy,
+                            file_path=NOTIFY_FILE, log=self.log_message),
+            log=self.log_message,
+        )
+        self.heartbeat = Heartbeat(
+            HEARTBEAT_FILE, f"{CLUB_NAME} GAA",
+            interval_hours=HEARTBEAT_INTERVAL_HOURS,
+            failure_threshold=HEARTBEAT_FAILURE_THRESHOLD,
+        )
+        # Outcome of the last check_for_changes(), recorded in the heartbeat
+        self.last_count = None
+        self.last_changed = False
+        self.last_error = None
+
     def log_message(self, message):
         """Log message to file"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -40,20 +66,12 @@ class EnhancedFixtureMonitor:
         print(message)
     
     def get_fixtures_data(self):
-        """Get current fixtures data using Selenium (GAA Cork) + HTTP (Camogie)."""
-        fixtures = self.selenium_scraper.scrape_club_profile(club_id=CLUB_ID, team_id=TEAM_ID)
-
-        if not fixtures:
-            self.log_message("No fixtures found with Selenium")
-            fixtures = []
-
-        # Scrape camogie fixtures and merge
-        try:
-            camogie_fixtures = scrape_camogie_fixtures()
-            self.log_message(f"Camogie: fetched {len(camogie_fixtures)} fixtures")
-            fixtures.extend(camogie_fixtures)
-        except Exception as e:
-            self.log_message(f"WARNING: Camogie scrape failed: {e}")
+        """Get current fixtures from every source (GAA Cork Selenium, camogie
+        league pages) fetched concurrently; see fixture_sources.py."""
+        self.source_results = fetch_sources(self.sources, log=self.log_message)
+        fixtures = []
+        for result in self.source_results:
+            fixtures.extend(result['fixtures'])
 
         if not fixtures:
             self.log_message("ERROR: No fixtures from any source")
@@ -61,10 +79,9 @@ class EnhancedFixtureMonitor:
 
         output = io.StringIO()
         writer = csv.writer(output)
-        writer.writerow(["Date", "Time", "Venue", "Ground", "Referee",
-                         "Team", "Competition Name", "Your Club Name",
-                         "Opponent", "Event Type"])
+        writer.writerow(FIXTURE_HEADER)
 
+        rows = {}  # fixture_key -> row dict, as clubzap_sync reads the CSV
         fixture_count = 0
         for fixture in fixtures:
             home_team = fixture.get('home', '')
@@ -107,19 +124,42 @@ class EnhancedFixtureMonitor:
             if not referee:
                 referee = 'TBC (Pending)'
 
-            writer.writerow([formatted_date, time_val, venue, ground, referee,
-                             team, competition, CLUB_NAME, opponent, event_type])
+            values = [formatted_date, time_val, venue, ground, referee,
+                      team, competition, CLUB_NAME, opponent, event_type]
+            writer.writerow(values)
+            row = dict(zip(FIXTURE_HEADER, values))
+            rows[fixture_key(row)] = row
             fixture_count += 1
 
-        fixtures_text = output.getvalue().rstrip('\r\n')
-        fixtures_hash = hashlib.sha256(fixtures_text.encode()).hexdigest()
-
+        fixtures = self._fixture_hashes(rows)
         return {
-            'hash': fixtures_hash,
-            'text': fixtures_text,
+            'hash': self._collection_hash(fixtures),
+            'text': output.getvalue().rstrip('\r\n'),
             'count': fixture_count,
+            'fixtures': fixtures,
+            'rows': rows,
             'timestamp': datetime.now().isoformat()
         }
+
+    @staticmethod
+    def _fixture_hashes(rows):
+        """Map "|"-joined fixture key -> per-fixture content hash."""
+        return {"|".join(key): fixture_hash(row) for key, row in rows.items()}
+
+    @staticmethod
+    def _collection_hash(fixtures):
+        """Order-independent hash over every fixture's key and content hash."""
+        digest = hashlib.sha256()
+        for key in sorted(fixtures):
+            digest.update(f"{key}={fixtures[key]}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _previous_fixture_hashes(self, previous_data):
+        """Per-fixture hashes from saved state (rebuilt from CSV text for old state files)."""
+        if 'fixtures' in previous_data:
+            return previous_data['fixtures']
+        reader = csv.DictReader(io.StringIO(previous_data.get('text') or ''))
+        return self._fixture_hashes({fixture_key(row): row for row in reader})
     
     def load_previous_data(self):
         """Load previous fixture data"""
@@ -132,9 +172,9 @@ class EnhancedFixtureMonitor:
         return None
     
     def save_current_data(self, data):
-        """Save current fixture data"""
+        """Save current fixture data (the in-memory rows are not persisted)"""
         with open(self.hash_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            json.dump({k: v for k, v in data.items() if k != 'rows'}, f, indent=2)
     
     def regenerate_csv(self, fixtures_text):
         """Regenerate the fixtures CSV"""
@@ -146,152 +186,92 @@ class EnhancedFixtureMonitor:
             self.log_message(f"Error saving CSV: {e}")
             return False
     
-    def _sanitize_for_xml(self, text):
-        """Escape text for safe XML/PowerShell interpolation."""
-        text = str(text)
-        # PowerShell escapes (backtick first, then dollar)
-        text = text.replace("`", "``")
-        text = text.replace("$", "`$")
-        # XML escapes
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-        text = text.replace("'", "&apos;")
-        text = text.replace('"', "&quot;")
-        return text
-    
     def send_notification(self, title, message):
-        """Send Windows toast + ntfy.sh mobile push notification"""
-        safe_title = self._sanitize_for_xml(title)
-        safe_message = self._sanitize_for_xml(message)
-        
-        # --- Windows toast notification ---
-        try:
-            ps_script = f'''
-[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-[Windows.UI.Notifications.ToastNotification, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
-
-$xml = New-Object Windows.Data.Xml.Dom.XmlDocument
-$xml.LoadXml('<toast><visual><binding template="ToastGeneric"><text>{safe_title}</text><text>{safe_message}</text></binding></visual></toast>')
-
-$toast = New-Object Windows.UI.Notifications.ToastNotification($xml)
-[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("GAA Monitor").Show($toast)
-'''
-            
-            result = subprocess.run([
-                'powershell', '-Command', ps_script
-            ], capture_output=True, text=True, timeout=5)
-            
-            if result.returncode == 0:
-                self.log_message("Windows toast notification sent")
-            else:
-                msg_script = f'''
-Add-Type -AssemblyName System.Windows.Forms
-[System.Windows.Forms.MessageBox]::Show("{safe_message}", "{safe_title}", "OK", "Information")
-'''
-                subprocess.run([
-                    'powershell', '-Command', msg_script
-                ], timeout=10)
-                self.log_message("Message box notification sent")
-                
-        except Exception as e:
-            self.log_message(f"Failed to send Windows notification: {e}")
-            print(f"\nNOTIFICATION: {title}")
-            print(f"Message: {message}\n")
-        
-        # --- ntfy.sh mobile push notification ---
-        self.send_ntfy(title, message)
-    
-    def send_ntfy(self, title, message, priority=None, topic=None, team_name=None):
-        """Send push notification via ntfy.sh with Ballincollig crest and fixtures link"""
+        """Send a notification through every selected backend (toast/console, ntfy, file)."""
+        self.notifiers.notify(title, message)
+
+    def send_ntfy(self, title, message, priority=None, topic=None, team_name=None,
+                  rank=None):
+        """Queue a push notification via ntfy.sh with Ballincollig crest and fixtures link.
+
+        Messages are sent by ``flush_notifications()``; several messages for
+        the same topic in one run are merged into a single digest.  *rank*
+        overrides *priority* for send ordering when ntfy.sh is throttling.
+        """
         if priority is None:
             priority = "low" if os.environ.get("NTFY_QUIET") else "high"
         target_topic = topic or self.ntfy_topic
         fixtures_url = team_fixtures_url(team_name) if team_name else NTFY_FIXTURES_URL
-        try:
-            resp = requests.post(
-                f"https://ntfy.sh/{target_topic}",
-                data=message.encode('utf-8'),
-                headers={
-                    "Title": title,
-                    "Priority": priority,
-                    "Icon": NTFY_ICON,
-                    "Actions": f"view, View Fixtures, {fixtures_url}",
-                },
-                timeout=10,
-            )
-            if resp.status_code == 200:
-                self.log_message(f"ntfy.sh notification sent to {target_topic}")
-            else:
-                self.log_message(f"ntfy.sh returned status {resp.status_code} for {target_topic}")
-        except Exception as e:
-            self.log_message(f"Failed to send ntfy.sh notification to {target_topic}: {e}")
-    
-    def analyze_changes(self, old_text, new_text):
-        """Analyze what changed between old and new fixtures"""
-        old_lines = set(old_text.split('\n')) if old_text else set()
-        new_lines = set(new_text.split('\n')) if new_text else set()
-        
-        added = new_lines - old_lines
-        removed = old_lines - new_lines
-        
+        self.dispatcher.post(
+            target_topic,
+            title,
+            message,
+            priority=priority,
+            headers={
+                "Icon": NTFY_ICON,
+                "Actions": f"view, View Fixtures, {fixtures_url}",
+            },
+            rank=rank,
+        )
+
+    def flush_notifications(self):
+        """Send all queued ntfy notifications concurrently over one session."""
+        results = self.dispatcher.flush()
+        failed = [r for r in results if not r['ok']]
+        if failed:
+            self.log_message(f"WARNING: {len(failed)} of {len(results)} ntfy.sh sends failed")
+        if results:
+            worst = max(r['queue_delay'] for r in results)
+            self.log_message(f"ntfy.sh: {len(results)} sends, max queueing delay {worst:.2f}s")
+        return results
+
+    def analyze_changes(self, previous_data, current_data):
+        """Keyed diff of per-fixture hashes between the previous and current run.
+
+        A fixture whose key (KEY_COLS) is unchanged but whose content
+        differs (e.g. a new referee) counts as changed, not added + removed.
+        """
+        old = self._previous_fixture_hashes(previous_data)
+        new = current_data['fixtures']
+
+        added = [k for k in new if k not in old]
+        removed = [k for k in old if k not in new]
+        changed = [k for k in new if k in old and old[k] != new[k]]
+
         return {
-            'added': list(added),
-            'removed': list(removed),
+            'added': added,
+            'removed': removed,
+            'changed': changed,
             'added_count': len(added),
-            'removed_count': len(removed)
+            'removed_count': len(removed),
+            'changed_count': len(changed),
         }
     
-    def _build_diff_summary(self):
-        """Compare current fixtures CSV against the ClubZap baseline.
+    def _build_diff_summary(self, sync_diff):
+        """Summarise a clubzap_sync.compute_diff result for notifications.
 
         Returns:
             tuple: (diff_summary_text, team_changes_dict) where team_changes
                    maps team name -> list of human-readable change descriptions.
         """
-        from clubzap_sync import read_csv_fixtures, FULL_CSV, BASELINE_CSV
-
-        current = read_csv_fixtures(FULL_CSV)
-        baseline = read_csv_fixtures(BASELINE_CSV)
-
-        new_items = []
-        changed_items = []
-        postponed_items = []
-        removed_items = []
+        new_items = sync_diff['new']
+        changed_items = sync_diff['changed']
+        postponed_items = sync_diff['postponed']
+        removed_items = sync_diff['removed']
         team_changes = {}  # team_name -> [description lines]
 
-        for key, row in current.items():
-            team = row.get('Team', 'Unknown')
-            if row.get('Time', '') == 'Postponed':
-                postponed_items.append(row)
-                team_changes.setdefault(team, []).append(
-                    f"POSTPONED: {row['Date']} vs {row['Opponent']}")
-            elif key not in baseline:
-                new_items.append(row)
-                team_changes.setdefault(team, []).append(
-                    f"NEW: {row['Date']} vs {row['Opponent']}")
-            else:
-                old_row = baseline[key]
-                row_changes = []
-                for col in CHANGE_COLS:
-                    if old_row.get(col, '').strip() != row.get(col, '').strip():
-                        row_changes.append(f"  {col}: {row.get(col, '')}")
-                if row_changes:
-                    changed_items.append((row, row_changes))
-                    detail = ", ".join(
-                        f"{col}: {row.get(col, '')}" for col in CHANGE_COLS
-                        if old_row.get(col, '').strip() != row.get(col, '').strip()
-                    )
-                    team_changes.setdefault(team, []).append(
-                        f"CHANGED: {row['Date']} vs {row['Opponent']} ({detail})")
-
-        for key, row in baseline.items():
-            if key not in current:
-                removed_items.append(row)
-                team = row.get('Team', 'Unknown')
-                team_changes.setdefault(team, []).append(
-                    f"REMOVED: {row['Date']} vs {row['Opponent']}")
+        def add(row, line):
+            team_changes.setdefault(row.get('Team', 'Unknown'), []).append(line)
+
+        for row in new_items:
+            add(row, f"NEW: {row['Date']} vs {row['Opponent']}")
+        for row, changes in changed_items:
+            detail = ", ".join(f"{col}: {new_val}" for col, _, new_val in changes)
+            add(row, f"CHANGED: {row['Date']} vs {row['Opponent']} ({detail})")
+        for row in postponed_items:
+            add(row, f"POSTPONED: {row['Date']} vs {row['Opponent']}")
+        for row in removed_items:
+            add(row, f"REMOVED: {row['Date']} vs {row['Opponent']}")
 
         parts = []
         if new_items:
@@ -305,8 +285,8 @@ Add-Type -AssemblyName System.Windows.Forms
             parts.append(f"CHANGED ({len(changed_items)}):")
             for r, ch in changed_items[:5]:
                 parts.append(f"  {r['Date']} {r['Team']} vs {r['Opponent']}")
-                for c in ch:
-                    parts.append(f"    {c}")
+                for col, _, new_val in ch:
+                    parts.append(f"    {col}: {new_val}")
             if len(changed_items) > 5:
                 parts.append(f"  ...and {len(changed_items)-5} more")
 
@@ -323,11 +303,11 @@ Add-Type -AssemblyName System.Windows.Forms
         diff_summary = "\n".join(parts) if parts else "No ClubZap action needed"
         return diff_summary, team_changes
 
-    def _run_clubzap_sync(self):
-        """Run the ClubZap sync diff to generate CSV diff files."""
-        from clubzap_sync import diff_fixtures
+    def _run_clubzap_sync(self, sync_diff):
+        """Write the ClubZap diff CSVs from the already-computed diff."""
         self.log_message("Running ClubZap sync diff...")
-        diff_fixtures()
+        write_diff_files(sync_diff)
+        print_diff_report(sync_diff)
 
     def _send_team_notifications(self, team_changes):
         """Send per-team ntfy notifications so managers only see their team."""
@@ -345,9 +325,23 @@ Add-Type -AssemblyName System.Windows.Forms
         """Main monitoring function"""
         self.log_message("Starting fixture check...")
 
+        self.last_count, self.last_changed, self.last_error = None, False, None
+
         current_data = self.get_fixtures_data()
         if not current_data:
             self.log_message("ERROR: Could not retrieve current fixtures")
+            self.last_error = "Could not retrieve current fixtures"
+            return False
+        self.last_count = current_data['count']
+
+        # A failed source returns no fixtures: diffing without them would
+        # report all of its fixtures removed (and delete them from ClubZap)
+        failed = [r for r in self.source_results if not r['ok']]
+        if failed:
+            detail = "; ".join(f"{r['name']}: {r['error']}" for r in failed)
+            self.log_message(f"ERROR: {len(failed)} source(s) failed ({detail}); "
+                             "skipping the diff and ClubZap sync this run")
+            self.last_error = f"Source(s) failed: {detail}"
             return False
 
         previous_data = self.load_previous_data()
@@ -363,44 +357,41 @@ Add-Type -AssemblyName System.Windows.Forms
             )
             return True
 
+        changes = self.analyze_changes(previous_data, current_data)
+
         # --- No changes ---
-        if current_data['hash'] == previous_data['hash']:
+        if not (changes['added'] or changes['removed'] or changes['changed']):
             self.log_message(f"INFO: No changes - {current_data['count']} fixtures")
-            # Always regenerate CSV so it's available for artifacts and sync
+            # Always regenerate CSV so it's available for artifacts and sync.
+            # No push here: quiet runs are summarised by the heartbeat digest.
             self.regenerate_csv(current_data['text'])
-            all_clear_msg = (
-                f"No fixture changes detected.\n"
-                f"{current_data['count']} fixtures monitored.\n\n"
-                "If you're seeing this for the first time — "
-                "welcome! Notifications are working."
-            )
-            self.send_ntfy(
-                f"{CLUB_NAME} GAA - All Clear",
-                all_clear_msg,
-                priority="low",
-            )
             return True
 
         # --- Changes detected ---
         self.log_message("ALERT: FIXTURE CHANGES DETECTED!")
+        self.last_changed = True
 
-        changes = self.analyze_changes(previous_data.get('text'), current_data['text'])
         self.log_message(f"INFO: Previous: {previous_data['count']} fixtures")
         self.log_message(f"INFO: Current: {current_data['count']} fixtures")
         self.log_message(f"INFO: Added: {changes['added_count']} fixtures")
         self.log_message(f"INFO: Removed: {changes['removed_count']} fixtures")
+        self.log_message(f"INFO: Changed: {changes['changed_count']} fixtures")
 
         if not self.regenerate_csv(current_data['text']):
             self.log_message("ERROR: Failed to process changes")
+            self.last_error = "Failed to regenerate fixtures CSV"
             return False
 
         self.save_current_data(current_data)
 
-        # Build detailed diff summary and run ClubZap sync
+        # One keyed diff against the ClubZap baseline feeds the summary,
+        # the per-team notifications and the ClubZap sync CSVs
         team_changes = {}
         try:
-            diff_summary, team_changes = self._build_diff_summary()
-            self._run_clubzap_sync()
+            sync_diff = compute_diff(current_data['rows'],
+                                     read_csv_fixtures(BASELINE_CSV))
+            diff_summary, team_changes = self._build_diff_summary(sync_diff)
+            self._run_clubzap_sync(sync_diff)
         except Exception as e:
             self.log_message(f"ClubZap sync diff failed: {e}")
             diff_summary = f"Fixtures: {previous_data['count']} -> {current_data['count']}"
@@ -412,12 +403,67 @@ Add-Type -AssemblyName System.Windows.Forms
         self.log_message("SUCCESS: Changes processed successfully")
         return True
 
+    def run(self):
+        """Run ``check_for_changes()`` and record the outcome in the heartbeat.
+
+        Queues the heartbeat digest when it is due, and an immediate alert
+        once runs have failed HEARTBEAT_FAILURE_THRESHOLD times in a row.
+        """
+        start = time.monotonic()
+        ok = False
+        try:
+            ok = self.check_for_changes()
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.heartbeat.record_run(
+                ok,
+                fixtures=self.last_count,
+                duration=time.monotonic() - start,
+                error=None if ok else self.last_error,
+                changed=self.last_changed,
+                browser_restarts=self._browser_restarts(),
+            )
+            self._queue_heartbeat_notifications()
+        return ok
+
+    def browser_metrics(self):
+        """The club-profile browser's metrics, or None if it never started."""
+        engine = getattr(self.selenium_scraper, 'engine', None)
+        return engine.metrics if engine is not None else None
+
+    def _browser_restarts(self):
+        metrics = self.browser_metrics()
+        return metrics.recycle_counts() if metrics else None
+
+    def _queue_heartbeat_notifications(self):
+        """Queue any due heartbeat digest/alert and persist the heartbeat."""
+        for note in self.heartbeat.due_notifications():
+            self.log_message(f"Heartbeat: {note['title']}")
+            self.send_ntfy(
+                note['title'],
+                note['message'],
+                priority=note['priority'],
+                rank="max" if note['kind'] == "alert" else "min",
+            )
+        self.heartbeat.save()
+
 def main():
     monitor = EnhancedFixtureMonitor()
     try:
-        monitor.check_for_changes()
+        monitor.run()
     finally:
+        monitor.notifiers.close()
+        monitor.flush_notifications()
+        monitor.dispatcher.close()
+        browser_metrics = monitor.browser_metrics()
         monitor.selenium_scraper.close()
+        if browser_metrics and browser_metrics.summary():
+            monitor.log_message(f"Browser:\n{browser_metrics.summary()}")
+        http_summary = get_client().metrics.summary()
+        if http_summary:
+            monitor.log_message(f"HTTP requests:\n{http_summary}")
 
 if __name__ == "__main__":
     main()
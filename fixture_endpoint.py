@@ -0,0 +1,340 @@
+"""
+Direct HTTP access to the club profile's fixture XHR.
+
+gaacork.ie renders a club's fixtures with JavaScript: the profile page
+loads, then a background request fetches the fixture list.  Rather than
+waiting for a browser to render it, SeleniumScraper records the XHR /
+fetch exchanges made while the profile loads (see browser_engine) and
+picks out the one whose response carries the fixtures.  That request is
+saved to FIXTURE_ENDPOINT_FILE as a FixtureEndpoint, with the club and
+team IDs turned into placeholders, and later runs call it directly with
+the shared HTTP client.
+
+If the endpoint stops answering in the recorded shape (gone, different
+content type, different JSON keys, fixture markup without the data-*
+attributes), FixtureEndpoint.fetch raises EndpointShapeChanged and the
+caller falls back to the browser, which captures the endpoint afresh.
+An HTML reply in the captured container markup with no fixture <ul>s in
+it is a club with no fixtures (off-season), not a shape change.
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+from html import unescape
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config import CLUB_NAME, RUGBY_INDICATORS, TIMEOUT
+
+# Competitions never reported (rugby grounds share venues; LGFA has its own feed)
+EXCLUDED_COMPETITIONS = RUGBY_INDICATORS + ['lgfa', 'ladies']
+
+# Request headers replayed with the captured request
+_REPLAYED_HEADERS = ("Content-Type", "X-Requested-With", "Accept")
+
+# Fixture record keys in a JSON response, by field
+_RECORD_KEYS = {
+    'home': ('hometeam', 'home_team', 'home'),
+    'away': ('awayteam', 'away_team', 'away'),
+    'date': ('date', 'fixture_date'),
+    'time': ('time', 'fixture_time'),
+    'venue': ('venue',),
+    'competition': ('compname', 'competition', 'competition_name'),
+    'referee': ('referee',),
+}
+
+
+class EndpointShapeChanged(Exception):
+    """The fixture endpoint no longer answers the way it did when captured."""
+
+
+def fixture_from_attributes(get):
+    """Monitor fixture dict from a fixture <ul>'s data-* attributes.
+
+    *get(name)* returns an attribute value (or None), e.g. a parsed
+    tag's or a dict's get.  Returns None unless our club plays and the
+    competition isn't excluded.
+    """
+    home = get('data-hometeam') or ''
+    away = get('data-awayteam') or ''
+    if CLUB_NAME not in home and CLUB_NAME not in away:
+        return None
+    competition = get('data-compname') or ''
+    comp_lower = competition.lower()
+    if any(indicator in comp_lower for indicator in EXCLUDED_COMPETITIONS):
+        return None
+    return {
+        'home': home,
+        'away': away,
+        'date': get('data-date') or '',
+        'time': get('data-time') or '',
+        'venue': get('data-venue') or '',
+        'competition': competition,
+        'referee': (get('data-referee') or '').strip(),
+    }
+
+
+# A <ul ...> opening tag (quoted attribute values may contain '>')
+# Unrolled so an unclosed quote fails in linear time rather than
+# backtracking through every way of splitting the attribute text
+_UL_OPEN_RE = re.compile(r"""<ul\b([^>"']*(?:(?:"[^"]*"|'[^']*')[^>"']*)*)>""",
+                         re.IGNORECASE)
+_DATA_ATTR_RE = re.compile(r"""\b(data-[\w-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""",
+                           re.IGNORECASE)
+
+
+def iter_fixture_tags(html, club_name=None):
+    """Yield the data-* attributes of each fixture <ul> opening tag.
+
+    One forward scan over the markup: every <ul> carrying a data-hometeam
+    or data-awayteam attribute is yielded exactly once, in page order, as
+    a dict of unescaped attribute values.  With *club_name*, tags that
+    don't mention it are skipped before their attributes are parsed.
+    """
+    for match in _UL_OPEN_RE.finditer(html):
+        attributes = match.group(1)
+        if 'data-' not in attributes or (club_name and club_name not in attributes):
+            continue
+        attrs = {}
+        for attr in _DATA_ATTR_RE.finditer(attributes):
+            value = attr.group(2) if attr.group(2) is not None else attr.group(3)
+            attrs[attr.group(1).lower()] = unescape(value)
+        if 'data-hometeam' in attrs or 'data-awayteam' in attrs:
+            yield attrs
+
+
+def fixtures_from_html(html):
+    """Our fixtures in HTML holding fixture <ul data-*> elements."""
+    fixtures = []
+    for attrs in iter_fixture_tags(html, CLUB_NAME):
+        fixture = fixture_from_attributes(attrs.get)
+        if fixture:
+            fixtures.append(fixture)
+    return fixtures
+
+
+def _html_strings(value):
+    """Strings inside a decoded JSON value that hold fixture markup."""
+    if isinstance(value, str):
+        if 'data-hometeam' in value or 'data-date' in value:
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _html_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _html_strings(item)
+
+
+def _records(value):
+    """Dicts inside a decoded JSON value that look like fixture records."""
+    if isinstance(value, dict):
+        keys = {k.lower() for k in value}
+        if keys & set(_RECORD_KEYS['home']) and keys & set(_RECORD_KEYS['away']):
+            yield value
+            return
+        for item in value.values():
+            yield from _records(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _records(item)
+
+
+def _record_get(record):
+    lowered = {k.lower(): v for k, v in record.items()}
+
+    def get(attribute):
+        field = {'hometeam': 'home', 'awayteam': 'away',
+                 'compname': 'competition'}.get(attribute[5:], attribute[5:])
+        for key in _RECORD_KEYS[field]:
+            if lowered.get(key) is not None:
+                return str(lowered[key])
+        return None
+    return get
+
+
+def fixtures_from_payload(kind, body):
+    """Our fixtures in an endpoint response body of *kind* html or json."""
+    if kind == 'html':
+        return fixtures_from_html(body)
+    data = json.loads(body)
+    markup = ''.join(_html_strings(data))
+    if markup:
+        return fixtures_from_html(markup)
+    fixtures = []
+    for record in _records(data):
+        fixture = fixture_from_attributes(_record_get(record))
+        if fixture:
+            fixtures.append(fixture)
+    return fixtures
+
+
+_FIRST_TAG_RE = re.compile(r'<([a-zA-Z][\w-]*)\b([^>]*)>')
+_CLASS_RE = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+
+
+def _container(html):
+    """'tag.class.class' for the element wrapping an HTML fragment's
+    fixture list, or None if the fragment doesn't open with one (a bare
+    list of fixture <ul>s, text, WordPress's "0" / "-1")."""
+    match = _FIRST_TAG_RE.search(html)
+    if match is None:
+        return None
+    tag, attributes = match.group(1).lower(), match.group(2)
+    if tag == 'ul' and 'data-' in attributes:
+        return None
+    classes = _CLASS_RE.search(attributes)
+    if classes:
+        tag += ''.join('.' + name for name in (classes.group(1) or classes.group(2)).split())
+    return tag
+
+
+def _json_keys(data):
+    return sorted(data) if isinstance(data, dict) else ['[]']
+
+
+def _templated(text, club_id, team_id):
+    """Replace the club / team IDs in a URL or body with placeholders."""
+    for name, value in (('club_id', club_id), ('team_id', team_id)):
+        if value is not None:
+            text = re.sub(rf'(?<!\d){re.escape(str(value))}(?!\d)',
+                          '{' + name + '}', text)
+    return text
+
+
+class FixtureEndpoint:
+    """A captured fixture request, replayable for any club / team."""
+
+    def __init__(self, url, method='GET', body=None, headers=None, kind='html',
+                 keys=None, container=None, captured_at=None):
+        self.url = url
+        self.method = method
+        self.body = body
+        self.headers = headers or {}
+        self.kind = kind
+        self.keys = keys
+        self.container = container
+        self.captured_at = captured_at or datetime.now().isoformat()
+
+    @classmethod
+    def load(cls, path):
+        """The endpoint saved at *path*, or None."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                return cls(**json.load(f))
+        except (ValueError, TypeError) as e:
+            print(f"Ignoring unreadable fixture endpoint file {path}: {e}")
+            return None
+
+    def save(self, path):
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp, path)
+
+    def to_dict(self):
+        return {'url': self.url, 'method': self.method, 'body': self.body,
+                'headers': self.headers, 'kind': self.kind, 'keys': self.keys,
+                'container': self.container, 'captured_at': self.captured_at}
+
+    def request_for(self, club_id, team_id):
+        """(url, body) for a club / team."""
+        def fill(text):
+            return text.replace('{club_id}', str(club_id)).replace('{team_id}', str(team_id))
+        return fill(self.url), (fill(self.body) if self.body is not None else None)
+
+    def check_shape(self, content_type, body):
+        """Raise EndpointShapeChanged unless *body* matches the capture."""
+        if self.kind == 'json':
+            try:
+                data = json.loads(body)
+            except ValueError:
+                raise EndpointShapeChanged(
+                    f"expected JSON, got {content_type or 'unknown content'}")
+            if self.keys is not None and _json_keys(data) != self.keys:
+                raise EndpointShapeChanged(
+                    f"JSON keys changed: {self.keys} -> {_json_keys(data)}")
+            return
+        if body.lstrip().startswith(('{', '[')):
+            raise EndpointShapeChanged("expected an HTML fragment, got JSON")
+        if re.search(r'<html[\s>]', body[:2000], re.IGNORECASE):
+            raise EndpointShapeChanged("expected an HTML fragment, got a full page")
+        if 'data-hometeam' not in body:
+            if self.container is not None and _container(body) == self.container:
+                return  # the captured fixture list, empty: no fixtures just now
+            # An empty body, WordPress's "0" / "-1" or markup without the
+            # fixture <ul data-*> list: the browser has to check for us
+            raise EndpointShapeChanged("no fixture markup with data-* attributes")
+
+    def fetch(self, client, club_id, team_id):
+        """Fixtures for a club / team straight from the endpoint.
+
+        Raises EndpointShapeChanged if the response no longer has the
+        captured shape; network errors propagate as RequestException.
+        """
+        url, body = self.request_for(club_id, team_id)
+        resp = client.request(self.method, url, data=body, headers=self.headers,
+                              timeout=TIMEOUT)
+        if resp.status_code in (400, 403, 404, 405, 410):
+            raise EndpointShapeChanged(f"endpoint answered HTTP {resp.status_code}")
+        resp.raise_for_status()
+        self.check_shape(resp.headers.get('Content-Type', ''), resp.text)
+        return fixtures_from_payload(self.kind, resp.text)
+
+    @classmethod
+    def from_capture(cls, request, content_type, body, club_id, team_id):
+        """Endpoint for a captured request whose response body is *body*."""
+        kind = 'json' if 'json' in content_type or body.lstrip().startswith(('{', '[')) \
+            else 'html'
+        keys = _json_keys(json.loads(body)) if kind == 'json' else None
+        container = _container(body) if kind == 'html' else None
+        # Browsers report header names lower-cased
+        headers = {name.title(): value
+                   for name, value in (request.get('headers') or {}).items()
+                   if name.title() in _REPLAYED_HEADERS}
+        post_data = request.get('postData')
+        return cls(
+            url=_templated(_without_cache_buster(request['url']), club_id, team_id),
+            method=request.get('method', 'GET'),
+            body=_templated(post_data, club_id, team_id) if post_data else None,
+            headers=headers,
+            kind=kind,
+            keys=keys,
+            container=container,
+        )
+
+
+def _without_cache_buster(url):
+    """Drop jQuery's ``_=<timestamp>`` cache-busting parameter."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != '_']
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+# ── Capture from the browser's network traffic ────────────────────────
+
+def find_fixture_endpoint(exchanges, club_id, team_id):
+    """The XHR / fetch request among *exchanges* that returned our fixtures.
+
+    *exchanges* are the dicts browser_engine records with capture=True:
+    ``{'request': {url, method, postData, headers}, 'status',
+    'content_type', 'body'}``.  Returns a FixtureEndpoint, or None.
+    """
+    for exchange in exchanges:
+        body = exchange.get('body')
+        if exchange.get('status') != 200 or not body:
+            continue
+        # A body labelled JSON that isn't (JSONP, WordPress's "0") fails in
+        # from_capture, so it's skipped like any other unparseable response
+        try:
+            endpoint = FixtureEndpoint.from_capture(exchange['request'],
+                                                    exchange.get('content_type', ''),
+                                                    body, club_id, team_id)
+            if fixtures_from_payload(endpoint.kind, body):
+                return endpoint
+        except (ValueError, KeyError, TypeError):
+            continue
+    return None
@@ -0,0 +1,175 @@
+"""
+Fixture sources for the fixture monitor, fetched concurrently.
+
+Each source (the GAA Cork club profile via Selenium, each camogie league
+page, and anything added later) returns a list of fixture dicts in the
+shared shape (home, away, date, time, venue, competition, referee and
+optionally team).  ``fetch_sources()`` runs them all at once with a time
+limit per source, so a run takes as long as the slowest source rather
+than the sum, and one failing source doesn't lose the others' fixtures.
+Sources whose fixtures can overlap (the camogie leagues) give each one a
+``dedup_key()``; a fixture already returned by an earlier source with
+the same key is dropped.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from camogie_scraper import fixture_key as camogie_fixture_key, scrape_camogie_league
+from config import (
+    CAMOGIE_LEAGUES, CAMOGIE_SOURCE_TIMEOUT, CLUB_ID, GAA_CORK_SOURCE_TIMEOUT,
+    TEAM_ID,
+)
+
+
+class FixtureSource:
+    """Base class: subclasses set ``name`` and implement ``fetch()``."""
+
+    name = "source"
+    timeout = 60  # seconds
+
+    def fetch(self):
+        raise NotImplementedError
+
+    def dedup_key(self, fixture):
+        """Key shared by duplicates of *fixture* across sources, or None."""
+        return None
+
+
+class GAACorkSource(FixtureSource):
+    """Club-profile fixtures from gaacork.ie via the Selenium scraper."""
+
+    def __init__(self, scraper, club_id=CLUB_ID, team_id=TEAM_ID,
+                 timeout=GAA_CORK_SOURCE_TIMEOUT):
+        self.name = "GAA Cork"
+        self.scraper = scraper
+        self.club_id = club_id
+        self.team_id = team_id
+        self.timeout = timeout
+
+    def fetch(self):
+        # The render is cancelled at the source's timeout rather than left
+        # using the browser after fetch_sources() has given up on it
+        return self.scraper.scrape_club_profile(
+            club_id=self.club_id, team_id=self.team_id,
+            deadline=time.monotonic() + self.timeout) or []
+
+
+class CamogieLeagueSource(FixtureSource):
+    """One CAMOGIE_LEAGUES page on corkcamogie.com."""
+
+    def __init__(self, league, timeout=CAMOGIE_SOURCE_TIMEOUT):
+        self.name = f"Camogie: {league.get('competition') or league['url']}"
+        self.league = league
+        self.timeout = timeout
+
+    def fetch(self):
+        return scrape_camogie_league(self.league)
+
+    def dedup_key(self, fixture):
+        return camogie_fixture_key(fixture)
+
+
+def default_sources(selenium_scraper, leagues=None):
+    """The monitor's standard sources: GAA Cork plus every camogie league."""
+    if leagues is None:
+        leagues = CAMOGIE_LEAGUES
+    return [GAACorkSource(selenium_scraper)] + [
+        CamogieLeagueSource(league) for league in leagues
+    ]
+
+
+def _run(source):
+    start = time.monotonic()
+    fixtures = source.fetch()
+    return fixtures, time.monotonic() - start
+
+
+def _start(source):
+    """Fetch *source* on a daemon thread; a Future of (fixtures, elapsed).
+
+    Daemon threads rather than an executor's: an executor joins its
+    workers at interpreter exit, so a hung source would hold the run open
+    long after fetch_sources() gave up on it.
+    """
+    future = Future()
+
+    def work():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_run(source))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=work, name=f"source-{source.name}", daemon=True).start()
+    return future
+
+
+def fetch_sources(sources, log=print):
+    """Fetch every source concurrently, each within its own time limit.
+
+    Returns one result dict per source, in *sources* order:
+        {"name", "ok", "fixtures", "error", "elapsed"}
+    A source that raises or overruns its timeout is reported with ok=False
+    and no fixtures.  Duplicates (see FixtureSource.dedup_key) are
+    dropped from all but the first source listing them.
+
+    An overrunning source's thread can't be interrupted; it is abandoned
+    (a daemon thread, so it doesn't delay the process exiting) and its
+    late result discarded.
+    """
+    if not sources:
+        return []
+
+    start = time.monotonic()
+    results = {}
+    futures = {_start(source): source for source in sources}
+    pending = set(futures)
+    while pending:
+        next_deadline = min(start + futures[f].timeout for f in pending)
+        done, pending = wait(pending,
+                             timeout=max(0, next_deadline - time.monotonic()),
+                             return_when=FIRST_COMPLETED)
+        for future in done:
+            source = futures[future]
+            try:
+                fixtures, elapsed = future.result()
+                results[source] = {"name": source.name, "ok": True,
+                                   "fixtures": fixtures, "error": None,
+                                   "elapsed": elapsed}
+            except Exception as e:
+                results[source] = {"name": source.name, "ok": False,
+                                   "fixtures": [], "error": str(e),
+                                   "elapsed": time.monotonic() - start}
+
+        now = time.monotonic()
+        for future in [f for f in pending
+                       if now >= start + futures[f].timeout]:
+            source = futures[future]
+            pending.discard(future)
+            results[source] = {"name": source.name, "ok": False,
+                               "fixtures": [],
+                               "error": f"timed out after {source.timeout}s",
+                               "elapsed": now - start}
+
+    ordered = [results[source] for source in sources]
+    seen = set()
+    for source, r in zip(sources, ordered):
+        fixtures = []
+        for fixture in r["fixtures"]:
+            key = source.dedup_key(fixture)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            fixtures.append(fixture)
+        dropped = len(r["fixtures"]) - len(fixtures)
+        r["fixtures"] = fixtures
+        if r["ok"]:
+            log(f"{r['name']}: {len(fixtures)} fixtures in {r['elapsed']:.1f}s"
+                + (f" ({dropped} already listed)" if dropped else ""))
+        else:
+            log(f"WARNING: {r['name']} failed: {r['error']}")
+    return ordered
@@ -246,10 +246,10 @@ h1 { color: var(--primary); margin-bottom: 4px; font-size: 1.8em; }
 def _generate_landing_page(age_groups_with_data, now):
     """Write dashboard/index.html with links to each age group page."""
     age_labels = {"u13": "U13", "u14": "U14", "u15": "U15",
-                  "u16": "U16", "minor": "Minor"}
+                  "u16": "U16", "minor": "Minor", "camogie": "Camogie"}
 
     links = ""
-    for ag_key in ["u13", "u14", "u15", "u16", "minor"]:
+    for ag_key in ["u13", "u14", "u15", "u16", "minor", "camogie"]:
         if ag_key not in age_groups_with_data:
             continue
         label = age_labels.get(ag_key, ag_key.upper())
@@ -286,7 +286,7 @@ def _generate_landing_page(age_groups_with_data, now):
 def _generate_age_group_page(ag_key, comps, baselines, now):
     """Write dashboard/{ag_key}/index.html for one age group."""
     age_labels = {"u13": "U13", "u14": "U14", "u15": "U15",
-                  "u16": "U16", "minor": "Minor"}
+                  "u16": "U16", "minor": "Minor", "camogie": "Camogie"}
     label = age_labels.get(ag_key, ag_key.upper())
 
     content_html = ""
@@ -355,7 +355,7 @@ def generate():
         by_age.setdefault(ag, []).append((comp_name, comp_config))
 
     # Generate a page per age group
-    for ag_key in ["u13", "u14", "u15", "u16", "minor"]:
+    for ag_key in ["u13", "u14", "u15", "u16", "minor", "camogie"]:
         comps = by_age.get(ag_key, [])
         if not comps:
             continue
@@ -0,0 +1,221 @@
+"""
+Run heartbeat: local run history with a periodic digest notification.
+
+Instead of pushing an "All Clear" on every unchanged run, each monitor
+records its run (success, fixture count, duration) in a small JSON state
+file.  A single digest summarising the runs since the last one is
+produced once per interval (daily by default).  The only immediate
+notification is an alert when runs stop succeeding, followed by a
+"recovered" notice once they succeed again.
+
+Used by enhanced_monitor.py and the competition monitor.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+DEFAULT_INTERVAL_HOURS = 24
+DEFAULT_FAILURE_THRESHOLD = 2  # consecutive failed runs before alerting
+MAX_RUNS = 500  # cap on stored run records between digests
+
+
+def _percentile(values, pct):
+    """Nearest-rank percentile of *values* (pct in 0-100)."""
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _fmt_time(iso):
+    try:
+        return datetime.fromisoformat(iso).strftime("%d/%m %H:%M")
+    except (TypeError, ValueError):
+        return str(iso)
+
+
+class Heartbeat:
+    """Persistent run history for one monitor.
+
+    Args:
+        path: JSON state file (kept between CI runs via the Actions cache).
+        label: prefix for notification titles, e.g. "Ballincollig GAA".
+        interval_hours: how often a digest is due.
+        failure_threshold: consecutive failures that trigger an alert.
+    """
+
+    def __init__(self, path, label, interval_hours=DEFAULT_INTERVAL_HOURS,
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD):
+        self.path = path
+        self.label = label
+        self.interval = timedelta(hours=interval_hours)
+        self.failure_threshold = max(1, failure_threshold)
+        self.state = self._load()
+
+    # ------------------------------------------------------------------
+    # State I/O
+    # ------------------------------------------------------------------
+    def _load(self):
+        state = {
+            "runs": [],
+            "last_digest_at": None,
+            "consecutive_failures": 0,
+            "failing_since": None,
+            "alerted": False,
+        }
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    state.update(json.load(f))
+            except (json.JSONDecodeError, ValueError):
+                pass
+        return state
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(self.state, f, indent=2)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def record_run(self, ok, fixtures=None, duration=None, error=None,
+                   changed=False, browser_restarts=None, now=None):
+        """Record the outcome of one monitor run.
+
+        *browser_restarts* is the run's {reason: count} of browser
+        recycles (see browser_engine.BrowserMetrics), if it used one.
+        """
+        now = now or datetime.now()
+        runs = self.state["runs"]
+        run = {
+            "at": now.isoformat(),
+            "ok": bool(ok),
+            "fixtures": fixtures,
+            "duration": round(duration, 2) if duration is not None else None,
+            "error": error,
+            "changed": bool(changed),
+        }
+        if browser_restarts:
+            run["browser_restarts"] = dict(browser_restarts)
+        runs.append(run)
+        del runs[:-MAX_RUNS]
+
+        if ok:
+            self.state["consecutive_failures"] = 0
+            self.state["failing_since"] = None
+        else:
+            if not self.state["consecutive_failures"]:
+                self.state["failing_since"] = now.isoformat()
+            self.state["consecutive_failures"] += 1
+
+        if self.state["last_digest_at"] is None:
+            # First run ever: start the digest clock now
+            self.state["last_digest_at"] = now.isoformat()
+
+    # ------------------------------------------------------------------
+    # Notifications
+    # ------------------------------------------------------------------
+    def due_notifications(self, now=None):
+        """Return the notifications that should be sent now, and mark them sent.
+
+        Each item is a dict with "kind" ("alert", "recovered" or "digest"),
+        "title", "message" and "priority".  Call ``save()`` afterwards.
+        """
+        now = now or datetime.now()
+        out = []
+        failures = self.state["consecutive_failures"]
+
+        if failures >= self.failure_threshold and not self.state["alerted"]:
+            out.append(self._alert())
+            self.state["alerted"] = True
+        elif failures == 0 and self.state["alerted"]:
+            out.append(self._recovered())
+            self.state["alerted"] = False
+
+        last = self.state["last_digest_at"]
+        if last and now - datetime.fromisoformat(last) >= self.interval:
+            if self.state["runs"]:
+                out.append(self._digest())
+            self.state["runs"] = []
+            self.state["last_digest_at"] = now.isoformat()
+
+        return out
+
+    def _last_error(self):
+        for run in reversed(self.state["runs"]):
+            if not run["ok"]:
+                return run.get("error") or "unknown error"
+        return "unknown error"
+
+    def _alert(self):
+        failures = self.state["consecutive_failures"]
+        return {
+            "kind": "alert",
+            "title": f"{self.label} - Monitor Failing",
+            "message": (
+                f"{failures} consecutive runs have failed "
+                f"(since {_fmt_time(self.state['failing_since'])}).\n"
+                f"Last error: {self._last_error()}"
+            ),
+            "priority": "high",
+        }
+
+    def _recovered(self):
+        return {
+            "kind": "recovered",
+            "title": f"{self.label} - Monitor Recovered",
+            "message": "Runs are succeeding again.",
+            "priority": "default",
+        }
+
+    def _digest(self):
+        runs = self.state["runs"]
+        ok_runs = [r for r in runs if r["ok"]]
+        failed = len(runs) - len(ok_runs)
+        changed = sum(1 for r in runs if r["changed"])
+
+        hours = self.interval.total_seconds() / 3600
+        period = "Daily" if hours == 24 else f"{hours:g}h"
+        lines = [
+            f"Runs: {len(runs)} ({len(ok_runs)} ok, {failed} failed)",
+            f"Runs with changes: {changed}",
+        ]
+
+        counts = [r["fixtures"] for r in ok_runs if r["fixtures"] is not None]
+        if counts:
+            lo, hi = min(counts), max(counts)
+            span = f" (range {lo}-{hi})" if lo != hi else ""
+            lines.append(f"Fixtures monitored: {counts[-1]}{span}")
+
+        durations = [r["duration"] for r in runs if r["duration"] is not None]
+        if durations:
+            lines.append(
+                f"Run time: p50 {_percentile(durations, 50):.1f}s, "
+                f"p95 {_percentile(durations, 95):.1f}s, "
+                f"max {max(durations):.1f}s"
+            )
+
+        restarts = {}
+        for r in runs:
+            for reason, count in (r.get("browser_restarts") or {}).items():
+                restarts[reason] = restarts.get(reason, 0) + count
+        if restarts:
+            lines.append("Browser restarts: " + ", ".join(
+                f"{count} {reason}" for reason, count in sorted(restarts.items())))
+
+        if failed:
+            last_fail = next(r for r in reversed(runs) if not r["ok"])
+            lines.append(f"Last failure: {_fmt_time(last_fail['at'])} - "
+                         f"{last_fail.get('error') or 'unknown error'}")
+        if ok_runs:
+            lines.append(f"Last success: {_fmt_time(ok_runs[-1]['at'])}")
+
+        return {
+            "kind": "digest",
+            "title": f"{self.label} - {period} Summary",
+            "message": "\n".join(lines),
+            "priority": "low",
+        }
@@ -0,0 +1,282 @@
+"""
+Shared HTTP client for every scraper, notifier and script.
+
+One ``HttpClient`` per process (``get_client()``) owns a keep-alive
+``requests.Session``; urllib3 keeps a connection pool per host, so
+gaacork.ie, corkcamogie.com and ntfy.sh each reuse their own connections
+and TLS sessions.  On top of the session the client adds:
+
+  - per-host rate limiting: a token bucket per host refilled every
+    HTTP_HOST_DELAYS[host] seconds (REQUEST_DELAY by default), replacing
+    the fixed sleeps after each request;
+  - one retry policy: connection errors, and 5xx / 429 on idempotent
+    methods, are retried with exponential backoff (honouring
+    Retry-After); POSTs are never re-sent once they reach the server;
+  - one TLS policy: certificates are verified except for the hosts in
+    HTTP_INSECURE_HOSTS, and only their warnings are silenced;
+  - per-request metrics (host, status, latency, bytes), summarised with
+    ``client.metrics.summary()``;
+  - an optional on-disk response cache for GETs (response_cache.py),
+    switched on with HTTP_CACHE_MODE or ``set_cache_mode()``.
+
+The client's ``get()`` / ``post()`` take the same arguments as the
+``requests`` functions and return ``requests.Response`` objects, so call
+sites that accept an injected session keep working with test fakes.
+"""
+
+import re
+import threading
+import time
+import warnings
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+
+from config import (
+    HTTP_CACHE_MODE, HTTP_HOST_BURSTS, HTTP_HOST_DELAYS, HTTP_INSECURE_HOSTS,
+    HTTP_MAX_RETRIES, HTTP_POOL_SIZE, REQUEST_DELAY, TIMEOUT, USER_AGENT,
+)
+from response_cache import open_cache
+
+RETRY_BACKOFF = 1  # seconds; doubles on each retry
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _host(url):
+    return (urlsplit(url).hostname or "").lower()
+
+
+def _host_setting(settings, host, default=None):
+    """Look *host* up in *settings*, also matching parent domains."""
+    parts = host.split(".")
+    for i in range(len(parts)):
+        key = ".".join(parts[i:])
+        if key in settings:
+            return settings[key]
+    return default
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class HostRateLimiter:
+    """Per-host token bucket: one token per *delay* seconds, up to a burst.
+
+    With the default burst of 1 this spaces requests to a host at least
+    its delay apart; a larger HTTP_HOST_BURSTS entry lets a few requests
+    go back to back before settling to that rate.  Thread-safe:
+    concurrent callers for one host reserve consecutive tokens, so N
+    workers hitting one host still go out at the host's rate.  Different
+    hosts never wait on each other.
+    """
+
+    def __init__(self, delays=None, default=REQUEST_DELAY, bursts=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.delays = dict(HTTP_HOST_DELAYS if delays is None else delays)
+        self.bursts = dict(HTTP_HOST_BURSTS if bursts is None else bursts)
+        self.default = default
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets = {}  # host -> [tokens, updated]
+        self._lock = threading.Lock()
+
+    def delay_for(self, host):
+        return _host_setting(self.delays, host, self.default)
+
+    def burst_for(self, host):
+        return _host_setting(self.bursts, host, 1)
+
+    def wait(self, host):
+        """Block until *host* may be called again; returns seconds waited."""
+        delay = self.delay_for(host)
+        if delay <= 0:
+            return 0.0
+        burst = self.burst_for(host)
+        with self._lock:
+            now = self._clock()
+            tokens, updated = self._buckets.get(host, (burst, now))
+            tokens = min(burst, tokens + (now - updated) / delay)
+            waited = max(0.0, (1 - tokens) * delay)
+            # Negative tokens are reservations by callers still sleeping
+            self._buckets[host] = (tokens - 1, now)
+        if waited > 0:
+            self._sleep(waited)
+        return waited
+
+
+class RequestMetrics:
+    """Thread-safe log of completed requests."""
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def record(self, method, url, status, elapsed, nbytes, waited=0.0,
+               error=None, cached=False):
+        with self._lock:
+            self.records.append({
+                "method": method,
+                "host": _host(url),
+                "url": url,
+                "status": status,
+                "elapsed": elapsed,
+                "bytes": nbytes,
+                "waited": waited,
+                "error": error,
+                "cached": cached,
+            })
+
+    def by_host(self):
+        """Per-host totals: requests, errors, bytes, p50/p95/max latency."""
+        with self._lock:
+            records = list(self.records)
+        hosts = {}
+        for r in records:
+            hosts.setdefault(r["host"], []).append(r)
+        stats = {}
+        for host, rs in hosts.items():
+            latencies = [r["elapsed"] for r in rs]
+            stats[host] = {
+                "requests": len(rs),
+                "errors": sum(1 for r in rs
+                              if r["error"] or (r["status"] or 0) >= 400),
+                "bytes": sum(r["bytes"] for r in rs),
+                "cached": sum(1 for r in rs if r["cached"]),
+                "waited": sum(r["waited"] for r in rs),
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "max": max(latencies),
+            }
+        return stats
+
+    def summary(self):
+        """One line per host, for the end-of-run log."""
+        lines = []
+        for host, s in sorted(self.by_host().items()):
+            lines.append(
+                f"{host}: {s['requests']} requests ({s['cached']} cached), "
+                f"{s['errors']} errors, "
+                f"{s['bytes'] / 1024:.0f} KB, latency p50 {s['p50']:.2f}s "
+                f"p95 {s['p95']:.2f}s max {s['max']:.2f}s, "
+                f"rate-limit wait {s['waited']:.1f}s")
+        return "\n".join(lines)
+
+
+class HttpClient:
+    """Pooled, rate-limited, retrying HTTP client with request metrics."""
+
+    def __init__(self, limiter=None, max_retries=HTTP_MAX_RETRIES,
+                 pool_size=HTTP_POOL_SIZE, insecure_hosts=HTTP_INSECURE_HOSTS,
+                 timeout=TIMEOUT, user_agent=USER_AGENT, cache=None):
+        self.limiter = limiter or HostRateLimiter()
+        self.metrics = RequestMetrics()
+        self.cache = cache
+        self.insecure_hosts = {h.lower(): False for h in insecure_hosts}
+        self.timeout = timeout
+        # Silence urllib3's warning for these hosts only (not process-wide)
+        for host in self.insecure_hosts:
+            pattern = (r"Unverified HTTPS request is being made to host "
+                       rf"'([\w.-]+\.)?{re.escape(host)}'")
+            warnings.filterwarnings("ignore", message=pattern,
+                                    category=InsecureRequestWarning)
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,  # not POST
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size,
+                              pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["User-Agent"] = user_agent
+
+    def verify_for(self, host):
+        return _host_setting(self.insecure_hosts, host, True)
+
+    def set_cache_mode(self, mode):
+        """Switch the on-disk response cache: off, read-write or offline-only."""
+        self.cache = open_cache(mode) if mode != "off" else None
+
+    def request(self, method, url, **kwargs):
+        """Send one request; same arguments and result as requests.request."""
+        if method == "GET" and self.cache is not None and self.cache.enabled:
+            return self._cached_get(url, **kwargs)
+        return self._send(method, url, **kwargs)
+
+    def _cached_get(self, url, **kwargs):
+        """GET through the response cache (see response_cache.py).
+
+        A caller sending its own validators (e.g. camogie_scraper) gets the
+        server's 304 back as-is; otherwise a 304 is answered from disk.
+        """
+        cache = self.cache
+        entry, body, fresh = cache.lookup(url)
+        if entry and (fresh or cache.offline):
+            self.metrics.record("GET", url, 200, 0.0, len(body), cached=True)
+            return cache.response(url, entry, body)
+        if cache.offline:
+            raise requests.ConnectionError(
+                f"Offline: {url} is not in the HTTP cache")
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        conditional = "If-None-Match" in headers or "If-Modified-Since" in headers
+        if entry and not conditional:
+            headers.update(cache.validators(entry))
+        resp = self._send("GET", url, headers=headers, **kwargs)
+        if resp.status_code == 304 and entry and not conditional:
+            cache.touch(url, entry)
+            return cache.response(url, entry, body)
+        if resp.status_code == 200:
+            cache.store(url, resp)
+        return resp
+
+    def _send(self, method, url, **kwargs):
+        host = _host(url)
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("verify", self.verify_for(host))
+
+        waited = self.limiter.wait(host)
+        start = time.monotonic()
+        try:
+            resp = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            self.metrics.record(method, url, None, time.monotonic() - start,
+                                0, waited, error=str(e))
+            raise
+        self.metrics.record(method, url, resp.status_code,
+                            time.monotonic() - start, len(resp.content), waited)
+        return resp
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """The process-wide shared client (created on first use)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+            if HTTP_CACHE_MODE != "off":
+                _client.set_cache_mode(HTTP_CACHE_MODE)
+        return _client
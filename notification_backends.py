@@ -0,0 +1,230 @@
+"""
+Pluggable local notification backends for the fixture monitor.
+
+Each backend delivers a (title, message) notification one way:
+
+  - windows: Windows toast via PowerShell (message box fallback)
+  - ntfy:    mobile push, queued on the monitor's NtfyDispatcher
+  - console: printed to stdout
+  - file:    appended to a text file
+
+Backends are chosen once at startup, from NOTIFY_BACKENDS (comma list, or
+"auto") and what the platform supports, so a Linux runner never spawns
+PowerShell.  NotificationHub fans each notification out to the selected
+backends on a small thread pool, so a slow backend can't hold up the
+monitor; ``close()`` waits for outstanding sends and logs failures.
+"""
+
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+TOAST_TIMEOUT = 5  # seconds
+MESSAGE_BOX_TIMEOUT = 10  # seconds
+
+
+def sanitize_for_xml(text):
+    """Escape text for safe XML/PowerShell interpolation."""
+    text = str(text)
+    # PowerShell escapes (backtick first, then dollar)
+    text = text.replace("`", "``")
+    text = text.replace("$", "`$")
+    # XML escapes
+    text = text.replace("&", "&amp;")
+    text = text.replace("<", "&lt;")
+    text = text.replace(">", "&gt;")
+    text = text.replace("'", "&apos;")
+    text = text.replace('"', "&quot;")
+    return text
+
+
+class NotificationBackend:
+    """Base class.  Subclasses implement ``send()`` and may override
+    ``available()`` (checked once, when backends are selected).
+
+    ``blocking`` backends are run on the hub's thread pool; non-blocking
+    ones (e.g. ntfy, which only queues) are called inline.
+    """
+
+    name = "base"
+    blocking = True
+
+    @classmethod
+    def available(cls):
+        return True
+
+    def send(self, title, message):
+        raise NotImplementedError
+
+
+class WindowsToastBackend(NotificationBackend):
+    name = "windows"
+
+    @classmethod
+    def available(cls):
+        return sys.platform == "win32" and shutil.which("powershell") is not None
+
+    def send(self, title, message):
+        safe_title = sanitize_for_xml(title)
+        safe_message = sanitize_for_xml(message)
+        ps_script = f'''
+[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
+[Windows.UI.Notifications.ToastNotification, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
+[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
+
+$xml = New-Object Windows.Data.Xml.Dom.XmlDocument
+$xml.LoadXml('<toast><visual><binding template="ToastGeneric"><text>{safe_title}</text><text>{safe_message}</text></binding></visual></toast>')
+
+$toast = New-Object Windows.UI.Notifications.ToastNotification($xml)
+[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("GAA Monitor").Show($toast)
+'''
+        result = subprocess.run(["powershell", "-Command", ps_script],
+                                capture_output=True, text=True,
+                                timeout=TOAST_TIMEOUT)
+        if result.returncode == 0:
+            return "Windows toast notification sent"
+
+        msg_script = f'''
+Add-Type -AssemblyName System.Windows.Forms
+[System.Windows.Forms.MessageBox]::Show("{safe_message}", "{safe_title}", "OK", "Information")
+'''
+        subprocess.run(["powershell", "-Command", msg_script],
+                       timeout=MESSAGE_BOX_TIMEOUT)
+        return "Message box notification sent"
+
+
+class NtfyBackend(NotificationBackend):
+    """Hands the notification to a ``send_ntfy(title, message)`` callable."""
+
+    name = "ntfy"
+    blocking = False
+
+    def __init__(self, send_ntfy):
+        self.send_ntfy = send_ntfy
+
+    def send(self, title, message):
+        self.send_ntfy(title, message)
+
+
+class ConsoleBackend(NotificationBackend):
+    name = "console"
+    blocking = False
+
+    def send(self, title, message):
+        print(f"\nNOTIFICATION: {title}")
+        print(f"Message: {message}\n")
+
+
+class FileBackend(NotificationBackend):
+    name = "file"
+
+    def __init__(self, path):
+        self.path = path
+
+    def send(self, title, message):
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(f"[{timestamp}] {title}\n{message}\n\n")
+
+
+BACKENDS = {
+    cls.name: cls
+    for cls in (WindowsToastBackend, NtfyBackend, ConsoleBackend, FileBackend)
+}
+
+
+def register_backend(cls):
+    """Add a backend class to the registry (usable as a decorator)."""
+    BACKENDS[cls.name] = cls
+    return cls
+
+
+def select_backends(names="auto", send_ntfy=None, file_path=None, log=print):
+    """Instantiate the backends to use for this run.
+
+    Args:
+        names: comma-separated backend names, or "auto" for: Windows toast
+            when available (console otherwise), ntfy when *send_ntfy* is
+            given, and file when *file_path* is given.
+        send_ntfy: callable used by the ntfy backend.
+        file_path: output file for the file backend.
+    """
+    if not names or names.strip().lower() == "auto":
+        wanted = ["windows" if WindowsToastBackend.available() else "console"]
+        if send_ntfy:
+            wanted.append("ntfy")
+        if file_path:
+            wanted.append("file")
+    else:
+        wanted = [n.strip().lower() for n in names.split(",") if n.strip()]
+
+    args = {"ntfy": (send_ntfy,), "file": (file_path,)}
+    backends = []
+    for name in wanted:
+        cls = BACKENDS.get(name)
+        if cls is None:
+            log(f"WARNING: Unknown notification backend '{name}'")
+            continue
+        if not cls.available():
+            log(f"Notification backend '{name}' not available on this platform")
+            continue
+        ctor_args = args.get(name, ())
+        if any(a is None for a in ctor_args):
+            log(f"WARNING: Notification backend '{name}' is not configured")
+            continue
+        backends.append(cls(*ctor_args))
+    return backends
+
+
+class NotificationHub:
+    """Fans notifications out to backends without blocking the caller."""
+
+    def __init__(self, backends, log=print, max_workers=2):
+        self.backends = list(backends)
+        self.log = log
+        self._executor = None
+        self._max_workers = max_workers
+        self._futures = []
+
+    @property
+    def names(self):
+        return [b.name for b in self.backends]
+
+    def notify(self, title, message):
+        for backend in self.backends:
+            if backend.blocking:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="notify")
+                future = self._executor.submit(backend.send, title, message)
+                self._futures.append((backend, future))
+            else:
+                self._run(backend, title, message)
+
+    def _run(self, backend, title, message):
+        try:
+            status = backend.send(title, message)
+            if status:
+                self.log(status)
+        except Exception as e:
+            self.log(f"Failed to send {backend.name} notification: {e}")
+
+    def close(self):
+        """Wait for outstanding sends; returns the number that failed."""
+        failures = 0
+        for backend, future in self._futures:
+            try:
+                status = future.result()
+                if status:
+                    self.log(status)
+            except Exception as e:
+                failures += 1
+                self.log(f"Failed to send {backend.name} notification: {e}")
+        self._futures = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        return failures
@@ -0,0 +1,396 @@
+"""
+Pooled, concurrent ntfy.sh dispatcher.
+
+Notifications are queued during a run and sent on ``flush()``.  Messages
+bound for the same topic with the same extra headers (Icon, Tags,
+Actions, ...) are merged into a single digest (split only when the digest
+would exceed ``MAX_BODY_BYTES``), so a busy run costs one POST per topic
+instead of one per change.  All POSTs go through the shared
+HTTP client's keep-alive pool (http_client.py) on a small bounded thread
+pool.
+
+Sending is paced by a token bucket sized to ntfy.sh's visitor quota.
+High-priority digests (e.g. "our result") are sent before low-priority
+ones (e.g. "all clear"); a 429 response pauses the bucket for the
+server's ``Retry-After`` and halves the send rate until sends succeed
+again.  Each result reports how long its messages sat in the queue.
+
+Used by both enhanced_monitor.py and competition_monitor/notifier.py.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+from http_client import get_client
+
+NTFY_BASE_URL = "https://ntfy.sh"
+MAX_BODY_BYTES = 3900  # ntfy.sh converts bodies >4096 bytes to attachment.txt
+MAX_WORKERS = 4
+TIMEOUT = 10  # seconds
+MAX_RETRIES = 3  # re-sends of a digest after a 429
+
+# ntfy.sh's default visitor quota: a burst of 60 requests, then one
+# request replenished every 5 seconds.
+RATE_LIMIT_BURST = 60
+RATE_LIMIT_PER_SEC = 0.2
+MAX_RETRY_AFTER = 60  # never stall a run longer than this on one 429
+DEFAULT_RETRY_AFTER = 5
+
+_TRUNCATION_NOTE = b"\n\n... (truncated)"
+_DIGEST_SEPARATOR = "\n\n"
+
+# ntfy priority names, lowest to highest
+_PRIORITY_RANK = {"min": 1, "low": 2, "default": 3, "high": 4, "max": 5, "urgent": 5}
+
+
+def truncate_body(body, limit=MAX_BODY_BYTES):
+    """Trim *body* (bytes) to *limit* bytes, marking the cut."""
+    if len(body) <= limit:
+        return body
+    truncated = body[: limit - 40]
+    # avoid cutting mid-character
+    truncated = truncated.decode("utf-8", errors="ignore").encode("utf-8")
+    return truncated + _TRUNCATION_NOTE
+
+
+def _retry_after_seconds(value):
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if value is None:
+        return DEFAULT_RETRY_AFTER
+    value = str(value).strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+            seconds = when.timestamp() - time.time()
+        except (TypeError, ValueError):
+            seconds = DEFAULT_RETRY_AFTER
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that adapts to server throttling.
+
+    ``acquire()`` blocks until a token is available.  ``throttle(delay)``
+    is called on a 429: it blocks everyone for *delay* seconds, leaves a
+    single token for a probe request and halves the refill rate.  ``recover()`` is called
+    on each success and creeps the rate back up toward its configured
+    ceiling (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, rate=RATE_LIMIT_PER_SEC, burst=RATE_LIMIT_BURST,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self):
+        now = self._clock()
+        if now > self._updated:
+            self._tokens = min(self.burst,
+                               self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def acquire(self):
+        """Take one token, sleeping until one is available.
+
+        Returns the number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+    def throttle(self, delay):
+        """React to a 429: pause for *delay* seconds and halve the rate."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+            # one probe request may go as soon as the pause ends
+            self._tokens = 1.0
+            self._updated = self._paused_until
+            self.rate = max(self.max_rate / 4, self.rate / 2)
+
+    def recover(self):
+        """React to a success: step the rate back toward its ceiling."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 8)
+
+
+def _highest_priority(priorities):
+    return max(priorities, key=lambda p: _PRIORITY_RANK.get(p, 3))
+
+
+def _pack_sections(sections, limit):
+    """Greedily pack encoded *sections* into chunks no larger than *limit*.
+
+    Returns a list of (chunk_bytes, section_count) tuples.
+    """
+    sep = _DIGEST_SEPARATOR.encode("utf-8")
+    chunks = []
+    current, count = b"", 0
+    for section in sections:
+        section = truncate_body(section, limit)
+        if count and len(current) + len(sep) + len(section) <= limit:
+            current, count = current + sep + section, count + 1
+        else:
+            if count:
+                chunks.append((current, count))
+            current, count = section, 1
+    if count:
+        chunks.append((current, count))
+    return chunks
+
+
+class NtfyDispatcher:
+    """Queue ntfy messages and send them as per-topic digests.
+
+    Args:
+        base_url: ntfy server, e.g. ``https://ntfy.sh``.
+        max_workers: upper bound on concurrent POSTs.
+        max_body_bytes: digest size limit (see ``MAX_BODY_BYTES``).
+        timeout: per-request timeout in seconds.
+        log: callable used for one-line status messages.
+        limiter: ``TokenBucket`` pacing the POSTs (shared across flushes).
+        max_retries: how many times a 429'd digest is re-sent.
+    """
+
+    def __init__(self, base_url=NTFY_BASE_URL, max_workers=MAX_WORKERS,
+                 max_body_bytes=MAX_BODY_BYTES, timeout=TIMEOUT, log=print,
+                 limiter=None, max_retries=MAX_RETRIES):
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.max_body_bytes = max_body_bytes
+        self.timeout = timeout
+        self.log = log
+        self.limiter = limiter or TokenBucket()
+        self.max_retries = max_retries
+        self._pending = {}  # topic -> [message dict], insertion-ordered
+        self._session = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def post(self, topic, title, message, priority="default", headers=None,
+             rank=None):
+        """Queue a message for *topic*.  Nothing is sent until ``flush()``.
+
+        *rank* is a priority name used only for send ordering; it defaults
+        to *priority*.  Quiet (CI) runs send everything at ntfy priority
+        "low" but still want results to go out before all-clears.
+        """
+        self._pending.setdefault(topic, []).append({
+            "title": title,
+            "message": message,
+            "priority": priority,
+            "rank": rank or priority,
+            "headers": dict(headers or {}),
+            "queued_at": time.monotonic(),
+        })
+
+    @property
+    def pending_count(self):
+        """Number of queued messages (before coalescing)."""
+        return sum(len(msgs) for msgs in self._pending.values())
+
+    def flush(self):
+        """Coalesce and send all queued messages.
+
+        Digests are sent highest-priority first through the rate-limit
+        scheduler; a 429 pauses sending for ``Retry-After`` seconds and
+        the digest is retried (up to ``max_retries`` times).
+
+        Returns a list of result dicts, one per POST, in send order:
+            {"topic", "title", "messages", "priority", "status", "ok",
+             "error", "elapsed", "queue_delay", "attempts"}
+        where ``queue_delay`` is the time from the first ``post()`` of a
+        digest's messages until its successful (or final) send started.
+        """
+        pending, self._pending = self._pending, {}
+        requests_out = []
+        for topic, msgs in pending.items():
+            requests_out.extend(self._build_digests(topic, msgs))
+        if not requests_out:
+            return []
+
+        work = queue.PriorityQueue()
+        for seq, req in enumerate(requests_out):
+            work.put((-_PRIORITY_RANK.get(req["rank"], 3), seq, req))
+        results = []
+        results_lock = threading.Lock()
+
+        def worker():
+            while True:
+                try:
+                    rank, seq, req = work.get_nowait()
+                except queue.Empty:
+                    return
+                self.limiter.acquire()
+                result = self._deliver(req)
+                if result["status"] == 429 and req["attempts"] <= self.max_retries:
+                    delay = _retry_after_seconds(result["retry_after"])
+                    self.limiter.throttle(delay)
+                    self.log(f"ntfy -> {req['topic']}: rate limited, "
+                             f"retrying in {delay:.1f}s")
+                    work.put((rank, seq, req))
+                    continue
+                if result["ok"]:
+                    self.limiter.recover()
+                with results_lock:
+                    results.append(result)
+
+        workers = max(1, min(self.max_workers, len(requests_out)))
+        if workers == 1:
+            worker()
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(worker) for _ in range(workers)]
+            # A worker that died (rather than a failed POST, which is a
+            # result) is raised as it would be with a single worker
+            for future in futures:
+                future.result()
+        return results
+
+    def close(self):
+        """Release the session (the shared client itself stays open)."""
+        self._session = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = get_client()
+        return self._session
+
+    def _build_digests(self, topic, msgs):
+        """Turn the queued *msgs* for one topic into one or more POSTs.
+
+        A POST carries one set of headers, so messages are digested
+        separately per distinct header set (in order of first appearance)
+        rather than one message's Actions or Tags applying to all.
+        """
+        groups = {}
+        for m in msgs:
+            groups.setdefault(tuple(sorted(m["headers"].items())), []).append(m)
+        out = []
+        for group in groups.values():
+            out.extend(self._build_group(topic, group))
+        return out
+
+    def _build_group(self, topic, msgs):
+        """POSTs for *msgs* that share the same extra headers."""
+        headers = dict(msgs[0]["headers"])
+        priority = _highest_priority(m["priority"] for m in msgs)
+        rank = _highest_priority(m["rank"] for m in msgs)
+
+        if len(msgs) == 1:
+            m = msgs[0]
+            return [{
+                "topic": topic,
+                "title": m["title"],
+                "priority": priority,
+                "rank": rank,
+                "headers": headers,
+                "body": truncate_body(m["message"].encode("utf-8"),
+                                      self.max_body_bytes),
+                "messages": 1,
+                "queued_at": m["queued_at"],
+                "attempts": 0,
+            }]
+
+        titles = [m["title"] for m in msgs]
+        if len(set(titles)) == 1:
+            title = titles[0]
+            sections = [m["message"].encode("utf-8") for m in msgs]
+        else:
+            title = f"{titles[0]} (+{len(msgs) - 1} more)"
+            sections = [f"{m['title']}\n{m['message']}".encode("utf-8")
+                        for m in msgs]
+
+        chunks = _pack_sections(sections, self.max_body_bytes)
+        queued_at = min(m["queued_at"] for m in msgs)
+        out = []
+        for i, (chunk, count) in enumerate(chunks, 1):
+            chunk_title = title if len(chunks) == 1 else f"{title} ({i}/{len(chunks)})"
+            out.append({
+                "topic": topic,
+                "title": chunk_title,
+                "priority": priority,
+                "rank": rank,
+                "headers": headers,
+                "body": chunk,
+                "messages": count,
+                "queued_at": queued_at,
+                "attempts": 0,
+            })
+        return out
+
+    def _deliver(self, req):
+        req["attempts"] += 1
+        headers = {
+            "Title": req["title"],
+            "Priority": req["priority"],
+            "Content-Type": "text/plain; charset=utf-8",
+        }
+        headers.update(req["headers"])
+        result = {
+            "topic": req["topic"],
+            "title": req["title"],
+            "messages": req["messages"],
+            "priority": req["priority"],
+            "status": None,
+            "ok": False,
+            "error": None,
+            "elapsed": None,
+            "queue_delay": time.monotonic() - req["queued_at"],
+            "attempts": req["attempts"],
+            "retry_after": None,
+        }
+        start = time.perf_counter()
+        try:
+            resp = self.session.post(
+                f"{self.base_url}/{req['topic']}",
+                data=req["body"],
+                headers=headers,
+                timeout=self.timeout,
+            )
+            result["status"] = resp.status_code
+            result["ok"] = resp.status_code == 200
+            if resp.status_code == 429:
+                result["retry_after"] = resp.headers.get("Retry-After")
+            status = "ok" if result["ok"] else f"status {resp.status_code}"
+        except Exception as e:
+            result["error"] = str(e)
+            status = f"FAILED – {e}"
+        result["elapsed"] = time.perf_counter() - start
+        if result["status"] != 429 or req["attempts"] > self.max_retries:
+            self.log(f"ntfy -> {req['topic']}: {status} "
+                     f"(queued {result['queue_delay']:.2f}s)")
+        return result
@@ -0,0 +1,215 @@
+"""
+Local ntfy-compatible stand-in server.
+
+Implements the ntfy publish endpoint (``POST /{topic}`` with Title,
+Priority, Tags, Icon and Actions headers), records every message it
+receives, and can inject faults so the notification senders can be
+tested and benchmarked without touching ntfy.sh:
+
+  - latency:          fixed delay (seconds) before each response
+  - rate_limit_every: every Nth request gets ``429 Too Many Requests``
+                      with a ``Retry-After`` header
+  - drop_every:       every Nth request has its connection closed with no
+                      response, the way a failed TLS handshake looks to
+                      the client
+
+Usage:
+    python ntfy_stub.py --port 8080 --latency 0.05 --rate-limit-every 10
+    NTFY_BASE_URL=http://127.0.0.1:8080 python enhanced_monitor.py
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like ntfy.sh
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark and test output clean
+
+    def do_POST(self):
+        stub = self.server.stub
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        topic = self.path.strip("/").split("?")[0]
+
+        n = stub._next_request_number()
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        if stub.drop_every and n % stub.drop_every == 0:
+            stub._count("dropped")
+            self.close_connection = True
+            try:
+                self.connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            return
+
+        if stub.rate_limit_every and n % stub.rate_limit_every == 0:
+            stub._count(429)
+            self._reply(429, {"code": 42901, "http": 429,
+                              "error": "limit reached: too many requests"},
+                        extra_headers={"Retry-After": str(stub.retry_after)})
+            return
+
+        if not topic or "/" in topic:
+            stub._count(404)
+            self._reply(404, {"code": 40401, "http": 404, "error": "page not found"})
+            return
+
+        message = stub._record(topic, self.headers, body)
+        stub._count(200)
+        self._reply(200, {
+            "id": message["id"],
+            "time": int(message["received_at"]),
+            "event": "message",
+            "topic": topic,
+            "title": message["title"],
+            "message": message["message"],
+        })
+
+    def _reply(self, status, payload, extra_headers=None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class NtfyStubServer:
+    """In-process ntfy stand-in.  Use as a context manager or start()/stop().
+
+    ``messages`` holds one dict per accepted publish:
+        {"id", "topic", "title", "priority", "tags", "icon", "actions",
+         "message", "received_at"}
+    ``statuses`` counts responses by status code (plus ``"dropped"``).
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0,
+                 rate_limit_every=0, retry_after=1, drop_every=0):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.drop_every = drop_every
+        self.messages = []
+        self.statuses = {}
+        self._requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self):
+        return self._requests
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def reset(self):
+        """Forget recorded messages and counters (fault settings are kept)."""
+        with self._lock:
+            self.messages = []
+            self.statuses = {}
+            self._requests = 0
+
+    def topics(self):
+        """Return {topic: [message, ...]} for everything recorded."""
+        by_topic = {}
+        for m in self.messages:
+            by_topic.setdefault(m["topic"], []).append(m)
+        return by_topic
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Called from handler threads
+    # ------------------------------------------------------------------
+    def _next_request_number(self):
+        with self._lock:
+            self._requests += 1
+            return self._requests
+
+    def _count(self, status):
+        with self._lock:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def _record(self, topic, headers, body):
+        with self._lock:
+            message = {
+                "id": f"stub{len(self.messages) + 1}",
+                "topic": topic,
+                "title": headers.get("Title", ""),
+                "priority": headers.get("Priority", "default"),
+                "tags": headers.get("Tags", ""),
+                "icon": headers.get("Icon", ""),
+                "actions": headers.get("Actions", ""),
+                "message": body.decode("utf-8", errors="replace"),
+                "received_at": time.time(),
+            }
+            self.messages.append(message)
+            return message
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local ntfy-compatible stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Seconds to delay every response")
+    parser.add_argument("--rate-limit-every", type=int, default=0,
+                        help="Answer every Nth request with 429")
+    parser.add_argument("--retry-after", type=int, default=1,
+                        help="Retry-After seconds sent with 429s")
+    parser.add_argument("--drop-every", type=int, default=0,
+                        help="Drop the connection on every Nth request")
+    args = parser.parse_args()
+
+    server = NtfyStubServer(args.host, args.port, latency=args.latency,
+                            rate_limit_every=args.rate_limit_every,
+                            retry_after=args.retry_after,
+                            drop_every=args.drop_every)
+    print(f"ntfy stub listening on {server.url} (Ctrl+C to stop)")
+    server.start()
+    try:
+        while True:
+            time.sleep(5)
+            print(f"  {server.request_count} requests, statuses {server.statuses}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
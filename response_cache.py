@@ -0,0 +1,228 @@
+"""
+On-disk HTTP response cache for the scrapers (optional).
+
+Stores GET responses from gaacork.ie, rebelog.ie and corkcamogie.com
+under ``output/http_cache/`` so development runs and re-runs don't
+re-download identical pages.  Used by the shared HTTP client
+(http_client.py) when a cache mode other than "off" is selected:
+
+  - off:          no caching (the default for the monitors)
+  - read-write:   serve fresh entries from disk; revalidate stale ones
+                  with their ETag / Last-Modified, store new responses
+  - offline-only: serve whatever is on disk, however old, and never touch
+                  the network; a miss raises requests.ConnectionError
+
+Freshness comes from HTTP_CACHE_TTLS, a list of (URL regex, seconds)
+rules checked in order, so club profiles, league pages and listing pages
+can each have their own lifetime.  Bodies are gzip-compressed on disk;
+when the cache grows past HTTP_CACHE_MAX_BYTES the least recently used
+entries are evicted.
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import (
+    HTTP_CACHE_DEFAULT_TTL, HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES, HTTP_CACHE_TTLS,
+)
+
+CACHE_MODES = ("off", "read-write", "offline-only")
+
+# Response headers kept with each entry
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def _cached_response(url, entry, body):
+    """Rebuild a 200 requests.Response from a cache entry."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = url
+    resp.headers = CaseInsensitiveDict(entry["headers"])
+    resp.encoding = entry.get("encoding")
+    resp._content = body
+    resp.from_cache = True
+    return resp
+
+
+class ResponseCache:
+    """Compressed, size-capped, TTL-aware cache of GET responses.
+
+    The index (``index.json``) maps each URL's sha256 to
+        {"url", "headers", "encoding", "stored_at", "last_access", "size"}
+    and each body lives in ``<sha256>.gz`` beside it.  Thread-safe.
+    """
+
+    def __init__(self, directory=HTTP_CACHE_DIR, mode="read-write",
+                 ttl_rules=HTTP_CACHE_TTLS, default_ttl=HTTP_CACHE_DEFAULT_TTL,
+                 max_bytes=HTTP_CACHE_MAX_BYTES, clock=time.time):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode '{mode}' "
+                             f"(expected one of {', '.join(CACHE_MODES)})")
+        self.directory = directory
+        self.mode = mode
+        self.ttl_rules = [(re.compile(pattern), ttl) for pattern, ttl in ttl_rules]
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._index_path = os.path.join(directory, "index.json")
+        self.index = {}
+        if mode != "off" and os.path.exists(self._index_path):
+            try:
+                with open(self._index_path, encoding="utf-8") as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                self.index = {}  # unreadable index: start afresh
+
+    @property
+    def enabled(self):
+        return self.mode != "off"
+
+    @property
+    def offline(self):
+        return self.mode == "offline-only"
+
+    def ttl_for(self, url):
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, f"{key}.gz")
+
+    def lookup(self, url):
+        """Return (entry, body, fresh) for *url*, or (None, None, False)."""
+        key = self._key(url)
+        with self._lock:
+            entry = self.index.get(key)
+        if entry is None:
+            return None, None, False
+        try:
+            with gzip.open(self._body_path(key), "rb") as f:
+                body = f.read()
+        except OSError:
+            with self._lock:
+                self.index.pop(key, None)
+                self._dirty = True
+            return None, None, False
+        fresh = self._clock() - entry["stored_at"] < self.ttl_for(url)
+        return entry, body, fresh
+
+    def response(self, url, entry, body):
+        """A cached 200 for *url*; marks the entry as recently used."""
+        with self._lock:
+            entry["last_access"] = self._clock()
+            self._dirty = True
+            self.hits += 1
+        return _cached_response(url, entry, body)
+
+    def validators(self, entry):
+        """Conditional request headers for revalidating *entry*."""
+        headers = {}
+        if entry["headers"].get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+
+    def touch(self, url, entry):
+        """Record a successful revalidation (304): the entry is fresh again."""
+        with self._lock:
+            entry["stored_at"] = entry["last_access"] = self._clock()
+            self._dirty = True
+            self.revalidated += 1
+
+    def store(self, url, resp):
+        """Store a 200 response, then evict down to the size cap.
+
+        The body is compressed into a private temp file and moved into
+        place under the lock, so two threads storing the same URL can't
+        interleave writes and the index always describes the file on disk.
+        """
+        key = self._key(url)
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".gz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(resp.content)
+            size = os.path.getsize(tmp)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        now = self._clock()
+        entry = {
+            "url": url,
+            "headers": {h: resp.headers[h] for h in _KEPT_HEADERS
+                        if resp.headers.get(h)},
+            "encoding": resp.encoding,
+            "stored_at": now,
+            "last_access": now,
+            "size": size,
+        }
+        with self._lock:
+            os.replace(tmp, self._body_path(key))
+            self.index[key] = entry
+            self.misses += 1
+            self._evict()
+            self._save()
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (lock held)."""
+        total = sum(e["size"] for e in self.index.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self.index.items(),
+                                 key=lambda kv: kv[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= entry["size"]
+            del self.index[key]
+            try:
+                os.remove(self._body_path(key))
+            except OSError:
+                pass
+
+    def _save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self._index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+        os.replace(tmp, self._index_path)
+        self._dirty = False
+
+    def flush(self):
+        """Persist last-access times updated by cache hits."""
+        with self._lock:
+            if self._dirty and self.enabled:
+                self._save()
+
+    def summary(self):
+        return (f"HTTP cache ({self.mode}): {self.hits} hits, "
+                f"{self.revalidated} revalidated, {self.misses} stored, "
+                f"{len(self.index)} entries")
+
+
+def open_cache(mode):
+    """A ResponseCache for *mode* that flushes itself at exit."""
+    cache = ResponseCache(mode=mode)
+    atexit.register(cache.flush)
+    return cache
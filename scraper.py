@@ -6,15 +6,16 @@ Extracts club information from gaacork.ie club profile pages
 import csv
 import io
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
-from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, NavigableString, Tag
 
-from config import BASE_URL, REQUEST_DELAY, TIMEOUT, CLUB_NAME, RUGBY_INDICATORS
+from competition_frontier import CompetitionPageCache, competition_frontier
+from config import (BASE_URL, HTML_PARSER, TIMEOUT, CLUB_NAME, RUGBY_INDICATORS,
+                    COMPETITION_FALLBACK_BUDGET, COMPETITION_FALLBACK_WORKERS)
+from http_client import get_client
 from team_mapping import map_team_name, determine_event_type
 
 
@@ -25,15 +26,53 @@ class GAAClubScraper:
         re.IGNORECASE
     )
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-        })
-        retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+    # Fixture text patterns
+    _TIME_PATTERN = re.compile(r'(\d{1,2}:\d{2})')
+    _CLOCK_PATTERN = re.compile(r'(\d{2}:\d{2})')
+    _NUMERIC_DATE_PATTERN = re.compile(r'(\d{2}/\d{2}/\d{4})')
+    _SCORE_PATTERN = re.compile(r'(\d+-\d+)\s*v\s*(\d+-\d+)')
+    _VENUE_PATTERN = re.compile(r'Venue:\s*([^\n\r]+)')
+    _COMPETITION_PATTERN = re.compile(r'([A-Za-z\s]+(?:FL|HL|FC|HC|SFC|IHC|JFC|JHC|PIHC))')
+    _TEAM_TIME_PATTERN = re.compile(r'([A-Za-z\s]+)\s+(\d{1,2}:\d{2})\s+([A-Za-z\s]+)')
+    # Navigation / league-table words: blocks containing them aren't fixtures
+    _NAV_WORDS = re.compile(
+        r'\b(?:back|results|table|teams|form|group|team|p|w|d|l|pf|pa|pd|pts)\b',
+        re.IGNORECASE
+    )
+    _TEXT_BLOCKS = frozenset(['div', 'p', 'li', 'tr', 'span'])
+    _SKIP_TAGS = frozenset(['script', 'style', 'template'])
+
+    _CLUB_HREF = re.compile(r'clubprofile')
+    _CLUB_ID_HREF = re.compile(r'clubprofile/\d+')
+    _WEBSITE_HREF = re.compile(r'^https?://')
+    _EMAIL_HREF = re.compile(r'^mailto:')
+    _MAPS_HREF = re.compile(r'google\.com/maps')
+    _COORDS_PATTERN = re.compile(r'/dir//([-\d.]+),([-\d.]+)')
+    _COLOR_PATTERNS = [
+        re.compile(r'([A-Z][a-z]+(?:\s+&\s+[A-Z][a-z]+)*)\s*\+\s*([A-Z][a-z]+)'),
+        re.compile(r'([A-Z][a-z]+)\s+and\s+([A-Z][a-z]+)'),
+        re.compile(r'([A-Z][a-z]+)\s*/\s*([A-Z][a-z]+)'),
+    ]
+    _DIVISIONS = ['Muskerry', 'Seandun', 'Imokilly', 'Carrigdhoun', 'Duhallow', 'Beara', 'Avondhu']
+
+    def __init__(self, client=None, competition_pages=None):
+        # Shared pooled client: retries, TLS and per-host request spacing
+        self.session = client or get_client()
+        # Competition pages parsed by the no-fixtures fallback, kept for the
+        # run so clubs in the same competition share one fetch
+        # (an empty cache is falsy, so test for None rather than using `or`)
+        self.competition_pages = (competition_pages if competition_pages is not None
+                                  else CompetitionPageCache())
+        self.competition_budget = COMPETITION_FALLBACK_BUDGET
+        self.competition_workers = COMPETITION_FALLBACK_WORKERS
+    
+    @staticmethod
+    def parse_html(content):
+        """Parse a page with HTML_PARSER (lxml), or html.parser without lxml."""
+        try:
+            return BeautifulSoup(content, HTML_PARSER)
+        except FeatureNotFound:
+            return BeautifulSoup(content, 'html.parser')
     
     def get_page_content(self, url):
         """
@@ -48,22 +87,26 @@ class GAAClubScraper:
         try:
             response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return self.parse_html(response.content)
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
     
-    def extract_fixtures_from_club_page(self, soup, club_id):
+    def extract_fixtures_from_club_page(self, soup, club_id, fixture_elements=None):
         """
         Extract fixtures directly from the club profile page
         This should capture all Ballincollig fixtures across all age grades
+        
+        fixture_elements: the page's fixture <ul>s, if already collected
+        (extract_club_info finds them in its single pass over the page)
         """
         fixtures = []
         
         print(f"Looking for fixtures directly on club profile page...")
         
         # Look for fixture elements directly on the club profile page
-        fixture_elements = soup.find_all('ul', class_=lambda x: x and 'fixtures' in str(x).lower())
+        if fixture_elements is None:
+            fixture_elements = soup.find_all('ul', class_=lambda x: x and 'fixtures' in str(x).lower())
         
         print(f"Found {len(fixture_elements)} fixture elements on club page")
         
@@ -75,35 +118,62 @@ class GAAClubScraper:
         # If no fixtures found on the main page, try the competition approach as fallback
         if not fixtures:
             print("No fixtures found on main page, trying competition links...")
-            
-            # Find all competition links on the page (both old and new formats)
-            competition_links = soup.find_all('a', href=lambda x: x and ('league' in str(x) or 'competition' in str(x)))
-            
-            print(f"Found {len(competition_links)} competition links")
-            
-            # Try competitions to find Ballincollig fixtures
-            for link in competition_links:
-                competition_url = link.get('href', '')
-                if competition_url.startswith('/'):
-                    competition_url = f"https://gaacork.ie{competition_url}"
-                
-                print(f"Checking competition: {competition_url}")
-                comp_fixtures = self.extract_fixtures_from_competition_page(competition_url, club_id)
-                fixtures.extend(comp_fixtures)
+            fixtures = self.follow_competition_links(soup)
         
         print(f"Total fixtures found: {len(fixtures)}")
         return fixtures
     
+    def follow_competition_links(self, soup):
+        """
+        Fixtures from the competition pages a club page links to
+        
+        Links are normalised and deduplicated (see competition_frontier.py).
+        Pages already parsed this run come from self.competition_pages; at
+        most competition_budget others are fetched, competition_workers at
+        a time - the shared client still spaces requests to gaacork.ie.
+        Fixtures listed by more than one competition page are kept once.
+        """
+        frontier = competition_frontier(soup)
+        uncached = [url for url in frontier if url not in self.competition_pages]
+        print(f"Found {len(frontier)} competition links "
+              f"({len(frontier) - len(uncached)} already parsed this run)")
+        
+        skipped = set(uncached[self.competition_budget:])
+        if skipped:
+            print(f"Competition budget reached: skipping {len(skipped)} "
+                  f"of {len(uncached)} unparsed competitions")
+        urls = [url for url in frontier if url not in skipped]
+        
+        def fetch(url):
+            print(f"Checking competition: {url}")
+            return self.competition_pages.get(url, self._fetch_competition_fixtures)
+        
+        with ThreadPoolExecutor(max_workers=max(1, self.competition_workers)) as pool:
+            pages = list(pool.map(fetch, urls))
+        
+        fixtures = []
+        seen = set()
+        for page_fixtures in pages:
+            for fixture in page_fixtures or []:
+                key = tuple(sorted(fixture.items()))
+                if key not in seen:
+                    seen.add(key)
+                    fixtures.append(fixture)
+        return fixtures
+    
     def extract_fixtures_from_competition_page(self, competition_url, club_id):
         """
         Extract fixtures from a competition page
         """
-        fixtures = []
+        return self._fetch_competition_fixtures(competition_url) or []
+    
+    def _fetch_competition_fixtures(self, competition_url):
+        """Fixtures on a competition page, or None if it couldn't be fetched"""
         today = datetime.now()
         
         soup = self.get_page_content(competition_url)
         if not soup:
-            return fixtures
+            return None
         
         print(f"Looking for fixtures in competition page...")
         
@@ -189,55 +259,79 @@ class GAAClubScraper:
         
         return fixtures
     
-    def extract_from_text_patterns(self, soup, club_id, today):
-        """Extract fixtures from text patterns on the page"""
-        fixtures = []
+    def _text_blocks(self, soup):
+        """
+        Yield (element, text) for every div/p/li/tr/span, innermost first
         
-        for element in soup.find_all(['div', 'p', 'li', 'tr', 'span']):
-            text = element.get_text().strip()
+        One walk over the tree: each string is appended to the block it
+        sits in (inline tags such as <a> or <td> belong to the enclosing
+        block), so a block's text is its own text, not its nested blocks',
+        and every string is read once however deep the page nests.
+        Script and style contents are skipped.
+        """
+        # (node, remaining children, text parts, is a block)
+        stack = [(soup, iter(soup.contents), [], False)]
+        while stack:
+            node, children, parts, is_block = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if is_block:
+                    yield node, ''.join(parts)
+            elif isinstance(child, Tag):
+                if child.name in self._SKIP_TAGS:
+                    continue
+                if child.name in self._TEXT_BLOCKS:
+                    stack.append((child, iter(child.contents), [], True))
+                else:
+                    stack.append((child, iter(child.contents), parts, False))
+            elif type(child) is NavigableString:
+                parts.append(child)
+    
+    def iter_text_fixtures(self, soup, club_id, today):
+        """Yield fixtures found in dated text blocks, one block at a time"""
+        for element, text in self._text_blocks(soup):
+            text = text.strip()
             
             # Skip navigation elements
-            if any(skip_word in text.lower() for skip_word in ['back', 'results', 'table', 'teams', 'form', 'group', 'team', 'p', 'w', 'd', 'l', 'pf', 'pa', 'pd', 'pts']):
+            if not text or self._NAV_WORDS.search(text):
                 continue
             
             # Look for date patterns
-            date_match = self._DATE_PATTERN.search(text)
-            if date_match:
+            if self._DATE_PATTERN.search(text):
                 print(f"Found date pattern in text: {text[:100]}...")
                 
                 # Try to extract fixture information from this text
-                fixture_data = self.parse_text_fixture(element, club_id, today)
+                fixture_data = self.parse_text_fixture(element, club_id, today, text=text)
                 if fixture_data:
-                    fixtures.append(fixture_data)
-        
-        return fixtures
+                    yield fixture_data
+    
+    def extract_from_text_patterns(self, soup, club_id, today):
+        """Extract fixtures from text patterns on the page"""
+        return list(self.iter_text_fixtures(soup, club_id, today))
+    
+    def iter_table_fixtures(self, soup, club_id, today):
+        """Yield fixtures from table rows, reading each row's text once"""
+        for row in soup.find_all('tr'):
+            cells = row.find_all(['td', 'th'], recursive=False)
+            if len(cells) >= 3:  # At least date, teams, time/venue
+                text = ' '.join(cell.get_text().strip() for cell in cells)
+                
+                # Check if our club is mentioned
+                if CLUB_NAME in text:
+                    print(f"Found {CLUB_NAME} in table row: {text[:100]}...")
+                    fixture_data = self.parse_table_fixture(cells, club_id, today)
+                    if fixture_data:
+                        yield fixture_data
     
     def extract_from_tables(self, soup, club_id, today):
         """Extract fixtures from table structures"""
-        fixtures = []
-        
-        # Look for tables that might contain fixture information
-        tables = soup.find_all('table')
-        
-        for table in tables:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 3:  # At least date, teams, time/venue
-                    text = ' '.join([cell.get_text().strip() for cell in cells])
-                    
-                    # Check if our club is mentioned
-                    if CLUB_NAME in text:
-                        print(f"Found {CLUB_NAME} in table row: {text[:100]}...")
-                        fixture_data = self.parse_table_fixture(cells, club_id, today)
-                        if fixture_data:
-                            fixtures.append(fixture_data)
-        
-        return fixtures
+        return list(self.iter_table_fixtures(soup, club_id, today))
     
-    def parse_text_fixture(self, element, club_id, today):
-        """Parse fixture from text element"""
-        text = element.get_text().strip()
+    def parse_text_fixture(self, element, club_id, today, text=None):
+        """Parse fixture from text element (text: its text, if already read)"""
+        if text is None:
+            text = element.get_text().strip()
         
         # This is a simplified version - you'd need to enhance this based on actual text patterns
         # For now, create a placeholder fixture
@@ -396,22 +490,19 @@ class GAAClubScraper:
             formatted_date = f"{day_num} {month_name}"
         
         # Extract time
-        time_pattern = re.compile(r'(\d{1,2}:\d{2})')
-        time_match = time_pattern.search(text)
+        time_match = self._TIME_PATTERN.search(text)
         fixture_time = time_match.group(1) if time_match else ""
         
         # Extract venue
-        venue_pattern = re.compile(r'Venue:\s*([^\n\r]+)')
-        venue_match = venue_pattern.search(text)
+        venue_match = self._VENUE_PATTERN.search(text)
         venue = venue_match.group(1).strip() if venue_match else ""
         
         # Extract teams - look for club profile links
-        team_links = element.find_all('a', href=re.compile(r'clubprofile/\d+'))
+        team_links = element.find_all('a', href=self._CLUB_ID_HREF)
         teams = [link.get_text().strip() for link in team_links if link.get_text().strip()]
         
         # Find competition name
-        competition_pattern = re.compile(r'([A-Za-z\s]+(?:FL|HL|FC|HC|SFC|IHC|JFC|JHC|PIHC))')
-        competition_match = competition_pattern.search(text)
+        competition_match = self._COMPETITION_PATTERN.search(text)
         competition = competition_match.group(1).strip() if competition_match else ""
         
         # Determine home/away teams
@@ -420,8 +511,7 @@ class GAAClubScraper:
         
         if len(teams) >= 2:
             # Look for pattern like "Team1 TIME Team2"
-            team_time_pattern = re.compile(r'([A-Za-z\s]+)\s+(\d{1,2}:\d{2})\s+([A-Za-z\s]+)')
-            team_time_match = team_time_pattern.search(text)
+            team_time_match = self._TEAM_TIME_PATTERN.search(text)
             
             if team_time_match:
                 home_team, time_found, away_team = team_time_match.groups()
@@ -456,26 +546,23 @@ class GAAClubScraper:
         text = element.get_text().strip()
         
         # Extract teams and score
-        score_pattern = re.compile(r'(\d+-\d+)\s*v\s*(\d+-\d+)')
-        score_match = score_pattern.search(text)
+        score_match = self._SCORE_PATTERN.search(text)
         
         if not score_match:
             return None
         
         # Extract date
-        date_pattern = re.compile(r'(\d{2}/\d{2}/\d{4})')
-        date_match = date_pattern.search(text)
+        date_match = self._NUMERIC_DATE_PATTERN.search(text)
         
         # Extract time
-        time_pattern = re.compile(r'(\d{2}:\d{2})')
-        time_match = time_pattern.search(text)
+        time_match = self._CLOCK_PATTERN.search(text)
         
         # Extract venue
-        venue_links = element.find_all('a', href=re.compile(r'google\.com/maps'))
+        venue_links = element.find_all('a', href=self._MAPS_HREF)
         venue = venue_links[0].get_text().strip() if venue_links else ""
         
         # Find team names
-        team_links = element.find_all('a', href=re.compile(r'clubprofile'))
+        team_links = element.find_all('a', href=self._CLUB_HREF)
         teams = [link.get_text().strip() for link in team_links if link.get_text().strip()]
         
         if len(teams) >= 2:
@@ -513,6 +600,40 @@ class GAAClubScraper:
         
         return ""
     
+    def _scan_page(self, soup):
+        """Collect every node extract_club_info needs in one pass.
+        
+        Walks the tags once in document order and keeps the first h1, the
+        first p after it, the first website / mailto / Google Maps link
+        hrefs, and every fixtures <ul> - the same nodes the separate
+        find() / find_all() calls used to search the whole tree for.
+        """
+        nodes = {'h1': None, 'address': None, 'website': None, 'email': None,
+                 'maps': None, 'fixture_elements': []}
+        for tag in soup.find_all(True):
+            name = tag.name
+            if name == 'a':
+                href = tag.get('href')
+                if not href:
+                    continue
+                if nodes['website'] is None and self._WEBSITE_HREF.search(href):
+                    nodes['website'] = href
+                if nodes['email'] is None and self._EMAIL_HREF.search(href):
+                    nodes['email'] = href
+                if nodes['maps'] is None and self._MAPS_HREF.search(href):
+                    nodes['maps'] = href
+            elif name == 'h1':
+                if nodes['h1'] is None:
+                    nodes['h1'] = tag
+            elif name == 'p':
+                if nodes['h1'] is not None and nodes['address'] is None:
+                    nodes['address'] = tag
+            elif name == 'ul':
+                classes = tag.get('class')
+                if classes and 'fixtures' in ' '.join(classes).lower():
+                    nodes['fixture_elements'].append(tag)
+        return nodes
+    
     def extract_club_info(self, soup, profile_url, competition_id=None, team_id=None):
         """
         Extract club information from parsed HTML
@@ -530,63 +651,46 @@ class GAAClubScraper:
             'profile_url': profile_url
         }
         
-        # Extract club name (main h1)
-        h1_tag = soup.find('h1')
-        if h1_tag:
-            club_data['club_name'] = h1_tag.get_text().strip()
-        
-        # Extract address (usually in a p tag after h1)
-        if h1_tag:
-            next_p = h1_tag.find_next('p')
-            if next_p:
-                address_text = next_p.get_text().strip()
-                club_data['address'] = address_text
-        
-        # Extract website link
-        website_link = soup.find('a', href=re.compile(r'^https?://'))
-        if website_link and 'gaacork.ie' not in website_link.get('href', ''):
-            club_data['website'] = website_link.get('href').strip()
-        
-        # Extract email
-        email_link = soup.find('a', href=re.compile(r'^mailto:'))
-        if email_link:
-            email = email_link.get('href').replace('mailto:', '').strip()
-            club_data['email'] = email
-        
-        # Extract division (look for division names)
-        divisions = ['Muskerry', 'Seandun', 'Imokilly', 'Carrigdhoun', 'Duhallow', 'Beara', 'Avondhu']
-        page_text = soup.get_text().lower()
-        for division in divisions:
-            if division.lower() in page_text:
+        nodes = self._scan_page(soup)
+        
+        # Club name (main h1) and address (the first p after it)
+        if nodes['h1']:
+            club_data['club_name'] = nodes['h1'].get_text().strip()
+        if nodes['address']:
+            club_data['address'] = nodes['address'].get_text().strip()
+        
+        # Website: the first absolute link, unless it points back at gaacork.ie
+        website = nodes['website']
+        if website and 'gaacork.ie' not in website:
+            club_data['website'] = website.strip()
+        
+        if nodes['email']:
+            club_data['email'] = nodes['email'].replace('mailto:', '').strip()
+        
+        # Division and colours both come from the page text, computed once
+        page_text = soup.get_text()
+        page_text_lower = page_text.lower()
+        for division in self._DIVISIONS:
+            if division.lower() in page_text_lower:
                 club_data['division'] = division
                 break
         
-        # Extract colors (look for color patterns)
-        color_patterns = [
-            r'([A-Z][a-z]+(?:\s+&\s+[A-Z][a-z]+)*)\s*\+\s*([A-Z][a-z]+)',
-            r'([A-Z][a-z]+)\s+and\s+([A-Z][a-z]+)',
-            r'([A-Z][a-z]+)\s*/\s*([A-Z][a-z]+)'
-        ]
-        
-        for pattern in color_patterns:
-            match = re.search(pattern, soup.get_text())
+        for pattern in self._COLOR_PATTERNS:
+            match = pattern.search(page_text)
             if match:
-                colors = f"{match.group(1)} + {match.group(2)}"
-                club_data['colors'] = colors
+                club_data['colors'] = f"{match.group(1)} + {match.group(2)}"
                 break
         
-        # Extract coordinates from directions link
-        directions_link = soup.find('a', href=re.compile(r'google\.com/maps'))
-        if directions_link:
-            href = directions_link.get('href', '')
-            # Extract coordinates from URL like /dir//51.892,-8.58863
-            coord_match = re.search(r'/dir//([-\d.]+),([-\d.]+)', href)
+        # Coordinates from the directions link, e.g. /dir//51.892,-8.58863
+        if nodes['maps'] is not None:
+            coord_match = self._COORDS_PATTERN.search(nodes['maps'])
             if coord_match:
                 club_data['coordinates'] = f"{coord_match.group(1)},{coord_match.group(2)}"
         
         # Extract fixtures from the club profile page itself
         club_id_from_url = profile_url.split('/')[-2].split('?')[0]
-        fixtures = self.extract_fixtures_from_club_page(soup, club_id_from_url)
+        fixtures = self.extract_fixtures_from_club_page(
+            soup, club_id_from_url, fixture_elements=nodes['fixture_elements'])
         
         if fixtures:
             # Create CSV with exact column order as specified
@@ -607,6 +711,21 @@ class GAAClubScraper:
         
         return club_data
     
+    @staticmethod
+    def club_profile_url(club_id, competition_id=None, team_id=None):
+        """Build the gaacork.ie club profile URL."""
+        url = f"{BASE_URL}{club_id}/"
+        params = []
+        
+        if competition_id:
+            params.append(f"competition_id={competition_id}")
+        if team_id:
+            params.append(f"team_id={team_id}")
+        
+        if params:
+            url += "?" + "&".join(params)
+        return url
+    
     def scrape_club_profile(self, club_id, competition_id=None, team_id=None):
         """
         Scrape a single club profile
@@ -619,18 +738,7 @@ class GAAClubScraper:
         Returns:
             dict: Club data or None if failed
         """
-        # Build URL
-        url = f"{BASE_URL}{club_id}/"
-        params = []
-        
-        if competition_id:
-            params.append(f"competition_id={competition_id}")
-        if team_id:
-            params.append(f"team_id={team_id}")
-        
-        if params:
-            url += "?" + "&".join(params)
-        
+        url = self.club_profile_url(club_id, competition_id, team_id)
         print(f"Scraping: {url}")
         
         # Get page content
@@ -641,12 +749,10 @@ class GAAClubScraper:
         # Extract data
         club_data = self.extract_club_info(soup, url, competition_id, team_id)
         
-        # Add delay to be respectful
-        time.sleep(REQUEST_DELAY)
-        
         return club_data
     
-    def scrape_multiple_clubs(self, club_ids, competition_id=None, team_id=None):
+    def scrape_multiple_clubs(self, club_ids, competition_id=None, team_id=None,
+                              workers=1):
         """
         Scrape multiple club profiles
         
@@ -654,14 +760,21 @@ class GAAClubScraper:
             club_ids (list): List of club IDs
             competition_id (int, optional): Competition ID
             team_id (int, optional): Team ID
+            workers (int): Clubs fetched at once; the shared client's
+                per-host rate limit still applies.  For resumable and
+                incremental crawls see club_crawler.py.
             
         Returns:
-            list: List of club data dictionaries
+            list: List of club data dictionaries, in club_ids order
         """
-        results = []
+        def scrape(club_id):
+            return self.scrape_club_profile(club_id, competition_id, team_id)
         
-        for club_id in club_ids:
-            club_data = self.scrape_club_profile(club_id, competition_id, team_id)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            scraped = list(pool.map(scrape, club_ids))
+        
+        results = []
+        for club_id, club_data in zip(club_ids, scraped):
             if club_data:
                 results.append(club_data)
             else:
@@ -0,0 +1,148 @@
+"""
+Foireann card parser benchmark.
+
+Builds a synthetic combined fixtures page (2,000 cards by default, spread
+over many divisions, with a mix of upcoming and scored cards) and times
+camogie_scraper.parse_fixture_cards against the previous split-and-search
+implementation, kept here as the reference.  Both outputs are checked to
+be identical, for our club and for all divisions.
+
+Usage (from the repo root):
+    PYTHONPATH=. python scripts/bench_camogie_parser.py
+    PYTHONPATH=. python scripts/bench_camogie_parser.py --cards 5000 --repeat 10
+"""
+
+import argparse
+import random
+import re
+import time
+from datetime import date, datetime, timedelta
+from html import unescape
+
+import camogie_scraper
+from camogie_scraper import parse_fixture_cards
+
+CLUBS = [
+    "Ballincollig", "Ballincollig 2", "Douglas", "Douglas 2", "Sarsfield",
+    "Na Piarsaigh", "Charleville", "Glen Rovers", "St Finbarr&#039;s",
+    "Inniscarra", "Blarney", "Courcey Rovers", "Killeagh", "Milford",
+]
+DIVISIONS = [f"2026 League - Division {i}" for i in range(1, 9)] + [
+    f"2026 Barry O&#039;Sullivan League - Group {g}" for g in "ABCDEF"]
+
+
+# ── Previous implementation (reference) ────────────────────────────────
+
+def _legacy_extract_text(pattern, html, default=""):
+    m = re.search(pattern, html, re.DOTALL)
+    return unescape(m.group(1).strip()) if m else default
+
+
+def _legacy_parse_datetime(raw):
+    raw = raw.strip()
+    for fmt in ("%a %d %b %Y %I:%M %p", "%a %d %b %Y %I:%M%p", "%d %b %Y %I:%M %p"):
+        try:
+            dt = datetime.strptime(raw, fmt)
+            return dt.strftime("%d %b %Y"), dt.strftime("%H:%M")
+        except ValueError:
+            continue
+    return raw, ""
+
+
+def legacy_parse_fixture_cards(html, club_name):
+    fixtures = []
+    cards = re.split(r"<article\s+class=\"foireann-card\">", html)
+    for card in cards[1:]:
+        date_raw = _legacy_extract_text(r'foireann-card-date[^>]*>([^<]*)<', card)
+        if not date_raw:
+            continue
+        date_str, time_str = _legacy_parse_datetime(date_raw)
+        teams = re.findall(r'foireann-team-name[^>]*>([^<]*)<', card)
+        home = unescape(teams[0].strip()) if len(teams) > 0 else ""
+        away = unescape(teams[1].strip()) if len(teams) > 1 else ""
+        if club_name.lower() not in home.lower() and club_name.lower() not in away.lower():
+            continue
+        division = _legacy_extract_text(r"Division:</strong>\s*([^<]*)<", card)
+        venue = _legacy_extract_text(r"Venue:</strong>\s*([^<]*)<", card)
+        if not venue:
+            venue = re.sub(r"\s+\d+$", "", home)
+        scores = re.findall(r'foireann-score-badge[^>]*>([^<]*)<', card)
+        fixtures.append({
+            "home": home, "away": away, "date": date_str, "time": time_str,
+            "venue": venue, "competition": division, "referee": "",
+            "_has_score": any(s.strip() for s in scores),
+        })
+    return fixtures
+
+
+# ── Synthetic page ─────────────────────────────────────────────────────
+
+def _team(name, score=None):
+    badge = f'<div class="foireann-score-badge">{score}</div>' if score else ""
+    return ('<div class="foireann-team"><div class="foireann-team-logo-wrap">'
+            f'<img class="foireann-team-logo" alt="{name} crest"></div>'
+            f'<div class="foireann-team-name">{name}</div>{badge}</div>')
+
+
+def build_page(n_cards, seed=2026):
+    rng = random.Random(seed)
+    start = date(2026, 3, 1)
+    parts = ['<html><body><div class="entry-content"><h2>All fixtures</h2>']
+    for i in range(n_cards):
+        home, away = rng.sample(CLUBS, 2)
+        day = start + timedelta(days=rng.randrange(120))
+        hour = rng.choice(["11:00 am", "2:30 pm", "6:00 pm", "7:15 pm"])
+        played = rng.random() < 0.4
+        scores = (f"{rng.randrange(6)}-{rng.randrange(20)}",
+                  f"{rng.randrange(6)}-{rng.randrange(20)}") if played else (None, None)
+        venue = (f'<div class="foireann-card-detail"><strong>Venue:</strong> '
+                 f'{home} GAA</div>') if rng.random() < 0.7 else ""
+        parts.append(
+            '<article class="foireann-card"><div class="foireann-card-top">'
+            f'<div class="foireann-card-round">Round {i % 9 + 1}</div>'
+            f'<div class="foireann-card-date">{day:%a} {day.day} {day:%b %Y} {hour}</div></div>'
+            '<div class="foireann-card-body"><div class="foireann-matchup">'
+            + _team(home, scores[0])
+            + '<div class="foireann-match-centre"><div class="foireann-vs-badge">VS</div></div>'
+            + _team(away, scores[1])
+            + '</div></div><div class="foireann-card-footer">'
+            f'<div class="foireann-card-detail"><strong>Division:</strong> '
+            f'{rng.choice(DIVISIONS)}</div>{venue}</div></article>'
+        )
+    parts.append("</div></body></html>")
+    return "".join(parts)
+
+
+def _best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        camogie_scraper._parse_datetime.cache_clear()  # cold memo each pass
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Foireann card parser benchmark")
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--club", default="Ballincollig")
+    args = parser.parse_args()
+
+    html = build_page(args.cards)
+    print(f"Page: {args.cards} cards, {len(html) / 1024:.0f} KB")
+
+    for label, club in ((f"club '{args.club}'", args.club), ("all divisions", "")):
+        old = legacy_parse_fixture_cards(html, club)
+        new = parse_fixture_cards(html, club)
+        assert old == new, f"output differs ({label})"
+        t_old = _best_time(lambda: legacy_parse_fixture_cards(html, club), args.repeat)
+        t_new = _best_time(lambda: parse_fixture_cards(html, club), args.repeat)
+        print(f"\n{label}: {len(new)} fixtures (identical output)")
+        print(f"  previous parser:    {t_old * 1000:8.1f} ms")
+        print(f"  single-pass parser: {t_new * 1000:8.1f} ms  ({t_old / t_new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Club profile extraction benchmark.
+
+Times GAAClubScraper's page parse + extract_club_info against the
+previous implementation (html.parser tree, a separate find() per field
+and a get_text() per colour pattern), kept here as the reference, and
+checks both produce identical club data.
+
+Runs on saved club profile pages when given a directory of .html files
+(e.g. pages saved from a browser, or bodies from the HTTP cache),
+otherwise on a synthetic profile page.  The competition-link fallback is
+disabled so no network requests are made.
+
+Usage (from the repo root):
+    PYTHONPATH=. python scripts/bench_club_extract.py
+    PYTHONPATH=. python scripts/bench_club_extract.py --pages saved_pages/ --repeat 10
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from scraper import GAAClubScraper
+
+
+class OfflineScraper(GAAClubScraper):
+    """No competition-page fallback: extraction only, no network."""
+
+    def get_page_content(self, url):
+        return None
+
+
+# ── Previous implementation (reference) ────────────────────────────────
+
+def legacy_extract_club_info(scraper, soup, profile_url):
+    club_data = {'profile_url': profile_url}
+    h1_tag = soup.find('h1')
+    if h1_tag:
+        club_data['club_name'] = h1_tag.get_text().strip()
+    if h1_tag:
+        next_p = h1_tag.find_next('p')
+        if next_p:
+            club_data['address'] = next_p.get_text().strip()
+    website_link = soup.find('a', href=re.compile(r'^https?://'))
+    if website_link and 'gaacork.ie' not in website_link.get('href', ''):
+        club_data['website'] = website_link.get('href').strip()
+    email_link = soup.find('a', href=re.compile(r'^mailto:'))
+    if email_link:
+        club_data['email'] = email_link.get('href').replace('mailto:', '').strip()
+    divisions = ['Muskerry', 'Seandun', 'Imokilly', 'Carrigdhoun', 'Duhallow', 'Beara', 'Avondhu']
+    page_text = soup.get_text().lower()
+    for division in divisions:
+        if division.lower() in page_text:
+            club_data['division'] = division
+            break
+    color_patterns = [
+        r'([A-Z][a-z]+(?:\s+&\s+[A-Z][a-z]+)*)\s*\+\s*([A-Z][a-z]+)',
+        r'([A-Z][a-z]+)\s+and\s+([A-Z][a-z]+)',
+        r'([A-Z][a-z]+)\s*/\s*([A-Z][a-z]+)'
+    ]
+    for pattern in color_patterns:
+        match = re.search(pattern, soup.get_text())
+        if match:
+            club_data['colors'] = f"{match.group(1)} + {match.group(2)}"
+            break
+    directions_link = soup.find('a', href=re.compile(r'google\.com/maps'))
+    if directions_link:
+        coord_match = re.search(r'/dir//([-\d.]+),([-\d.]+)', directions_link.get('href', ''))
+        if coord_match:
+            club_data['coordinates'] = f"{coord_match.group(1)},{coord_match.group(2)}"
+    club_id_from_url = profile_url.split('/')[-2].split('?')[0]
+    fixture_elements = soup.find_all('ul', class_=lambda x: x and 'fixtures' in str(x).lower())
+    fixtures = [f for f in (scraper.parse_fixture_element(e, club_id_from_url)
+                            for e in fixture_elements) if f]
+    if fixtures:
+        club_data['fixture_count'] = len(fixtures)
+    return club_data
+
+
+# ── Synthetic page ─────────────────────────────────────────────────────
+
+def build_page(n_fixtures=300, n_nav=400):
+    nav = "".join(f'<li><a href="/league/{210000 + i}/">Competition {i} '
+                  f'Football League Division {i % 7}</a></li>' for i in range(n_nav))
+    fixtures = "".join(
+        f'<ul class="column-eight table-body fixtures fixtures-{211000 + i}" '
+        f'data-date="{i % 28 + 1} May 2026" data-time="19:00" '
+        f'data-hometeam="Ballincollig" data-awayteam="Club {i}">'
+        f'<li><div><span>Sat {i % 28 + 1}th May</span></div></li>'
+        f'<li><a href="/clubprofile/1986/">Ballincollig</a></li>'
+        f'<li><div><span>19:00</span></div></li>'
+        f'<li><a href="/clubprofile/{2000 + i}/">Club {i}</a></li>'
+        f'<li><a href="https://www.google.com/maps/dir//51.89,-8.58">Venue {i}</a></li>'
+        f'</ul>' for i in range(n_fixtures))
+    return (
+        '<html><head><title>Ballincollig</title>'
+        '<script>var nonce = "abc";</script></head><body>'
+        f'<header><nav><ul class="menu">{nav}</ul></nav></header>'
+        '<main><div class="club-header"><h1>Ballincollig</h1>'
+        '<p>Ballincollig GAA Grounds, Ballincollig, Co. Cork</p>'
+        '<a href="https://gaacork.ie/">County board</a>'
+        '<a href="https://www.ballincolliggaa.ie/">Club website</a>'
+        '<a href="mailto:secretary.ballincollig.cork@gaa.ie">Email</a>'
+        '<a href="https://www.google.com/maps/dir//51.892,-8.58863">Directions</a>'
+        '<div><div><p>Division: Muskerry</p><p>Colours: Green and White</p></div></div>'
+        f'</div><div class="fixtures-block">{fixtures}</div></main>'
+        '<footer><p>Cork GAA / Rebel Og</p></footer></body></html>'
+    ).encode("utf-8")
+
+
+def _best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Club profile extraction benchmark")
+    parser.add_argument("--pages", help="Directory of saved club profile .html files")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.pages:
+        paths = sorted(glob.glob(os.path.join(args.pages, "*.html")))
+        pages = [(os.path.basename(p), open(p, "rb").read()) for p in paths]
+    else:
+        pages = [("synthetic", build_page())]
+    if not pages:
+        parser.error(f"no .html files in {args.pages}")
+
+    scraper = OfflineScraper(client=object())
+    url = "https://gaacork.ie/clubprofile/1986/"
+
+    def legacy(content):
+        return legacy_extract_club_info(scraper, BeautifulSoup(content, "html.parser"), url)
+
+    def current(content):
+        return scraper.extract_club_info(scraper.parse_html(content), url)
+
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, content in pages:
+            old, new = legacy(content), current(content)
+            new_comparable = {k: v for k, v in new.items()
+                              if k not in ("fixtures", "competition_name")}
+            # the legacy helper counts fixtures instead of building the CSV
+            new_comparable.pop("fixture_count", None)
+            old.pop("fixture_count", None)
+            assert old == new_comparable, f"output differs for {name}"
+            t_old = _best_time(lambda: legacy(content), args.repeat)
+            t_new = _best_time(lambda: current(content), args.repeat)
+            results.append((name, len(content), t_old, t_new))
+
+    total_old = total_new = 0.0
+    for name, size, t_old, t_new in results:
+        total_old += t_old
+        total_new += t_new
+        print(f"{name} ({size / 1024:.0f} KB): identical output")
+        print(f"  previous extraction: {t_old * 1000:8.1f} ms")
+        print(f"  single-pass (lxml):  {t_new * 1000:8.1f} ms  ({t_old / t_new:.1f}x)")
+    if len(results) > 1:
+        print(f"\nAll {len(results)} pages: {total_old * 1000:.0f} ms -> "
+              f"{total_new * 1000:.0f} ms ({total_old / total_new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Notification load benchmark against the local ntfy stand-in.
+
+Replays a busy weekend of diffs (a result and fixture changes in every
+configured competition, plus fixture changes for every ClubZap team)
+through competition_monitor.notifier and EnhancedFixtureMonitor.send_ntfy,
+and reports sends per second, per-POST tail latency and queueing delay
+(which includes any backoff the scheduler applied after a 429).
+
+Usage (from the repo root):
+    PYTHONPATH=. python scripts/bench_notifications.py
+    PYTHONPATH=. python scripts/bench_notifications.py --latency 0.2 --rate-limit-every 15 --send-rate 5
+    PYTHONPATH=. python scripts/bench_notifications.py --mode serial   # one POST per message
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from competition_monitor import notifier
+from competition_monitor.config import COMPETITIONS
+from config import CLUB_NAME, CLUBZAP_TEAM_IDS
+from enhanced_monitor import EnhancedFixtureMonitor
+from ntfy_dispatcher import RATE_LIMIT_PER_SEC, NtfyDispatcher, TokenBucket
+from ntfy_stub import NtfyStubServer
+
+
+class _SerialDispatcher(NtfyDispatcher):
+    """Sends each message as soon as it is posted (the pre-dispatcher behaviour)."""
+
+    def __init__(self, **kwargs):
+        super().__init__(max_workers=1, **kwargs)
+        self.results = []
+
+    def post(self, *args, **kwargs):
+        super().post(*args, **kwargs)
+        self.results.extend(super().flush())
+
+    def flush(self):
+        results, self.results = self.results + super().flush(), []
+        return results
+
+
+class _NoBrowser:
+    def close(self):
+        pass
+
+
+def _weekend_competition_diff(comp_name, i):
+    opponent = f"Opponent {i}"
+    ours = {"home": CLUB_NAME, "away": opponent, "date": "12/04/2026",
+            "home_score": "2-10", "away_score": "1-8"}
+    others = [{"home": f"Team {i}-{j}", "away": f"Team {i}-{j + 1}",
+               "date": "12/04/2026", "home_score": "1-9", "away_score": "0-12"}
+              for j in range(6)]
+    fixture = {"home": CLUB_NAME, "away": f"Rival {i}", "date": "19/04/2026",
+               "time": "11:00"}
+    return {
+        "our_new_results": [ours],
+        "new_results": [ours] + others,
+        "our_standing": {"position": 2, "pts": 6},
+        "fixture_changes": [(fixture, ["Time: 11:00 -> 12:30"])] * 3,
+        "new_fixtures": [fixture],
+        "removed_fixtures": [],
+    }
+
+
+def _weekend_team_changes():
+    return {
+        team: ["CHANGED: 19/04/2026 vs Rival (Time: 12:30)",
+               "NEW: 26/04/2026 vs Other Club"]
+        for team in CLUBZAP_TEAM_IDS
+    }
+
+
+def run_benchmark(server, mode, send_rate=RATE_LIMIT_PER_SEC):
+    """Send one weekend through both senders.  Returns (results, messages, wall)."""
+    limiter = TokenBucket(rate=send_rate)
+
+    def make(**kwargs):
+        cls = _SerialDispatcher if mode == "serial" else NtfyDispatcher
+        return cls(limiter=limiter, **kwargs)
+
+    notifier._dispatcher = make(base_url=server.url, log=lambda msg: None)
+
+    log_dir = tempfile.mkdtemp(prefix="bench-ntfy-")
+    monitor = EnhancedFixtureMonitor(selenium_scraper=_NoBrowser(),
+                                     ntfy_base_url=server.url)
+    monitor.log_file = os.path.join(log_dir, "bench_log.txt")
+    monitor.dispatcher = make(base_url=server.url, log=lambda msg: None)
+
+    start = time.perf_counter()
+    for i, (comp_name, comp_config) in enumerate(COMPETITIONS.items()):
+        diff = _weekend_competition_diff(comp_name, i)
+        notifier.notify_our_result(comp_config, diff, comp_name)
+        notifier.notify_other_results(comp_config, diff, comp_name)
+        notifier.notify_fixture_changes(comp_config, diff, comp_name)
+    queued = notifier._dispatcher.pending_count
+    results = notifier.flush()
+
+    team_changes = _weekend_team_changes()
+    monitor.send_ntfy(f"{CLUB_NAME} GAA - Fixture Changes",
+                      "Weekend summary\n" + "\n".join(team_changes))
+    monitor._send_team_notifications(team_changes)
+    queued += monitor.dispatcher.pending_count
+    results += monitor.flush_notifications()
+    wall = time.perf_counter() - start
+
+    if mode == "serial":
+        queued = len(results)
+    return results, queued, wall
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ntfy notification load benchmark")
+    parser.add_argument("--mode", choices=["pooled", "serial"], default="pooled")
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="Stub server delay per request (seconds)")
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--retry-after", type=int, default=1,
+                        help="Retry-After seconds the stub sends with 429s")
+    parser.add_argument("--drop-every", type=int, default=0)
+    parser.add_argument("--send-rate", type=float, default=RATE_LIMIT_PER_SEC,
+                        help="Scheduler refill rate (sends/sec) once the burst is spent")
+    args = parser.parse_args()
+
+    with NtfyStubServer(latency=args.latency,
+                        rate_limit_every=args.rate_limit_every,
+                        retry_after=args.retry_after,
+                        drop_every=args.drop_every) as server:
+        results, messages, wall = run_benchmark(server, args.mode, args.send_rate)
+        latencies = [r["elapsed"] for r in results if r["elapsed"] is not None]
+        ok = sum(1 for r in results if r["ok"])
+
+        print(f"Mode:            {args.mode}")
+        print(f"Messages queued: {messages}")
+        print(f"POSTs sent:      {len(results)} ({ok} ok)")
+        print(f"Stub statuses:   {server.statuses}")
+        print(f"Wall time:       {wall:.3f}s")
+        print(f"Sends/sec:       {len(results) / wall:.1f}")
+        print(f"Messages/sec:    {messages / wall:.1f}")
+        if latencies:
+            print(f"Latency p50:     {statistics.median(latencies) * 1000:.1f} ms")
+            print(f"Latency p95:     {_percentile(latencies, 95) * 1000:.1f} ms")
+            print(f"Latency p99:     {_percentile(latencies, 99) * 1000:.1f} ms")
+            print(f"Latency max:     {max(latencies) * 1000:.1f} ms")
+        delays = [r["queue_delay"] for r in results]
+        if delays:
+            print(f"Queue delay p50: {statistics.median(delays) * 1000:.1f} ms")
+            print(f"Queue delay p95: {_percentile(delays, 95) * 1000:.1f} ms")
+            print(f"Retried sends:   {sum(1 for r in results if r['attempts'] > 1)}")
+
+
+if __name__ == "__main__":
+    main()
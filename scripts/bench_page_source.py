@@ -0,0 +1,147 @@
+"""
+Page-source fixture extraction benchmark.
+
+Times SeleniumScraper.extract_from_page_source (one scan over the
+fixture <ul data-*> opening tags) against the previous implementation,
+kept here as the reference: a findall for our club in data-hometeam /
+data-awayteam, then a fresh DOTALL search of the whole page for each
+match's enclosing <ul>.  Runs on a saved rendered club page (--page) or
+a synthetic one of about 2 MB.
+
+The previous version returned the first <ul> naming the team for every
+match, so its output is reported rather than compared; the single-pass
+output is checked against a BeautifulSoup parse of the same page.
+
+Usage (from the repo root):
+    PYTHONPATH=. python scripts/bench_page_source.py
+    PYTHONPATH=. python scripts/bench_page_source.py --page saved_profile.html
+"""
+
+import argparse
+import contextlib
+import io
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from config import CLUB_NAME
+from fixture_endpoint import fixture_from_attributes
+from selenium_scraper import SeleniumScraper
+
+CLUBS = ["Douglas", "Nemo Rangers", "Blarney", "Carrigaline", "Glen Rovers",
+         "Bishopstown", "Inniscarra", "Aghabullogue"]
+
+
+# ── Previous implementation (reference) ────────────────────────────────
+
+def legacy_extract_from_page_source(page_source):
+    fixtures = []
+    club_escaped = re.escape(CLUB_NAME)
+    pattern = fr'data-hometeam="([^"]*{club_escaped}[^"]*)"|data-awayteam="([^"]*{club_escaped}[^"]*)"'
+    for home_team, away_team in re.findall(pattern, page_source):
+        team_name = home_team or away_team
+        if not team_name:
+            continue
+        ul_pattern = fr'<ul[^>]*data-(?:home|away)team="[^"]*{re.escape(team_name)}[^"]*"[^>]*>.*?</ul>'
+        ul_match = re.search(ul_pattern, page_source, re.DOTALL)
+        if ul_match:
+            data_attrs = dict(re.findall(r'data-([^=]+)="([^"]*)"', ul_match.group()))
+            fixtures.append({
+                'home': data_attrs.get('hometeam', ''),
+                'away': data_attrs.get('awayteam', ''),
+                'date': data_attrs.get('date', ''),
+                'time': data_attrs.get('time', ''),
+                'venue': data_attrs.get('venue', ''),
+                'competition': data_attrs.get('compname', ''),
+            })
+    return fixtures
+
+
+def reference_fixtures(page_source):
+    """What a full HTML parse finds, for checking the single-pass output."""
+    soup = BeautifulSoup(page_source, "lxml")
+    fixtures = []
+    for ul in soup.find_all("ul"):
+        if ul.has_attr("data-hometeam") or ul.has_attr("data-awayteam"):
+            fixture = fixture_from_attributes(ul.get)
+            if fixture:
+                fixtures.append(fixture)
+    return fixtures
+
+
+# ── Synthetic page ─────────────────────────────────────────────────────
+
+def build_page(target_bytes=2 * 1024 * 1024, fixture_bytes=600 * 1024):
+    """A rendered profile: mostly inline assets and menus, then fixtures."""
+    menu = "".join(f'<ul class="sub-menu"><li><a href="/club/{i}/">Club {i}</a></li></ul>'
+                   for i in range(4000))
+    asset = "<script>window.__data = " + '{"k": "%s"}' % ("x" * 1024) + ";</script>\n"
+    head = []
+    size = len(menu)
+    while size < target_bytes - fixture_bytes:
+        head.append(asset)
+        size += len(asset)
+    rows = []
+    i = 0
+    while size < target_bytes:
+        home, away = CLUBS[i % len(CLUBS)], CLUBS[(i + 3) % len(CLUBS)]
+        if i % 10 == 0:
+            home = CLUB_NAME
+        elif i % 10 == 5:
+            away = f"{CLUB_NAME} 2"
+        row = (
+            f'<ul class="column-eight table-body fixtures" data-date="{i % 28 + 1} May 2026" '
+            f'data-time="{10 + i % 9}:30" data-hometeam="{home}" data-awayteam="{away}" '
+            f'data-venue="{home} GAA Grounds" data-compname="U{12 + i % 6} Football League" '
+            f'data-referee="Referee {i}">'
+            f'<li><span>{i % 28 + 1} May</span></li><li><a href="/clubprofile/{i}/">{home}</a></li>'
+            f'<li><span>v</span></li><li><a href="/clubprofile/{i + 1}/">{away}</a></li>'
+            f'<li><div class="venue">{home} GAA Grounds</div></li></ul>\n'
+        )
+        rows.append(row)
+        size += len(row)
+        i += 1
+    return (f'<html><head>{"".join(head)}</head><body><nav>{menu}</nav>'
+            f'<div class="fixtures-list">{"".join(rows)}</div></body></html>')
+
+
+def _best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Page-source extraction benchmark")
+    parser.add_argument("--page", help="Saved rendered club profile page (.html)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.page:
+        with open(args.page, encoding="utf-8") as f:
+            page = f.read()
+    else:
+        page = build_page()
+
+    scraper = SeleniumScraper(endpoint_mode="off")
+    with contextlib.redirect_stdout(io.StringIO()):
+        new = scraper.extract_from_page_source(page)
+        assert new == reference_fixtures(page), "single-pass output differs from full parse"
+        old = legacy_extract_from_page_source(page)
+        t_new = _best_time(lambda: scraper.extract_from_page_source(page), args.repeat)
+        t_old = _best_time(lambda: legacy_extract_from_page_source(page), 1)
+
+    distinct_old = {tuple(sorted(f.items())) for f in old}
+    print(f"Page: {len(page) / 1024 / 1024:.1f} MB")
+    print(f"Previous (search per match): {t_old * 1000:9.1f} ms, "
+          f"{len(old)} fixtures ({len(distinct_old)} distinct)")
+    print(f"Single scan:                 {t_new * 1000:9.1f} ms, "
+          f"{len(new)} fixtures, matches a full parse  ({t_old / t_new:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
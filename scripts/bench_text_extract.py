@@ -0,0 +1,201 @@
+"""
+Text-pattern fixture extraction benchmark.
+
+Times GAAClubScraper.extract_from_text_patterns against the previous
+implementation, kept here unchanged as the reference: a get_text() on
+every div/p/li/tr/span, which re-reads the same text at each ancestor
+level.  Runs on a saved club page (--page) or a synthetic one (deeply
+nested div/li/span wrappers around dated fixture blocks, plus navigation
+and league-table noise).
+
+parse_text_fixture only returns a date placeholder, so fixtures say
+little about what changed.  Instead the candidate text blocks (dated,
+not navigation) of the two versions are compared, and every difference
+is put down to one of the intended changes:
+
+  - own text: a block reads its own text, not its nested blocks', so an
+    ancestor of a dated block is no longer a candidate and a dated block
+    no longer carries its children's text;
+  - whole words: the navigation filter matches whole words, where the
+    old substring test (p, w, d, l, ...) rejected nearly every block;
+  - skipped tags: blocks inside script / style / template aren't read.
+
+Anything else is reported as unexplained and fails the run.
+
+Usage (from the repo root):
+    PYTHONPATH=. python scripts/bench_text_extract.py
+    PYTHONPATH=. python scripts/bench_text_extract.py --fixtures 2000 --depth 12
+    PYTHONPATH=. python scripts/bench_text_extract.py --page saved_club_page.html
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from datetime import datetime, timedelta
+
+from scraper import GAAClubScraper
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+# The previous navigation filter's words, matched as substrings
+LEGACY_SKIP_WORDS = ['back', 'results', 'table', 'teams', 'form', 'group', 'team',
+                     'p', 'w', 'd', 'l', 'pf', 'pa', 'pd', 'pts']
+
+
+# ── Previous implementation (reference) ────────────────────────────────
+
+def legacy_extract_from_text_patterns(self, soup, club_id, today):
+    """Extract fixtures from text patterns on the page"""
+    fixtures = []
+
+    for element in soup.find_all(['div', 'p', 'li', 'tr', 'span']):
+        text = element.get_text().strip()
+
+        # Skip navigation elements
+        if any(skip_word in text.lower() for skip_word in ['back', 'results', 'table', 'teams', 'form', 'group', 'team', 'p', 'w', 'd', 'l', 'pf', 'pa', 'pd', 'pts']):
+            continue
+
+        # Look for date patterns
+        date_match = self._DATE_PATTERN.search(text)
+        if date_match:
+            print(f"Found date pattern in text: {text[:100]}...")
+
+            # Try to extract fixture information from this text
+            fixture_data = self.parse_text_fixture(element, club_id, today)
+            if fixture_data:
+                fixtures.append(fixture_data)
+
+    return fixtures
+
+
+# ── Candidate blocks ───────────────────────────────────────────────────
+
+def legacy_candidates(scraper, soup):
+    """{element id: text} for the blocks the previous version parsed."""
+    candidates = {}
+    for element in soup.find_all(list(scraper._TEXT_BLOCKS)):
+        text = element.get_text().strip()
+        if any(word in text.lower() for word in LEGACY_SKIP_WORDS):
+            continue
+        if scraper._DATE_PATTERN.search(text):
+            candidates[id(element)] = text
+    return candidates
+
+
+def compare_candidates(scraper, soup):
+    """(old candidates, new candidates, {reason: count}) for *soup*."""
+    old = legacy_candidates(scraper, soup)
+    elements = {}
+    own = {}
+    for element, text in scraper._text_blocks(soup):
+        elements[id(element)] = element
+        own[id(element)] = text.strip()
+    new = {key: text for key, text in own.items()
+           if text and not scraper._NAV_WORDS.search(text)
+           and scraper._DATE_PATTERN.search(text)}
+
+    reasons = {}
+
+    def count(reason):
+        reasons[reason] = reasons.get(reason, 0) + 1
+
+    for key, text in new.items():
+        if key in old:
+            count("same block, same text" if old[key] == text
+                  else "own text: nested blocks' text dropped")
+            continue
+        full = elements[key].get_text().strip()
+        if any(word in full.lower() for word in LEGACY_SKIP_WORDS):
+            count("whole words: kept, rejected by substring filter")
+        elif full != text:
+            count("own text: dated only without nested blocks' text")
+        else:
+            count("unexplained: new candidate")
+    for key in old.keys() - new.keys():
+        if key not in own:
+            count("skipped tags: inside script / style / template")
+        elif not scraper._DATE_PATTERN.search(own[key]):
+            count("own text: ancestor of a dated block dropped")
+        elif scraper._NAV_WORDS.search(own[key]):
+            count("whole words: own text has a navigation word")
+        else:
+            count("unexplained: candidate dropped")
+    return old, new, reasons
+
+
+# ── Synthetic page ─────────────────────────────────────────────────────
+
+def _ordinal(n):
+    return "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+
+
+def build_page(n_fixtures, depth, today):
+    blocks = []
+    for i in range(n_fixtures):
+        day = today + timedelta(days=i % 150 + 1)
+        inner = (f'<span>{DAYS[day.weekday()]} {day.day}{_ordinal(day.day)} '
+                 f'{day.strftime("%B")}</span> '
+                 f'<a href="/clubprofile/1986/">Ballincollig</a> 19:30 '
+                 f'<a href="/clubprofile/{2000 + i}/">Club {i}</a>')
+        for level in range(depth):
+            tag = ("div", "li", "div")[level % 3]
+            inner = f'<{tag} class="wrap-{level}">{inner}</{tag}>'
+        blocks.append(inner)
+    nav = "".join(f'<li><a href="/league/{i}/">Back to results</a></li>' for i in range(200))
+    table = "".join(f'<tr><td>{i}</td><td>Team {i}</td><td>Pts</td></tr>' for i in range(200))
+    return (f'<html><body><ul class="menu">{nav}</ul>'
+            f'<table>{table}</table><main>{"".join(blocks)}</main></body></html>')
+
+
+def _best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Text-pattern extraction benchmark")
+    parser.add_argument("--page", help="Saved club page (.html) instead of a synthetic one")
+    parser.add_argument("--fixtures", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=10, help="Wrapper elements per fixture")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    today = datetime(2026, 5, 1)
+    if args.page:
+        with open(args.page, encoding="utf-8") as f:
+            html = f.read()
+        description = args.page
+    else:
+        html = build_page(args.fixtures, args.depth, today)
+        description = f"{args.fixtures} dated blocks nested {args.depth} deep"
+    scraper = GAAClubScraper(client=object())
+    soup = scraper.parse_html(html)
+
+    old_blocks, new_blocks, reasons = compare_candidates(scraper, soup)
+    with contextlib.redirect_stdout(io.StringIO()):
+        old = legacy_extract_from_text_patterns(scraper, soup, "1986", today)
+        new = scraper.extract_from_text_patterns(soup, "1986", today)
+        t_old = _best_time(
+            lambda: legacy_extract_from_text_patterns(scraper, soup, "1986", today), args.repeat)
+        t_new = _best_time(
+            lambda: scraper.extract_from_text_patterns(soup, "1986", today), args.repeat)
+
+    print(f"Page: {len(html) / 1024:.0f} KB, {description}")
+    print(f"Previous (get_text per element): {t_old * 1000:8.1f} ms, "
+          f"{len(old_blocks)} candidate blocks, {len(old)} fixtures")
+    print(f"Single pass:                     {t_new * 1000:8.1f} ms, "
+          f"{len(new_blocks)} candidate blocks, {len(new)} fixtures  "
+          f"({t_old / t_new:.1f}x)")
+    print("Candidate blocks compared:")
+    for reason, n in sorted(reasons.items()):
+        print(f"  {n:6d}  {reason}")
+    unexplained = sum(n for reason, n in reasons.items() if reason.startswith("unexplained"))
+    assert not unexplained, f"{unexplained} candidate blocks differ for no intended reason"
+
+
+if __name__ == "__main__":
+    main()
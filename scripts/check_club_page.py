@@ -2,23 +2,15 @@
 Check what's actually on the club profile page
 """
 
-import requests
 from bs4 import BeautifulSoup
-import urllib3
-
-# Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from http_client import get_client
 
 def check_club_page():
     """Check the club profile page content"""
     
     url = "https://gaacork.ie/clubprofile/1986/?team_id=327535"
     
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    })
-    session.verify = False
+    session = get_client()  # shared pool, rate limit and TLS settings
     
     try:
         response = session.get(url)
@@ -0,0 +1,87 @@
+"""
+Crawl many gaacork.ie club profiles into the club directory CSV.
+
+Concurrent, resumable and incremental (see club_crawler.py): re-running
+after an interruption picks up where it stopped, and a later re-crawl
+only re-parses clubs whose profile page changed.  Reports throughput and
+per-host HTTP stats at the end.
+
+Usage (from the repo root):
+    PYTHONPATH=.:scripts python scripts/crawl_clubs.py --id-range 1900 2100
+    PYTHONPATH=.:scripts python scripts/crawl_clubs.py --club-ids 1986 1990 --workers 8
+    PYTHONPATH=.:scripts python scripts/crawl_clubs.py --id-range 1900 2100 --full
+"""
+
+import argparse
+
+from club_crawler import ClubCrawler, CrawlState
+from config import CLUB_CRAWL_STATE_FILE, CLUB_CRAWL_WORKERS, CSV_FILENAME, HTTP_CACHE_MODE
+from data_formatter import save_to_csv
+from http_client import get_client
+from response_cache import CACHE_MODES
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Crawl GAA club profiles concurrently')
+    parser.add_argument('--club-ids', nargs='+', type=int, help='Club IDs to crawl')
+    parser.add_argument('--id-range', nargs=2, type=int, metavar=('FIRST', 'LAST'),
+                        help='Crawl every club ID from FIRST to LAST inclusive')
+    parser.add_argument('--competition-id', type=int, help='Competition ID')
+    parser.add_argument('--team-id', type=int, help='Team ID')
+    parser.add_argument('--workers', type=int, default=CLUB_CRAWL_WORKERS,
+                        help='Profiles fetched at once')
+    parser.add_argument('--delay', type=float,
+                        help='Seconds per request to gaacork.ie (overrides REQUEST_DELAY)')
+    parser.add_argument('--burst', type=int,
+                        help='Requests to gaacork.ie allowed back to back')
+    parser.add_argument('--full', action='store_true',
+                        help='Re-parse every club, ignoring stored fingerprints')
+    parser.add_argument('--no-resume', action='store_true',
+                        help='Start over even if the last crawl was interrupted or had failures')
+    parser.add_argument('--state', default=CLUB_CRAWL_STATE_FILE, help='Crawl state file')
+    parser.add_argument('--output', default=CSV_FILENAME, help='Output CSV filename')
+    parser.add_argument('--cache-mode', choices=CACHE_MODES, default=HTTP_CACHE_MODE,
+                        help='On-disk HTTP response cache (offline-only: no network)')
+    args = parser.parse_args()
+
+    if args.club_ids:
+        club_ids = args.club_ids
+    elif args.id_range:
+        club_ids = list(range(args.id_range[0], args.id_range[1] + 1))
+    else:
+        parser.error('give --club-ids or --id-range')
+
+    client = get_client()
+    client.set_cache_mode(args.cache_mode)
+    if args.delay is not None:
+        client.limiter.delays['gaacork.ie'] = args.delay
+    if args.burst is not None:
+        client.limiter.bursts['gaacork.ie'] = args.burst
+
+    crawler = ClubCrawler(state=CrawlState(args.state), workers=args.workers)
+    print(f"Crawling {len(club_ids)} clubs with {crawler.workers} workers...")
+    report = crawler.crawl(club_ids, args.competition_id, args.team_id,
+                           resume=not args.no_resume, full=args.full)
+
+    crawled = report['clubs'] - report['skipped'] - len(report['failed'])
+    print("\n=== Crawl summary ===")
+    print(f"Clubs:          {report['clubs']} ({report['skipped']} resumed from last run)")
+    print(f"Parsed:         {report['parsed']}")
+    print(f"Unchanged:      {report['unchanged']} (same fingerprint)")
+    print(f"Not modified:   {report['not_modified']} (304)")
+    print(f"Failed:         {len(report['failed'])}"
+          + (" (retried by the next crawl)" if report['failed'] else ""))
+    print(f"Downloaded:     {report['bytes'] / 1024:.0f} KB")
+    print(f"Elapsed:        {report['elapsed']:.1f}s")
+    print(f"Throughput:     {report['clubs_per_sec']:.2f} clubs/s ({crawled} crawled)")
+    http_summary = client.metrics.summary()
+    if http_summary:
+        print(f"\nHTTP requests:\n{http_summary}")
+
+    records = crawler.records(club_ids)
+    if records:
+        save_to_csv(records, args.output)
+
+
+if __name__ == "__main__":
+    main()
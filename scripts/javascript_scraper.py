@@ -2,28 +2,19 @@
 JavaScript-enabled scraper to get dynamically loaded fixtures
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import re
-import urllib3
-
-# Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from http_client import get_client
 
 class JavaScriptScraper:
     def __init__(self):
         self.base_url = "https://gaacork.ie"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        self.session = get_client()  # shared pool, rate limit and TLS settings
+        self.headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-        self.session.verify = False
+        }
         
     def extract_json_from_scripts(self, soup):
         """Extract JSON data from JavaScript scripts"""
@@ -102,7 +93,7 @@ class JavaScriptScraper:
                 
                 print(f"Trying endpoint: {url}")
                 
-                response = self.session.get(url)
+                response = self.session.get(url, headers=self.headers)
                 response.raise_for_status()
                 
                 # Try to parse as JSON
@@ -133,7 +124,7 @@ class JavaScriptScraper:
         url = f"https://gaacork.ie/clubprofile/{club_id}/?team_id={team_id}"
         
         try:
-            response = self.session.get(url)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -4,6 +4,9 @@ Main script to run the GAA club scraper
 
 from scraper import GAAClubScraper
 from data_formatter import save_to_csv, load_existing_csv
+from config import HTTP_CACHE_MODE
+from http_client import get_client
+from response_cache import CACHE_MODES
 import argparse
 
 
@@ -15,9 +18,12 @@ def main():
     parser.add_argument('--team-id', type=int, help='Team ID')
     parser.add_argument('--output', type=str, help='Output CSV filename')
     parser.add_argument('--append', action='store_true', help='Append to existing CSV file')
+    parser.add_argument('--cache-mode', choices=CACHE_MODES, default=HTTP_CACHE_MODE,
+                        help='On-disk HTTP response cache (offline-only: no network)')
     
     args = parser.parse_args()
     
+    get_client().set_cache_mode(args.cache_mode)
     scraper = GAAClubScraper()
     
     # Determine which clubs to scrape
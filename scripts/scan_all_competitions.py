@@ -2,24 +2,18 @@
 Scan all GAA competitions to find Ballincollig fixtures
 """
 
-import requests
+import argparse
 from bs4 import BeautifulSoup
 import re
 from urllib.parse import urljoin
-import time
-import urllib3
-
-# Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from config import HTTP_CACHE_MODE
+from http_client import get_client
+from response_cache import CACHE_MODES
 
 class CompetitionScanner:
     def __init__(self):
         self.base_url = "https://gaacork.ie"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        self.session.verify = False  # Disable SSL verification
+        self.session = get_client()  # shared pool, rate limit and TLS settings
         
     def get_all_competition_links(self):
         """Get all competition links from the GAA website"""
@@ -111,9 +105,6 @@ class CompetitionScanner:
             if fixtures:
                 all_fixtures.extend(fixtures)
                 competitions_with_fixtures.append(competition_url)
-            
-            # Be respectful to the server
-            time.sleep(0.5)
         
         print()
         print("=== SUMMARY ===")
@@ -135,5 +126,11 @@ class CompetitionScanner:
         return all_fixtures, competitions_with_fixtures
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scan all competitions for Ballincollig fixtures")
+    parser.add_argument("--cache-mode", choices=CACHE_MODES, default=HTTP_CACHE_MODE,
+                        help="On-disk HTTP response cache (offline-only: no network)")
+    args = parser.parse_args()
+    get_client().set_cache_mode(args.cache_mode)
+
     scanner = CompetitionScanner()
     fixtures, competitions = scanner.scan_all_competitions()
@@ -2,22 +2,16 @@
 Scan a range of competition IDs to find Ballincollig fixtures
 """
 
-import requests
+import argparse
 from bs4 import BeautifulSoup
-import time
-import urllib3
-
-# Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from config import HTTP_CACHE_MODE
+from http_client import get_client
+from response_cache import CACHE_MODES
 
 class CompetitionRangeScanner:
     def __init__(self):
         self.base_url = "https://gaacork.ie"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        self.session.verify = False  # Disable SSL verification
+        self.session = get_client()  # shared pool, rate limit and TLS settings
         
     def scan_competition(self, comp_id):
         """Scan a single competition by ID"""
@@ -82,9 +76,6 @@ class CompetitionRangeScanner:
                     print(f"  {fixture['date']}: {fixture['home']} vs {fixture['away']} ({fixture['competition']})")
             else:
                 print("no fixtures")
-            
-            # Be respectful to the server
-            time.sleep(0.3)
         
         print()
         print("=== SUMMARY ===")
@@ -100,6 +91,12 @@ class CompetitionRangeScanner:
         return all_fixtures, competitions_with_fixtures
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scan a range of competition IDs")
+    parser.add_argument("--cache-mode", choices=CACHE_MODES, default=HTTP_CACHE_MODE,
+                        help="On-disk HTTP response cache (offline-only: no network)")
+    args = parser.parse_args()
+    get_client().set_cache_mode(args.cache_mode)
+
     scanner = CompetitionRangeScanner()
     
     # Scan around the known competition IDs and look for newer ones
@@ -13,11 +13,11 @@ Usage:
 
 import sys
 import time
-import requests
 from config import (
-    CLUB_NAME, NTFY_TOPIC, NTFY_ICON, NTFY_FIXTURES_URL,
+    CLUB_NAME, NTFY_BASE_URL, NTFY_TOPIC, NTFY_ICON, NTFY_FIXTURES_URL,
     CLUBZAP_TEAM_IDS, team_ntfy_topic, team_fixtures_url,
 )
+from http_client import get_client
 
 WELCOME_TITLE = f"{CLUB_NAME} GAA - Notifications Active"
 WELCOME_MSG = (
@@ -39,8 +39,8 @@ def send(topic, title, message, fixtures_url, dry_run=False):
         print(f"  [DRY-RUN] {topic}")
         return True
     try:
-        resp = requests.post(
-            f"https://ntfy.sh/{topic}",
+        resp = get_client().post(
+            f"{NTFY_BASE_URL}/{topic}",
             data=message.encode("utf-8"),
             headers={
                 "Title": title,
@@ -1,261 +1,146 @@
 """
-Selenium-based scraper to execute JavaScript and get dynamically loaded fixtures
+Club-profile fixture scraper for pages that load their fixtures with JavaScript
+
+The page is rendered in the shared headless browser (browser_engine);
+the module keeps its historical name, from when it drove Selenium.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-import json
-import re
 import time
 
-from config import CLUB_NAME, CLUB_ID, TEAM_ID, RUGBY_INDICATORS
+from browser_engine import PageEngine
+from config import (CLUB_NAME, CLUB_ID, TEAM_ID, FIXTURE_ENDPOINT_FILE,
+                    FIXTURE_ENDPOINT_MODE)
+from fixture_endpoint import (EndpointShapeChanged, FixtureEndpoint,
+                              find_fixture_endpoint, fixtures_from_html)
+from http_client import get_client
 
 class SeleniumScraper:
-    def __init__(self):
-        self.setup_driver()
+    # Seconds to wait for the fixture list to render (slow on cloud runners)
+    FIXTURE_WAIT = 75
+    
+    def __init__(self, endpoint_mode=FIXTURE_ENDPOINT_MODE,
+                 endpoint_file=FIXTURE_ENDPOINT_FILE, client=None, engine=None):
+        # The browser is only started when the page has to be rendered;
+        # an engine passed in is shared, and left open by close()
+        self.engine = engine
+        self._owns_engine = engine is None
+        self.endpoint_mode = endpoint_mode
+        self.endpoint_file = endpoint_file
+        self.client = client
+        self.endpoint = (FixtureEndpoint.load(endpoint_file)
+                         if endpoint_mode == 'auto' else None)
+        # XHR / fetch exchanges from the last rendered profile
+        self.exchanges = []
+    
+    @property
+    def capturing(self):
+        """Record the page's requests to capture the fixture endpoint"""
+        return self.endpoint_mode in ('auto', 'discover')
+    
+    def ensure_engine(self):
+        """The page engine, created on first use"""
+        if self.engine is None:
+            self.engine = PageEngine()
+        return self.engine
+    
+    def scrape_club_profile(self, club_id, team_id, deadline=None):
+        """
+        Club profile fixtures, from the captured fixture endpoint if there
+        is one (one HTTP request), otherwise by rendering the page
         
-    def setup_driver(self):
-        """Setup Chrome driver with headless options"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        The browser is used only when no endpoint is saved or the saved
+        one no longer answers in the captured shape; a browser run
+        captures the endpoint for next time.  Network errors calling the
+        endpoint are raised, not retried in the browser.
         
+        *deadline* (a time.monotonic() value) cancels a browser render
+        still running then, so nothing is left using the browser.
+        """
+        if self.endpoint is not None:
+            try:
+                fixtures = self.endpoint.fetch(self.client or get_client(),
+                                               club_id, team_id)
+                print(f"Fetched {len(fixtures)} {CLUB_NAME} fixtures directly "
+                      f"from {self.endpoint.url}")
+                return fixtures
+            except EndpointShapeChanged as e:
+                print(f"Fixture endpoint has changed ({e}); falling back to the browser")
+                self.endpoint = None
+        
+        fixtures = self.scrape_with_browser(club_id, team_id, deadline)
+        if fixtures and self.capturing:
+            self.capture_endpoint(club_id, team_id)
+        return fixtures
+    
+    def capture_endpoint(self, club_id, team_id):
+        """Save the fixture XHR seen while the profile loaded, if found"""
+        # The fixtures are already scraped; a bad capture mustn't lose them
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            print("Chrome driver initialized successfully")
+            endpoint = find_fixture_endpoint(self.exchanges, club_id, team_id)
+            if endpoint is None:
+                print("No fixture XHR found among the page's requests")
+                return None
+            endpoint.save(self.endpoint_file)
         except Exception as e:
-            print(f"Failed to initialize Chrome driver: {e}")
-            self.driver = None
+            print(f"Error capturing fixture endpoint: {e}")
+            return None
+        print(f"Captured fixture endpoint: {endpoint.method} {endpoint.url}")
+        if self.endpoint_mode == 'auto':
+            self.endpoint = endpoint
+        return endpoint
     
-    def scrape_club_profile(self, club_id, team_id):
+    def scrape_with_browser(self, club_id, team_id, deadline=None):
         """Scrape club profile with JavaScript execution"""
-        
-        if not self.driver:
-            print("No driver available")
-            return []
-        
         url = f"https://gaacork.ie/clubprofile/{club_id}/?team_id={team_id}"
-        
+        print(f"Loading page: {url}")
+        timeout = max(0, deadline - time.monotonic()) if deadline is not None else None
         try:
-            print(f"Loading page: {url}")
-            self.driver.get(url)
-            
-            # Wait for initial page load
-            time.sleep(5)
-            
-            # Wait for JavaScript to execute and load fixtures
-            print("Waiting for JavaScript to load fixtures...")
-            
-            # Retry with increasing waits (cloud environments are slower)
-            for attempt in range(3):
-                wait_time = 15 + (attempt * 10)  # 15s, 25s, 35s
-                print(f"Attempt {attempt + 1}/3 (waiting up to {wait_time}s)...")
-                
-                # Method 1: Wait for fixture elements with data-date
-                try:
-                    fixture_elements = WebDriverWait(self.driver, wait_time).until(
-                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'ul[data-date]'))
-                    )
-                    print(f"Found {len(fixture_elements)} fixture elements via CSS selector")
-                    return self.process_fixture_elements(fixture_elements)
-                except TimeoutException:
-                    print(f"No fixture elements found on attempt {attempt + 1}")
-                
-                # Method 2: Try JavaScript finder
-                js_fixtures = self.execute_javascript_fixture_finder()
-                if js_fixtures:
-                    return js_fixtures
-                
-                # Scroll page to trigger any lazy loading
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
-            
-            # Method 3: Look for elements with 'fixtures' in class
-            try:
-                fixture_elements = self.driver.find_elements(By.CSS_SELECTOR, 'ul[class*="fixtures"]')
-                if fixture_elements:
-                    print(f"Found {len(fixture_elements)} fixture elements via class name")
-                    return self.process_fixture_elements(fixture_elements)
-            except Exception:
-                print("No fixture elements found with 'fixtures' in class")
-            
-            # Method 4: Look for any table-like structures
-            try:
-                fixture_elements = self.driver.find_elements(By.CSS_SELECTOR, 'ul.table-body')
-                if fixture_elements:
-                    print(f"Found {len(fixture_elements)} table-body elements")
-                    return self.process_fixture_elements(fixture_elements)
-            except Exception:
-                print("No table-body elements found")
-            
-            # Method 5: Check page source after JavaScript execution
-            print("Checking page source after JavaScript execution...")
-            page_source = self.driver.page_source
-            
-            # Look for club name in the page source
-            if CLUB_NAME in page_source:
-                print(f"Found '{CLUB_NAME}' in page source, attempting to extract...")
-                return self.extract_from_page_source(page_source)
-            
-            print("No fixtures found after JavaScript execution")
+            page = self.ensure_engine().render(
+                url, wait_for='ul[data-date]', wait_timeout=self.FIXTURE_WAIT,
+                capture=self.capturing, timeout=timeout)
+        except TimeoutError:
+            print("Club profile still rendering at the source's deadline; cancelled")
             return []
-            
         except Exception as e:
-            print(f"Error scraping with Selenium: {e}")
+            print(f"Error rendering club profile: {e}")
             return []
-    
-    def process_fixture_elements(self, elements):
-        """Process fixture elements found by Selenium"""
-        
-        fixtures = []
-        
-        for element in elements:
-            try:
-                # Get data attributes
-                home_team = element.get_attribute('data-hometeam') or ''
-                away_team = element.get_attribute('data-awayteam') or ''
-                date = element.get_attribute('data-date') or ''
-                fixture_time = element.get_attribute('data-time') or ''
-                venue = element.get_attribute('data-venue') or ''
-                competition = element.get_attribute('data-compname') or ''
-                
-                # Check if club is involved
-                if CLUB_NAME in home_team or CLUB_NAME in away_team:
-                    # Filter out rugby and LGFA
-                    exclude_indicators = RUGBY_INDICATORS + ['lgfa', 'ladies']
-                    comp_lower = competition.lower()
-                    
-                    if not any(indicator in comp_lower for indicator in exclude_indicators):
-                        referee = element.get_attribute('data-referee') or ''
-                        fixtures.append({
-                            'home': home_team,
-                            'away': away_team,
-                            'date': date,
-                            'time': fixture_time,
-                            'venue': venue,
-                            'competition': competition,
-                            'referee': referee.strip()
-                        })
-                        
-                        print(f"Found fixture: {date} - {home_team} vs {away_team} ({competition})")
-                
-            except Exception as e:
-                print(f"Error processing element: {e}")
-                continue
         
-        print(f"Processed {len(fixtures)} {CLUB_NAME} fixtures")
-        return fixtures
-    
-    def execute_javascript_fixture_finder(self):
-        """Execute JavaScript to find fixtures"""
-        
-        js_code = f"""
-        // Look for fixture data in various places
-        var fixtures = [];
-        
-        // Check for elements with data attributes
-        var elements = document.querySelectorAll('ul[data-date], ul[data-hometeam], ul[data-awayteam]');
-        
-        for (var i = 0; i < elements.length; i++) {{
-            var el = elements[i];
-            var homeTeam = el.getAttribute('data-hometeam') || '';
-            var awayTeam = el.getAttribute('data-awayteam') || '';
-            
-            if (homeTeam.indexOf('{CLUB_NAME}') !== -1 || awayTeam.indexOf('{CLUB_NAME}') !== -1) {{
-                fixtures.push({{
-                    home: homeTeam,
-                    away: awayTeam,
-                    date: el.getAttribute('data-date') || '',
-                    time: el.getAttribute('data-time') || '',
-                    venue: el.getAttribute('data-venue') || '',
-                    competition: el.getAttribute('data-compname') || ''
-                }});
-            }}
-        }}
-        
-        return fixtures;
-        """
-        
-        try:
-            result = self.driver.execute_script(js_code)
-            print(f"JavaScript found {len(result)} fixtures")
-            return result
-        except Exception as e:
-            print(f"Error executing JavaScript: {e}")
-            return []
+        self.exchanges = page.exchanges
+        if not page.found:
+            print(f"No fixture elements after {self.FIXTURE_WAIT}s; "
+                  "reading the page as rendered")
+        return self.extract_from_page_source(page.html)
     
     def extract_from_page_source(self, page_source):
-        """Extract fixtures from page source using regex"""
-        
-        fixtures = []
-        
-        # Look for data attributes in the HTML
-        club_escaped = re.escape(CLUB_NAME)
-        pattern = fr'data-hometeam="([^"]*{club_escaped}[^"]*)"|data-awayteam="([^"]*{club_escaped}[^"]*)"'
-        matches = re.findall(pattern, page_source)
-        
-        for match in matches:
-            home_team = match[0] if match[0] else ''
-            away_team = match[1] if match[1] else ''
-            
-            # Try to extract the full fixture element
-            if home_team or away_team:
-                # Look for the surrounding ul element
-                team_name = home_team or away_team
-                ul_pattern = fr'<ul[^>]*data-(?:home|away)team="[^"]*{re.escape(team_name)}[^"]*"[^>]*>.*?</ul>'
-                ul_match = re.search(ul_pattern, page_source, re.DOTALL)
-                
-                if ul_match:
-                    ul_html = ul_match.group()
-                    
-                    # Extract all data attributes
-                    data_pattern = r'data-([^=]+)="([^"]*)"'
-                    data_attrs = dict(re.findall(data_pattern, ul_html))
-                    
-                    fixtures.append({
-                        'home': data_attrs.get('hometeam', ''),
-                        'away': data_attrs.get('awayteam', ''),
-                        'date': data_attrs.get('date', ''),
-                        'time': data_attrs.get('time', ''),
-                        'venue': data_attrs.get('venue', ''),
-                        'competition': data_attrs.get('compname', '')
-                    })
+        """
+        Extract fixtures from page source in one scan
         
+        Each fixture <ul data-*> opening tag is read once (see
+        fixture_endpoint.iter_fixture_tags), so a fixture appears once
+        even when our club is on both sides, and the same club / rugby /
+        LGFA filter and referee field apply as for the fixture endpoint.
+        """
+        fixtures = fixtures_from_html(page_source)
         print(f"Extracted {len(fixtures)} fixtures from page source")
         return fixtures
     
     def close(self):
-        """Close the driver"""
-        if self.driver:
-            self.driver.quit()
+        """Close the browser, unless it was shared with this scraper"""
+        if self.engine is not None and self._owns_engine:
+            self.engine.close()
+            self.engine = None
 
 if __name__ == "__main__":
-    scraper = SeleniumScraper()
+    scraper = SeleniumScraper(endpoint_mode='discover')
     
-    if scraper.driver:
-        try:
-            fixtures = scraper.scrape_club_profile(CLUB_ID, TEAM_ID)
-            
-            print("\n=== Fixtures Found ===")
-            for fixture in fixtures:
-                print(f"{fixture['date']}: {fixture['home']} vs {fixture['away']} ({fixture['competition']})")
-            
-            print(f"\nTotal fixtures: {len(fixtures)}")
-            
-        finally:
-            scraper.close()
-    else:
-        print("Could not initialize Selenium driver")
-        print("You may need to install ChromeDriver:")
-        print("1. Download ChromeDriver: https://chromedriver.chromium.org/")
-        print("2. Add it to your PATH or place it in the project directory")
+    try:
+        fixtures = scraper.scrape_club_profile(CLUB_ID, TEAM_ID)
+        
+        print("\n=== Fixtures Found ===")
+        for fixture in fixtures:
+            print(f"{fixture['date']}: {fixture['home']} vs {fixture['away']} ({fixture['competition']})")
+        
+        print(f"\nTotal fixtures: {len(fixtures)}")
+        
+    finally:
+        scraper.close()
@@ -0,0 +1,373 @@
+"""
+Unit tests for browser_engine.py — the shared, pooled browser — run
+against a fake browser standing in for Playwright's Chromium.
+"""
+
+import asyncio
+import time
+
+import pytest
+from bs4 import BeautifulSoup
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from browser_engine import PageEngine, PageHung
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, method="GET", post_data=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.post_data = post_data
+        self.headers = {"x-requested-with": "XMLHttpRequest"}
+
+
+class FakeResponse:
+    def __init__(self, request, body, content_type="text/html"):
+        self.request = request
+        self.status = 200
+        self.headers = {"content-type": content_type}
+        self._body = body
+
+    async def text(self):
+        return self._body
+
+
+class FakePage:
+    def __init__(self, browser, context):
+        self.browser = browser
+        self.context = context
+        self.listeners = []
+        self.html = ""
+
+    def set_default_navigation_timeout(self, ms):
+        self.nav_timeout = ms
+
+    def set_default_timeout(self, ms):
+        self.timeout = ms
+
+    def on(self, event, handler):
+        self.listeners.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners.remove(handler)
+
+    async def goto(self, url, wait_until=None):
+        browser = self.browser
+        browser.active += 1
+        browser.peak = max(browser.peak, browser.active)
+        browser.visits.append(url)
+        try:
+            await asyncio.sleep(browser.delays.get(url, 0.02))
+            if browser.closed:
+                raise RuntimeError("Target page, context or browser has been closed")
+            if url not in browser.site:
+                raise PlaywrightTimeout(f"Timeout exceeded navigating to {url}")
+            self.html, requests = browser.site[url]
+            for request, body in requests:
+                for handler in list(self.listeners):
+                    handler(FakeResponse(request, body))
+        finally:
+            browser.active -= 1
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        if BeautifulSoup(self.html, "html.parser").select_one(selector) is None:
+            raise PlaywrightTimeout(f"waiting for {selector}")
+
+    async def content(self):
+        return self.html
+
+
+class FakeContext:
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.closed = False
+        self.close_handlers = []
+
+    def once(self, event, handler):
+        self.close_handlers.append(handler)
+
+    async def new_page(self):
+        return FakePage(self.browser, self)
+
+    async def close(self):
+        self.closed = True
+        for handler in self.close_handlers:
+            handler(self)
+
+
+class FakeBrowser:
+    """Serves {url: (html, [(request, response body), ...])}.
+
+    *delays* gives seconds per URL for goto (default 0.02).
+    """
+
+    def __init__(self, site, delays=None):
+        self.site = site
+        self.delays = delays or {}
+        self.contexts = []
+        self.visits = []
+        self.active = self.peak = 0
+        self.closed = False
+
+    async def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+def _engine(site, pool_size=2, **kwargs):
+    browser = FakeBrowser(site)
+
+    async def launch():
+        return browser
+
+    return PageEngine(pool_size=pool_size, launcher=launch, memory_probe=None,
+                      **kwargs), browser
+
+
+def _site(n):
+    return {f"https://rebelog.ie/league/{i}/": (f"<ul data-date='x'>League {i}</ul>", [])
+            for i in range(n)}
+
+
+@pytest.fixture
+def engine_and_browser():
+    engines = []
+
+    def make(site, pool_size=2):
+        engine, browser = _engine(site, pool_size)
+        engines.append(engine)
+        return engine, browser
+
+    yield make
+    for engine in engines:
+        engine.close()
+
+
+class TestRender:
+    def test_browser_started_on_first_render(self, engine_and_browser):
+        engine, browser = engine_and_browser(_site(1))
+        assert not engine.started
+        page = engine.render("https://rebelog.ie/league/0/", wait_for="ul[data-date]")
+        assert engine.started
+        assert page.found
+        assert "League 0" in page.html
+
+    def test_missing_selector_still_returns_markup(self, engine_and_browser):
+        engine, _ = engine_and_browser(_site(1))
+        page = engine.render("https://rebelog.ie/league/0/", wait_for="table.league_table")
+        assert not page.found
+        assert "League 0" in page.html
+
+    def test_pages_rendered_in_parallel_within_pool(self, engine_and_browser):
+        site = _site(6)
+        engine, browser = engine_and_browser(site, pool_size=3)
+        pages = engine.render_many(site)
+        assert [p.url for p in pages] == list(site)
+        assert browser.peak == 3
+        # one context per pool slot, reused page after page
+        assert len(browser.contexts) == 3
+        assert engine.pages_rendered == 6
+
+    def test_failed_page_is_none_and_not_reused(self, engine_and_browser):
+        site = _site(2)
+        engine, browser = engine_and_browser(site, pool_size=1)
+        pages = engine.render_many(["https://rebelog.ie/league/0/",
+                                    "https://rebelog.ie/gone/",
+                                    "https://rebelog.ie/league/1/"])
+        assert pages[1] is None
+        assert pages[2].found
+        assert [c.closed for c in browser.contexts] == [True, False]
+
+    def test_render_raises_navigation_errors(self, engine_and_browser):
+        engine, _ = engine_and_browser({})
+        with pytest.raises(PlaywrightTimeout):
+            engine.render("https://rebelog.ie/gone/")
+
+
+class TestCapture:
+    def test_background_requests_recorded(self, engine_and_browser):
+        xhr = FakeRequest("https://gaacork.ie/wp-admin/admin-ajax.php", "xhr",
+                          method="POST", post_data="action=club_fixtures")
+        image = FakeRequest("https://gaacork.ie/logo.png", "image")
+        site = {"https://gaacork.ie/clubprofile/1986/": (
+            "<ul data-date='x'></ul>", [(xhr, "<ul data-date='x'></ul>"), (image, "")])}
+        engine, _ = engine_and_browser(site)
+        page = engine.render("https://gaacork.ie/clubprofile/1986/", capture=True)
+        (exchange,) = page.exchanges
+        assert exchange["request"]["method"] == "POST"
+        assert exchange["request"]["postData"] == "action=club_fixtures"
+        assert exchange["content_type"] == "text/html"
+
+    def test_not_recorded_without_capture(self, engine_and_browser):
+        xhr = FakeRequest("https://gaacork.ie/wp-admin/admin-ajax.php", "xhr")
+        engine, _ = engine_and_browser({"https://gaacork.ie/": ("", [(xhr, "body")])})
+        assert engine.render("https://gaacork.ie/").exchanges == []
+
+
+class TestSharedBrowser:
+    def test_contexts_for_async_callers(self, engine_and_browser):
+        engine, browser = engine_and_browser(_site(1))
+
+        async def session():
+            context = await engine.new_context()
+            page = await context.new_page()
+            await page.goto("https://rebelog.ie/league/0/")
+            return context
+
+        context = engine.run(session())
+        assert context.options["viewport"]["width"] == 1920
+        assert browser.visits == ["https://rebelog.ie/league/0/"]
+
+    def test_render_past_its_timeout_cancelled(self, engine_and_browser):
+        site = _site(1)
+        engine, browser = engine_and_browser(site)
+        browser.delays["https://rebelog.ie/league/0/"] = 5
+        with pytest.raises(TimeoutError):
+            engine.render("https://rebelog.ie/league/0/", timeout=0.2)
+        time.sleep(0.1)
+        assert browser.active == 0
+        assert [c.closed for c in browser.contexts] == [True]
+
+    def test_run_from_engine_loop_rejected(self, engine_and_browser):
+        engine, _ = engine_and_browser({})
+
+        async def nested():
+            engine.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError):
+            engine.run(nested())
+
+    def test_close_closes_browser(self):
+        engine, browser = _engine(_site(1))
+        engine.render("https://rebelog.ie/league/0/")
+        engine.close()
+        assert browser.closed
+        assert all(c.closed for c in browser.contexts)
+        engine.close()  # idempotent
+
+
+class Launcher:
+    """Launches a new FakeBrowser each time, with per-launch delays."""
+
+    def __init__(self, site, delays=()):
+        self.site = site
+        self.delays = list(delays)
+        self.browsers = []
+
+    async def __call__(self):
+        delays = self.delays[len(self.browsers)] if len(self.browsers) < len(self.delays) else {}
+        browser = FakeBrowser(self.site, delays)
+        self.browsers.append(browser)
+        return browser
+
+
+HUNG = 3600  # seconds: a goto that never returns
+
+
+@pytest.fixture
+def watched():
+    engines = []
+
+    def make(launcher, **kwargs):
+        kwargs.setdefault("memory_probe", None)
+        engine = PageEngine(launcher=launcher, nav_timeout=0.1, script_timeout=0.1,
+                            hang_grace=0.1, **kwargs)
+        engine.close_timeout = 0.5
+        engines.append(engine)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.close()
+
+
+class TestWatchdog:
+    URL = "https://rebelog.ie/league/0/"
+
+    def test_hung_page_restarts_browser_and_retries(self, watched):
+        launcher = Launcher(_site(1), delays=[{self.URL: HUNG}])
+        engine = watched(launcher)
+        page = engine.render(self.URL)
+        assert "League 0" in page.html
+        assert len(launcher.browsers) == 2
+        assert launcher.browsers[0].closed
+        assert engine.metrics.recycle_counts() == {"hang": 1}
+        assert engine.metrics.retries == 1
+        assert engine.metrics.recycles[0]["url"] == self.URL
+
+    def test_page_hanging_twice_raises(self, watched):
+        launcher = Launcher(_site(1), delays=[{self.URL: HUNG}, {self.URL: HUNG}])
+        engine = watched(launcher)
+        with pytest.raises(PageHung):
+            engine.render(self.URL)
+        assert engine.metrics.recycle_counts() == {"hang": 2}
+
+    def test_pages_in_flight_retried_after_restart(self, watched):
+        site = _site(2)
+        other = "https://rebelog.ie/league/1/"
+        launcher = Launcher(site, delays=[{self.URL: HUNG, other: 0.5}])
+        engine = watched(launcher, pool_size=2)
+        pages = engine.render_many([self.URL, other])
+        assert all(p is not None for p in pages)
+        assert engine.metrics.recycle_counts() == {"hang": 1}
+        assert engine.metrics.retries == 2
+
+    def test_time_queued_for_a_page_is_not_a_hang(self, watched):
+        # Six 0.2s pages through one tab: the last waits a second for it,
+        # well past the 0.3s deadline, without its own render hanging
+        site = _site(6)
+        launcher = Launcher(site, delays=[dict.fromkeys(site, 0.2)])
+        engine = watched(launcher, pool_size=1)
+        pages = engine.render_many(site)
+        assert all(p is not None for p in pages)
+        assert len(launcher.browsers) == 1
+        assert engine.metrics.recycles == []
+        assert engine.metrics.retries == 0
+
+    def test_slow_selector_wait_is_not_a_hang(self, watched):
+        launcher = Launcher(_site(1), delays=[{self.URL: 0.5}])
+        engine = watched(launcher)
+        assert engine.render(self.URL, wait_for="ul", wait_timeout=1).found
+        assert engine.metrics.recycles == []
+
+    def test_deadline_covers_every_step(self):
+        engine = PageEngine(nav_timeout=60, script_timeout=30, hang_grace=15)
+        assert engine.render_deadline() == 105
+        assert engine.render_deadline("ul", wait_timeout=75) == 180
+        assert engine.render_deadline("ul") == 165
+
+    def test_recycled_after_n_pages(self, watched):
+        site = _site(5)
+        launcher = Launcher(site)
+        engine = watched(launcher, pool_size=1, recycle_pages=2)
+        assert all(engine.render_many(site))
+        assert len(launcher.browsers) == 3
+        assert engine.metrics.recycle_counts() == {"pages": 2}
+        assert [e["pages"] for e in engine.metrics.recycles] == [2, 2]
+        assert all(b.closed for b in launcher.browsers[:2])
+
+    def test_recycled_over_memory_threshold(self, watched):
+        readings = iter([400, 1600, 1600, 300, 300])
+        launcher = Launcher(_site(3))
+        engine = watched(launcher, pool_size=1, recycle_memory_mb=1500,
+                         memory_probe=lambda: next(readings))
+        engine.render_many(_site(3))
+        assert engine.metrics.recycle_counts() == {"memory": 1}
+        assert engine.metrics.recycles[0]["memory_mb"] == 1600
+        assert "memory after 2 pages, 1600 MB" in engine.metrics.summary()
+
+    def test_not_recycled_while_a_context_is_open(self, watched):
+        launcher = Launcher(_site(3))
+        engine = watched(launcher, pool_size=1, recycle_pages=1)
+        context = engine.run(engine.new_context())
+        engine.render_many(_site(2))
+        assert engine.metrics.recycles == []
+        engine.run(context.close())
+        engine.render("https://rebelog.ie/league/2/")
+        assert engine.metrics.recycle_counts() == {"pages": 1}
@@ -0,0 +1,76 @@
+"""
+Unit tests for competition_monitor/camogie.py — camogie league pages in
+the competition monitor's scrape shape.
+"""
+
+import pytest
+import requests
+
+from camogie_scraper import LeagueCache
+from competition_monitor.camogie import CamogieCompetitionScraper
+from competition_monitor import results_tracker
+from competition_monitor.results_tracker import compute_diff, save_baseline
+from tests.test_camogie_scraper import (
+    AWAY_FIXTURE, FIXTURE_CARD, RESULT_CARD, SECOND_TEAM_FIXTURE,
+    STANDINGS_TABLE, UNRELATED_FIXTURE, FakeSession,
+)
+
+URL = "https://corkcamogie.com/test-league/"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LeagueCache(str(tmp_path / "camogie_cache.json"))
+
+
+def _scrape(html, cache, club="Ballincollig"):
+    session = FakeSession({URL: html})
+    return CamogieCompetitionScraper(club, session=session, cache=cache).scrape(URL)
+
+
+class TestScrape:
+    def test_same_shape_as_competition_scraper(self, cache):
+        data = _scrape(FIXTURE_CARD + STANDINGS_TABLE, cache)
+        assert set(data) == {"competition_name", "competition_url",
+                             "fixtures", "results", "table"}
+        assert data["competition_url"] == URL
+        assert data["competition_name"] == (
+            "Premier Intermediate League 2026 - League Division 1")
+
+    def test_played_match_is_a_result_not_a_fixture(self, cache):
+        data = _scrape(FIXTURE_CARD + RESULT_CARD + AWAY_FIXTURE, cache)
+        assert [(r["home"], r["home_score"], r["away_score"])
+                for r in data["results"]] == [("Ballincollig", "7-15", "0-3")]
+        assert [f["home"] for f in data["fixtures"]] == ["Na Piarsaigh"]
+        assert "_has_score" not in data["fixtures"][0]
+
+    def test_other_teams_in_our_division_kept(self, cache):
+        data = _scrape(FIXTURE_CARD + UNRELATED_FIXTURE, cache)
+        assert [f["home"] for f in data["fixtures"]] == ["Ballincollig", "Douglas"]
+
+    def test_other_divisions_dropped(self, cache):
+        data = _scrape(FIXTURE_CARD + SECOND_TEAM_FIXTURE, cache,
+                       club="Ballincollig 2")
+        assert [f["away"] for f in data["fixtures"]] == ["Ballincollig 2"]
+
+    def test_table_is_our_group(self, cache):
+        other = STANDINGS_TABLE.replace("Ballincollig", "Douglas")
+        data = _scrape(FIXTURE_CARD + other + STANDINGS_TABLE, cache)
+        assert data["table"][0]["team"] == "Ballincollig"
+
+    def test_fetch_error_returns_none(self, cache):
+        html = requests.ConnectionError("refused")
+        assert _scrape(html, cache) is None
+
+
+class TestResultsTrackerIntegration:
+    def test_new_result_detected(self, cache, tmp_path, monkeypatch):
+        monkeypatch.setattr(results_tracker, "BASELINE_DIR", str(tmp_path))
+        before = _scrape(FIXTURE_CARD + STANDINGS_TABLE, cache)
+        save_baseline("Camogie", before)
+
+        after = _scrape(FIXTURE_CARD + RESULT_CARD + STANDINGS_TABLE,
+                        LeagueCache(str(tmp_path / "fresh.json")))
+        diff = compute_diff("Camogie", after)
+        assert len(diff["our_new_results"]) == 1
+        assert diff["removed_fixtures"] == []
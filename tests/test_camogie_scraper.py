@@ -4,7 +4,11 @@ from corkcamogie.com.
 """
 
 import pytest
-from camogie_scraper import parse_fixture_cards, _parse_datetime, scrape_camogie_fixtures
+import camogie_scraper
+from camogie_scraper import (
+    LeagueCache, parse_fixture_cards, parse_standings, _parse_datetime,
+    scrape_camogie_fixtures,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -212,135 +216,230 @@ class TestParseFixtureCards:
         fixtures = parse_fixture_cards(SECOND_TEAM_FIXTURE, "Ballincollig")
         assert fixtures[0]["venue"] == "Douglas"
 
+    def test_no_club_returns_all_divisions(self):
+        html = FIXTURE_CARD + UNRELATED_FIXTURE + SECOND_TEAM_FIXTURE
+        assert len(parse_fixture_cards(html, None)) == 3
+        assert len(parse_fixture_cards(html, "")) == 3
+
+    def test_only_article_tag_starts_a_card(self):
+        """A non-article element with the card class must not split a card."""
+        html = FIXTURE_CARD.replace(
+            '<div class="foireann-card-footer">',
+            '<div class="foireann-card">x</div><div class="foireann-card-footer">')
+        fixtures = parse_fixture_cards(html, "Ballincollig")
+        assert len(fixtures) == 1
+        assert fixtures[0]["venue"] == "Ballincollig GAA"
+
+    def test_detail_label_after_icon(self):
+        html = FIXTURE_CARD.replace(
+            '<strong>Venue:</strong>', '<span class="icon"></span><strong>Venue:</strong>')
+        assert parse_fixture_cards(html, "Ballincollig")[0]["venue"] == "Ballincollig GAA"
+
+    def test_first_division_wins(self):
+        html = FIXTURE_CARD.replace(
+            "</div></article>",
+            '<div class="foireann-card-detail"><strong>Division:</strong> Other</div>'
+            "</div></article>")
+        assert parse_fixture_cards(html, "Ballincollig")[0]["competition"] == (
+            "Premier Intermediate League 2026 - League Division 1")
+
+
+class TestParseFixtureCardsWithScores:
+    def test_result_scores_included(self):
+        (result,) = parse_fixture_cards(RESULT_CARD, "Ballincollig", with_scores=True)
+        assert result["home_score"] == "7-15"
+        assert result["away_score"] == "0-3"
+
+    def test_fixture_has_no_score_keys(self):
+        (fixture,) = parse_fixture_cards(FIXTURE_CARD, "Ballincollig", with_scores=True)
+        assert "home_score" not in fixture
+
+    def test_scores_off_by_default(self):
+        (result,) = parse_fixture_cards(RESULT_CARD, "Ballincollig")
+        assert "home_score" not in result
+
+
+# ---------------------------------------------------------------------------
+# parse_standings
+# ---------------------------------------------------------------------------
+
+STANDINGS_TABLE = """<table class="foireann-standings-table"><thead><tr><th>Pos</th><th>Team</th><th>P</th><th>W</th><th>D</th><th>L</th><th>F</th><th>A</th><th>+/-</th><th>Pts</th></tr></thead><tbody><tr><td>1</td><td><span class="foireann-team-name">Ballincollig</span></td><td>2</td><td>2</td><td>0</td><td>0</td><td>7-30</td><td>1-12</td><td>+36</td><td>4</td></tr><tr><td>2</td><td>St Finbarr&#039;s</td><td>2</td><td>1</td><td>0</td><td>1</td><td>40</td><td>38</td><td>2</td><td>2</td></tr></tbody></table>"""
+
+
+class TestParseStandings:
+    def test_rows_mapped_by_header(self):
+        (table,) = parse_standings(STANDINGS_TABLE)
+        assert table[0] == {
+            "position": 1, "team": "Ballincollig", "played": 2, "won": 2,
+            "drawn": 0, "lost": 0, "pf": 51, "pa": 15, "pd": 36, "pts": 4,
+        }
+        assert table[1]["team"] == "St Finbarr's"
+        assert table[1]["pts"] == 2
+
+    def test_headerless_rows_parsed_positionally(self):
+        html = ('<table class="foireann-table"><tr><td>1</td><td>Douglas</td>'
+                '<td>3</td><td>3</td><td>0</td><td>0</td><td>60</td><td>20</td>'
+                '<td>40</td><td>6</td></tr></table>')
+        (table,) = parse_standings(html)
+        assert table[0]["team"] == "Douglas"
+        assert table[0]["pf"] == 60 and table[0]["pts"] == 6
+
+    def test_one_table_per_group(self):
+        assert len(parse_standings(STANDINGS_TABLE * 2)) == 2
+
+    def test_non_foireann_tables_ignored(self):
+        html = STANDINGS_TABLE.replace("foireann-standings-table", "wp-table")
+        assert parse_standings(html) == []
+
 
 # ---------------------------------------------------------------------------
 # scrape_camogie_fixtures (with mocked HTTP)
 # ---------------------------------------------------------------------------
 
-class TestScrapeCamogieFixtures:
-    """Integration-level tests using fake league config and mocked responses."""
+class FakeResponse:
+    def __init__(self, text, status_code=200, headers=None):
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
 
-    def test_returns_fixtures_with_team_mapping(self, monkeypatch):
-        """Fixtures should carry the pre-mapped ClubZap team name."""
-        fake_leagues = [
-            {
-                "url": "http://fake.test/league1/",
-                "team": "BCC 2026 Senior Squad",
-                "club_name": "Ballincollig",
-                "competition": "Test Camogie League",
-            },
-        ]
 
-        class FakeResponse:
-            status_code = 200
-            text = FIXTURE_CARD + AWAY_FIXTURE
+class FakeSession:
+    """Serves canned responses by URL and records the request headers.
 
-            def raise_for_status(self):
-                pass
+    A page value may be a response text, a FakeResponse, or an exception
+    to raise.
+    """
 
-        monkeypatch.setattr("camogie_scraper.requests.get", lambda *a, **kw: FakeResponse())
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
 
-        fixtures = scrape_camogie_fixtures(leagues=fake_leagues)
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, dict(headers or {})))
+        page = self.pages[url]
+        if isinstance(page, Exception):
+            raise page
+        return page if isinstance(page, FakeResponse) else FakeResponse(page)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LeagueCache(str(tmp_path / "camogie_cache.json"))
+
+
+def _league(url, team="BCC 2026 Senior Squad", club="Ballincollig", comp="Test League"):
+    return {"url": url, "team": team, "club_name": club, "competition": comp}
+
+
+class TestScrapeCamogieFixtures:
+    """Integration-level tests using fake league config and a fake session."""
+
+    def test_returns_fixtures_with_team_mapping(self, cache):
+        """Fixtures should carry the pre-mapped ClubZap team name."""
+        fake_leagues = [_league("http://fake.test/league1/", comp="Test Camogie League")]
+        session = FakeSession({"http://fake.test/league1/": FIXTURE_CARD + AWAY_FIXTURE})
+
+        fixtures = scrape_camogie_fixtures(leagues=fake_leagues, session=session,
+                                           cache=cache)
         assert len(fixtures) == 2
         for fx in fixtures:
             assert fx["team"] == "BCC 2026 Senior Squad"
             assert fx["competition"] == "Test Camogie League"
             assert "_has_score" not in fx  # internal key stripped
 
-    def test_deduplicates_fixture_and_result_cards(self, monkeypatch):
+    def test_deduplicates_fixture_and_result_cards(self, cache):
         """Same match appearing as fixture + result should appear only once."""
-        fake_leagues = [
-            {
-                "url": "http://fake.test/league1/",
-                "team": "BCC 2026 Senior Squad",
-                "club_name": "Ballincollig",
-                "competition": "Test League",
-            },
-        ]
-
-        class FakeResponse:
-            status_code = 200
-            text = FIXTURE_CARD + RESULT_CARD  # same match, two cards
-
-            def raise_for_status(self):
-                pass
-
-        monkeypatch.setattr("camogie_scraper.requests.get", lambda *a, **kw: FakeResponse())
-
-        fixtures = scrape_camogie_fixtures(leagues=fake_leagues)
+        session = FakeSession({"http://fake.test/league1/": FIXTURE_CARD + RESULT_CARD})
+        fixtures = scrape_camogie_fixtures(leagues=[_league("http://fake.test/league1/")],
+                                           session=session, cache=cache)
         assert len(fixtures) == 1
 
-    def test_multiple_leagues_merged(self, monkeypatch):
+    def test_multiple_leagues_merged(self, cache):
         fake_leagues = [
-            {
-                "url": "http://fake.test/league1/",
-                "team": "BCC 2026 Senior Squad",
-                "club_name": "Ballincollig",
-                "competition": "League 1",
-            },
-            {
-                "url": "http://fake.test/league2/",
-                "team": "BCC 2026 Junior Squad",
-                "club_name": "Ballincollig 2",
-                "competition": "League 2",
-            },
+            _league("http://fake.test/league1/", comp="League 1"),
+            _league("http://fake.test/league2/", team="BCC 2026 Junior Squad",
+                    club="Ballincollig 2", comp="League 2"),
         ]
+        session = FakeSession({
+            "http://fake.test/league1/": FIXTURE_CARD,
+            "http://fake.test/league2/": SECOND_TEAM_FIXTURE,
+        })
 
-        class FakeResp1:
-            status_code = 200
-            text = FIXTURE_CARD
-            def raise_for_status(self): pass
-
-        class FakeResp2:
-            status_code = 200
-            text = SECOND_TEAM_FIXTURE
-            def raise_for_status(self): pass
-
-        responses = iter([FakeResp1(), FakeResp2()])
-        monkeypatch.setattr("camogie_scraper.requests.get", lambda *a, **kw: next(responses))
-
-        fixtures = scrape_camogie_fixtures(leagues=fake_leagues)
+        fixtures = scrape_camogie_fixtures(leagues=fake_leagues, session=session,
+                                           cache=cache)
         assert len(fixtures) == 2
-        teams = {f["team"] for f in fixtures}
-        assert teams == {"BCC 2026 Senior Squad", "BCC 2026 Junior Squad"}
+        assert [f["team"] for f in fixtures] == [
+            "BCC 2026 Senior Squad", "BCC 2026 Junior Squad"]
 
-    def test_http_failure_skips_league(self, monkeypatch):
+    def test_http_failure_skips_league(self, cache):
         """If a league page fails to load, other leagues still work."""
         import requests as req
 
         fake_leagues = [
-            {
-                "url": "http://fake.test/broken/",
-                "team": "BCC 2026 Senior Squad",
-                "club_name": "Ballincollig",
-                "competition": "Broken League",
-            },
-            {
-                "url": "http://fake.test/working/",
-                "team": "BCC 2026 Minor",
-                "club_name": "Ballincollig",
-                "competition": "Working League",
-            },
+            _league("http://fake.test/broken/", comp="Broken League"),
+            _league("http://fake.test/working/", team="BCC 2026 Minor",
+                    comp="Working League"),
         ]
+        session = FakeSession({
+            "http://fake.test/broken/": req.ConnectionError("simulated failure"),
+            "http://fake.test/working/": FIXTURE_CARD,
+        })
 
-        call_count = [0]
-
-        def fake_get(*a, **kw):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise req.ConnectionError("simulated failure")
-
-            class OK:
-                status_code = 200
-                text = FIXTURE_CARD
-                def raise_for_status(self): pass
-            return OK()
-
-        monkeypatch.setattr("camogie_scraper.requests.get", fake_get)
-
-        fixtures = scrape_camogie_fixtures(leagues=fake_leagues)
+        fixtures = scrape_camogie_fixtures(leagues=fake_leagues, session=session,
+                                           cache=cache)
         assert len(fixtures) == 1
         assert fixtures[0]["team"] == "BCC 2026 Minor"
 
     def test_empty_leagues_returns_empty(self):
         assert scrape_camogie_fixtures(leagues=[]) == []
+
+
+class TestConditionalRequests:
+    URL = "http://fake.test/league1/"
+
+    def _scrape(self, session, cache):
+        return scrape_camogie_fixtures(leagues=[_league(self.URL)], session=session,
+                                       cache=cache)
+
+    def test_validators_sent_on_next_request(self, cache):
+        session = FakeSession({self.URL: FakeResponse(
+            FIXTURE_CARD, headers={"ETag": '"abc"',
+                                   "Last-Modified": "Mon, 30 Mar 2026 10:00:00 GMT"})})
+        self._scrape(session, cache)
+        self._scrape(session, cache)
+        first, second = session.requests
+        assert "If-None-Match" not in first[1]
+        assert second[1]["If-None-Match"] == '"abc"'
+        assert second[1]["If-Modified-Since"] == "Mon, 30 Mar 2026 10:00:00 GMT"
+
+    def test_304_reuses_cached_parse(self, cache, monkeypatch):
+        session = FakeSession({self.URL: FakeResponse(FIXTURE_CARD,
+                                                      headers={"ETag": '"abc"'})})
+        first = self._scrape(session, cache)
+        session.pages[self.URL] = FakeResponse("", status_code=304)
+        monkeypatch.setattr(camogie_scraper, "parse_fixture_cards",
+                            lambda *a: pytest.fail("should not re-parse"))
+        assert self._scrape(session, cache) == first
+
+    def test_identical_body_skips_parse(self, cache, monkeypatch):
+        session = FakeSession({self.URL: FIXTURE_CARD})
+        first = self._scrape(session, cache)
+        monkeypatch.setattr(camogie_scraper, "parse_fixture_cards",
+                            lambda *a: pytest.fail("should not re-parse"))
+        assert self._scrape(session, cache) == first
+
+    def test_changed_body_reparsed(self, cache):
+        session = FakeSession({self.URL: FIXTURE_CARD})
+        self._scrape(session, cache)
+        session.pages[self.URL] = FIXTURE_CARD + AWAY_FIXTURE
+        assert len(self._scrape(session, cache)) == 2
+
+    def test_cache_persisted(self, cache):
+        self._scrape(FakeSession({self.URL: FIXTURE_CARD}), cache)
+        reloaded = LeagueCache(cache.path)
+        assert reloaded.get(self.URL)["body_hash"]
+        assert len(reloaded.get(self.URL)["page"]["cards"]) == 1
@@ -0,0 +1,204 @@
+"""
+Unit tests for club_crawler.py — concurrent, resumable, incremental
+club profile crawls.
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+from club_crawler import ClubCrawler, CrawlState, page_fingerprint
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200, headers=None):
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeClient:
+    """Serves club pages by URL; tracks requests and peak concurrency."""
+
+    def __init__(self, pages, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=None):
+        with self._lock:
+            self.requests.append((url, dict(headers or {})))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        page = self.pages[url]
+        if isinstance(page, BaseException):
+            raise page
+        if isinstance(page, FakeResponse):
+            if page.headers.get("ETag") and headers and \
+                    headers.get("If-None-Match") == page.headers["ETag"]:
+                return FakeResponse("", status_code=304)
+            return page
+        return FakeResponse(page)
+
+
+class FakeScraper:
+    def __init__(self, client):
+        self.session = client
+        self.parsed = []
+
+    @staticmethod
+    def club_profile_url(club_id, competition_id=None, team_id=None):
+        return f"https://gaacork.ie/clubprofile/{club_id}/"
+
+    @staticmethod
+    def parse_html(content):
+        return BeautifulSoup(content, "html.parser")
+
+    def extract_club_info(self, soup, profile_url, competition_id=None, team_id=None):
+        self.parsed.append(profile_url)
+        return {"profile_url": profile_url, "club_name": soup.find("h1").get_text()}
+
+
+def _page(name, nonce="abc"):
+    return (f"<html><script>var nonce='{nonce}';</script>"
+            f"<h1>{name}</h1><p>Address</p></html>")
+
+
+def _url(club_id):
+    return f"https://gaacork.ie/clubprofile/{club_id}/"
+
+
+def _crawler(pages, tmp_path, workers=4, delay=0.0):
+    client = FakeClient({_url(k): v for k, v in pages.items()}, delay=delay)
+    scraper = FakeScraper(client)
+    state = CrawlState(str(tmp_path / "state.json"))
+    return ClubCrawler(scraper, state=state, workers=workers, log=lambda m: None)
+
+
+class TestPageFingerprint:
+    def test_ignores_scripts_and_whitespace(self):
+        assert page_fingerprint(_page("Ballincollig", "a")) == \
+            page_fingerprint(_page("Ballincollig", "b").replace("<p>", "\n  <p>"))
+
+    def test_content_change_detected(self):
+        assert page_fingerprint(_page("Ballincollig")) != page_fingerprint(_page("Douglas"))
+
+
+class TestCrawl:
+    def test_crawls_concurrently_within_worker_bound(self, tmp_path):
+        pages = {i: _page(f"Club {i}") for i in range(12)}
+        crawler = _crawler(pages, tmp_path, workers=3, delay=0.05)
+        report = crawler.crawl(list(pages))
+        assert report["parsed"] == 12
+        assert 1 < crawler.scraper.session.peak <= 3
+
+    def test_records_in_requested_order(self, tmp_path):
+        crawler = _crawler({i: _page(f"Club {i}") for i in range(5)}, tmp_path)
+        crawler.crawl([4, 2, 0])
+        assert [r["club_name"] for r in crawler.records([4, 2, 0])] == [
+            "Club 4", "Club 2", "Club 0"]
+
+    def test_failure_reported_not_raised(self, tmp_path):
+        crawler = _crawler({1: _page("One"), 2: requests.ConnectionError("reset")},
+                           tmp_path)
+        report = crawler.crawl([1, 2])
+        assert report["failed"] == [2]
+        assert report["parsed"] == 1
+
+    def test_parse_error_reported_not_raised(self, tmp_path):
+        crawler = _crawler({1: _page("One"), 2: "<html><p>No heading</p></html>"},
+                           tmp_path)
+        report = crawler.crawl([1, 2])
+        assert report["failed"] == [2]
+        assert crawler.state.failed == ["2"]
+
+    def test_throughput_reported(self, tmp_path):
+        report = _crawler({1: _page("One")}, tmp_path).crawl([1])
+        assert report["clubs_per_sec"] > 0
+        assert report["bytes"] > 0
+
+
+class TestIncremental:
+    def test_unchanged_fingerprint_not_reparsed(self, tmp_path):
+        crawler = _crawler({1: _page("One", "n1"), 2: _page("Two")}, tmp_path)
+        crawler.crawl([1, 2])
+        crawler.scraper.session.pages[_url(1)] = _page("One", "n2")  # new nonce only
+        crawler.scraper.session.pages[_url(2)] = _page("Two (renamed)")
+        crawler.scraper.parsed.clear()
+
+        report = crawler.crawl([1, 2])
+        assert report["unchanged"] == 1 and report["parsed"] == 1
+        assert crawler.scraper.parsed == [_url(2)]
+        assert crawler.records([1])[0]["club_name"] == "One"
+
+    def test_validators_sent_and_304_reuses_record(self, tmp_path):
+        page = FakeResponse(_page("One"), headers={"ETag": '"v1"'})
+        crawler = _crawler({1: page}, tmp_path)
+        crawler.crawl([1])
+        report = crawler.crawl([1])
+        assert crawler.scraper.session.requests[1][1] == {"If-None-Match": '"v1"'}
+        assert report["not_modified"] == 1
+        assert crawler.records([1])[0]["club_name"] == "One"
+
+    def test_full_crawl_reparses_everything(self, tmp_path):
+        crawler = _crawler({1: _page("One")}, tmp_path)
+        crawler.crawl([1])
+        report = crawler.crawl([1], full=True)
+        assert report["parsed"] == 1
+        assert crawler.scraper.session.requests[1][1] == {}
+
+
+class TestResume:
+    def test_failed_clubs_retried_next_crawl(self, tmp_path):
+        pages = {1: _page("One"), 2: requests.ConnectionError("reset"), 3: _page("Three")}
+        crawler = _crawler(pages, tmp_path)
+        crawler.crawl([1, 2, 3])
+        state = CrawlState(str(tmp_path / "state.json"))
+        assert not state.interrupted
+        assert state.failed == ["2"]
+
+        crawler.scraper.session.pages[_url(2)] = _page("Two")
+        crawler.scraper.session.requests.clear()
+        report = crawler.crawl([1, 2, 3])
+        assert report["skipped"] == 2
+        assert [url for url, _ in crawler.scraper.session.requests] == [_url(2)]
+        assert crawler.state.failed == []
+
+    def test_interrupted_crawl_saved_and_resumed(self, tmp_path):
+        pages = {1: _page("One"), 2: KeyboardInterrupt(), 3: _page("Three")}
+        crawler = _crawler(pages, tmp_path, workers=1)
+        with pytest.raises(KeyboardInterrupt):
+            crawler.crawl([1, 2, 3])
+        assert CrawlState(str(tmp_path / "state.json")).interrupted
+
+        crawler.scraper.session.pages[_url(2)] = _page("Two")
+        crawler.scraper.session.requests.clear()
+        report = crawler.crawl([1, 2, 3])
+        assert report["skipped"] == 1
+        assert not crawler.state.interrupted
+
+    def test_no_resume_starts_over(self, tmp_path):
+        crawler = _crawler({1: _page("One"), 2: requests.ConnectionError("x")}, tmp_path)
+        crawler.crawl([1, 2])
+        report = crawler.crawl([1, 2], resume=False)
+        assert report["skipped"] == 0
+
+    def test_state_persisted(self, tmp_path):
+        _crawler({1: _page("One")}, tmp_path).crawl([1])
+        state = CrawlState(str(tmp_path / "state.json"))
+        assert state.get(1)["data"]["club_name"] == "One"
+        assert state.get(1)["fingerprint"] == page_fingerprint(_page("One"))
@@ -0,0 +1,777 @@
+"""
+Unit tests for clubzap_automate.py and clubzap_fixture_map.py — reading
+the ClubZap fixtures list into the saved fixture-ID map — against a fake
+logged-in browser context.  The in-page script isn't run: the fake pages
+answer evaluate() with the rows it would return.
+"""
+
+import asyncio
+import csv
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from clubzap_automate import ClubZapAutomation, _is_form_post, fixture_from_cells
+from clubzap_fixture_map import FixtureIdMap, page_fingerprint
+from config import (
+    CLUBZAP_BASE_URL as BASE_URL, CLUBZAP_FIXTURES_URL as FIXTURES_URL,
+    CLUBZAP_WAIT_TIMEOUTS,
+)
+
+NOW = datetime(2026, 4, 1, 9, 0)
+
+
+def _row(fixture_id, date="04/04/2026", team="Senior Football", opponent="Nemo Rangers"):
+    return [str(fixture_id), date, "19:30", "League", "Premier SFC", team, opponent,
+            "Ballincollig"]
+
+
+def _page_url(n):
+    return FIXTURES_URL if n == 1 else f"{FIXTURES_URL}?page={n}"
+
+
+def _dashboard(pages, last_page=None):
+    """{url: table} for *pages* lists of rows; the pager links up to *last_page*."""
+    last_page = last_page or len(pages)
+    return {_page_url(n): {"rows": rows, "last_page": last_page}
+            for n, rows in enumerate(pages, 1)}
+
+
+class FakeTab:
+    def __init__(self, context):
+        self.context = context
+        self.url = None
+        self.closed = False
+        self.rendered = False
+
+    def set_default_timeout(self, ms):
+        self.timeout = ms
+
+    async def goto(self, url, wait_until=None):
+        context = self.context
+        context.active += 1
+        context.peak = max(context.peak, context.active)
+        context.visits.append(url)
+        try:
+            await asyncio.sleep(0.01)
+            self.url = url
+            self.rendered = False
+        finally:
+            context.active -= 1
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        """The rows "render" once waited for; a page without any times out."""
+        if not self.context.site.get(self.url, {}).get("rows"):
+            raise PlaywrightTimeout(f"waiting for {selector}")
+        self.rendered = True
+
+    async def evaluate(self, script):
+        if not self.rendered:
+            return {"rows": [], "last_page": 1}
+        return self.context.site[self.url]
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, site):
+        self.site = site
+        self.tabs = []
+        self.visits = []
+        self.active = self.peak = 0
+
+    async def new_page(self):
+        tab = FakeTab(self)
+        self.tabs.append(tab)
+        return tab
+
+
+@pytest.fixture
+def map_path(tmp_path):
+    return str(tmp_path / "clubzap_fixture_map.json")
+
+
+def _automation(site, id_map):
+    automation = ClubZapAutomation("club@example.com", "secret", engine=None,
+                                   id_map=id_map)
+    automation.context = FakeContext(site)
+    automation.page = asyncio.run(automation._new_tab())
+    return automation
+
+
+class TestFixtureMap:
+    def test_entry_from_cells(self):
+        entry = fixture_from_cells(_row(7)[1:])
+        assert entry == {"date": "04/04/2026", "time": "19:30",
+                         "competition": "Premier SFC", "team": "Senior Football",
+                         "opponent": "Nemo Rangers", "venue": "Ballincollig"}
+
+    def test_all_pages_mapped_in_page_order(self, map_path):
+        site = _dashboard([[_row(i) for i in range(p * 10, p * 10 + 10)]
+                           for p in range(6)])
+        automation = _automation(site, FixtureIdMap(map_path))
+        asyncio.run(automation.build_fixture_map())
+        assert list(automation.fixture_map) == [str(i) for i in range(60)]
+        assert sorted(automation.page.context.visits) == sorted(site)
+
+    def test_remaining_pages_read_in_parallel_tabs(self, monkeypatch, map_path):
+        monkeypatch.setattr("clubzap_automate.CLUBZAP_PAGE_TABS", 3)
+        site = _dashboard([[_row(p)] for p in range(8)])
+        automation = _automation(site, FixtureIdMap(map_path))
+        asyncio.run(automation.build_fixture_map())
+        context = automation.page.context
+        assert context.visits[0] == FIXTURES_URL
+        assert context.peak == 3
+        # the extra tabs are closed; the automation's own page stays open
+        assert [tab.closed for tab in context.tabs] == [False, True, True]
+
+    def test_windowed_pager_followed(self, map_path):
+        site = _dashboard([[_row(p)] for p in range(5)], last_page=3)
+        site[_page_url(3)]["last_page"] = 5
+        automation = _automation(site, FixtureIdMap(map_path))
+        asyncio.run(automation.build_fixture_map())
+        assert len(automation.fixture_map) == 5
+
+    def test_empty_list(self, map_path):
+        automation = _automation({}, FixtureIdMap(map_path))
+        asyncio.run(automation.build_fixture_map())
+        assert automation.fixture_map == {}
+        assert automation.page.context.visits == [FIXTURES_URL]
+
+    def test_full_read_drops_fixtures_no_longer_listed(self, map_path):
+        automation = _automation(_dashboard([[_row(1), _row(2)]]), FixtureIdMap(map_path))
+        automation.fixture_map["99"] = fixture_from_cells(_row(99)[1:])
+        asyncio.run(automation.build_fixture_map())
+        assert set(automation.fixture_map) == {"1", "2"}
+        assert automation.id_map.reconciled_at
+
+
+def _saved_map(path, pages, reconciled=NOW):
+    """A FixtureIdMap saved at *path* holding *pages* (lists of rows)."""
+    id_map = FixtureIdMap(path)
+    id_map.reconcile({n: {row[0]: fixture_from_cells(row[1:]) for row in rows}
+                      for n, rows in enumerate(pages, 1)}, now=reconciled)
+    id_map.save()
+    return FixtureIdMap(path)
+
+
+# Newest first, as the dashboard lists them: page 1 upcoming, page 4 oldest
+SEASON = [[_row(p * 10 + i, date=f"{28 - p * 7 - i:02d}/04/2026") for i in range(3)]
+          for p in range(4)]
+
+
+class TestRefresh:
+    def _refresh(self, site, id_map, since=datetime(2026, 4, 10)):
+        automation = _automation(site, id_map)
+        asyncio.run(automation.refresh_fixture_map(since))
+        return automation
+
+    def test_stops_at_unchanged_page(self, map_path):
+        id_map = _saved_map(map_path, SEASON)
+        pages = [list(rows) for rows in SEASON]
+        pages[0].insert(0, _row(500, date="30/04/2026"))
+        automation = self._refresh(_dashboard(pages), id_map, since=datetime(2026, 1, 1))
+        # page 1 changed, page 2 matches the saved fingerprint
+        assert automation.page.context.visits == [_page_url(1), _page_url(2)]
+        assert "500" in automation.fixture_map
+
+    def test_stops_below_date_window(self, map_path):
+        id_map = _saved_map(map_path, SEASON)
+        pages = [[_row(r[0] + "0", date=r[1]) for r in rows] for rows in SEASON]
+        automation = self._refresh(_dashboard(pages), id_map,
+                                   since=datetime(2026, 4, 20))
+        # page 2 (21/04 - 19/04) still reaches the window; page 3 is all before it
+        assert automation.page.context.visits == [_page_url(n) for n in (1, 2, 3)]
+        assert "00" in automation.fixture_map and "300" not in automation.fixture_map
+
+    def test_fixtures_no_longer_on_read_pages_dropped(self, map_path):
+        id_map = _saved_map(map_path, SEASON)
+        pages = [list(rows) for rows in SEASON]
+        del pages[0][1]
+        pages[0].insert(0, _row(500, date="30/04/2026"))
+        automation = self._refresh(_dashboard(pages), id_map, since=datetime(2026, 1, 1))
+        assert automation.page.context.visits == [_page_url(1), _page_url(2)]
+        assert "1" not in automation.fixture_map
+        assert {"0", "2", "10", "30"} <= set(automation.fixture_map)
+
+    def test_uploaded_marks_kept_across_refresh(self, map_path):
+        id_map = _saved_map(map_path, SEASON)
+        id_map.mark_uploaded("0", now=NOW)
+        pages = [list(rows) for rows in SEASON]
+        pages[0][1] = _row(1, date="27/04/2026", opponent="Douglas")
+        automation = self._refresh(_dashboard(pages), id_map)
+        assert automation.fixture_map["0"]["uploaded_at"] == NOW.isoformat()
+        assert automation.fixture_map["1"]["opponent"] == "Douglas"
+
+
+class TestUpdateFixtureMap:
+    def _update(self, site, id_map, wanted, **kwargs):
+        automation = _automation(site, id_map)
+        asyncio.run(automation.update_fixture_map(wanted, **kwargs))
+        return automation
+
+    def _wanted(self, row):
+        return {"Date": row[1], "Team": row[5], "Opponent": row[6]}
+
+    def test_no_saved_map_reads_everything(self, map_path):
+        automation = self._update(_dashboard(SEASON), FixtureIdMap(map_path), [])
+        assert len(automation.page.context.visits) == 4
+        assert len(automation.fixture_map) == 12
+
+    def test_fresh_map_only_refreshed(self, map_path):
+        id_map = _saved_map(map_path, SEASON, reconciled=datetime.now())
+        automation = self._update(_dashboard(SEASON), id_map,
+                                  [self._wanted(SEASON[1][0])])
+        assert automation.page.context.visits == [_page_url(1)]
+
+    def test_stale_map_reconciled(self, map_path):
+        id_map = _saved_map(map_path, SEASON,
+                            reconciled=datetime.now() - timedelta(days=30))
+        automation = self._update(_dashboard(SEASON), id_map, [])
+        assert len(automation.page.context.visits) == 4
+
+    def test_missing_fixture_triggers_full_read(self, map_path):
+        pages = [list(rows) for rows in SEASON]
+        id_map = _saved_map(map_path, pages, reconciled=datetime.now())
+        # listed on ClubZap after the last sync, on an unchanged-looking page
+        moved = _row(777, date="10/04/2026", opponent="Douglas")
+        pages[3].append(moved)
+        automation = self._update(_dashboard(pages), id_map, [self._wanted(moved)])
+        assert automation.find_fixture_id("10/04/2026", "Senior Football", "Douglas") == "777"
+
+    def test_upload_below_unchanged_page_triggers_full_read(self, map_path):
+        pages = [list(rows) for rows in SEASON]
+        id_map = _saved_map(map_path, pages, reconciled=datetime.now())
+        uploaded = _row(778, date="12/04/2026", opponent="Douglas")
+        pages[2].append(uploaded)
+        automation = self._update(_dashboard(pages), id_map, [],
+                                  uploaded=[self._wanted(uploaded)])
+        assert automation.find_fixture_id("12/04/2026", "Senior Football", "Douglas") == "778"
+
+    def test_reconcile_on_demand(self, map_path):
+        id_map = _saved_map(map_path, SEASON, reconciled=datetime.now())
+        automation = self._update(_dashboard(SEASON), id_map, [], reconcile=True)
+        assert len(automation.page.context.visits) == 4
+
+
+class TestFixtureIdMap:
+    def test_round_trip(self, map_path):
+        id_map = _saved_map(map_path, SEASON)
+        assert len(id_map.fixtures) == 12
+        assert id_map.fixtures["0"]["last_seen"] == NOW.isoformat()
+        assert id_map.pages["1"] == page_fingerprint(
+            {row[0]: fixture_from_cells(row[1:]) for row in SEASON[0]})
+        assert not id_map.needs_reconcile(now=NOW + timedelta(days=1))
+        assert id_map.needs_reconcile(now=NOW + timedelta(days=8))
+
+    def test_unreadable_file_ignored(self, map_path):
+        with open(map_path, "w") as f:
+            f.write("{not json")
+        id_map = FixtureIdMap(map_path)
+        assert id_map.fixtures == {} and id_map.needs_reconcile()
+
+    def test_remove_forgets_page_fingerprints(self, map_path):
+        id_map = _saved_map(map_path, SEASON)
+        id_map.remove("0")
+        assert "0" not in id_map.fixtures
+        assert id_map.pages == {}
+
+    def test_match_prefers_most_recently_seen(self, map_path):
+        id_map = _saved_map(map_path, SEASON)
+        id_map.record_page(5, {"99": fixture_from_cells(SEASON[0][0][1:])},
+                           now=NOW + timedelta(days=1))
+        assert id_map.match("28/04/2026", "Senior Football", "Nemo Rangers") == (
+            ["99", "0"], True)
+
+    def test_reconcile_keeps_upload_marks(self, map_path):
+        id_map = _saved_map(map_path, SEASON)
+        id_map.mark_uploaded("10", now=NOW)
+        pages = {1: {"10": fixture_from_cells(SEASON[1][0][1:])}}
+        assert id_map.reconcile(pages, now=NOW) == 11
+        assert id_map.fixtures["10"]["uploaded_at"] == NOW.isoformat()
+
+
+class TestFindFixtureId:
+    def _automation(self, map_path, rows):
+        id_map = _saved_map(map_path, [rows])
+        return ClubZapAutomation("club@example.com", "secret", engine=None, id_map=id_map)
+
+    def test_names_normalised(self, map_path):
+        automation = self._automation(map_path, [
+            _row(1, date="04/04/2026", team="Senior Football", opponent="St. Finbarr's GAA"),
+        ])
+        assert automation.find_fixture_id("4/4/2026", " senior  football",
+                                          "St Finbarrs") == "1"
+        assert automation.find_fixture_id("04/04/2026", "Snr Football",
+                                          "st finbarr’s") == "1"
+
+    def test_fuzzy_match_on_date_and_opponent(self, map_path):
+        automation = self._automation(map_path, [_row(1, team="Senior Football")])
+        assert automation.find_fixture_id("04/04/2026", "Junior A Football",
+                                          "Nemo Rangers") == "1"
+
+    def test_ambiguous_fuzzy_match_reported(self, map_path):
+        automation = self._automation(map_path, [
+            _row(1, team="Senior Football"), _row(2, team="Junior A Football")])
+        assert automation.find_fixture_id("04/04/2026", "Minor Football GAA",
+                                          "Nemo Rangers") is None
+        assert automation.ambiguous == [("04/04/2026", "Minor Football GAA",
+                                         "Nemo Rangers", ["1", "2"])]
+        # the exact team still resolves
+        assert automation.find_fixture_id("04/04/2026", "Junior A Football",
+                                          "Nemo Rangers") == "2"
+
+    def test_index_follows_refresh_and_delete(self, map_path):
+        automation = self._automation(map_path, [_row(1)])
+        assert automation.find_fixture_id("04/04/2026", "Senior Football", "Nemo Rangers") == "1"
+        moved = fixture_from_cells(_row(1, opponent="Douglas")[1:])
+        automation.id_map.record_page(1, {"1": moved})
+        assert automation.find_fixture_id("04/04/2026", "Senior Football", "Nemo Rangers") is None
+        assert automation.find_fixture_id("04/04/2026", "Senior Football", "Douglas") == "1"
+        automation.id_map.remove("1")
+        assert automation.find_fixture_id("04/04/2026", "Senior Football", "Douglas") is None
+
+
+# ── Form submissions ────────────────────────────────────────────────────
+
+SUBMIT = 'input[type="submit"], button[type="submit"]'
+SAVE = 'input[type="submit"], button[type="submit"], input[name="commit"]'
+VENUE = '#fixture_event_attributes_venue, input[name*="[venue]"]'
+DELETE = 'a:has-text("Delete"), input[value="Delete"]'
+SIGNIN = f"{BASE_URL}/signin"
+
+
+class FakeRequest:
+    def __init__(self, method, navigation=True):
+        self.method = method
+        self.navigation = navigation
+
+    def is_navigation_request(self):
+        return self.navigation
+
+
+class FakeResponse:
+    def __init__(self, method, status, navigation=True):
+        self.request = FakeRequest(method, navigation)
+        self.status = status
+
+
+class FakeElement:
+    def __init__(self, tab, value=""):
+        self.tab = tab
+        self.value = value
+
+    async def get_attribute(self, name):
+        return self.value if name == "value" else None
+
+    async def fill(self, value):
+        self.value = value
+
+    async def set_input_files(self, path):
+        self.value = path
+
+    async def inner_text(self):
+        return self.value
+
+    async def click(self):
+        await self.tab.submit()
+
+
+class ResponseInfo:
+    def __init__(self, future, timeout):
+        self.future = future
+        self.timeout = timeout
+
+    @property
+    async def value(self):
+        try:
+            return await asyncio.wait_for(self.future, self.timeout / 1000)
+        except asyncio.TimeoutError:
+            raise PlaywrightTimeout("waiting for response")
+
+
+class FormTab:
+    """A tab on a fake dashboard.
+
+    *site* maps URL -> {"elements": {selector: value},
+                        "post": (status, URL the browser ends up on)}.
+    A page without "post" sends nothing when its form is submitted, one
+    with "fail": n fails to load n times, and one with "status" loads
+    with that HTTP status.  A fixtures-list page's "table" is what
+    evaluate() returns.  A page with "load_delay" takes that many seconds
+    to land on its "post" URL after submitting, reading the page meanwhile
+    failing as Playwright does mid-navigation.  Selectors are matched as
+    literal strings; a missing one times out at once.
+    """
+
+    def __init__(self, site, context=None):
+        self.site = site
+        self.context = context
+        self.url = None
+        self.elements = {}
+        self.posted = []
+        self.closed = False
+        self.loading = False
+        self._waiting = None
+        self._navigation = None
+
+    def set_default_timeout(self, ms):
+        self.timeout = ms
+
+    def once(self, event, handler):
+        self.dialog_handler = handler
+
+    async def close(self):
+        self.closed = True
+
+    async def goto(self, url, wait_until=None):
+        context = self.context
+        if context:
+            context.active += 1
+            context.peak = max(context.peak, context.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            if context:
+                context.active -= 1
+        if self.site[url].get("fail"):
+            self.site[url]["fail"] -= 1
+            raise RuntimeError("net::ERR_CONNECTION_RESET")
+        self.url = url
+        self.elements = {selector: FakeElement(self, value)
+                         for selector, value in self.site[url].get("elements", {}).items()}
+        return FakeResponse("GET", self.site[url].get("status", 200))
+
+    async def evaluate(self, script):
+        return self.site[self.url].get("table", {"rows": [], "last_page": 1})
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        if selector not in self.elements:
+            raise PlaywrightTimeout(f"waiting for {selector}")
+        return self.elements[selector]
+
+    async def query_selector(self, selector):
+        return self.elements.get(selector)
+
+    async def query_selector_all(self, selector):
+        if self.loading:
+            raise RuntimeError("Execution context was destroyed, most likely "
+                               "because of a navigation")
+        if selector == "table tbody tr":
+            table = self.site[self.url].get("table", {"rows": []})
+            return [FakeElement(self, row[0]) for row in table["rows"]]
+        return [self.elements[selector]] if selector in self.elements else []
+
+    async def fill(self, selector, value):
+        await self.elements[selector].fill(value)
+
+    async def click(self, selector):
+        await self.elements[selector].click()
+
+    async def content(self):
+        return ""
+
+    @asynccontextmanager
+    async def expect_response(self, predicate, timeout=None):
+        future = asyncio.get_running_loop().create_future()
+        self._waiting = (predicate, future)
+        yield ResponseInfo(future, timeout)
+
+    async def submit(self):
+        if "post" not in self.site[self.url]:
+            return
+        status, landed = self.site[self.url]["post"]
+        self.posted.append(self.url)
+        if self.context:
+            self.context.posted.append(self.url)
+        response = FakeResponse("POST", status)
+        predicate, future = self._waiting
+        if predicate(response):
+            future.set_result(response)
+        delay = self.site[self.url].get("load_delay")
+        if delay:
+            self.loading = True
+            asyncio.ensure_future(self._land(landed, delay))
+        else:
+            self.url = landed
+            self._navigated()
+
+    async def _land(self, url, delay):
+        await asyncio.sleep(delay)
+        self.url = url
+        self.elements = {selector: FakeElement(self, value)
+                         for selector, value in self.site[url].get("elements", {}).items()}
+        self.loading = False
+        self._navigated()
+
+    def _navigated(self):
+        if self._navigation is not None:
+            self._navigation.set()
+
+    @asynccontextmanager
+    async def expect_navigation(self, wait_until=None, timeout=None):
+        self._navigation = asyncio.Event()
+        yield
+        try:
+            await asyncio.wait_for(self._navigation.wait(), timeout / 1000)
+        except asyncio.TimeoutError:
+            raise PlaywrightTimeout("waiting for navigation")
+        finally:
+            self._navigation = None
+
+    async def wait_for_url(self, predicate, wait_until=None, timeout=None):
+        if not predicate(self.url):
+            raise PlaywrightTimeout("waiting for URL")
+
+    async def wait_for_load_state(self, state=None):
+        pass
+
+
+LOGIN_FORM = {"elements": {'input[type="email"], input[name*="email"]': "",
+                           'input[type="password"]': "", SUBMIT: "Sign in"}}
+
+
+def _form_automation(site, tmp_path):
+    automation = ClubZapAutomation("club@example.com", "secret", engine=None,
+                                   id_map=FixtureIdMap(str(tmp_path / "map.json")))
+    automation.page = FormTab(site)
+    return automation
+
+
+class TestWaits:
+    def test_only_the_form_navigation_is_its_response(self):
+        assert _is_form_post(FakeResponse("POST", 302))
+        assert not _is_form_post(FakeResponse("POST", 204, navigation=False))
+        assert not _is_form_post(FakeResponse("GET", 200))
+
+    def test_login_waits_for_redirect(self, tmp_path):
+        automation = _form_automation(
+            {SIGNIN: dict(LOGIN_FORM, post=(302, f"{BASE_URL}/dashboard"))}, tmp_path)
+        started = time.monotonic()
+        asyncio.run(automation.login())
+        assert time.monotonic() - started < 1
+        assert automation.page.elements['input[type="password"]'].value == "secret"
+        assert list(automation.waits) == ["login form", "sign in"]
+
+    def test_rejected_login_fails_without_waiting_out_the_timeout(self, tmp_path):
+        automation = _form_automation({SIGNIN: dict(LOGIN_FORM, post=(200, SIGNIN))},
+                                      tmp_path)
+        started = time.monotonic()
+        with pytest.raises(Exception, match="Login failed"):
+            asyncio.run(automation.login())
+        assert time.monotonic() - started < 1
+
+    def test_edit_saved_on_redirect(self, tmp_path):
+        edit_url = f"{BASE_URL}/fixtures/42/edit"
+        automation = _form_automation({edit_url: {
+            "elements": {SAVE: "Save", VENUE: "Ballincollig"},
+            "post": (302, f"{BASE_URL}/fixtures/42")}}, tmp_path)
+        saved, had_failures = asyncio.run(
+            automation.edit_fixture("42", {"Venue": "Pairc Ui Rinn"}))
+        assert (saved, had_failures) == (True, False)
+        assert automation.page.posted == [edit_url]
+        assert automation.page.elements[VENUE].value == "Pairc Ui Rinn"
+
+    def test_delete_waits_for_redirect_off_the_fixture(self, tmp_path):
+        view_url = f"{BASE_URL}/fixtures/42"
+        automation = _form_automation({view_url: {
+            "elements": {DELETE: "Delete"}, "post": (302, FIXTURES_URL)}}, tmp_path)
+        assert asyncio.run(automation.delete_fixture_by_id("42"))
+        assert len(automation.waits["delete"]) == 1
+
+    def test_missing_delete_button(self, tmp_path):
+        automation = _form_automation({f"{BASE_URL}/fixtures/42": {}}, tmp_path)
+        assert not asyncio.run(automation.delete_fixture_by_id("42"))
+
+    def test_no_response_times_out_per_step(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(CLUBZAP_WAIT_TIMEOUTS, "delete", 0.2)
+        view_url = f"{BASE_URL}/fixtures/42"
+        automation = _form_automation({view_url: {"elements": {DELETE: "Delete"}}},
+                                      tmp_path)
+        assert not asyncio.run(automation.delete_fixture_by_id("42"))
+        assert 0.2 <= automation.waits["delete"][0] < 1
+        assert automation.wait_summary()[-1].startswith("delete: 1x")
+
+
+class TestUpload:
+    FILE = 'input[type="file"]'
+    UPLOAD = ('input[type="submit"][value*="Upload"], input[type="submit"][value*="Import"], '
+              'input[type="submit"], button[type="submit"]')
+    FLASH = '.alert, .error, .flash, .notice'
+    IMPORTED = f"{FIXTURES_URL}?imported=1"
+
+    def test_page_read_after_the_redirect_lands(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("clubzap_automate.NEW_CSV", _diff_csv(
+            tmp_path / "new.csv", [_fixture_row(2), _fixture_row(3)]))
+        automation = _form_automation({
+            FIXTURES_URL: {"elements": {self.FILE: "", self.UPLOAD: "Upload"},
+                           "table": {"rows": [_row(1)], "last_page": 1},
+                           "post": (302, self.IMPORTED), "load_delay": 0.2},
+            self.IMPORTED: {"elements": {self.FLASH: "2 fixtures imported"},
+                            "table": {"rows": [_row(1), _row(2), _row(3)],
+                                      "last_page": 1}},
+        }, tmp_path)
+        assert asyncio.run(automation.upload_new_fixtures()) == 2
+        assert automation.page.url == self.IMPORTED
+
+
+class FormContext:
+    def __init__(self, site):
+        self.site = site
+        self.tabs = []
+        self.posted = []
+        self.active = self.peak = 0
+
+    async def new_page(self):
+        tab = FormTab(self.site, self)
+        self.tabs.append(tab)
+        return tab
+
+    async def close(self):
+        self.closed = True
+
+
+class FormEngine:
+    """Hands out one FormContext, as PageEngine.new_context would."""
+
+    def __init__(self, site):
+        self.context = FormContext(site)
+
+    async def new_context(self):
+        return self.context
+
+
+def _diff_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["Date", "Team", "Opponent", "Changes"])
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+    return str(path)
+
+
+def _pool_automation(tmp_path, site, fixture_ids):
+    id_map = _saved_map(str(tmp_path / "map.json"),
+                        [[_row(i, opponent=f"Opponent {i}") for i in fixture_ids]])
+    automation = ClubZapAutomation("club@example.com", "secret", engine=None,
+                                   id_map=id_map)
+    automation.context = FormContext(site)
+    automation.page = asyncio.run(automation._new_tab())
+    return automation
+
+
+def _fixture_row(i, **extra):
+    return dict({"Date": "04/04/2026", "Team": "Senior Football",
+                 "Opponent": f"Opponent {i}"}, **extra)
+
+
+class TestWorkers:
+    def test_deletes_share_a_bounded_pool_of_tabs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("clubzap_automate.CLUBZAP_WORKERS", 2)
+        monkeypatch.setattr("clubzap_automate.REMOVED_CSV",
+                            _diff_csv(tmp_path / "removed.csv",
+                                      [_fixture_row(i) for i in range(5)]))
+        site = {f"{BASE_URL}/fixtures/{i}": {"elements": {DELETE: "Delete"},
+                                            "post": (302, FIXTURES_URL)}
+                for i in range(5)}
+        automation = _pool_automation(tmp_path, site, range(5))
+        assert asyncio.run(automation.delete_removed_fixtures()) == 5
+        context = automation.context
+        assert context.peak == 2
+        assert [tab.closed for tab in context.tabs] == [False, True]
+        assert automation.fixture_map == {}
+        assert automation.result_report() == ["delete done: 5"]
+
+    def test_failed_edit_retried_and_reported(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("clubzap_automate.CHANGED_CSV", _diff_csv(
+            tmp_path / "changed.csv",
+            [_fixture_row(i, Changes="Venue: 'Ballincollig' -> 'Pairc Ui Rinn'")
+             for i in range(4)]))
+        site = {f"{BASE_URL}/fixtures/{i}/edit": {
+            "elements": {SAVE: "Save", VENUE: "Ballincollig"},
+            "post": (302, f"{BASE_URL}/fixtures/{i}")} for i in range(3)}
+        site[f"{BASE_URL}/fixtures/1/edit"]["fail"] = 1  # flaky: works on retry
+        site[f"{BASE_URL}/fixtures/2/edit"]["fail"] = 10  # down for good
+        automation = _pool_automation(tmp_path, site, range(3))
+        assert asyncio.run(automation.edit_changed_fixtures()) == 2
+        assert sorted(automation.context.posted) == [f"{BASE_URL}/fixtures/{i}/edit"
+                                                     for i in (0, 1)]
+        assert automation.result_report() == [
+            "edit done: 2", "edit failed: 1", "edit not found: 1",
+            "FAILED: edit 04/04/2026 Senior Football vs Opponent 2, ID 2, 3 attempts",
+            "NOT FOUND: edit 04/04/2026 Senior Football vs Opponent 3",
+        ]
+
+
+    def test_stale_id_looked_up_again_after_full_read(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("clubzap_automate.REMOVED_CSV",
+                            _diff_csv(tmp_path / "removed.csv", [_fixture_row(0)]))
+        # fixture 0 was deleted and re-imported as 7
+        site = {f"{BASE_URL}/fixtures/0": {"status": 404},
+                f"{BASE_URL}/fixtures/7": {"elements": {DELETE: "Delete"},
+                                           "post": (302, FIXTURES_URL)},
+                FIXTURES_URL: {"elements": {"table tbody tr": ""},
+                               "table": {"rows": [_row(7, opponent="Opponent 0")],
+                                         "last_page": 1}}}
+        automation = _pool_automation(tmp_path, site, range(1))
+        assert asyncio.run(automation.delete_removed_fixtures()) == 1
+        assert automation.context.posted == [f"{BASE_URL}/fixtures/7"]
+        assert automation.report[0]["id"] == "7"
+        assert automation.fixture_map == {}
+
+    def test_fixture_gone_for_good_not_found(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("clubzap_automate.REMOVED_CSV",
+                            _diff_csv(tmp_path / "removed.csv", [_fixture_row(0)]))
+        site = {f"{BASE_URL}/fixtures/0": {"status": 404}, FIXTURES_URL: {}}
+        automation = _pool_automation(tmp_path, site, range(1))
+        assert asyncio.run(automation.delete_removed_fixtures()) == 0
+        assert automation.result_report() == [
+            "delete not found: 1",
+            "NOT FOUND: delete 04/04/2026 Senior Football vs Opponent 0"]
+
+
+class TestSyncBaseline:
+    def _sync(self, tmp_path, monkeypatch, edit_site):
+        monkeypatch.setattr("clubzap_automate.NEW_CSV", str(tmp_path / "new.csv"))
+        monkeypatch.setattr("clubzap_automate.REMOVED_CSV", str(tmp_path / "removed.csv"))
+        monkeypatch.setattr("clubzap_automate.CHANGED_CSV", _diff_csv(
+            tmp_path / "changed.csv",
+            [_fixture_row(i, Changes="Venue: 'Ballincollig' -> 'Pairc Ui Rinn'")
+             for i in range(2)]))
+        marked = []
+        monkeypatch.setattr("clubzap_sync.mark_uploaded", lambda: marked.append(True))
+        site = dict(edit_site)
+        site[SIGNIN] = dict(LOGIN_FORM, post=(302, f"{BASE_URL}/dashboard"))
+        id_map = _saved_map(str(tmp_path / "map.json"),
+                            [[_row(i, opponent=f"Opponent {i}") for i in range(2)]])
+        automation = ClubZapAutomation("club@example.com", "secret", FormEngine(site),
+                                       id_map=id_map)
+
+        async def mapped(*args, **kwargs):
+            pass
+
+        automation.update_fixture_map = mapped
+        results = asyncio.run(automation.sync(['edit']))
+        return results, marked
+
+    def _edit_site(self, failing=()):
+        site = {f"{BASE_URL}/fixtures/{i}/edit": {
+            "elements": {SAVE: "Save", VENUE: "Ballincollig"},
+            "post": (302, f"{BASE_URL}/fixtures/{i}")} for i in range(2)}
+        for i in failing:
+            site[f"{BASE_URL}/fixtures/{i}/edit"]["fail"] = 10
+        return site
+
+    def test_baseline_updated_when_every_edit_saved(self, tmp_path, monkeypatch):
+        results, marked = self._sync(tmp_path, monkeypatch, self._edit_site())
+        assert results == {"edited": 2}
+        assert marked == [True]
+
+    def test_failed_edit_keeps_baseline_for_retry(self, tmp_path, monkeypatch):
+        results, marked = self._sync(tmp_path, monkeypatch, self._edit_site(failing=[1]))
+        assert results == {"edited": 1}
+        assert marked == []
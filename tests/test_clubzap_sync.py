@@ -9,7 +9,10 @@ import shutil
 
 import pytest
 
-from clubzap_sync import fixture_key, read_csv_fixtures, write_csv, diff_fixtures, mark_uploaded
+from clubzap_sync import (
+    fixture_key, fixture_hash, read_csv_fixtures, write_csv, diff_fixtures,
+    mark_uploaded, compute_diff,
+)
 from config import FIXTURE_HEADER as HEADER, KEY_COLS, CHANGE_COLS
 
 
@@ -277,6 +280,59 @@ class TestDiffFixtures:
         assert not os.path.exists(self.changed_csv)
 
 
+# ---------------------------------------------------------------------------
+# fixture_hash / compute_diff (in-memory, no files)
+# ---------------------------------------------------------------------------
+
+def _keyed(*rows):
+    return {fixture_key(r): r for r in rows}
+
+
+class TestFixtureHash:
+    def test_same_content_same_hash(self):
+        assert fixture_hash(_make_row()) == fixture_hash(_make_row(Time=" 19:30 "))
+
+    def test_referee_change_changes_hash(self):
+        assert fixture_hash(_make_row()) != fixture_hash(_make_row(Referee="Pat Murphy"))
+
+
+class TestComputeDiff:
+    def test_referee_change_is_changed_not_new_and_removed(self):
+        diff = compute_diff(_keyed(_make_row(Referee="Pat Murphy")),
+                            _keyed(_make_row()))
+        assert diff["new"] == [] and diff["removed"] == []
+        assert len(diff["changed"]) == 1
+        row, changes = diff["changed"][0]
+        assert changes == [("Referee", "John Smith", "Pat Murphy")]
+
+    def test_unchanged_counted(self):
+        diff = compute_diff(_keyed(_make_row()), _keyed(_make_row()))
+        assert diff["unchanged"] == 1
+        assert not (diff["new"] or diff["changed"] or diff["removed"])
+
+    def test_postponed_not_new(self):
+        diff = compute_diff(_keyed(_make_row(Time="Postponed")), {})
+        assert diff["new"] == []
+        assert len(diff["postponed"]) == 1
+
+    def test_counts(self):
+        diff = compute_diff(_keyed(_make_row(), _make_row(Opponent="Carbery Rangers")),
+                            _keyed(_make_row(Opponent="Douglas")))
+        assert diff["current_count"] == 2
+        assert diff["baseline_count"] == 1
+        assert len(diff["new"]) == 2
+        assert len(diff["removed"]) == 1
+
+    def test_diff_fixtures_accepts_in_memory_fixtures(self, tmp_path, monkeypatch):
+        import clubzap_sync
+        for name in ("NEW_CSV", "CHANGED_CSV", "REMOVED_CSV"):
+            monkeypatch.setattr(clubzap_sync, name, str(tmp_path / f"{name}.csv"))
+        monkeypatch.setattr(clubzap_sync, "FULL_CSV", str(tmp_path / "missing.csv"))
+        diff = diff_fixtures(_keyed(_make_row(Time="14:00")), _keyed(_make_row()))
+        assert len(diff["changed"]) == 1
+        assert os.path.exists(tmp_path / "CHANGED_CSV.csv")
+
+
 # ---------------------------------------------------------------------------
 # mark_uploaded
 # ---------------------------------------------------------------------------
@@ -0,0 +1,94 @@
+"""
+Unit tests for competition_frontier.py — competition URL normalisation
+and the run-level competition page cache.
+"""
+
+import threading
+
+import pytest
+from bs4 import BeautifulSoup
+
+from competition_frontier import (CompetitionPageCache, competition_frontier,
+                                  normalise_competition_url)
+
+
+class TestNormaliseCompetitionUrl:
+    @pytest.mark.parametrize("href", [
+        "/league/210001/",
+        "/league/210001",
+        "https://gaacork.ie/league/210001/#fixtures",
+        "HTTP://GAACORK.IE/league/210001/?utm_source=facebook",
+        " league/210001/ ",
+    ])
+    def test_variants_collapse(self, href):
+        base = "https://gaacork.ie/"
+        assert normalise_competition_url(href, base) == "https://gaacork.ie/league/210001/"
+
+    def test_query_sorted_and_kept(self):
+        assert normalise_competition_url("/competition/?b=2&a=1") == \
+            "https://gaacork.ie/competition/?a=1&b=2"
+
+    def test_off_site_and_non_http_links_dropped(self):
+        assert normalise_competition_url("https://facebook.com/league/") is None
+        assert normalise_competition_url("mailto:league@gaacork.ie") is None
+
+
+class TestCompetitionFrontier:
+    def test_distinct_links_in_page_order(self):
+        soup = BeautifulSoup(
+            '<a href="/league/2/">B</a><a href="/about/">About</a>'
+            '<a href="/league/1">A</a><a href="/league/2/#t">B again</a>'
+            '<a href="/competition-listing/">All</a>', "html.parser")
+        assert competition_frontier(soup) == [
+            "https://gaacork.ie/league/2/", "https://gaacork.ie/league/1/",
+            "https://gaacork.ie/competition-listing/"]
+
+
+class TestCompetitionPageCache:
+    def test_fetched_once(self):
+        cache = CompetitionPageCache()
+        calls = []
+        fetch = lambda url: calls.append(url) or [{"Opponent": "Douglas"}]
+        assert cache.get("u", fetch) == cache.get("u", fetch)
+        assert calls == ["u"]
+        assert (cache.fetches, cache.hits) == (1, 1)
+
+    def test_concurrent_callers_wait_for_fetch_in_flight(self):
+        cache = CompetitionPageCache()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow_fetch(url):
+            calls.append(url)
+            started.set()
+            release.wait(2)
+            return ["fixture"]
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(cache.get("u", slow_fetch)))
+        first.start()
+        started.wait(2)
+        second = threading.Thread(target=lambda: results.append(cache.get("u", slow_fetch)))
+        second.start()
+        release.set()
+        first.join()
+        second.join()
+        assert calls == ["u"]
+        assert results == [["fixture"], ["fixture"]]
+
+    def test_unavailable_page_not_cached(self):
+        cache = CompetitionPageCache()
+        assert cache.get("u", lambda url: None) is None
+        assert "u" not in cache
+        assert cache.get("u", lambda url: []) == []
+        assert "u" in cache
+
+    def test_fetch_error_propagates_and_is_not_cached(self):
+        cache = CompetitionPageCache()
+
+        def boom(url):
+            raise RuntimeError("parse failed")
+
+        with pytest.raises(RuntimeError):
+            cache.get("u", boom)
+        assert len(cache) == 0
@@ -0,0 +1,145 @@
+"""
+Unit tests for competition_monitor/scraper.py and discovery.py — parsing
+rendered SportLomo competition pages, and verifying discovered leagues —
+with a stand-in for the shared page engine.
+"""
+
+from browser_engine import RenderedPage
+from competition_monitor import discovery
+from competition_monitor.scraper import CompetitionScraper
+
+URL = "https://rebelog.ie/league/214370/"
+
+PAGE = """
+<html><body>
+<nav><h2>Menu</h2></nav>
+<h1 class="entry-title">Fe13 Football Grp 1B</h1>
+<div class="tab fixtures-tab" style="display:none">
+  <ul class="fixtures-214370 table-body" data-date="9 May 2026" data-time="11:00"
+      data-hometeam="Ballincollig" data-awayteam="Douglas" data-venue="Ballincollig"
+      data-compname="Fe13 Football Grp 1B" data-referee=" Pat Murphy ">
+    <li>Ballincollig</li><li>v</li><li>Douglas</li></ul>
+  <ul class="fixtures-214370 table-body" data-date="16 May 2026" data-time="0:00"
+      data-hometeam="Nemo Rangers" data-awayteam="Ballincollig"></ul>
+  <ul class="fixtures-214999 table-body" data-date="16 May 2026"
+      data-hometeam="Other" data-awayteam="League"></ul>
+</div>
+<div class="results-tab">
+  <ul class="results fixtures-214370" data-date="2 May 2026" data-time="11:00"
+      data-hometeam="Blarney" data-awayteam="Ballincollig">
+    <li>Blarney</li><li>2-05 v 3-10</li><li>Ballincollig</li></ul>
+  <ul class="results" data-date="25 Apr 2026" data-hometeam="Ballincollig"
+      data-awayteam="Douglas"><li>Awaiting result</li></ul>
+</div>
+<table class="league_table">
+  <thead><tr><th>Pos</th><th>Team</th><th>Pld</th><th>W</th><th>D</th><th>L</th>
+    <th>PF</th><th>PA</th><th>PD</th><th>Pts</th></tr></thead>
+  <tbody>
+    <tr><td>1</td><td>Ballincollig</td><td>3</td><td>3</td><td>0</td><td>0</td>
+      <td>45</td><td>20</td><td>+25</td><td>6</td></tr>
+    <tr><td>2</td><td>Douglas</td><td>3</td><td>1</td><td>0</td><td>2</td>
+      <td>30</td><td>35</td><td>-5</td><td>2</td></tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+
+class FakeEngine:
+    """Serves rendered pages from a dict; records what was loaded."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.rendered = []
+
+    def _page(self, url):
+        self.rendered.append(url)
+        html = self.pages.get(url)
+        return RenderedPage(url, html) if html is not None else None
+
+    def render(self, url, **kwargs):
+        return self._page(url)
+
+    def render_many(self, urls, **kwargs):
+        return [self._page(url) for url in urls]
+
+
+class TestParse:
+    def _data(self, html=PAGE, url=URL):
+        return CompetitionScraper(FakeEngine({})).parse(html, url)
+
+    def test_fixtures_from_hidden_tab(self):
+        fixtures = self._data()["fixtures"]
+        assert [(f["home"], f["away"]) for f in fixtures] == [
+            ("Ballincollig", "Douglas"), ("Nemo Rangers", "Ballincollig")]
+        assert fixtures[0]["referee"] == "Pat Murphy"
+        assert fixtures[1]["postponed"]
+
+    def test_results_need_a_score(self):
+        (result,) = self._data()["results"]
+        assert (result["home_score"], result["away_score"]) == ("2-05", "3-10")
+
+    def test_heading_skips_menu(self):
+        assert self._data()["competition_name"] == "Fe13 Football Grp 1B"
+
+    def test_league_table(self):
+        table = self._data()["table"]
+        assert [(r["position"], r["team"], r["pts"]) for r in table] == [
+            (1, "Ballincollig", 6), (2, "Douglas", 2)]
+        assert table[0]["pd"] == 25
+
+    def test_table_from_div_grid_text(self):
+        page = ("<html><body><div class='grid'>"
+                "<div>1</div><div>Ballincollig</div><div>3</div><div>3</div>"
+                "<div>0</div><div>0</div><div>45</div><div>20</div><div>25</div>"
+                "<div>6</div></div><script>var x = 1;</script></body></html>")
+        (row,) = self._data(page)["table"]
+        assert (row["team"], row["played"], row["pts"]) == ("Ballincollig", 3, 6)
+
+
+class TestScrapeMany:
+    def test_each_page_rendered_once(self):
+        other = "https://rebelog.ie/league/214382/"
+        engine = FakeEngine({URL: PAGE, other: "<html><h1>Hurling</h1></html>"})
+        scraped = CompetitionScraper(engine).scrape_many([URL, other, URL])
+        assert engine.rendered == [URL, other]
+        assert len(scraped[URL]["fixtures"]) == 2
+        assert scraped[other]["competition_name"] == "Hurling"
+
+    def test_failed_page_is_none(self):
+        scraper = CompetitionScraper(FakeEngine({}))
+        assert scraper.scrape(URL) is None
+
+    def test_shared_engine_left_open(self):
+        engine = FakeEngine({})
+        scraper = CompetitionScraper(engine)
+        scraper.close()
+        assert scraper.engine is engine
+
+
+FIXTURES_PAGE = """
+<a href="https://rebelog.ie/league/214370/">Fe13 Football Grp 1B</a>
+<a href="https://rebelog.ie/league/300001/"> Fe13 Football Championship </a>
+<a href="https://rebelog.ie/league/300002/">Fe14 Hurling Championship</a>
+<a href="https://rebelog.ie/league/300003/">Senior Football League</a>
+"""
+
+
+class TestDiscovery:
+    def test_new_leagues_verified_on_their_pages(self):
+        engine = FakeEngine({
+            "https://rebelog.ie/fixtures/": FIXTURES_PAGE,
+            "https://rebelog.ie/league/300001/": "<ul data-hometeam='Ballincollig'></ul>",
+            "https://rebelog.ie/league/300002/": "<ul data-hometeam='Douglas'></ul>",
+        })
+        found = discovery.discover_new_competitions(engine)
+        # known (214370) and non-underage leagues aren't loaded
+        assert engine.rendered[1:] == ["https://rebelog.ie/league/300001/",
+                                       "https://rebelog.ie/league/300002/"]
+        assert found == [{"name": "Fe13 Football Championship",
+                          "competition_id": 300001,
+                          "url": "https://rebelog.ie/league/300001/",
+                          "age_group": "u13"}]
+
+    def test_no_engine(self):
+        assert discovery.discover_new_competitions(None) == []
@@ -0,0 +1,294 @@
+"""
+Unit tests for fixture_endpoint.py — capturing the club profile's fixture
+XHR from the browser's requests and calling it directly — and
+SeleniumScraper's use of it.
+"""
+
+import json
+import time
+
+import pytest
+import requests
+
+from fixture_endpoint import (EndpointShapeChanged, FixtureEndpoint,
+                              find_fixture_endpoint, fixtures_from_payload)
+from browser_engine import RenderedPage
+from selenium_scraper import SeleniumScraper
+
+FRAGMENT = (
+    '<ul class="column-eight table-body fixtures" data-date="9 May 2026" '
+    'data-time="11:00" data-hometeam="Ballincollig" data-awayteam="Douglas" '
+    'data-venue="Ballincollig GAA" data-compname="U14 Football League" '
+    'data-referee=" Pat Murphy "></ul>'
+    '<ul class="column-eight table-body fixtures" data-date="10 May 2026" '
+    'data-hometeam="Nemo Rangers" data-awayteam="Douglas" '
+    'data-compname="U14 Football League"></ul>'
+    '<ul class="column-eight table-body fixtures" data-date="11 May 2026" '
+    'data-hometeam="Ballincollig" data-awayteam="Highfield" '
+    'data-compname="Munster Junior Rugby Cup"></ul>'
+)
+AJAX_URL = "https://gaacork.ie/wp-admin/admin-ajax.php"
+
+
+def _exchanges(body=FRAGMENT, content_type="text/html; charset=UTF-8"):
+    return [
+        {"request": {"url": "https://gaacork.ie/wp-json/sportlomo/v1/menu",
+                     "method": "GET", "postData": None, "headers": {}},
+         "status": 200, "content_type": "application/json", "body": '{"items": []}'},
+        {"request": {"url": AJAX_URL + "?_=1715000000000", "method": "POST",
+                     "postData": "action=club_fixtures&club_id=1986&team_id=327535&page=1",
+                     "headers": {"content-type": "application/x-www-form-urlencoded",
+                                 "x-requested-with": "XMLHttpRequest",
+                                 "cookie": "session=secret"}},
+         "status": 200, "content_type": content_type, "body": body},
+    ]
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200, content_type="text/html"):
+        self.text = text
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeClient:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+def _endpoint():
+    return find_fixture_endpoint(_exchanges(), 1986, 327535)
+
+
+class TestCapture:
+    def test_fixture_xhr_identified_and_templated(self):
+        endpoint = _endpoint()
+        assert endpoint.url == AJAX_URL
+        assert endpoint.method == "POST"
+        assert endpoint.body == "action=club_fixtures&club_id={club_id}&team_id={team_id}&page=1"
+        assert endpoint.kind == "html"
+
+    def test_only_replayable_headers_kept(self):
+        assert _endpoint().headers == {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "X-Requested-With": "XMLHttpRequest"}
+
+    def test_response_without_our_fixtures_ignored(self):
+        assert find_fixture_endpoint(_exchanges("<p>No fixtures</p>"),
+                                     1986, 327535) is None
+
+    def test_failed_response_ignored(self):
+        exchanges = _exchanges()
+        exchanges[1]["status"] = 500
+        assert find_fixture_endpoint(exchanges, 1986, 327535) is None
+
+    def test_mislabelled_json_skipped(self):
+        exchanges = _exchanges("callback({})", "application/json") + _exchanges()[1:]
+        assert find_fixture_endpoint(exchanges, 1986, 327535).kind == "html"
+        assert find_fixture_endpoint(_exchanges("0", "application/json"),
+                                     1986, 327535) is None
+
+    def test_json_capture_records_keys(self):
+        body = json.dumps({"success": True, "data": FRAGMENT})
+        endpoint = find_fixture_endpoint(_exchanges(body, "application/json"),
+                                         1986, 327535)
+        assert endpoint.kind == "json"
+        assert endpoint.keys == ["data", "success"]
+
+    def test_saved_and_loaded(self, tmp_path):
+        path = str(tmp_path / "endpoint.json")
+        endpoint = _endpoint()
+        endpoint.save(path)
+        assert FixtureEndpoint.load(path).to_dict() == endpoint.to_dict()
+        assert FixtureEndpoint.load(str(tmp_path / "missing.json")) is None
+
+
+class TestPayload:
+    def test_club_fixtures_with_referee_rugby_excluded(self):
+        fixtures = fixtures_from_payload("html", FRAGMENT)
+        assert fixtures == [{
+            "home": "Ballincollig", "away": "Douglas", "date": "9 May 2026",
+            "time": "11:00", "venue": "Ballincollig GAA",
+            "competition": "U14 Football League", "referee": "Pat Murphy"}]
+
+    def test_json_records(self):
+        body = json.dumps({"fixtures": [
+            {"HomeTeam": "Douglas", "AwayTeam": "Ballincollig", "Date": "9 May 2026",
+             "CompName": "U14 Hurling League", "Venue": "Douglas"}]})
+        (fixture,) = fixtures_from_payload("json", body)
+        assert fixture["away"] == "Ballincollig"
+        assert fixture["competition"] == "U14 Hurling League"
+
+
+class TestPageSource:
+    def _fixtures(self, page):
+        return SeleniumScraper(endpoint_mode="off").extract_from_page_source(page)
+
+    def test_each_fixture_once_with_referee(self):
+        page = ('<html><ul class="menu"><li>Home</li></ul>'
+                '<ul data-date="9 May 2026" data-hometeam="Ballincollig" '
+                'data-awayteam="Ballincollig 2" data-referee="Pat Murphy"><li>x</li></ul>'
+                + FRAGMENT + '</html>')
+        fixtures = self._fixtures(page)
+        assert [(f["home"], f["away"]) for f in fixtures] == [
+            ("Ballincollig", "Ballincollig 2"), ("Ballincollig", "Douglas")]
+        assert fixtures[0]["referee"] == "Pat Murphy"
+
+    def test_quoting_and_entities(self):
+        page = ("<UL data-date='9 May 2026' data-hometeam='St Finbarr&#039;s'\n"
+                ' data-note="a>b" data-awayteam="Ballincollig"></UL>')
+        (fixture,) = self._fixtures(page)
+        assert fixture["home"] == "St Finbarr's"
+
+    def test_no_fixtures(self):
+        assert self._fixtures("<html><ul><li>Ballincollig</li></ul></html>") == []
+
+    def test_unclosed_quote_fails_fast(self):
+        start = time.perf_counter()
+        page = ("<ul " + "a" * 30 + ' "') * 50 + FRAGMENT
+        assert len(self._fixtures(page)) >= 1
+        assert time.perf_counter() - start < 1
+
+
+class TestFetch:
+    def test_request_filled_for_club(self):
+        client = FakeClient(FakeResponse(FRAGMENT))
+        fixtures = _endpoint().fetch(client, 1990, 400000)
+        method, url, kwargs = client.calls[0]
+        assert (method, url) == ("POST", AJAX_URL)
+        assert kwargs["data"] == "action=club_fixtures&club_id=1990&team_id=400000&page=1"
+        assert len(fixtures) == 1
+
+    @pytest.mark.parametrize("response", [
+        FakeResponse("", status_code=404),
+        FakeResponse('{"success": false}', content_type="application/json"),
+        FakeResponse("<!DOCTYPE html><html><body>Login</body></html>"),
+        FakeResponse('<ul class="fixtures"><li>9 May Ballincollig v Douglas</li></ul>'),
+        FakeResponse(""),
+        FakeResponse("0"),
+        FakeResponse("-1"),
+        FakeResponse("<p>No fixtures</p>"),
+    ])
+    def test_shape_changes_detected(self, response):
+        with pytest.raises(EndpointShapeChanged):
+            _endpoint().fetch(FakeClient(response), 1986, 327535)
+
+    def test_json_key_change_detected(self):
+        endpoint = FixtureEndpoint(AJAX_URL, kind="json", keys=["data", "success"])
+        with pytest.raises(EndpointShapeChanged):
+            endpoint.fetch(FakeClient(FakeResponse('{"items": []}')), 1986, 327535)
+
+    def test_other_clubs_fixtures_are_not_a_shape_change(self):
+        other = FRAGMENT.replace("Ballincollig", "Carrigaline")
+        assert _endpoint().fetch(FakeClient(FakeResponse(other)), 1986, 327535) == []
+
+    def test_empty_list_in_captured_container_is_no_fixtures(self):
+        wrapped = '<div class="club-fixtures list">' + FRAGMENT + '</div>'
+        endpoint = find_fixture_endpoint(_exchanges(wrapped), 1986, 327535)
+        assert endpoint.container == "div.club-fixtures.list"
+        empty = FakeResponse('<div class="club-fixtures list"><p>No fixtures</p></div>')
+        assert endpoint.fetch(FakeClient(empty), 1986, 327535) == []
+        for changed in ("0", "-1", "", '<div class="login"></div>'):
+            with pytest.raises(EndpointShapeChanged):
+                endpoint.fetch(FakeClient(FakeResponse(changed)), 1986, 327535)
+
+    def test_bare_fixture_list_has_no_container(self):
+        assert _endpoint().container is None
+
+    def test_network_error_raised(self):
+        with pytest.raises(requests.ConnectionError):
+            _endpoint().fetch(FakeClient(requests.ConnectionError("down")), 1986, 327535)
+
+
+class BrowserlessScraper(SeleniumScraper):
+    """SeleniumScraper whose browser path is recorded instead of run."""
+
+    def __init__(self, endpoint, response, tmp_path):
+        super().__init__(endpoint_mode="auto", endpoint_file=str(tmp_path / "e.json"),
+                         client=FakeClient(response))
+        self.endpoint = endpoint
+        self.browser_runs = 0
+
+    def scrape_with_browser(self, club_id, team_id, deadline=None):
+        self.browser_runs += 1
+        return [{"home": "Ballincollig", "away": "Browser"}]
+
+    def capture_endpoint(self, club_id, team_id):
+        return None
+
+
+class TestSeleniumScraperEndpoint:
+    def test_endpoint_used_without_browser(self, tmp_path):
+        scraper = BrowserlessScraper(_endpoint(), FakeResponse(FRAGMENT), tmp_path)
+        fixtures = scraper.scrape_club_profile(1986, 327535)
+        assert fixtures[0]["away"] == "Douglas"
+        assert scraper.browser_runs == 0
+        assert scraper.engine is None
+
+    def test_shape_change_falls_back_to_browser(self, tmp_path):
+        scraper = BrowserlessScraper(_endpoint(), FakeResponse("", status_code=404), tmp_path)
+        assert scraper.scrape_club_profile(1986, 327535)[0]["away"] == "Browser"
+        assert scraper.browser_runs == 1
+        assert scraper.endpoint is None
+
+    def test_saved_endpoint_loaded_in_auto_mode(self, tmp_path):
+        path = str(tmp_path / "endpoint.json")
+        _endpoint().save(path)
+        assert SeleniumScraper(endpoint_file=path).endpoint.url == AJAX_URL
+        assert SeleniumScraper(endpoint_mode="off", endpoint_file=path).endpoint is None
+
+
+class ProfileEngine:
+    """Stand-in page engine returning one rendered club profile."""
+
+    def __init__(self, html, exchanges):
+        self.page = RenderedPage("", html, exchanges)
+        self.calls = []
+
+    def render(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.page
+
+
+class TestBrowserCapture:
+    def test_capture_error_keeps_scraped_fixtures(self, tmp_path):
+        exchanges = _exchanges()
+        exchanges[1]["request"] = None
+        engine = ProfileEngine("<html>" + FRAGMENT + "</html>", exchanges)
+        scraper = SeleniumScraper(endpoint_mode="auto", engine=engine,
+                                  endpoint_file=str(tmp_path / "e.json"))
+        scraper.endpoint = None
+        assert [f["away"] for f in scraper.scrape_club_profile(1986, 327535)] == ["Douglas"]
+        assert scraper.endpoint is None
+
+
+    def test_rendered_profile_parsed_and_endpoint_captured(self, tmp_path):
+        engine = ProfileEngine("<html>" + FRAGMENT + "</html>", _exchanges())
+        scraper = SeleniumScraper(endpoint_mode="auto", engine=engine,
+                                  endpoint_file=str(tmp_path / "e.json"))
+        scraper.endpoint = None
+        fixtures = scraper.scrape_club_profile(1986, 327535)
+        assert [f["away"] for f in fixtures] == ["Douglas"]
+        assert engine.calls[0][1]["capture"]
+        assert scraper.endpoint.url == AJAX_URL
+        assert FixtureEndpoint.load(str(tmp_path / "e.json")).url == AJAX_URL
+
+    def test_requests_not_recorded_in_off_mode(self, tmp_path):
+        engine = ProfileEngine(FRAGMENT, [])
+        scraper = SeleniumScraper(endpoint_mode="off", engine=engine,
+                                  endpoint_file=str(tmp_path / "e.json"))
+        assert len(scraper.scrape_club_profile(1986, 327535)) == 1
+        assert not engine.calls[0][1]["capture"]
+        scraper.close()
+        assert scraper.engine is engine
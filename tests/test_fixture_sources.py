@@ -0,0 +1,151 @@
+"""
+Unit tests for fixture_sources.py — concurrent per-source fetching.
+"""
+
+import threading
+import time
+
+from browser_engine import PageEngine
+from config import GAA_CORK_SOURCE_TIMEOUT
+from enhanced_monitor import EnhancedFixtureMonitor
+from fixture_sources import (
+    CamogieLeagueSource, FixtureSource, GAACorkSource, default_sources,
+    fetch_sources,
+)
+from selenium_scraper import SeleniumScraper
+
+
+class FakeSource(FixtureSource):
+    def __init__(self, name, fixtures=(), delay=0.0, error=None, timeout=5):
+        self.name = name
+        self.fixtures = list(fixtures)
+        self.delay = delay
+        self.error = error
+        self.timeout = timeout
+
+    def fetch(self):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.fixtures
+
+
+class FakeScraper:
+    def scrape_club_profile(self, club_id, team_id, deadline=None):
+        self.deadline = deadline
+        return None
+
+
+def _quiet(msg):
+    pass
+
+
+class TestFetchSources:
+    def test_sources_run_concurrently(self):
+        sources = [FakeSource(f"s{i}", [{"home": str(i)}], delay=0.3)
+                   for i in range(3)]
+        start = time.monotonic()
+        results = fetch_sources(sources, log=_quiet)
+        assert time.monotonic() - start < 0.8
+        assert all(r["ok"] for r in results)
+
+    def test_results_in_source_order(self):
+        sources = [FakeSource("slow", delay=0.2), FakeSource("fast")]
+        results = fetch_sources(sources, log=_quiet)
+        assert [r["name"] for r in results] == ["slow", "fast"]
+
+    def test_failure_isolated(self):
+        sources = [FakeSource("bad", error=ConnectionError("refused")),
+                   FakeSource("good", [{"home": "Ballincollig"}])]
+        bad, good = fetch_sources(sources, log=_quiet)
+        assert bad["ok"] is False and "refused" in bad["error"]
+        assert bad["fixtures"] == []
+        assert good["ok"] is True and len(good["fixtures"]) == 1
+
+    def test_per_source_timeout(self):
+        sources = [FakeSource("hung", delay=2, timeout=0.2),
+                   FakeSource("quick", [{"home": "x"}], timeout=5)]
+        start = time.monotonic()
+        hung, quick = fetch_sources(sources, log=_quiet)
+        assert time.monotonic() - start < 1.5
+        assert hung["ok"] is False and "timed out" in hung["error"]
+        assert quick["ok"] is True
+
+    def test_abandoned_source_does_not_hold_the_process_open(self):
+        fetch_sources([FakeSource("abandoned", delay=2, timeout=0.1)], log=_quiet)
+        (thread,) = [t for t in threading.enumerate() if t.name == "source-abandoned"]
+        assert thread.daemon
+
+    def test_each_source_reported(self):
+        logged = []
+        fetch_sources([FakeSource("a", [{}]), FakeSource("b", error=ValueError("x"))],
+                      log=logged.append)
+        assert any(m.startswith("a: 1 fixtures") for m in logged)
+        assert any("WARNING: b failed" in m for m in logged)
+
+    def test_fixture_on_two_league_pages_kept_once(self):
+        match = {"date": "9 May 2026", "home": "Ballincollig", "away": "Douglas"}
+        a = CamogieLeagueSource({"url": "https://example.test/a", "competition": "A"})
+        b = CamogieLeagueSource({"url": "https://example.test/b", "competition": "B"})
+        a.fetch = lambda: [dict(match, competition="A")]
+        b.fetch = lambda: [dict(match, home="BALLINCOLLIG", competition="B"),
+                           dict(match, date="16 May 2026", competition="B")]
+        gaa = FakeSource("GAA", [dict(match)])
+        results = fetch_sources([gaa, a, b], log=_quiet)
+        assert [len(r["fixtures"]) for r in results] == [1, 1, 1]
+        assert results[1]["fixtures"][0]["competition"] == "A"
+        assert results[2]["fixtures"][0]["date"] == "16 May 2026"
+
+    def test_no_sources(self):
+        assert fetch_sources([], log=_quiet) == []
+
+
+class TestMonitorWithFailedSource:
+    FIXTURE = {"home": "Ballincollig", "away": "Douglas", "date": "9 May 2026",
+               "time": "11:00", "venue": "Ballincollig", "competition": "U14 FL"}
+
+    def _monitor(self, tmp_path, sources):
+        monitor = EnhancedFixtureMonitor(selenium_scraper=FakeScraper())
+        monitor.hash_file = str(tmp_path / "hashes.json")
+        monitor.log_file = str(tmp_path / "monitor.log")
+        monitor.output_file = str(tmp_path / "fixtures.csv")
+        monitor.sources = sources
+        return monitor
+
+    def test_run_with_a_failed_source_is_not_diffed(self, tmp_path):
+        state = tmp_path / "hashes.json"
+        state.write_text('{"count": 2, "fixtures": {}}')
+        monitor = self._monitor(tmp_path, [
+            FakeSource("GAA Cork", error=TimeoutError("timed out")),
+            FakeSource("Camogie", [self.FIXTURE])])
+        assert monitor.check_for_changes() is False
+        assert "GAA Cork" in monitor.last_error
+        assert state.read_text() == '{"count": 2, "fixtures": {}}'
+        assert not (tmp_path / "fixtures.csv").exists()
+
+
+class TestSourceTimeouts:
+    def test_gaa_cork_outlasts_a_hung_render_and_its_retry(self):
+        deadline = PageEngine().render_deadline("ul[data-date]",
+                                                SeleniumScraper.FIXTURE_WAIT)
+        assert GAA_CORK_SOURCE_TIMEOUT >= 2 * deadline
+
+
+class TestDefaultSources:
+    def test_gaa_cork_plus_each_league(self):
+        leagues = [{"url": "https://example.test/a", "team": "A", "club_name": "X",
+                    "competition": "League A"},
+                   {"url": "https://example.test/b", "team": "B", "club_name": "X"}]
+        sources = default_sources(FakeScraper(), leagues=leagues)
+        assert isinstance(sources[0], GAACorkSource)
+        assert [s.name for s in sources[1:]] == [
+            "Camogie: League A", "Camogie: https://example.test/b"]
+        assert all(isinstance(s, CamogieLeagueSource) for s in sources[1:])
+
+    def test_gaa_cork_none_becomes_empty(self):
+        assert GAACorkSource(FakeScraper()).fetch() == []
+
+    def test_gaa_cork_render_bounded_by_source_timeout(self):
+        scraper = FakeScraper()
+        GAACorkSource(scraper, timeout=30).fetch()
+        assert 0 < scraper.deadline - time.monotonic() <= 30
@@ -0,0 +1,124 @@
+"""
+Unit tests for heartbeat.py — run history, digest and failure alerts.
+"""
+
+from datetime import datetime, timedelta
+
+from heartbeat import Heartbeat, _percentile
+
+
+T0 = datetime(2026, 4, 12, 6, 0)
+
+
+def _hb(tmp_path, **kwargs):
+    return Heartbeat(str(tmp_path / "hb.json"), "Ballincollig GAA", **kwargs)
+
+
+def _kinds(notes):
+    return [n["kind"] for n in notes]
+
+
+class TestPercentile:
+    def test_median(self):
+        assert _percentile([3, 1, 2], 50) == 2
+
+    def test_p95_of_single(self):
+        assert _percentile([7.5], 95) == 7.5
+
+
+class TestRecording:
+    def test_state_persists(self, tmp_path):
+        hb = _hb(tmp_path)
+        hb.record_run(True, fixtures=40, duration=12.3, now=T0)
+        hb.save()
+        again = _hb(tmp_path)
+        assert len(again.state["runs"]) == 1
+        assert again.state["runs"][0]["fixtures"] == 40
+
+    def test_corrupt_state_file_ignored(self, tmp_path):
+        (tmp_path / "hb.json").write_text("{not json")
+        hb = _hb(tmp_path)
+        assert hb.state["runs"] == []
+
+    def test_success_resets_failure_streak(self, tmp_path):
+        hb = _hb(tmp_path)
+        hb.record_run(False, error="boom", now=T0)
+        hb.record_run(True, now=T0)
+        assert hb.state["consecutive_failures"] == 0
+
+
+class TestNotifications:
+    def test_quiet_run_sends_nothing(self, tmp_path):
+        hb = _hb(tmp_path)
+        hb.record_run(True, fixtures=40, duration=10, now=T0)
+        assert hb.due_notifications(now=T0) == []
+
+    def test_digest_after_interval(self, tmp_path):
+        hb = _hb(tmp_path, interval_hours=24)
+        for i in range(4):
+            hb.record_run(True, fixtures=40 + i, duration=10 + i,
+                          changed=(i == 2), now=T0 + timedelta(hours=6 * i))
+        hb.record_run(False, error="timeout", now=T0 + timedelta(hours=23))
+        notes = hb.due_notifications(now=T0 + timedelta(hours=24))
+        assert _kinds(notes) == ["digest"]
+        digest = notes[0]
+        assert digest["title"] == "Ballincollig GAA - Daily Summary"
+        assert digest["priority"] == "low"
+        assert "Runs: 5 (4 ok, 1 failed)" in digest["message"]
+        assert "Runs with changes: 1" in digest["message"]
+        assert "Fixtures monitored: 43 (range 40-43)" in digest["message"]
+        assert "p50" in digest["message"] and "p95" in digest["message"]
+        assert "timeout" in digest["message"]
+
+    def test_digest_totals_browser_restarts(self, tmp_path):
+        hb = _hb(tmp_path, interval_hours=24)
+        hb.record_run(True, browser_restarts={"hang": 1}, now=T0)
+        hb.record_run(True, browser_restarts={"hang": 1, "memory": 2}, now=T0)
+        hb.record_run(True, browser_restarts={}, now=T0)
+        assert "browser_restarts" not in hb.state["runs"][2]
+        (digest,) = hb.due_notifications(now=T0 + timedelta(hours=24))
+        assert "Browser restarts: 2 hang, 2 memory" in digest["message"]
+
+    def test_digest_resets_run_window(self, tmp_path):
+        hb = _hb(tmp_path, interval_hours=24)
+        hb.record_run(True, now=T0)
+        hb.due_notifications(now=T0 + timedelta(hours=24))
+        assert hb.state["runs"] == []
+        hb.record_run(True, now=T0 + timedelta(hours=25))
+        assert hb.due_notifications(now=T0 + timedelta(hours=25)) == []
+
+    def test_custom_interval_title(self, tmp_path):
+        hb = _hb(tmp_path, interval_hours=6)
+        hb.record_run(True, now=T0)
+        notes = hb.due_notifications(now=T0 + timedelta(hours=6))
+        assert notes[0]["title"] == "Ballincollig GAA - 6h Summary"
+
+    def test_alert_once_per_failure_streak(self, tmp_path):
+        hb = _hb(tmp_path, failure_threshold=2)
+        hb.record_run(False, error="no fixtures", now=T0)
+        assert hb.due_notifications(now=T0) == []
+        hb.record_run(False, error="no fixtures", now=T0 + timedelta(hours=1))
+        notes = hb.due_notifications(now=T0 + timedelta(hours=1))
+        assert _kinds(notes) == ["alert"]
+        assert notes[0]["priority"] == "high"
+        assert "2 consecutive runs" in notes[0]["message"]
+        assert "no fixtures" in notes[0]["message"]
+        hb.record_run(False, now=T0 + timedelta(hours=2))
+        assert hb.due_notifications(now=T0 + timedelta(hours=2)) == []
+
+    def test_recovery_after_alert(self, tmp_path):
+        hb = _hb(tmp_path, failure_threshold=1)
+        hb.record_run(False, now=T0)
+        hb.due_notifications(now=T0)
+        hb.record_run(True, now=T0 + timedelta(hours=1))
+        notes = hb.due_notifications(now=T0 + timedelta(hours=1))
+        assert _kinds(notes) == ["recovered"]
+
+    def test_alert_state_survives_reload(self, tmp_path):
+        hb = _hb(tmp_path, failure_threshold=1)
+        hb.record_run(False, now=T0)
+        hb.due_notifications(now=T0)
+        hb.save()
+        again = _hb(tmp_path, failure_threshold=1)
+        again.record_run(False, now=T0 + timedelta(hours=1))
+        assert again.due_notifications(now=T0 + timedelta(hours=1)) == []
@@ -0,0 +1,136 @@
+"""
+Unit tests for http_client.py — per-host rate limiting, TLS policy and
+request metrics.
+"""
+
+import pytest
+import requests
+
+from http_client import HostRateLimiter, HttpClient, RequestMetrics
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"ok"):
+        self.status_code = status_code
+        self.content = content
+
+
+class FakeSession:
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        if self.error:
+            raise self.error
+        return FakeResponse(content=b"x" * 2048)
+
+
+def _limiter(delays, default=1.0):
+    clock = FakeClock()
+    return HostRateLimiter(delays, default=default, clock=clock,
+                           sleep=clock.sleep), clock
+
+
+def _client(delays=None, session=None):
+    limiter, clock = _limiter(delays or {})
+    client = HttpClient(limiter=limiter, insecure_hosts=["corkcamogie.com"])
+    client.session = session or FakeSession()
+    return client, clock
+
+
+class TestHostRateLimiter:
+    def test_first_request_not_delayed(self):
+        limiter, clock = _limiter({})
+        assert limiter.wait("gaacork.ie") == 0
+        assert clock.sleeps == []
+
+    def test_same_host_spaced_by_delay(self):
+        limiter, clock = _limiter({"gaacork.ie": 2.0})
+        limiter.wait("gaacork.ie")
+        clock.now += 0.5
+        assert limiter.wait("gaacork.ie") == pytest.approx(1.5)
+
+    def test_hosts_independent(self):
+        limiter, clock = _limiter({})
+        limiter.wait("gaacork.ie")
+        assert limiter.wait("rebelog.ie") == 0
+
+    def test_subdomain_uses_parent_setting(self):
+        limiter, _ = _limiter({"ntfy.sh": 0})
+        assert limiter.delay_for("eu.ntfy.sh") == 0
+        assert limiter.delay_for("gaacork.ie") == 1.0
+
+    def test_zero_delay_never_waits(self):
+        limiter, clock = _limiter({"ntfy.sh": 0})
+        for _ in range(5):
+            limiter.wait("ntfy.sh")
+        assert clock.sleeps == []
+
+
+class TestHttpClient:
+    def test_tls_verified_except_insecure_hosts(self):
+        client, _ = _client()
+        client.get("https://gaacork.ie/clubprofile/1986/")
+        client.get("https://corkcamogie.com/league/")
+        verify = [kwargs["verify"] for _, _, kwargs in client.session.calls]
+        assert verify == [True, False]
+
+    def test_default_timeout_applied(self):
+        client, _ = _client()
+        client.get("https://gaacork.ie/", timeout=3)
+        client.post("https://ntfy.sh/topic", data=b"hi")
+        timeouts = [kwargs["timeout"] for _, _, kwargs in client.session.calls]
+        assert timeouts == [3, client.timeout]
+
+    def test_requests_rate_limited_per_host(self):
+        client, clock = _client({"gaacork.ie": 1.0})
+        client.get("https://gaacork.ie/a")
+        client.get("https://gaacork.ie/b")
+        assert clock.sleeps == [1.0]
+
+    def test_metrics_recorded(self):
+        client, _ = _client({"gaacork.ie": 1.0})
+        client.get("https://gaacork.ie/a")
+        client.get("https://gaacork.ie/b")
+        stats = client.metrics.by_host()["gaacork.ie"]
+        assert stats["requests"] == 2
+        assert stats["bytes"] == 4096
+        assert stats["waited"] == pytest.approx(1.0)
+        assert "gaacork.ie: 2 requests (0 cached), 0 errors, 4 KB" in client.metrics.summary()
+
+    def test_failed_request_recorded_and_raised(self):
+        client, _ = _client(session=FakeSession(
+            error=requests.ConnectionError("refused")))
+        with pytest.raises(requests.ConnectionError):
+            client.get("https://gaacork.ie/")
+        (record,) = client.metrics.records
+        assert record["status"] is None and "refused" in record["error"]
+        assert client.metrics.by_host()["gaacork.ie"]["errors"] == 1
+
+
+class TestRequestMetrics:
+    def test_error_statuses_counted(self):
+        metrics = RequestMetrics()
+        metrics.record("GET", "https://a.test/1", 200, 0.1, 10)
+        metrics.record("GET", "https://a.test/2", 503, 0.3, 0)
+        stats = metrics.by_host()["a.test"]
+        assert stats["errors"] == 1
+        assert stats["max"] == 0.3
+
+    def test_empty_summary(self):
+        assert RequestMetrics().summary() == ""
@@ -0,0 +1,115 @@
+"""
+Unit tests for notification_backends.py — backend selection and the hub.
+"""
+
+import threading
+
+import pytest
+
+import notification_backends as nb
+from notification_backends import (
+    ConsoleBackend, FileBackend, NotificationBackend, NotificationHub,
+    NtfyBackend, WindowsToastBackend, sanitize_for_xml, select_backends,
+)
+
+
+class SlowBackend(NotificationBackend):
+    name = "slow"
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.sent = []
+
+    def send(self, title, message):
+        self.release.wait(5)
+        self.sent.append(title)
+        return "slow sent"
+
+
+class BrokenBackend(NotificationBackend):
+    name = "broken"
+
+    def send(self, title, message):
+        raise OSError("no display")
+
+
+@pytest.fixture
+def no_windows(monkeypatch):
+    monkeypatch.setattr(WindowsToastBackend, "available", classmethod(lambda cls: False))
+
+
+class TestSanitize:
+    def test_xml_and_powershell_escaped(self):
+        assert sanitize_for_xml('<a> & "$x"') == "&lt;a&gt; &amp; &quot;`$x&quot;"
+
+
+class TestSelectBackends:
+    def test_auto_on_linux_uses_console_and_ntfy(self, no_windows):
+        backends = select_backends("auto", send_ntfy=lambda t, m: None)
+        assert [b.name for b in backends] == ["console", "ntfy"]
+
+    def test_auto_prefers_windows_when_available(self, monkeypatch):
+        monkeypatch.setattr(WindowsToastBackend, "available",
+                            classmethod(lambda cls: True))
+        backends = select_backends("auto")
+        assert [b.name for b in backends] == ["windows"]
+
+    def test_auto_adds_file_when_configured(self, no_windows, tmp_path):
+        backends = select_backends("auto", file_path=str(tmp_path / "n.txt"))
+        assert [b.name for b in backends] == ["console", "file"]
+
+    def test_explicit_list(self, no_windows, tmp_path):
+        backends = select_backends("file, ntfy", send_ntfy=lambda t, m: None,
+                                   file_path=str(tmp_path / "n.txt"))
+        assert [b.name for b in backends] == ["file", "ntfy"]
+
+    def test_unavailable_and_unknown_skipped(self, no_windows):
+        logged = []
+        backends = select_backends("windows,pager,console", log=logged.append)
+        assert [b.name for b in backends] == ["console"]
+        assert len(logged) == 2
+
+    def test_unconfigured_backend_skipped(self, no_windows):
+        backends = select_backends("ntfy,file", log=lambda msg: None)
+        assert backends == []
+
+    def test_registered_backend_selectable(self, monkeypatch):
+        monkeypatch.setitem(nb.BACKENDS, "slow", SlowBackend)
+        assert [b.name for b in select_backends("slow")] == ["slow"]
+
+
+class TestNotificationHub:
+    def test_ntfy_and_file_delivery(self, tmp_path):
+        sent = []
+        path = tmp_path / "notifications.txt"
+        hub = NotificationHub([NtfyBackend(lambda t, m: sent.append((t, m))),
+                               FileBackend(str(path))], log=lambda msg: None)
+        hub.notify("Fixture Changes", "NEW: Sat vs Rival")
+        assert hub.close() == 0
+        assert sent == [("Fixture Changes", "NEW: Sat vs Rival")]
+        assert "NEW: Sat vs Rival" in path.read_text()
+
+    def test_slow_backend_does_not_block_notify(self):
+        slow = SlowBackend()
+        sent = []
+        hub = NotificationHub([slow, NtfyBackend(lambda t, m: sent.append(t))],
+                              log=lambda msg: None)
+        hub.notify("Title", "Body")
+        assert sent == ["Title"]
+        assert slow.sent == []
+        slow.release.set()
+        hub.close()
+        assert slow.sent == ["Title"]
+
+    def test_failures_logged_not_raised(self):
+        logged = []
+        hub = NotificationHub([BrokenBackend()], log=logged.append)
+        hub.notify("Title", "Body")
+        assert hub.close() == 1
+        assert "no display" in logged[0]
+
+    def test_console_backend_prints(self, capsys):
+        hub = NotificationHub([ConsoleBackend()], log=lambda msg: None)
+        hub.notify("Title", "Body")
+        hub.close()
+        assert "NOTIFICATION: Title" in capsys.readouterr().out
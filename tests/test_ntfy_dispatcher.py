@@ -0,0 +1,366 @@
+"""
+Unit tests for ntfy_dispatcher.py — pooled, coalescing ntfy.sh sender.
+"""
+
+import threading
+
+import pytest
+
+from ntfy_dispatcher import (
+    NtfyDispatcher, TokenBucket, truncate_body, _pack_sections,
+    _retry_after_seconds,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeSession:
+    """Records every POST instead of sending it.
+
+    *statuses* optionally scripts the status codes of successive POSTs
+    (429s carry ``Retry-After: 0``); after it runs out *status_code* is used.
+    """
+
+    def __init__(self, status_code=200, fail_topics=(), statuses=()):
+        self.status_code = status_code
+        self.fail_topics = set(fail_topics)
+        self.statuses = list(statuses)
+        self.posts = []
+        self._lock = threading.Lock()
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        with self._lock:
+            self.posts.append({"url": url, "data": data, "headers": headers})
+            status = self.statuses.pop(0) if self.statuses else self.status_code
+        topic = url.rsplit("/", 1)[-1]
+        if topic in self.fail_topics:
+            raise ConnectionError("simulated failure")
+        if status == 429:
+            return FakeResponse(429, {"Retry-After": "0"})
+        return FakeResponse(status)
+
+    def close(self):
+        pass
+
+
+def _dispatcher(**kwargs):
+    d = NtfyDispatcher(log=lambda msg: None, **kwargs)
+    d._session = FakeSession()
+    return d
+
+
+# ---------------------------------------------------------------------------
+# truncate_body / _pack_sections
+# ---------------------------------------------------------------------------
+
+class TestTruncateBody:
+    def test_short_body_unchanged(self):
+        assert truncate_body(b"hello", 100) == b"hello"
+
+    def test_long_body_truncated_under_limit(self):
+        body = truncate_body(b"x" * 5000, 3900)
+        assert len(body) <= 3900
+        assert body.endswith(b"(truncated)")
+
+    def test_does_not_split_multibyte_character(self):
+        body = truncate_body("é".encode("utf-8") * 3000, 3900)
+        body.decode("utf-8")  # must not raise
+
+
+class TestPackSections:
+    def test_all_fit_in_one_chunk(self):
+        chunks = _pack_sections([b"a", b"b", b"c"], 100)
+        assert chunks == [(b"a\n\nb\n\nc", 3)]
+
+    def test_splits_when_limit_reached(self):
+        chunks = _pack_sections([b"x" * 60, b"y" * 60], 100)
+        assert [count for _, count in chunks] == [1, 1]
+        assert all(len(c) <= 100 for c, _ in chunks)
+
+
+# ---------------------------------------------------------------------------
+# NtfyDispatcher
+# ---------------------------------------------------------------------------
+
+class TestDispatcherCoalescing:
+    def test_nothing_sent_until_flush(self):
+        d = _dispatcher()
+        d.post("topic-a", "Title", "Body")
+        assert d._session.posts == []
+        assert d.pending_count == 1
+
+    def test_single_message_sent_as_is(self):
+        d = _dispatcher()
+        d.post("topic-a", "Title", "Body", priority="low",
+               headers={"Icon": "icon.png"})
+        results = d.flush()
+        assert len(results) == 1
+        post = d._session.posts[0]
+        assert post["url"] == "https://ntfy.sh/topic-a"
+        assert post["data"] == b"Body"
+        assert post["headers"]["Title"] == "Title"
+        assert post["headers"]["Priority"] == "low"
+        assert post["headers"]["Icon"] == "icon.png"
+
+    def test_same_topic_merged_into_one_post(self):
+        d = _dispatcher()
+        d.post("topic-a", "Result", "Ballincollig won")
+        d.post("topic-a", "Fixture Update", "Time changed")
+        results = d.flush()
+        assert len(results) == 1
+        assert results[0]["messages"] == 2
+        body = d._session.posts[0]["data"].decode("utf-8")
+        assert "Result\nBallincollig won" in body
+        assert "Fixture Update\nTime changed" in body
+        assert d._session.posts[0]["headers"]["Title"] == "Result (+1 more)"
+
+    def test_identical_titles_keep_title(self):
+        d = _dispatcher()
+        d.post("topic-a", "All Clear", "Comp 1 quiet")
+        d.post("topic-a", "All Clear", "Comp 2 quiet")
+        d.flush()
+        post = d._session.posts[0]
+        assert post["headers"]["Title"] == "All Clear"
+        assert post["data"] == b"Comp 1 quiet\n\nComp 2 quiet"
+
+    def test_messages_with_different_headers_not_merged(self):
+        d = _dispatcher()
+        d.post("topic-a", "Result", "won", headers={"Actions": "view, Table, https://a"})
+        d.post("topic-a", "Fixture Update", "moved")
+        d.post("topic-a", "Result", "lost", headers={"Actions": "view, Table, https://a"})
+        results = d.flush()
+        assert [r["messages"] for r in results] == [2, 1]
+        posts = {p["data"]: p["headers"] for p in d._session.posts}
+        assert posts[b"won\n\nlost"]["Actions"] == "view, Table, https://a"
+        assert "Actions" not in posts[b"moved"]
+
+    def test_digest_uses_highest_priority(self):
+        d = _dispatcher()
+        d.post("topic-a", "A", "a", priority="low")
+        d.post("topic-a", "B", "b", priority="high")
+        d.flush()
+        assert d._session.posts[0]["headers"]["Priority"] == "high"
+
+    def test_different_topics_sent_separately(self):
+        d = _dispatcher()
+        d.post("topic-a", "A", "a")
+        d.post("topic-b", "B", "b")
+        d.post("topic-c", "C", "c")
+        results = d.flush()
+        assert {r["topic"] for r in results} == {"topic-a", "topic-b", "topic-c"}
+        assert len(d._session.posts) == 3
+
+    def test_oversized_digest_is_split(self):
+        d = _dispatcher(max_body_bytes=200)
+        for i in range(5):
+            d.post("topic-a", f"Update {i}", "x" * 80)
+        results = d.flush()
+        assert len(results) > 1
+        assert sum(r["messages"] for r in results) == 5
+        for post in d._session.posts:
+            assert len(post["data"]) <= 200
+        titles = {p["headers"]["Title"] for p in d._session.posts}
+        assert any(t.endswith(f"(1/{len(results)})") for t in titles)
+
+    def test_flush_clears_queue(self):
+        d = _dispatcher()
+        d.post("topic-a", "A", "a")
+        d.flush()
+        assert d.pending_count == 0
+        assert d.flush() == []
+
+
+class TestDispatcherDelivery:
+    def test_failure_reported_not_raised(self):
+        d = _dispatcher()
+        d._session = FakeSession(fail_topics={"topic-b"})
+        d.post("topic-a", "A", "a")
+        d.post("topic-b", "B", "b")
+        results = {r["topic"]: r for r in d.flush()}
+        assert results["topic-a"]["ok"] is True
+        assert results["topic-b"]["ok"] is False
+        assert "simulated failure" in results["topic-b"]["error"]
+
+    def test_worker_error_raised(self):
+        class BrokenLimiter:
+            def acquire(self):
+                raise RuntimeError("limiter broke")
+
+        d = _dispatcher(limiter=BrokenLimiter())
+        d.post("topic-a", "A", "a")
+        d.post("topic-b", "B", "b")
+        with pytest.raises(RuntimeError, match="limiter broke"):
+            d.flush()
+
+    def test_non_200_status_not_ok(self):
+        d = _dispatcher()
+        d._session = FakeSession(status_code=500)
+        d.post("topic-a", "A", "a")
+        result = d.flush()[0]
+        assert result["ok"] is False
+        assert result["status"] == 500
+
+    def test_custom_base_url(self):
+        d = _dispatcher(base_url="http://localhost:8080/")
+        d.post("topic-a", "A", "a")
+        d.flush()
+        assert d._session.posts[0]["url"] == "http://localhost:8080/topic-a"
+
+
+# ---------------------------------------------------------------------------
+# Rate-limit scheduling
+# ---------------------------------------------------------------------------
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestRetryAfter:
+    def test_seconds(self):
+        assert _retry_after_seconds("3") == 3
+
+    def test_missing_uses_default(self):
+        assert _retry_after_seconds(None) > 0
+
+    def test_capped(self):
+        assert _retry_after_seconds("100000") <= 60
+
+    def test_http_date_in_past_is_zero(self):
+        assert _retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+class TestTokenBucket:
+    def test_burst_available_immediately(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=3, clock=clock, sleep=clock.sleep)
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+
+    def test_waits_for_refill_when_empty(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=1, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        assert bucket.acquire() == pytest.approx(0.5)
+
+    def test_throttle_pauses_and_halves_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=4, burst=10, clock=clock, sleep=clock.sleep)
+        bucket.throttle(5)
+        assert bucket.rate == 2
+        assert bucket.acquire() == pytest.approx(5)
+
+    def test_recover_restores_rate_gradually(self):
+        bucket = TokenBucket(rate=8, burst=1)
+        bucket.throttle(0)
+        assert bucket.rate == 4
+        bucket.recover()
+        assert 4 < bucket.rate < 8
+        for _ in range(10):
+            bucket.recover()
+        assert bucket.rate == 8
+
+
+class TestDispatcherScheduling:
+    def test_429_retried_then_succeeds(self):
+        d = _dispatcher()
+        d._session = FakeSession(statuses=[429])
+        d.post("topic-a", "A", "a")
+        results = d.flush()
+        assert len(results) == 1
+        assert results[0]["ok"] is True
+        assert results[0]["attempts"] == 2
+        assert len(d._session.posts) == 2
+
+    def test_429_gives_up_after_max_retries(self):
+        d = _dispatcher(max_retries=1)
+        d._session = FakeSession(status_code=429)
+        d.post("topic-a", "A", "a")
+        result = d.flush()[0]
+        assert result["ok"] is False
+        assert result["status"] == 429
+        assert result["attempts"] == 2
+
+    def test_high_priority_sent_first(self):
+        d = _dispatcher(max_workers=1)
+        d.post("all-clear", "All Clear", "quiet", priority="low")
+        d.post("results", "Result", "we won", priority="high")
+        d.post("other", "Other", "x", priority="default")
+        d.flush()
+        order = [p["url"].rsplit("/", 1)[-1] for p in d._session.posts]
+        assert order == ["results", "other", "all-clear"]
+
+    def test_rank_overrides_priority_for_ordering(self):
+        d = _dispatcher(max_workers=1)
+        d.post("all-clear", "All Clear", "quiet", priority="low", rank="min")
+        d.post("results", "Result", "we won", priority="low", rank="max")
+        d.flush()
+        assert d._session.posts[0]["url"].endswith("/results")
+        assert d._session.posts[0]["headers"]["Priority"] == "low"
+
+    def test_queue_delay_reported(self):
+        d = _dispatcher()
+        d.post("topic-a", "A", "a")
+        result = d.flush()[0]
+        assert result["queue_delay"] >= 0
+
+
+# ---------------------------------------------------------------------------
+# Against the local ntfy stand-in server
+# ---------------------------------------------------------------------------
+
+class TestDispatcherAgainstStub:
+    @pytest.fixture
+    def server(self):
+        from ntfy_stub import NtfyStubServer
+        with NtfyStubServer() as srv:
+            yield srv
+
+    def test_messages_recorded_with_headers(self, server):
+        d = NtfyDispatcher(base_url=server.url, log=lambda msg: None)
+        d.post("topic-a", "Title", "Body", priority="high",
+               headers={"Icon": "icon.png",
+                        "Actions": "view, View Fixtures, https://example.test"})
+        results = d.flush()
+        d.close()
+        assert results[0]["ok"] is True
+        assert len(server.messages) == 1
+        msg = server.messages[0]
+        assert msg["topic"] == "topic-a"
+        assert msg["title"] == "Title"
+        assert msg["priority"] == "high"
+        assert msg["actions"].startswith("view, View Fixtures")
+        assert msg["message"] == "Body"
+
+    def test_rate_limited_request_reported(self, server):
+        server.rate_limit_every = 1
+        d = NtfyDispatcher(base_url=server.url, log=lambda msg: None,
+                           max_retries=0)
+        d.post("topic-a", "Title", "Body")
+        result = d.flush()[0]
+        d.close()
+        assert result["status"] == 429
+        assert result["ok"] is False
+        assert server.messages == []
+
+    def test_dropped_connection_reported(self, server):
+        server.drop_every = 1
+        d = NtfyDispatcher(base_url=server.url, log=lambda msg: None)
+        d.post("topic-a", "Title", "Body")
+        result = d.flush()[0]
+        d.close()
+        assert result["ok"] is False
+        assert result["error"]
@@ -0,0 +1,172 @@
+"""
+Unit tests for response_cache.py — TTLs, revalidation, offline mode and
+LRU eviction, through the shared HTTP client.
+"""
+
+import gzip
+import os
+import threading
+
+import pytest
+import requests
+
+from http_client import HostRateLimiter, HttpClient
+from response_cache import ResponseCache
+
+PROFILE = "https://gaacork.ie/clubprofile/1986/"
+LISTING = "https://gaacork.ie/competition-listing/"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"<html>page</html>", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.encoding = "utf-8"
+
+
+class FakeSession:
+    """Returns queued responses and records each request's headers."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append((url, dict(headers or {})))
+        return self.responses.pop(0)
+
+
+def _setup(tmp_path, responses, mode="read-write", **kwargs):
+    clock = FakeClock()
+    cache = ResponseCache(str(tmp_path / "cache"), mode=mode, clock=clock,
+                          ttl_rules=[(r"/clubprofile/", 900),
+                                     (r"/competition-listing/", 86400)],
+                          **kwargs)
+    client = HttpClient(limiter=HostRateLimiter({}, default=0), cache=cache)
+    client.session = FakeSession(responses)
+    return client, cache, clock
+
+
+class TestReadWrite:
+    def test_fresh_entry_served_from_disk(self, tmp_path):
+        client, _, clock = _setup(tmp_path, [FakeResponse()])
+        client.get(PROFILE)
+        clock.now += 60
+        resp = client.get(PROFILE)
+        assert resp.text == "<html>page</html>"
+        assert resp.from_cache
+        assert len(client.session.requests) == 1
+
+    def test_ttl_depends_on_url_pattern(self, tmp_path):
+        client, _, clock = _setup(tmp_path, [FakeResponse()] * 3)
+        client.get(PROFILE)
+        client.get(LISTING)
+        clock.now += 3600
+        client.get(PROFILE)  # 15 min TTL: stale
+        client.get(LISTING)  # 1 day TTL: fresh
+        assert [url for url, _ in client.session.requests] == [PROFILE, LISTING, PROFILE]
+
+    def test_stale_entry_revalidated_with_validators(self, tmp_path):
+        client, cache, clock = _setup(tmp_path, [
+            FakeResponse(headers={"ETag": '"v1"', "Last-Modified": "Sat, 04 Apr 2026 10:00:00 GMT"}),
+            FakeResponse(status_code=304, content=b""),
+        ])
+        client.get(PROFILE)
+        clock.now += 3600
+        resp = client.get(PROFILE)
+        assert client.session.requests[1][1] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Sat, 04 Apr 2026 10:00:00 GMT"}
+        assert resp.status_code == 200 and resp.content == b"<html>page</html>"
+        assert cache.revalidated == 1
+
+    def test_caller_validators_passed_through(self, tmp_path):
+        client, _, clock = _setup(tmp_path, [
+            FakeResponse(headers={"ETag": '"v1"'}),
+            FakeResponse(status_code=304, content=b""),
+        ])
+        client.get(PROFILE)
+        clock.now += 3600
+        resp = client.get(PROFILE, headers={"If-None-Match": '"mine"'})
+        assert client.session.requests[1][1] == {"If-None-Match": '"mine"'}
+        assert resp.status_code == 304
+
+    def test_error_responses_not_stored(self, tmp_path):
+        client, cache, _ = _setup(tmp_path, [FakeResponse(status_code=500)] * 2)
+        client.get(PROFILE)
+        client.get(PROFILE)
+        assert cache.index == {}
+
+    def test_body_compressed_and_index_persisted(self, tmp_path):
+        client, cache, _ = _setup(tmp_path, [FakeResponse(content=b"x" * 10000)])
+        client.get(PROFILE)
+        (key,) = cache.index
+        path = os.path.join(cache.directory, f"{key}.gz")
+        assert os.path.getsize(path) < 1000
+        assert gzip.open(path).read() == b"x" * 10000
+        reloaded = ResponseCache(cache.directory, mode="offline-only")
+        assert reloaded.index[key]["url"] == PROFILE
+
+
+    def test_concurrent_stores_leave_one_complete_body(self, tmp_path):
+        _, cache, _ = _setup(tmp_path, [])
+        bodies = [bytes([i]) * 50000 for i in range(8)]
+        threads = [threading.Thread(target=cache.store,
+                                    args=(PROFILE, FakeResponse(content=body)))
+                   for body in bodies]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        entry, body, _ = cache.lookup(PROFILE)
+        assert body in bodies
+        (key,) = cache.index
+        assert entry["size"] == os.path.getsize(os.path.join(cache.directory, f"{key}.gz"))
+        assert not [f for f in os.listdir(cache.directory) if f.endswith(".tmp")]
+
+
+class TestOffline:
+    def test_serves_stale_entries_without_network(self, tmp_path):
+        client, cache, clock = _setup(tmp_path, [FakeResponse()])
+        client.get(PROFILE)
+        offline = ResponseCache(cache.directory, mode="offline-only", clock=clock)
+        client.cache = offline
+        clock.now += 10 * 86400
+        assert client.get(PROFILE).text == "<html>page</html>"
+        assert len(client.session.requests) == 1
+
+    def test_miss_raises_connection_error(self, tmp_path):
+        client, _, _ = _setup(tmp_path, [], mode="offline-only")
+        with pytest.raises(requests.ConnectionError, match="not in the HTTP cache"):
+            client.get(PROFILE)
+
+
+class TestEviction:
+    def test_least_recently_used_evicted(self, tmp_path):
+        urls = [f"https://gaacork.ie/clubprofile/{i}/" for i in range(3)]
+        client, cache, clock = _setup(
+            tmp_path, [FakeResponse(content=os.urandom(400)) for _ in urls],
+            max_bytes=1000)
+        client.get(urls[0])
+        clock.now += 1
+        client.get(urls[1])
+        clock.now += 1
+        client.get(urls[0])  # hit: urls[1] is now least recently used
+        clock.now += 1
+        client.get(urls[2])
+        assert sorted(e["url"] for e in cache.index.values()) == [urls[0], urls[2]]
+        assert len([f for f in os.listdir(cache.directory) if f.endswith(".gz")]) == 2
+
+
+def test_unknown_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ResponseCache(str(tmp_path), mode="sometimes")
@@ -0,0 +1,212 @@
+"""
+Unit tests for scraper.py — club profile extraction and the
+competition-link fallback and text-pattern fixture extraction.
+"""
+
+import threading
+import time
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from competition_frontier import CompetitionPageCache
+from scraper import GAAClubScraper
+
+PROFILE_URL = "https://gaacork.ie/clubprofile/1986/"
+
+CLUB_PAGE = """
+<html><body>
+<nav><a href="/league/210001/">Football League</a><p>Menu</p></nav>
+<h1> Ballincollig </h1>
+<div><p>Ballincollig GAA Grounds, Co. Cork</p></div>
+<a href="https://gaacork.ie/">County board</a>
+<a href="https://www.ballincolliggaa.ie/">Club website</a>
+<a href="mailto:secretary@ballincolliggaa.ie">Email</a>
+<a href="https://www.google.com/maps/dir//51.892,-8.58863">Directions</a>
+<p>Division: Muskerry</p><p>Colours: Green and White</p>
+</body></html>
+"""
+
+
+class OfflineScraper(GAAClubScraper):
+    def __init__(self):
+        super().__init__(client=object())
+
+    def get_page_content(self, url):
+        return None
+
+
+class TestExtractClubInfo:
+    def _info(self, html=CLUB_PAGE):
+        scraper = OfflineScraper()
+        return scraper.extract_club_info(scraper.parse_html(html), PROFILE_URL)
+
+    def test_profile_fields(self):
+        info = self._info()
+        assert info["club_name"] == "Ballincollig"
+        assert info["address"] == "Ballincollig GAA Grounds, Co. Cork"
+        assert info["email"] == "secretary@ballincolliggaa.ie"
+        assert info["division"] == "Muskerry"
+        assert info["colors"] == "Green + White"
+        assert info["coordinates"] == "51.892,-8.58863"
+
+    def test_website_is_first_absolute_link_unless_gaacork(self):
+        # the first absolute link points at gaacork.ie, so no website
+        assert "website" not in self._info()
+        page = CLUB_PAGE.replace('<a href="https://gaacork.ie/">County board</a>', "")
+        assert self._info(page)["website"] == "https://www.ballincolliggaa.ie/"
+
+    def test_same_result_with_either_parser(self):
+        scraper = OfflineScraper()
+        lxml_info = scraper.extract_club_info(scraper.parse_html(CLUB_PAGE), PROFILE_URL)
+        std_info = scraper.extract_club_info(BeautifulSoup(CLUB_PAGE, "html.parser"),
+                                             PROFILE_URL)
+        assert lxml_info == std_info
+
+
+def _competition_page(opponent):
+    return (f'<ul class="column-eight table-body fixtures" data-date="1 Jan 2099" '
+            f'data-time="19:00" data-hometeam="Ballincollig" data-awayteam="{opponent}" '
+            f'data-venue="Ballincollig" data-compname="U14 Football League"></ul>')
+
+
+class CompetitionSiteScraper(GAAClubScraper):
+    """Serves competition pages from a dict; records what was fetched."""
+
+    def __init__(self, pages, **kwargs):
+        super().__init__(client=object(), **kwargs)
+        self.pages = pages
+        self.fetched = []
+        self._lock = threading.Lock()
+        self.active = self.peak = 0
+
+    def get_page_content(self, url):
+        with self._lock:
+            self.fetched.append(url)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        html = self.pages.get(url)
+        return self.parse_html(html) if html else None
+
+
+def _club_page(*hrefs):
+    links = "".join(f'<a href="{href}">Competition</a>' for href in hrefs)
+    return BeautifulSoup(f"<html><body><h1>Club</h1>{links}</body></html>", "html.parser")
+
+
+COMP_A = "https://gaacork.ie/league/1/"
+COMP_B = "https://gaacork.ie/league/2/"
+
+
+class TestCompetitionFallback:
+    def test_duplicate_links_fetched_once(self):
+        scraper = CompetitionSiteScraper({COMP_A: _competition_page("Douglas")})
+        fixtures = scraper.extract_fixtures_from_club_page(
+            _club_page("/league/1", "/league/1/#table", COMP_A + "?utm_source=x"), "1986")
+        assert scraper.fetched == [COMP_A]
+        assert [f["Opponent"] for f in fixtures] == ["Douglas"]
+
+    def test_pages_fetched_concurrently(self):
+        pages = {f"https://gaacork.ie/league/{i}/": _competition_page(f"Club {i}")
+                 for i in range(6)}
+        scraper = CompetitionSiteScraper(pages)
+        scraper.competition_workers = 3
+        fixtures = scraper.extract_fixtures_from_club_page(
+            _club_page(*pages), "1986")
+        assert 1 < scraper.peak <= 3
+        assert [f["Opponent"] for f in fixtures] == [f"Club {i}" for i in range(6)]
+
+    def test_parsed_pages_shared_across_clubs(self):
+        scraper = CompetitionSiteScraper({COMP_A: _competition_page("Douglas"),
+                                          COMP_B: _competition_page("Nemo")})
+        scraper.extract_fixtures_from_club_page(_club_page(COMP_A), "1986")
+        fixtures = scraper.extract_fixtures_from_club_page(
+            _club_page(COMP_A, COMP_B), "1990")
+        assert scraper.fetched == [COMP_A, COMP_B]
+        assert [f["Opponent"] for f in fixtures] == ["Douglas", "Nemo"]
+
+    def test_injected_empty_cache_used(self):
+        cache = CompetitionPageCache()
+        scraper = CompetitionSiteScraper({COMP_A: _competition_page("Douglas")},
+                                         competition_pages=cache)
+        assert scraper.competition_pages is cache
+        scraper.extract_fixtures_from_club_page(_club_page(COMP_A), "1986")
+        assert cache.fetches == 1
+
+    def test_budget_limits_uncached_fetches(self):
+        pages = {f"https://gaacork.ie/league/{i}/": _competition_page(f"Club {i}")
+                 for i in range(5)}
+        scraper = CompetitionSiteScraper(pages)
+        scraper.competition_budget = 2
+        scraper.extract_fixtures_from_club_page(_club_page(*list(pages)[3:]), "1")
+        scraper.fetched.clear()
+        fixtures = scraper.extract_fixtures_from_club_page(_club_page(*pages), "2")
+        # two cached pages are free; only two of the other three are fetched
+        assert sorted(scraper.fetched) == list(pages)[:2]
+        assert len(fixtures) == 4
+
+    def test_same_fixture_on_two_pages_kept_once(self):
+        scraper = CompetitionSiteScraper({COMP_A: _competition_page("Douglas"),
+                                          COMP_B: _competition_page("Douglas")})
+        fixtures = scraper.extract_fixtures_from_club_page(
+            _club_page(COMP_A, COMP_B), "1986")
+        assert len(fixtures) == 1
+
+    def test_failed_page_retried_by_next_club(self):
+        scraper = CompetitionSiteScraper({})
+        scraper.extract_fixtures_from_club_page(_club_page(COMP_A), "1")
+        scraper.pages[COMP_A] = _competition_page("Douglas")
+        fixtures = scraper.extract_fixtures_from_club_page(_club_page(COMP_A), "2")
+        assert scraper.fetched == [COMP_A, COMP_A]
+        assert len(fixtures) == 1
+
+
+TODAY = datetime(2026, 5, 1)
+
+
+class TestTextFixtures:
+    def _fixtures(self, html):
+        scraper = OfflineScraper()
+        return scraper.extract_from_text_patterns(scraper.parse_html(html), "1986", TODAY)
+
+    def test_nested_block_reported_once(self):
+        html = ("<div><div><li><div><span>Saturday 9th May</span> "
+                "<a href='/clubprofile/1986/'>Ballincollig</a></div></li></div></div>")
+        fixtures = self._fixtures(html)
+        assert [f["Date"] for f in fixtures] == ["09/05/2026"]
+
+    def test_inline_text_belongs_to_block(self):
+        html = "<p><b>Sunday</b> <i>10th</i> May at <a href='#'>Ballincollig</a></p>"
+        assert [f["Date"] for f in self._fixtures(html)] == ["10/05/2026"]
+
+    def test_navigation_and_past_dates_skipped(self):
+        html = ("<li>Back to results Saturday 9th May</li>"
+                "<div>Friday 1st May</div>"  # today: kept
+                "<div>Thursday 30th April</div>"  # yesterday: skipped
+                "<script>var d = 'Saturday 9th May';</script>")
+        assert [f["Date"] for f in self._fixtures(html)] == ["01/05/2026"]
+
+    def test_fixtures_yielded_lazily(self):
+        scraper = OfflineScraper()
+        soup = scraper.parse_html("".join(f"<div>Saturday {d}th May</div>"
+                                          for d in range(9, 30, 7)))
+        fixtures = scraper.iter_text_fixtures(soup, "1986", TODAY)
+        assert next(fixtures)["Date"] == "09/05/2026"
+        assert [f["Date"] for f in fixtures] == ["16/05/2026", "23/05/2026"]
+
+
+class TestFutureFixtureElement:
+    def test_fields_parsed(self):
+        scraper = OfflineScraper()
+        soup = scraper.parse_html(
+            "<li>Saturday 9th May U14 Football FL "
+            "<a href='/clubprofile/1986/'>Ballincollig</a> 11:00 "
+            "<a href='/clubprofile/2001/'>Douglas</a>\nVenue: Ballincollig GAA</li>")
+        fixture = scraper.parse_future_fixture_element(soup.li, "1986", TODAY)
+        assert fixture["date"] == "09/05/2026"
+        assert fixture["time"] == "11:00"
+        assert fixture["venue"] == "Ballincollig GAA"
+        assert fixture["competition"] == "Football FL"